@@ -0,0 +1,144 @@
+"""SHARED TIMING, RECORDING AND COMPARISON FOR THE BENCHMARK SUITES.
+
+EVERY SUITE RETURNS A LIST OF RESULTS (DICTS WITH A UNIQUE "NAME"). SAVE()
+WRITES THEM TO JSON TOGETHER WITH THE COMMIT AND THE MACHINE THEY WERE
+MEASURED ON, AND COMPARE() LINES THEM UP WITH AN EARLIER FILE, SO RUNS CAN
+BE COMPARED ACROSS COMMITS:
+
+    git checkout OLD && python -m benchmarks.LAYERS --output old.json
+    git checkout NEW && python -m benchmarks.LAYERS --output new.json --baseline old.json
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import time
+
+import numpy as np
+
+
+def MEASURE(FUNCTION, REPEATS=5, MIN_TIME=0.05):
+    """TIME A FUNCTION
+
+    THE FUNCTION IS CALLED ONCE TO WARM UP, THEN IN REPEATS ROUNDS OF AS MANY
+    CALLS AS FIT IN MIN_TIME SECONDS.
+
+    PARAMETERS
+    ----------
+    FUNCTION : FUNCTION
+        FUNCTION WITHOUT ARGUMENTS
+    REPEATS : INT, OPTIONAL (DEFAULT=5)
+        NUMBER OF TIMED ROUNDS
+    MIN_TIME : FLOAT, OPTIONAL (DEFAULT=0.05)
+        MINIMUM DURATION OF A ROUND IN SECONDS
+
+    RETURNS
+    -------
+    DICT
+        MEDIAN AND MINIMUM SECONDS PER CALL, AND CALLS PER ROUND
+    """
+    START = time.perf_counter()  # START TIMER
+    FUNCTION()  # WARM UP
+    SECONDS = max(time.perf_counter() - START, 1e-9)  # DURATION OF ONE CALL
+    NUMBER = max(1, int(np.ceil(MIN_TIME / SECONDS)))  # CALLS PER ROUND
+    TIMES = []  # SECONDS PER CALL OF EACH ROUND
+    for _ in range(REPEATS):  # FOR EACH ROUND
+        START = time.perf_counter()  # START TIMER
+        for _ in range(NUMBER):  # FOR EACH CALL
+            FUNCTION()  # CALL FUNCTION
+        TIMES.append((time.perf_counter() - START) / NUMBER)  # RECORD SECONDS PER CALL
+    return {"MEDIAN": float(np.median(TIMES)), "MIN": float(np.min(TIMES)), "NUMBER": NUMBER}  # RETURN TIMES
+
+
+def ENVIRONMENT():
+    """DESCRIBE THE CODE AND MACHINE THE BENCHMARKS RUN ON
+
+    RETURNS
+    -------
+    DICT
+        COMMIT, WHETHER THE TREE HAS CHANGES, DATE AND VERSIONS
+    """
+    ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # ROOT OF THE REPOSITORY
+    try:
+        COMMIT = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()  # CURRENT COMMIT
+        DIRTY = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())  # UNCOMMITTED CHANGES
+    except (OSError, subprocess.CalledProcessError):  # IF GIT IS NOT AVAILABLE
+        COMMIT, DIRTY = None, None  # UNKNOWN COMMIT
+    return {"COMMIT": COMMIT, "DIRTY": DIRTY, "DATE": datetime.datetime.now().isoformat(timespec="seconds"),
+            "PYTHON": platform.python_version(), "NUMPY": np.__version__, "MACHINE": platform.machine(),
+            "PROCESSOR": platform.processor(), "CPUS": os.cpu_count()}  # RETURN ENVIRONMENT
+
+
+def SAVE(PATH, SUITE, RESULTS):
+    """SAVE RESULTS TO JSON
+
+    PARAMETERS
+    ----------
+    PATH : STRING
+        PATH OF THE JSON FILE
+    SUITE : STRING
+        NAME OF THE SUITE
+    RESULTS : LIST
+        RESULTS OF THE SUITE
+
+    RETURNS
+    -------
+    NONE
+    """
+    with open(PATH, "w") as FILE:  # OPEN FILE
+        json.dump({"SUITE": SUITE, "ENVIRONMENT": ENVIRONMENT(), "RESULTS": RESULTS}, FILE, indent=1)  # WRITE RESULTS
+
+
+def COMPARE(PATH, RESULTS, KEY, HIGHER_IS_BETTER=False):
+    """PRINT RESULTS NEXT TO THOSE OF AN EARLIER RUN
+
+    PARAMETERS
+    ----------
+    PATH : STRING
+        PATH OF THE JSON FILE OF THE EARLIER RUN
+    RESULTS : LIST
+        RESULTS OF THIS RUN
+    KEY : STRING
+        KEY OF THE COMPARED VALUE
+    HIGHER_IS_BETTER : BOOL, OPTIONAL (DEFAULT=False)
+        WHETHER HIGHER VALUES ARE BETTER (E.G. THROUGHPUT)
+
+    RETURNS
+    -------
+    NONE
+    """
+    with open(PATH) as FILE:  # OPEN FILE
+        BASELINE = json.load(FILE)  # EARLIER RUN
+    OLD = {RESULT["NAME"]: RESULT[KEY] for RESULT in BASELINE["RESULTS"]}  # EARLIER VALUES BY NAME
+    print("BASELINE: %s (%s)" % (BASELINE["ENVIRONMENT"]["COMMIT"], BASELINE["ENVIRONMENT"]["DATE"]))
+    print("%-60s %14s %14s %9s" % ("NAME", "BASELINE", "CURRENT", "SPEEDUP"))
+    for RESULT in RESULTS:  # FOR EACH RESULT OF THIS RUN
+        if RESULT["NAME"] in OLD:  # IF THE EARLIER RUN HAS IT TOO
+            SPEEDUP = RESULT[KEY] / OLD[RESULT["NAME"]] if HIGHER_IS_BETTER else OLD[RESULT["NAME"]] / RESULT[KEY]  # RATIO
+            print("%-60s %14.6g %14.6g %8.2fx" % (RESULT["NAME"], OLD[RESULT["NAME"]], RESULT[KEY], SPEEDUP))
+
+
+def ARGUMENTS(DESCRIPTION):
+    """PARSE THE COMMAND LINE OF A SUITE
+
+    PARAMETERS
+    ----------
+    DESCRIPTION : STRING
+        DESCRIPTION OF THE SUITE
+
+    RETURNS
+    -------
+    NAMESPACE
+        OUTPUT, BASELINE, QUICK, REPEATS AND FILTER ARGUMENTS
+    """
+    PARSER = argparse.ArgumentParser(description=DESCRIPTION)  # COMMAND LINE PARSER
+    PARSER.add_argument("--output", help="JSON FILE TO SAVE THE RESULTS TO")
+    PARSER.add_argument("--baseline", help="JSON FILE OF AN EARLIER RUN TO COMPARE WITH")
+    PARSER.add_argument("--quick", action="store_true", help="RUN THE SMALLEST CASES ONLY")
+    PARSER.add_argument("--repeats", type=int, default=5, help="NUMBER OF TIMED ROUNDS")
+    PARSER.add_argument("--filter", default="", help="ONLY RUN CASES WHOSE NAME CONTAINS THIS TEXT")
+    return PARSER.parse_args()  # RETURN ARGUMENTS
@@ -0,0 +1,118 @@
+"""MICRO-BENCHMARK FOR THE FORWARD AND BACKWARD PASSES OF THE LAYERS.
+
+EACH LAYER IS SET UP ON ITS OWN FOR A GRID OF BATCH SIZES AND WIDTHS (UNITS,
+CHANNELS OR HIDDEN STATE) AND THE SCRIPT TIMES ITS FORWARD PASS IN THE
+TRAINING PHASE, ITS BACKWARD PASS AND, FOR LAYERS WITH PHASES, ITS FORWARD
+PASS IN THE TESTING PHASE. INPUTS AND WEIGHTS ARE SEEDED, SO EVERY RUN TIMES
+THE SAME WORK.
+
+RUN FROM THE ROOT OF THE REPOSITORY WITH:
+
+    python -m benchmarks.LAYERS --output layers.json [--baseline old.json] [--quick]
+"""
+import numpy as np
+
+from benchmarks.HARNESS import ARGUMENTS, COMPARE, MEASURE, SAVE
+from turing.NEURAL_NETWORKS.LAYERS.BASIC import DENSE, PHASE_MIXIN, TIME_DISTRIBUTED_DENSE
+from turing.NEURAL_NETWORKS.LAYERS.CONVOLUTION import CONVOLUTION, MAX_POOLING
+from turing.NEURAL_NETWORKS.LAYERS.NORMALIZATION import BATCH_NORMALIZATION
+from turing.NEURAL_NETWORKS.LAYERS.RECURRENT.LSTM import LSTM
+from turing.NEURAL_NETWORKS.LAYERS.RECURRENT.RNN import RNN
+from turing.NEURAL_NETWORKS.PARAMETERS import PARAMETER
+
+N_TIMESTEPS = 20  # LENGTH OF THE SEQUENCES OF THE RECURRENT LAYERS
+IMAGE_SIZE = 16  # HEIGHT AND WIDTH OF THE IMAGES OF THE CONVOLUTION LAYERS
+# (NAME, LAYER OF A WIDTH, INPUT SHAPE OF A BATCH SIZE AND WIDTH, BATCH SIZES, WIDTHS)
+CASES = [
+    ("DENSE", lambda WIDTH: DENSE(WIDTH, PARAMETER()),
+     lambda BATCH, WIDTH: (BATCH, WIDTH), (32, 256), (128, 512, 1024)),
+    ("CONVOLUTION", lambda WIDTH: CONVOLUTION(WIDTH, (3, 3), (1, 1), PARAMETERS=PARAMETER()),
+     lambda BATCH, WIDTH: (BATCH, WIDTH, IMAGE_SIZE, IMAGE_SIZE), (16, 64), (8, 32)),
+    ("MAX_POOLING", lambda WIDTH: MAX_POOLING((2, 2), (2, 2)),
+     lambda BATCH, WIDTH: (BATCH, WIDTH, IMAGE_SIZE, IMAGE_SIZE), (16, 64), (8, 32)),
+    ("BATCH_NORMALIZATION", lambda WIDTH: BATCH_NORMALIZATION(PARAMETERS=PARAMETER()),
+     lambda BATCH, WIDTH: (BATCH, WIDTH), (32, 256), (128, 1024)),
+    ("RNN", lambda WIDTH: RNN(WIDTH, PARAMETERS=PARAMETER()),
+     lambda BATCH, WIDTH: (BATCH, N_TIMESTEPS, WIDTH), (16, 64), (32, 128)),
+    ("LSTM", lambda WIDTH: LSTM(WIDTH, PARAMETERS=PARAMETER()),
+     lambda BATCH, WIDTH: (BATCH, N_TIMESTEPS, WIDTH), (16, 64), (32, 128)),
+    ("TIME_DISTRIBUTED_DENSE", lambda WIDTH: TIME_DISTRIBUTED_DENSE(WIDTH, PARAMETER()),
+     lambda BATCH, WIDTH: (BATCH, N_TIMESTEPS, WIDTH), (16, 64), (32, 128)),
+]
+
+
+def BENCHMARK(LAYER, X_SHAPE, REPEATS=5):
+    """BENCHMARK THE PASSES OF A SINGLE LAYER
+
+    PARAMETERS
+    ----------
+    LAYER : LAYER
+        LAYER, NOT SET UP YET
+    X_SHAPE : TUPLE
+        SHAPE OF THE INPUT BATCH
+    REPEATS : INT, OPTIONAL (DEFAULT=5)
+        NUMBER OF TIMED ROUNDS
+
+    RETURNS
+    -------
+    DICT
+        TIMES OF EACH PASS ("FORWARD", "BACKWARD" AND, WITH PHASES, "INFERENCE")
+    """
+    RANDOM_STATE = np.random.default_rng(0)  # RANDOM NUMBER GENERATOR OF THE DATA
+    np.random.seed(0)  # SEED THE INITIALIZERS
+    LAYER.SETUP(X_SHAPE)  # ALLOCATE WEIGHTS
+    X = RANDOM_STATE.standard_normal(X_SHAPE)  # INPUT BATCH
+    if isinstance(LAYER, PHASE_MIXIN):  # IF THE LAYER HAS PHASES
+        LAYER.IS_TRAINING = True  # KEEP THE CACHES OF THE BACKWARD PASS
+    DELTA = RANDOM_STATE.standard_normal(np.shape(LAYER.FORWARD_PASS(X)))  # GRADIENT OF THE OUTPUT
+    TIMES = {"FORWARD": MEASURE(lambda: LAYER.FORWARD_PASS(X), REPEATS)}  # TIME FORWARD PASS
+    TIMES["BACKWARD"] = MEASURE(lambda: LAYER.BACKWARD_PASS(DELTA), REPEATS)  # TIME BACKWARD PASS
+    if isinstance(LAYER, PHASE_MIXIN):  # IF THE LAYER HAS PHASES
+        LAYER.IS_TRAINING = False  # SWITCH TO THE TESTING PHASE
+        TIMES["INFERENCE"] = MEASURE(lambda: LAYER.FORWARD_PASS(X), REPEATS)  # TIME TESTING FORWARD PASS
+    return TIMES  # RETURN TIMES
+
+
+def RUN(QUICK=False, REPEATS=5, FILTER=""):
+    """RUN THE SUITE
+
+    PARAMETERS
+    ----------
+    QUICK : BOOL, OPTIONAL (DEFAULT=False)
+        WHETHER TO RUN THE SMALLEST BATCH SIZE AND WIDTH OF EACH LAYER ONLY
+    REPEATS : INT, OPTIONAL (DEFAULT=5)
+        NUMBER OF TIMED ROUNDS
+    FILTER : STRING, OPTIONAL (DEFAULT="")
+        ONLY RUN CASES WHOSE NAME CONTAINS THIS TEXT
+
+    RETURNS
+    -------
+    LIST
+        ONE RESULT PER LAYER, BATCH SIZE, WIDTH AND PASS
+    """
+    RESULTS = []  # RESULTS OF THE SUITE
+    print("%-60s %12s %12s %14s" % ("NAME", "MEDIAN (MS)", "MIN (MS)", "SAMPLES / S"))
+    for NAME, LAYER, SHAPE, BATCHES, WIDTHS in CASES:  # FOR EACH LAYER
+        for BATCH in BATCHES[:1] if QUICK else BATCHES:  # FOR EACH BATCH SIZE
+            for WIDTH in WIDTHS[:1] if QUICK else WIDTHS:  # FOR EACH WIDTH
+                CASE = "%s/BATCH=%d/WIDTH=%d" % (NAME, BATCH, WIDTH)  # NAME OF THE CASE
+                if FILTER not in CASE:  # IF THE CASE IS FILTERED OUT
+                    continue  # SKIP IT
+                X_SHAPE = SHAPE(BATCH, WIDTH)  # INPUT SHAPE
+                for PASS, TIME in BENCHMARK(LAYER(WIDTH), X_SHAPE, REPEATS).items():  # FOR EACH PASS
+                    RESULT = {"NAME": "%s/%s" % (CASE, PASS), "LAYER": NAME, "PASS": PASS, "BATCH": BATCH,
+                              "WIDTH": WIDTH, "INPUT_SHAPE": list(X_SHAPE), "SECONDS": TIME["MEDIAN"],
+                              "MIN_SECONDS": TIME["MIN"], "SAMPLES_PER_SECOND": BATCH / TIME["MEDIAN"]}  # RESULT
+                    RESULTS.append(RESULT)  # RECORD RESULT
+                    print("%-60s %12.4f %12.4f %14.1f" % (RESULT["NAME"], TIME["MEDIAN"] * 1e3, TIME["MIN"] * 1e3,
+                                                          RESULT["SAMPLES_PER_SECOND"]))
+    return RESULTS  # RETURN RESULTS
+
+
+if __name__ == "__main__":
+    ARGS = ARGUMENTS("FORWARD AND BACKWARD PASSES OF THE LAYERS")  # COMMAND LINE
+    RESULTS = RUN(ARGS.quick, ARGS.repeats, ARGS.filter)  # RUN SUITE
+    if ARGS.output:  # IF THE RESULTS ARE SAVED
+        SAVE(ARGS.output, "LAYERS", RESULTS)  # SAVE RESULTS
+    if ARGS.baseline:  # IF THE RESULTS ARE COMPARED
+        COMPARE(ARGS.baseline, RESULTS, "SECONDS")  # COMPARE WITH THE BASELINE
@@ -0,0 +1,114 @@
+"""MICRO-BENCHMARK FOR THE OPTIMIZER UPDATE KERNELS.
+
+FOR EACH OPTIMIZER, A NETWORK WITH A FEW LARGE DENSE LAYERS IS SET UP, THE
+GRADIENTS ARE FILLED WITH RANDOM VALUES AND UPDATE() IS CALLED REPEATEDLY.
+THE SCRIPT REPORTS THE WALL TIME PER STEP AND THE PEAK NUMBER OF BYTES
+ALLOCATED (AND RELEASED) DURING A SINGLE STEP, AS SEEN BY TRACEMALLOC.
+
+RUN FROM THE ROOT OF THE REPOSITORY WITH:
+
+    python -m benchmarks.OPTIMIZERS
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from turing.NEURAL_NETWORKS import OPTIMIZERS
+from turing.NEURAL_NETWORKS.LAYERS.BASIC import DENSE
+from turing.NEURAL_NETWORKS.PARAMETERS import PARAMETER
+
+
+class NETWORK:
+    """MINIMAL STAND-IN FOR A NEURAL NETWORK EXPOSING ONLY PARAMETER GROUPS"""
+
+    def __init__(self, SHAPES, FLAT_PARAMETERS=False):
+        """INITIALIZE NETWORK
+
+        PARAMETERS
+        ----------
+        SHAPES : LIST OF TUPLES
+            (N_INPUT, N_OUTPUT) OF EACH DENSE LAYER
+        FLAT_PARAMETERS : BOOL, OPTIONAL (DEFAULT=False)
+            WHETHER TO STORE THE PARAMETERS IN A SINGLE ARENA
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.PARAMETERS = []  # LIST OF PARAMETERS
+        for N_INPUT, N_OUTPUT in SHAPES:  # FOR EACH LAYER
+            LAYER = DENSE(N_OUTPUT, PARAMETER())  # CREATE LAYER
+            LAYER.SETUP((None, N_INPUT))  # ALLOCATE WEIGHTS
+            self.PARAMETERS.append(LAYER.PARAMETERS)  # STORE PARAMETERS
+        self.PARAMETER_GROUPS = self.PARAMETERS  # ONE GROUP PER LAYER
+        if FLAT_PARAMETERS:  # IF FLAT PARAMETERS ARE REQUESTED
+            from turing.NEURAL_NETWORKS.PARAMETERS import PARAMETER_ARENA
+            self.PARAMETER_GROUPS = [PARAMETER_ARENA(self.PARAMETERS)]  # ONE GROUP FOR ALL LAYERS
+
+    def FILL_GRADIENTS(self, RANDOM_STATE):
+        """FILL ALL GRADIENTS WITH RANDOM VALUES
+
+        PARAMETERS
+        ----------
+        RANDOM_STATE : NUMPY GENERATOR
+            RANDOM NUMBER GENERATOR
+
+        RETURNS
+        -------
+        NONE
+        """
+        for PARAMETERS in self.PARAMETERS:  # FOR EACH LAYER
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER
+                PARAMETERS.GRAD[n][...] = RANDOM_STATE.standard_normal(
+                    PARAMETERS[n].shape)  # FILL GRADIENT
+
+
+def BENCHMARK(OPTIMIZER, SHAPES, STEPS=20, FLAT_PARAMETERS=False):
+    """BENCHMARK A SINGLE OPTIMIZER
+
+    PARAMETERS
+    ----------
+    OPTIMIZER : OBJECT
+        OPTIMIZER INSTANCE
+    SHAPES : LIST OF TUPLES
+        (N_INPUT, N_OUTPUT) OF EACH DENSE LAYER
+    STEPS : INT, OPTIONAL (DEFAULT=20)
+        NUMBER OF TIMED STEPS
+    FLAT_PARAMETERS : BOOL, OPTIONAL (DEFAULT=False)
+        WHETHER TO STORE THE PARAMETERS IN A SINGLE ARENA
+
+    RETURNS
+    -------
+    TUPLE
+        (SECONDS PER STEP, PEAK TRANSIENT BYTES PER STEP)
+    """
+    NET = NETWORK(SHAPES, FLAT_PARAMETERS)  # CREATE NETWORK
+    NET.FILL_GRADIENTS(np.random.default_rng(0))  # FILL GRADIENTS
+    OPTIMIZER.SETUP(NET)  # SETUP OPTIMIZER
+    OPTIMIZER.UPDATE(NET)  # WARM UP
+    tracemalloc.start()  # START TRACING ALLOCATIONS
+    PEAK = 0  # PEAK TRANSIENT BYTES
+    for _ in range(3):  # FOR A FEW TRACED STEPS
+        CURRENT, _ = tracemalloc.get_traced_memory()  # MEMORY BEFORE THE STEP
+        tracemalloc.reset_peak()  # RESET PEAK
+        OPTIMIZER.UPDATE(NET)  # RUN STEP
+        PEAK = max(PEAK, tracemalloc.get_traced_memory()[1] - CURRENT)  # RECORD PEAK
+    tracemalloc.stop()  # STOP TRACING ALLOCATIONS
+    START = time.perf_counter()  # START TIMER
+    for _ in range(STEPS):  # FOR EACH TIMED STEP
+        OPTIMIZER.UPDATE(NET)  # RUN STEP
+    return (time.perf_counter() - START) / STEPS, PEAK  # RETURN RESULTS
+
+
+if __name__ == "__main__":
+    SHAPES = [(1024, 1024), (1024, 1024), (1024, 10)]  # LAYER SHAPES (~2.1M PARAMETERS)
+    N_BYTES = sum((I + 1) * O for I, O in SHAPES) * 8  # BYTES OF ALL PARAMETERS
+    print("PARAMETER BYTES: %d" % N_BYTES)
+    print("%-30s %6s %12s %18s %10s" % ("OPTIMIZER", "FLAT", "MS / STEP", "PEAK BYTES / STEP", "x PARAMS"))
+    for CLASS in [OPTIMIZERS.STOCHASTIC_GRADIENT_DESCENT, OPTIMIZERS.ADA_GRAD, OPTIMIZERS.ADA_DELTA,
+                  OPTIMIZERS.RMS_PROP, OPTIMIZERS.ADMA, OPTIMIZERS.ADA_MAX]:  # FOR EACH OPTIMIZER
+        for FLAT_PARAMETERS in (False, True):  # WITH AND WITHOUT THE PARAMETER ARENA
+            SECONDS, PEAK = BENCHMARK(CLASS(), SHAPES, FLAT_PARAMETERS=FLAT_PARAMETERS)  # RUN BENCHMARK
+            print("%-30s %6s %12.3f %18d %10.2f" % (CLASS.__name__, FLAT_PARAMETERS,
+                                                    SECONDS * 1e3, PEAK, PEAK / N_BYTES))
@@ -0,0 +1,165 @@
+"""END-TO-END BENCHMARK OF NEURAL_NETWORK.FIT.
+
+AN MLP, A CNN AND AN LSTM ARE TRAINED ON SEEDED SYNTHETIC DATA AND THE
+SCRIPT REPORTS THE TRAINING THROUGHPUT IN SAMPLES PER SECOND. EACH NETWORK
+IS SET UP AND TRAINED FOR ONE EPOCH BEFORE IT IS TIMED, SO THE SETUP OF THE
+LAYERS IS NOT COUNTED.
+
+RUN FROM THE ROOT OF THE REPOSITORY WITH:
+
+    python -m benchmarks.TRAINING --output training.json [--baseline old.json] [--quick]
+"""
+import time
+
+import numpy as np
+
+from benchmarks.HARNESS import ARGUMENTS, COMPARE, SAVE
+from turing.NEURAL_NETWORKS.ACTIVATIONS import RELU, SOFTMAX
+from turing.NEURAL_NETWORKS.LAYERS.BASIC import ACTIVATION, DENSE, TIME_DISTRIBUTED_DENSE
+from turing.NEURAL_NETWORKS.LAYERS.CONVOLUTION import CONVOLUTION, FLATTEN, MAX_POOLING
+from turing.NEURAL_NETWORKS.LAYERS.RECURRENT.LSTM import LSTM
+from turing.NEURAL_NETWORKS.METRICS import CATEGORICAL_CROSSENTROPY, MEAN_SQUARED_ERROR
+from turing.NEURAL_NETWORKS.NEURAL_NETWORK import NEURAL_NETWORK
+from turing.NEURAL_NETWORKS.OPTIMIZERS import ADMA
+from turing.NEURAL_NETWORKS.PARAMETERS import PARAMETER
+
+
+def MLP(RANDOM_STATE, N_SAMPLES):
+    """MULTI-LAYER PERCEPTRON CLASSIFYING 64 FEATURES INTO 10 CLASSES
+
+    PARAMETERS
+    ----------
+    RANDOM_STATE : NUMPY GENERATOR
+        RANDOM NUMBER GENERATOR OF THE DATA
+    N_SAMPLES : INT
+        NUMBER OF TRAINING SAMPLES
+
+    RETURNS
+    -------
+    TUPLE
+        (NETWORK, X, Y)
+    """
+    X = RANDOM_STATE.standard_normal((N_SAMPLES, 64))  # FEATURES
+    Y = np.eye(10)[RANDOM_STATE.integers(0, 10, N_SAMPLES)]  # ONE-HOT CLASSES
+    NETWORK = NEURAL_NETWORK([DENSE(256, PARAMETER()), ACTIVATION(RELU), DENSE(256, PARAMETER()), ACTIVATION(RELU),
+                              DENSE(10, PARAMETER()), ACTIVATION(SOFTMAX)], ADMA(), CATEGORICAL_CROSSENTROPY,
+                             MAX_EPOCHS=1, BATCH_SIZE=128)  # NETWORK
+    return NETWORK, X, Y  # RETURN NETWORK AND DATA
+
+
+def CNN(RANDOM_STATE, N_SAMPLES):
+    """CONVOLUTIONAL NETWORK CLASSIFYING 16X16 IMAGES INTO 10 CLASSES
+
+    PARAMETERS
+    ----------
+    RANDOM_STATE : NUMPY GENERATOR
+        RANDOM NUMBER GENERATOR OF THE DATA
+    N_SAMPLES : INT
+        NUMBER OF TRAINING SAMPLES
+
+    RETURNS
+    -------
+    TUPLE
+        (NETWORK, X, Y)
+    """
+    X = RANDOM_STATE.standard_normal((N_SAMPLES, 1, 16, 16))  # IMAGES
+    Y = np.eye(10)[RANDOM_STATE.integers(0, 10, N_SAMPLES)]  # ONE-HOT CLASSES
+    NETWORK = NEURAL_NETWORK([CONVOLUTION(8, (3, 3), (1, 1), PARAMETERS=PARAMETER()), ACTIVATION(RELU),
+                              MAX_POOLING((2, 2), (2, 2)), FLATTEN(), DENSE(10, PARAMETER()), ACTIVATION(SOFTMAX)],
+                             ADMA(), CATEGORICAL_CROSSENTROPY, MAX_EPOCHS=1, BATCH_SIZE=64)  # NETWORK
+    return NETWORK, X, Y  # RETURN NETWORK AND DATA
+
+
+def RECURRENT(RANDOM_STATE, N_SAMPLES):
+    """LSTM REGRESSING A TARGET AT EVERY STEP OF 20-STEP SEQUENCES
+
+    PARAMETERS
+    ----------
+    RANDOM_STATE : NUMPY GENERATOR
+        RANDOM NUMBER GENERATOR OF THE DATA
+    N_SAMPLES : INT
+        NUMBER OF TRAINING SEQUENCES
+
+    RETURNS
+    -------
+    TUPLE
+        (NETWORK, X, Y)
+    """
+    X = RANDOM_STATE.standard_normal((N_SAMPLES, 20, 16))  # SEQUENCES
+    Y = np.tanh(np.cumsum(X[:, :, :1], axis=1))  # TARGETS
+    NETWORK = NEURAL_NETWORK([LSTM(32, PARAMETERS=PARAMETER()), TIME_DISTRIBUTED_DENSE(1, PARAMETER())], ADMA(),
+                             MEAN_SQUARED_ERROR, MAX_EPOCHS=1, BATCH_SIZE=64)  # NETWORK
+    return NETWORK, X, Y  # RETURN NETWORK AND DATA
+
+
+# (NAME, MODEL, NUMBER OF SAMPLES, NUMBER OF SAMPLES OF A QUICK RUN)
+MODELS = [("MLP", MLP, 8192, 1024), ("CNN", CNN, 1024, 128), ("LSTM", RECURRENT, 1024, 128)]
+
+
+def BENCHMARK(MODEL, N_SAMPLES, REPEATS=5):
+    """BENCHMARK THE TRAINING THROUGHPUT OF A MODEL
+
+    PARAMETERS
+    ----------
+    MODEL : FUNCTION
+        FUNCTION RETURNING (NETWORK, X, Y)
+    N_SAMPLES : INT
+        NUMBER OF TRAINING SAMPLES
+    REPEATS : INT, OPTIONAL (DEFAULT=5)
+        NUMBER OF TIMED EPOCHS
+
+    RETURNS
+    -------
+    LIST
+        SECONDS OF EACH TIMED EPOCH
+    """
+    np.random.seed(0)  # SEED THE INITIALIZERS
+    NETWORK, X, Y = MODEL(np.random.default_rng(0), N_SAMPLES)  # NETWORK AND DATA
+    NETWORK.FIT(X, Y)  # SET UP AND WARM UP
+    TIMES = []  # SECONDS OF EACH EPOCH
+    for _ in range(REPEATS):  # FOR EACH TIMED EPOCH
+        START = time.perf_counter()  # START TIMER
+        NETWORK.FIT(X, Y)  # TRAIN ONE EPOCH
+        TIMES.append(time.perf_counter() - START)  # RECORD TIME
+    return TIMES  # RETURN TIMES
+
+
+def RUN(QUICK=False, REPEATS=5, FILTER=""):
+    """RUN THE SUITE
+
+    PARAMETERS
+    ----------
+    QUICK : BOOL, OPTIONAL (DEFAULT=False)
+        WHETHER TO TRAIN ON FEWER SAMPLES
+    REPEATS : INT, OPTIONAL (DEFAULT=5)
+        NUMBER OF TIMED EPOCHS
+    FILTER : STRING, OPTIONAL (DEFAULT="")
+        ONLY RUN MODELS WHOSE NAME CONTAINS THIS TEXT
+
+    RETURNS
+    -------
+    LIST
+        ONE RESULT PER MODEL
+    """
+    RESULTS = []  # RESULTS OF THE SUITE
+    print("%-20s %14s %14s" % ("NAME", "SECONDS", "SAMPLES / S"))
+    for NAME, MODEL, N_SAMPLES, N_QUICK in MODELS:  # FOR EACH MODEL
+        if FILTER not in NAME:  # IF THE MODEL IS FILTERED OUT
+            continue  # SKIP IT
+        N_SAMPLES = N_QUICK if QUICK else N_SAMPLES  # NUMBER OF SAMPLES
+        TIMES = BENCHMARK(MODEL, N_SAMPLES, REPEATS)  # RUN BENCHMARK
+        SECONDS = float(np.median(TIMES))  # MEDIAN SECONDS PER EPOCH
+        RESULT = {"NAME": "%s/SAMPLES=%d" % (NAME, N_SAMPLES), "MODEL": NAME, "SAMPLES": N_SAMPLES, "SECONDS": SECONDS, "MIN_SECONDS": float(np.min(TIMES)),
+                  "SAMPLES_PER_SECOND": N_SAMPLES / SECONDS}  # RESULT
+        RESULTS.append(RESULT)  # RECORD RESULT
+        print("%-20s %14.4f %14.1f" % (RESULT["NAME"], SECONDS, RESULT["SAMPLES_PER_SECOND"]))
+    return RESULTS  # RETURN RESULTS
+
+
+if __name__ == "__main__":
+    ARGS = ARGUMENTS("TRAINING THROUGHPUT OF NEURAL_NETWORK.FIT")  # COMMAND LINE
+    RESULTS = RUN(ARGS.quick, ARGS.repeats, ARGS.filter)  # RUN SUITE
+    if ARGS.output:  # IF THE RESULTS ARE SAVED
+        SAVE(ARGS.output, "TRAINING", RESULTS)  # SAVE RESULTS
+    if ARGS.baseline:  # IF THE RESULTS ARE COMPARED
+        COMPARE(ARGS.baseline, RESULTS, "SAMPLES_PER_SECOND", HIGHER_IS_BETTER=True)  # COMPARE WITH THE BASELINE
@@ -1,3 +1,4 @@
+from autograd import elementwise_grad
 import numpy as np
 
 
@@ -137,3 +138,355 @@ def STEP_FUNCTION(Z):
     RETURN STEP ACTIVATION
     """
     return 1.0 if (Z > 0) else 0.0
+
+
+def SIGMOID_DERIVATIVE(Z, OUTPUT, DELTA):
+    """BACKPROPAGATE THROUGH THE SIGMOID ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        SIGMOID ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z
+    """
+    GRAD = np.subtract(1.0, OUTPUT)  # COMPUTE 1 - SIGMOID
+    GRAD *= OUTPUT  # COMPUTE SIGMOID * (1 - SIGMOID)
+    GRAD *= DELTA  # APPLY CHAIN RULE
+    return GRAD  # RETURN GRADIENT
+
+
+def SOFTMAX_DERIVATIVE(Z, OUTPUT, DELTA):
+    """BACKPROPAGATE THROUGH THE SOFTMAX ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        SOFTMAX ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z (JACOBIAN-VECTOR PRODUCT)
+    """
+    GRAD = OUTPUT * DELTA  # COMPUTE SOFTMAX * DELTA
+    GRAD -= OUTPUT * np.sum(GRAD, axis=1, keepdims=True)  # SUBTRACT SOFTMAX * SUM(SOFTMAX * DELTA)
+    return GRAD  # RETURN GRADIENT
+
+
+def LINEAR_DERIVATIVE(Z, OUTPUT, DELTA):
+    """BACKPROPAGATE THROUGH THE LINEAR ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        LINEAR ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z
+    """
+    return DELTA  # RETURN GRADIENT UNCHANGED
+
+
+def SOFT_PLUS_DERIVATIVE(Z, OUTPUT, DELTA):
+    """BACKPROPAGATE THROUGH THE SOFT PLUS ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        SOFT PLUS ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z
+    """
+    GRAD = np.negative(OUTPUT)  # COMPUTE -SOFT_PLUS
+    np.expm1(GRAD, out=GRAD)  # COMPUTE EXP(-SOFT_PLUS) - 1 = -SIGMOID
+    np.negative(GRAD, out=GRAD)  # COMPUTE SIGMOID
+    GRAD *= DELTA  # APPLY CHAIN RULE
+    return GRAD  # RETURN GRADIENT
+
+
+def SOFT_SIGN_DERIVATIVE(Z, OUTPUT, DELTA):
+    """BACKPROPAGATE THROUGH THE SOFT SIGN ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        SOFT SIGN ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z
+    """
+    GRAD = np.abs(OUTPUT)  # COMPUTE |SOFT_SIGN|
+    np.subtract(1.0, GRAD, out=GRAD)  # COMPUTE 1 - |SOFT_SIGN| = 1 / (1 + |Z|)
+    GRAD *= GRAD  # COMPUTE 1 / (1 + |Z|) ** 2
+    GRAD *= DELTA  # APPLY CHAIN RULE
+    return GRAD  # RETURN GRADIENT
+
+
+def TANH_DERIVATIVE(Z, OUTPUT, DELTA):
+    """BACKPROPAGATE THROUGH THE TANH ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        TANH ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z
+    """
+    GRAD = np.multiply(OUTPUT, OUTPUT)  # COMPUTE TANH ** 2
+    np.subtract(1.0, GRAD, out=GRAD)  # COMPUTE 1 - TANH ** 2
+    GRAD *= DELTA  # APPLY CHAIN RULE
+    return GRAD  # RETURN GRADIENT
+
+
+def RELU_DERIVATIVE(Z, OUTPUT, DELTA):
+    """BACKPROPAGATE THROUGH THE RELU ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        RELU ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z
+    """
+    return np.where(Z > 0, DELTA, 0.0)  # PASS GRADIENT ONLY WHERE Z IS POSITIVE
+
+
+def LEAKY_RELU_DERIVATIVE(Z, OUTPUT, DELTA, A=0.01):
+    """BACKPROPAGATE THROUGH THE LEAKY RELU ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        LEAKY RELU ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+    A : FLOAT, OPTIONAL
+        LEAKY RELU PARAMETER, BY DEFAULT 0.01
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z
+    """
+    return np.where(Z > 0, DELTA, DELTA * A)  # SCALE GRADIENT WHERE Z IS NOT POSITIVE
+
+
+def STEP_FUNCTION_DERIVATIVE(Z, OUTPUT, DELTA):
+    """BACKPROPAGATE THROUGH THE STEP FUNCTION
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+    OUTPUT : ARRAY
+        STEP ACTIVATION OF Z
+    DELTA : ARRAY
+        GRADIENT WITH RESPECT TO THE OUTPUT
+
+    RETURNS
+    -------
+    RETURN GRADIENT WITH RESPECT TO Z (ZERO ALMOST EVERYWHERE)
+    """
+    return np.zeros_like(DELTA)  # RETURN ZERO GRADIENT
+
+
+# DERIVATIVES MAPS EACH BUILT-IN ACTIVATION FUNCTION TO ITS CLOSED-FORM DERIVATIVE. EVERY DERIVATIVE TAKES THE INPUT Z, THE OUTPUT OF THE FORWARD PASS AND THE INCOMING GRADIENT, AND RETURNS THE GRADIENT WITH RESPECT TO Z.
+DERIVATIVES = {
+    SIGMOID: SIGMOID_DERIVATIVE,
+    SOFTMAX: SOFTMAX_DERIVATIVE,
+    LINEAR: LINEAR_DERIVATIVE,
+    SOFT_PLUS: SOFT_PLUS_DERIVATIVE,
+    SOFT_SIGN: SOFT_SIGN_DERIVATIVE,
+    TANH: TANH_DERIVATIVE,
+    RELU: RELU_DERIVATIVE,
+    LEAKY_RELU: LEAKY_RELU_DERIVATIVE,
+    STEP_FUNCTION: STEP_FUNCTION_DERIVATIVE,
+}
+
+
+def REGISTER_DERIVATIVE(ACTIVATION_FUNCTION, DERIVATIVE_FUNCTION):
+    """REGISTER A CLOSED-FORM DERIVATIVE FOR AN ACTIVATION FUNCTION
+
+    PARAMETERS
+    ----------
+    ACTIVATION_FUNCTION : FUNCTION
+        ACTIVATION FUNCTION
+    DERIVATIVE_FUNCTION : FUNCTION
+        FUNCTION (Z, OUTPUT, DELTA) -> GRADIENT WITH RESPECT TO Z
+
+    RETURNS
+    -------
+    NONE
+    """
+    DERIVATIVES[ACTIVATION_FUNCTION] = DERIVATIVE_FUNCTION  # STORE DERIVATIVE
+
+
+def DERIVATIVE(ACTIVATION_FUNCTION):
+    """RETURN THE DERIVATIVE OF AN ACTIVATION FUNCTION
+
+    BUILT-IN AND REGISTERED FUNCTIONS USE THEIR CLOSED-FORM DERIVATIVE. ANY
+    OTHER FUNCTION FALLS BACK TO AUTOGRAD, SO IT MUST BE ELEMENTWISE AND
+    WRITTEN WITH AUTOGRAD.NUMPY.
+
+    PARAMETERS
+    ----------
+    ACTIVATION_FUNCTION : FUNCTION
+        ACTIVATION FUNCTION
+
+    RETURNS
+    -------
+    RETURN FUNCTION (Z, OUTPUT, DELTA) -> GRADIENT WITH RESPECT TO Z
+    """
+    if ACTIVATION_FUNCTION in DERIVATIVES:  # IF A CLOSED-FORM DERIVATIVE IS KNOWN
+        return DERIVATIVES[ACTIVATION_FUNCTION]  # RETURN IT
+    GRAD = elementwise_grad(ACTIVATION_FUNCTION)  # BUILD AUTOGRAD DERIVATIVE ONCE
+    return lambda Z, OUTPUT, DELTA: GRAD(Z) * DELTA  # RETURN FALLBACK DERIVATIVE
+
+
+def SIGMOID_IN_PLACE(Z):
+    """SIGMOID ACTIVATION FUNCTION, OVERWRITING ITS INPUT
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION, OVERWRITTEN WITH THE ACTIVATION
+
+    RETURNS
+    -------
+    RETURN Z
+    """
+    np.negative(Z, out=Z)  # COMPUTE -Z
+    np.exp(Z, out=Z)  # COMPUTE EXP(-Z)
+    Z += 1.0  # COMPUTE 1 + EXP(-Z)
+    return np.reciprocal(Z, out=Z)  # RETURN 1 / (1 + EXP(-Z))
+
+
+def LINEAR_IN_PLACE(Z):
+    """LINEAR ACTIVATION FUNCTION, OVERWRITING ITS INPUT
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION
+
+    RETURNS
+    -------
+    RETURN Z
+    """
+    return Z  # RETURN LINEAR ACTIVATION
+
+
+def TANH_IN_PLACE(Z):
+    """TANH ACTIVATION FUNCTION, OVERWRITING ITS INPUT
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION, OVERWRITTEN WITH THE ACTIVATION
+
+    RETURNS
+    -------
+    RETURN Z
+    """
+    return np.tanh(Z, out=Z)  # RETURN TANH ACTIVATION
+
+
+def RELU_IN_PLACE(Z):
+    """RELU ACTIVATION FUNCTION, OVERWRITING ITS INPUT
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION, OVERWRITTEN WITH THE ACTIVATION
+
+    RETURNS
+    -------
+    RETURN Z
+    """
+    return np.maximum(Z, 0, out=Z)  # RETURN RELU ACTIVATION
+
+
+def LEAKY_RELU_IN_PLACE(Z, A=0.01):
+    """LEAKY RELU ACTIVATION FUNCTION, OVERWRITING ITS INPUT
+
+    PARAMETERS
+    ----------
+    Z : ARRAY
+        LINEAR TRANSFORMATION, OVERWRITTEN WITH THE ACTIVATION
+    A : FLOAT, OPTIONAL
+        LEAKY RELU PARAMETER, BY DEFAULT 0.01
+
+    RETURNS
+    -------
+    RETURN Z
+    """
+    return np.multiply(Z, A, out=Z, where=Z < 0)  # RETURN LEAKY RELU ACTIVATION
+
+
+# IN_PLACE MAPS BUILT-IN ACTIVATION FUNCTIONS TO A VERSION THAT OVERWRITES ITS INPUT. ONLY FUNCTIONS WHOSE DERIVATIVE GIVES THE SAME RESULT WHEN THE OUTPUT IS PASSED AS Z ARE LISTED, SO THE INPUT DOES NOT HAVE TO BE KEPT FOR THE BACKWARD PASS.
+IN_PLACE = {
+    SIGMOID: SIGMOID_IN_PLACE,
+    LINEAR: LINEAR_IN_PLACE,
+    TANH: TANH_IN_PLACE,
+    RELU: RELU_IN_PLACE,
+    LEAKY_RELU: LEAKY_RELU_IN_PLACE,
+}
+
+
+def REGISTER_IN_PLACE(ACTIVATION_FUNCTION, IN_PLACE_FUNCTION):
+    """REGISTER A VERSION OF AN ACTIVATION FUNCTION THAT OVERWRITES ITS INPUT
+
+    THE DERIVATIVE OF THE ACTIVATION FUNCTION MUST GIVE THE SAME RESULT WHEN
+    ITS OUTPUT IS PASSED IN PLACE OF Z.
+
+    PARAMETERS
+    ----------
+    ACTIVATION_FUNCTION : FUNCTION
+        ACTIVATION FUNCTION
+    IN_PLACE_FUNCTION : FUNCTION
+        FUNCTION Z -> ACTIVATION OF Z, WRITTEN INTO Z
+
+    RETURNS
+    -------
+    NONE
+    """
+    IN_PLACE[ACTIVATION_FUNCTION] = IN_PLACE_FUNCTION  # STORE IN-PLACE FUNCTION
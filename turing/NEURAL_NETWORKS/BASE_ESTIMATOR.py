@@ -1,5 +1,7 @@
 import numpy as np
 
+from .DATASETS import SHARDED_DATASET
+
 
 class BASE_ESTIMATOR:
     """BASE CLASS FOR ESTIMATORS IN THE NEURAL NETWORKS MODULE.
@@ -68,7 +70,8 @@ class BASE_ESTIMATOR:
         """ENSURE INPUTS TO AN ESTIMATOR ARE IN THE EXPECTED FORMAT.
 
         ENSURES X AND Y ARE STORED AS NUMPY NDARRAYS BY CONVERTING FROM AN
-        ARRAY-LIKE OBJECT IF NECESSARY. ENABLES ESTIMATORS TO DEFINE WHETHER
+        ARRAY-LIKE OBJECT IF NECESSARY. MEMORY-MAPPED ARRAYS AND SHARDED
+        DATASETS ARE KEPT AS THEY ARE, SO THEY ARE NEVER READ INTO MEMORY. ENABLES ESTIMATORS TO DEFINE WHETHER
         THEY REQUIRE A SET OF Y TARGET VALUES OR NOT WITH Y_REQUIRED, E.G.
         KMEANS CLUSTERING REQUIRES NO TARGET LABELS AND IS FIT AGAINST ONLY X.
 
@@ -80,7 +83,7 @@ class BASE_ESTIMATOR:
             TARGET VALUES. BY DEFAULT IS REQUIRED, BUT IF Y_REQUIRED = FALSE
             THEN MAY BE OMITTED.
         """
-        if not isinstance(X, np.ndarray):  # IF X IS NOT A NUMPY ARRAY
+        if not isinstance(X, (np.ndarray, SHARDED_DATASET)):  # IF X IS NOT A NUMPY ARRAY OR AN OUT-OF-CORE DATASET
             X = np.array(X)  # CONVERT IT TO ONE
         if X.size == 0:  # IF X (OR THE CONVERTED X) IS EMPTY
             raise ValueError("GOT AN EMPTY MATRIX")  # RAISE A VALUE ERROR
@@ -95,7 +98,7 @@ class BASE_ESTIMATOR:
             if Y is None:  # IF Y IS NONE
                 # RAISE A VALUE ERROR
                 raise ValueError("MISSED REQUIRED ARGUMENT Y")
-            if not isinstance(Y, np.ndarray):  # IF Y IS NOT A NUMPY ARRAY
+            if not isinstance(Y, (np.ndarray, SHARDED_DATASET)):  # IF Y IS NOT A NUMPY ARRAY OR AN OUT-OF-CORE DATASET
                 Y = np.array(Y)  # CONVERT IT TO ONE
             if Y.size == 0:  # IF Y (OR THE CONVERTED Y) IS EMPTY
                 # RAISE A VALUE ERROR
@@ -124,7 +127,7 @@ class BASE_ESTIMATOR:
         X : ARRAY-LIKE
             FEATURE DATASET.
         """
-        if not isinstance(X, np.ndarray):  # IF X IS NOT A NUMPY ARRAY
+        if not isinstance(X, (np.ndarray, SHARDED_DATASET)):  # IF X IS NOT A NUMPY ARRAY OR AN OUT-OF-CORE DATASET
             X = np.array(X)  # CONVERT IT TO ONE
         # RETURN THE RESULT OF CALLING THE __PREDICT__ FUNCTION WITH ARGUMENT X
         return self.__PREDICT__(X)
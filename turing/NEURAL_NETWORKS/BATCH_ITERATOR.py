@@ -1,4 +1,7 @@
-def BATCH_ITERATOR(X, BATCH_SIZE=64):
+import numpy as np
+
+
+def BATCH_ITERATOR(X, BATCH_SIZE=64, INDICES=None):
     """ITERATE OVER BATCHES OF A DATASET.
 
     PARAMETERS
@@ -7,7 +10,14 @@ def BATCH_ITERATOR(X, BATCH_SIZE=64):
         FEATURE DATASET.
     BATCH_SIZE : INTEGER
         SIZE OF EACH BATCH.
+    INDICES : ARRAY-LIKE, OPTIONAL
+        ORDER IN WHICH TO VISIT THE SAMPLES. ONLY THE ROWS OF THE CURRENT
+        BATCH ARE GATHERED, SO A SHUFFLED EPOCH NEVER COPIES THE WHOLE DATASET.
     """
+    if INDICES is not None:  # IF AN ORDER IS GIVEN
+        for BATCH_INDICES in BATCH_ITERATOR(INDICES, BATCH_SIZE):  # FOR EACH BATCH OF INDICES
+            yield X[BATCH_INDICES]  # YIELD THE ROWS OF X AT THOSE INDICES
+        return
     N_SAMPLES = X.shape[0]  # SET THE NUMBER OF SAMPLES TO THE FIRST ELEMENT OF THE SHAPE OF X
     # SET THE NUMBER OF BATCHES TO THE NUMBER OF SAMPLES DIVIDED BY THE BATCH SIZE
     N_BATCHES = N_SAMPLES // BATCH_SIZE
@@ -24,3 +34,22 @@ def BATCH_ITERATOR(X, BATCH_SIZE=64):
     if N_BATCHES * BATCH_SIZE < N_SAMPLES:
         # YIELD THE SLICE OF X FROM BATCH_END TO THE END OF X
         yield X[BATCH_END:]
+
+
+def SEQUENCE_ITERATOR(X, WINDOW=64):
+    """ITERATE OVER CONSECUTIVE TIME WINDOWS OF A SEQUENCE DATASET.
+
+    ONLY THE CURRENT WINDOW IS READ, SO X CAN BE A MEMORY-MAPPED ARRAY THAT
+    DOES NOT FIT IN MEMORY.
+
+    PARAMETERS
+    ----------
+    X : ARRAY-LIKE
+        SEQUENCE DATASET OF SHAPE (N_SEQUENCES, N_TIMESTEPS, ...).
+    WINDOW : INTEGER
+        NUMBER OF TIMESTEPS IN EACH WINDOW.
+    """
+    N_TIMESTEPS = X.shape[1]  # SET THE NUMBER OF TIMESTEPS TO THE SECOND ELEMENT OF THE SHAPE OF X
+    for WINDOW_BEGIN in range(0, N_TIMESTEPS, WINDOW):  # FOR EACH WINDOW, INCLUDING A SHORTER LAST ONE
+        # YIELD THE SLICE OF X FROM WINDOW_BEGIN TO WINDOW_BEGIN PLUS THE WINDOW SIZE AS AN IN-MEMORY ARRAY
+        yield np.asarray(X[:, WINDOW_BEGIN: WINDOW_BEGIN + WINDOW])
@@ -0,0 +1,339 @@
+import numpy as np
+
+from .LAYERS.NORMALIZATION import LEARNED_STATE
+from .METRICS import ACCURACY, R2_SCORE
+
+# METRICS WHOSE HIGHER VALUES ARE BETTER (ALL OTHER METRICS ARE ERRORS)
+MAXIMIZED = (ACCURACY, R2_SCORE)
+# STATE THE RECURRENT LAYERS CARRY FROM ONE BATCH TO THE NEXT
+RECURRENT_STATE = ("H_PREV", "O_PREV")
+
+
+class CALLBACK:
+    """BASE CLASS FOR TRAINING CALLBACKS
+
+    NEURAL_NETWORK.FIT CALLS THE HOOKS OF ITS CALLBACKS, IN ORDER, WHILE THE
+    NETWORK TRAINS. A CALLBACK CAN END TRAINING BY SETTING
+    NETWORK.STOP_TRAINING TO TRUE: THE OPTIMIZER STOPS AFTER THE CURRENT BATCH.
+
+    METHODS
+    -------
+    ON_TRAIN_BEGIN(NETWORK)
+        CALLED BEFORE THE FIRST BATCH.
+    ON_BATCH_END(NETWORK, LOSS)
+        CALLED AFTER EVERY BATCH.
+    ON_EPOCH_END(NETWORK, LOSS)
+        CALLED AFTER EVERY EPOCH.
+    ON_TRAIN_END(NETWORK)
+        CALLED WHEN TRAINING IS OVER.
+    """
+
+    def ON_TRAIN_BEGIN(self, NETWORK):
+        """CALLED BEFORE THE FIRST BATCH
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+
+        RETURNS
+        -------
+        NONE
+        """
+
+    def ON_BATCH_END(self, NETWORK, LOSS):
+        """CALLED AFTER EVERY BATCH
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        LOSS : FLOAT
+            LOSS OF THE BATCH
+
+        RETURNS
+        -------
+        NONE
+        """
+
+    def ON_EPOCH_END(self, NETWORK, LOSS):
+        """CALLED AFTER EVERY EPOCH
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        LOSS : FLOAT
+            MEAN LOSS OF THE EPOCH
+
+        RETURNS
+        -------
+        NONE
+        """
+
+    def ON_TRAIN_END(self, NETWORK):
+        """CALLED WHEN TRAINING IS OVER
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            TRAINED NETWORK
+
+        RETURNS
+        -------
+        NONE
+        """
+
+
+class EARLY_STOPPING(CALLBACK):
+    """STOP TRAINING WHEN THE SCORE ON A HELD-OUT SET STOPS IMPROVING
+
+    THE NETWORK IS SCORED ON THE VALIDATION SET AFTER EVERY EPOCH, OR AFTER
+    EVERY EVERY_STEPS BATCHES. A SCORE IMPROVES ON THE BEST ONE IF IT IS
+    BETTER BY MORE THAN MIN_DELTA. TRAINING STOPS AFTER PATIENCE SCORES IN A
+    ROW THAT DO NOT IMPROVE, AND THE PARAMETERS (AND THE RUNNING STATISTICS
+    OF THE BATCH NORMALIZATIONS) OF THE BEST SCORE ARE RESTORED AT THE END.
+    WITH SUBSAMPLE, THE NETWORK IS ONLY SCORED ON A FIXED RANDOM SUBSET OF
+    THE VALIDATION SET, SO FREQUENT EVALUATIONS STAY CHEAP.
+
+    PARAMETERS
+    ----------
+    X : ARRAY-LIKE
+        VALIDATION FEATURES.
+    Y : ARRAY-LIKE
+        VALIDATION TARGETS.
+    EVERY_STEPS : INT
+        NUMBER OF BATCHES BETWEEN EVALUATIONS (NONE TO EVALUATE AFTER EVERY EPOCH).
+    SUBSAMPLE : INT
+        NUMBER OF VALIDATION SAMPLES SCORED (NONE FOR ALL OF THEM).
+    PATIENCE : INT
+        NUMBER OF EVALUATIONS WITHOUT IMPROVEMENT BEFORE TRAINING STOPS.
+    MIN_DELTA : FLOAT
+        MINIMUM CHANGE OF THE SCORE THAT COUNTS AS AN IMPROVEMENT.
+    METRIC : FUNCTION
+        METRIC OF THE SCORE (NONE FOR THE METRIC OF THE NETWORK).
+    MAXIMIZE : BOOL
+        WHETHER HIGHER SCORES ARE BETTER (NONE TO DECIDE FROM THE METRIC).
+    RESTORE_BEST : BOOL
+        WHETHER TO RESTORE THE PARAMETERS OF THE BEST SCORE AT THE END.
+    SEED : INT
+        SEED OF THE RANDOM NUMBER GENERATOR THAT DRAWS THE SUBSAMPLE.
+
+    ATTRIBUTES
+    ----------
+    BEST : FLOAT
+        BEST SCORE OF THE CURRENT CALL TO FIT (NONE BEFORE THE FIRST EVALUATION).
+    WAIT : INT
+        NUMBER OF EVALUATIONS SINCE THE BEST SCORE.
+    HISTORY : LIST
+        SCORE OF EVERY EVALUATION OF THE CURRENT CALL TO FIT.
+    BEST_WEIGHTS : LIST
+        COPIES OF THE PARAMETERS AND LAYER STATE OF THE BEST SCORE.
+
+    METHODS
+    -------
+    EVALUATE(NETWORK)
+        SCORE THE NETWORK AND STOP TRAINING IF IT HAS NOT IMPROVED FOR PATIENCE EVALUATIONS.
+    """
+
+    def __init__(self, X, Y, EVERY_STEPS=None, SUBSAMPLE=None, PATIENCE=5, MIN_DELTA=0.0, METRIC=None, MAXIMIZE=None,
+                 RESTORE_BEST=True, SEED=None):
+        """INITIALIZE EARLY STOPPING
+
+        PARAMETERS
+        ----------
+        X : ARRAY-LIKE
+            VALIDATION FEATURES.
+        Y : ARRAY-LIKE
+            VALIDATION TARGETS.
+        EVERY_STEPS : INT
+            NUMBER OF BATCHES BETWEEN EVALUATIONS (NONE TO EVALUATE AFTER EVERY EPOCH).
+        SUBSAMPLE : INT
+            NUMBER OF VALIDATION SAMPLES SCORED (NONE FOR ALL OF THEM).
+        PATIENCE : INT
+            NUMBER OF EVALUATIONS WITHOUT IMPROVEMENT BEFORE TRAINING STOPS.
+        MIN_DELTA : FLOAT
+            MINIMUM CHANGE OF THE SCORE THAT COUNTS AS AN IMPROVEMENT.
+        METRIC : FUNCTION
+            METRIC OF THE SCORE (NONE FOR THE METRIC OF THE NETWORK).
+        MAXIMIZE : BOOL
+            WHETHER HIGHER SCORES ARE BETTER (NONE TO DECIDE FROM THE METRIC).
+        RESTORE_BEST : BOOL
+            WHETHER TO RESTORE THE PARAMETERS OF THE BEST SCORE AT THE END.
+        SEED : INT
+            SEED OF THE RANDOM NUMBER GENERATOR THAT DRAWS THE SUBSAMPLE.
+
+        RETURNS
+        -------
+        NONE
+        """
+        X = np.asarray(X)  # CONVERT FEATURES
+        Y = np.asarray(Y)  # CONVERT TARGETS
+        assert len(X) == len(Y), "X AND Y MUST HAVE THE SAME LENGTH"  # CHECK VALIDATION SET
+        assert len(X) > 0, "THE VALIDATION SET CANNOT BE EMPTY"  # CHECK VALIDATION SET
+        assert PATIENCE > 0, "PATIENCE MUST BE POSITIVE"  # CHECK PATIENCE
+        assert EVERY_STEPS is None or EVERY_STEPS > 0, "EVERY_STEPS MUST BE POSITIVE"  # CHECK SCHEDULE
+        if Y.ndim == 1:  # IF THE TARGETS ARE A 1D ARRAY
+            Y = Y[:, np.newaxis]  # ADD AXIS, AS FIT DOES
+        if SUBSAMPLE is not None and SUBSAMPLE < len(X):  # IF ONLY PART OF THE VALIDATION SET IS SCORED
+            INDICES = np.sort(np.random.default_rng(SEED).choice(len(X), SUBSAMPLE, replace=False))  # DRAW SUBSAMPLE ONCE
+            X, Y = X[INDICES], Y[INDICES]  # KEEP SUBSAMPLE
+        self.X = X  # VALIDATION FEATURES
+        self.Y = Y  # VALIDATION TARGETS
+        self.EVERY_STEPS = EVERY_STEPS  # BATCHES BETWEEN EVALUATIONS
+        self.PATIENCE = PATIENCE  # EVALUATIONS WITHOUT IMPROVEMENT BEFORE STOPPING
+        self.MIN_DELTA = MIN_DELTA  # MINIMUM IMPROVEMENT
+        self.METRIC = METRIC  # METRIC OF THE SCORE
+        self.MAXIMIZE = MAXIMIZE  # WHETHER HIGHER SCORES ARE BETTER
+        self.RESTORE_BEST = RESTORE_BEST  # WHETHER TO RESTORE THE BEST PARAMETERS
+        self.STEPS = 0  # BATCHES SINCE THE LAST EVALUATION
+        self.BEST = None  # BEST SCORE
+        self.WAIT = 0  # EVALUATIONS SINCE THE BEST SCORE
+        self.HISTORY = []  # SCORES
+        self.BEST_WEIGHTS = None  # PARAMETERS OF THE BEST SCORE
+
+    def ON_TRAIN_BEGIN(self, NETWORK):
+        """FORGET THE SCORES OF EARLIER CALLS TO FIT
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.STEPS = 0  # RESTART BATCH COUNT
+        self.BEST = None  # FORGET BEST SCORE
+        self.WAIT = 0  # RESTART WAIT
+        self.HISTORY = []  # FORGET SCORES
+
+    def ON_BATCH_END(self, NETWORK, LOSS):
+        """EVALUATE IF EVERY_STEPS BATCHES HAVE PASSED
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        LOSS : FLOAT
+            LOSS OF THE BATCH
+
+        RETURNS
+        -------
+        NONE
+        """
+        if self.EVERY_STEPS is not None:  # IF EVALUATIONS ARE COUNTED IN BATCHES
+            self.STEPS += 1  # COUNT BATCH
+            if self.STEPS >= self.EVERY_STEPS:  # IF AN EVALUATION IS DUE
+                self.STEPS = 0  # RESTART BATCH COUNT
+                self.EVALUATE(NETWORK)  # EVALUATE
+
+    def ON_EPOCH_END(self, NETWORK, LOSS):
+        """EVALUATE IF EVALUATIONS ARE COUNTED IN EPOCHS
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        LOSS : FLOAT
+            MEAN LOSS OF THE EPOCH
+
+        RETURNS
+        -------
+        NONE
+        """
+        if self.EVERY_STEPS is None:  # IF EVALUATIONS ARE COUNTED IN EPOCHS
+            self.EVALUATE(NETWORK)  # EVALUATE
+
+    def ON_TRAIN_END(self, NETWORK):
+        """RESTORE THE PARAMETERS OF THE BEST SCORE
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            TRAINED NETWORK
+
+        RETURNS
+        -------
+        NONE
+        """
+        if self.RESTORE_BEST and self.WAIT > 0 and self.BEST_WEIGHTS is not None:  # IF THE LAST SCORE IS NOT THE BEST
+            for TARGET, NAME, WEIGHTS in self.BEST_WEIGHTS:  # LOOP OVER COPIES
+                if NAME in LEARNED_STATE:  # IF THE COPY IS LAYER STATE
+                    setattr(TARGET, NAME, WEIGHTS.copy())  # RESTORE STATE
+                else:  # OTHERWISE
+                    TARGET[NAME][...] = WEIGHTS  # RESTORE PARAMETERS IN PLACE
+            NETWORK.RESET_STAGE_CACHES()  # DROP WEIGHTS CACHED BY FUSED BLOCKS
+
+    def EVALUATE(self, NETWORK):
+        """SCORE THE NETWORK AND STOP TRAINING IF IT HAS NOT IMPROVED FOR PATIENCE EVALUATIONS
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+
+        RETURNS
+        -------
+        FLOAT
+            SCORE ON THE VALIDATION SET
+        """
+        METRIC = self.METRIC if self.METRIC is not None else NETWORK.METRIC  # METRIC OF THE SCORE
+        MAXIMIZE = self.MAXIMIZE if self.MAXIMIZE is not None else METRIC in MAXIMIZED  # DIRECTION OF THE SCORE
+        CARRIED = [(LAYER, NAME, getattr(LAYER, NAME)) for LAYER in NETWORK.LAYERS
+                   for NAME in RECURRENT_STATE if getattr(LAYER, NAME, None) is not None]  # STATE CARRIED BY TRAINING
+        TRAINING = NETWORK.IS_TRAINING  # PHASE OF THE NETWORK
+        NETWORK.IS_TRAINING = False  # SCORE IN THE TESTING PHASE
+        NETWORK.RESET_STATES()  # SCORE THE SEQUENCES FROM A ZERO STATE
+        try:
+            SCORE = float(METRIC(self.Y, NETWORK.PREDICT(self.X)))  # SCORE ON THE VALIDATION SET
+        finally:
+            NETWORK.IS_TRAINING = TRAINING  # RESTORE PHASE
+            for LAYER, NAME, STATE in CARRIED:  # LOOP OVER CARRIED STATE
+                setattr(LAYER, NAME, STATE)  # RESTORE STATE, SO TRAINING IS NOT DISTURBED
+        self.HISTORY.append(SCORE)  # RECORD SCORE
+        if self.BEST is None or (SCORE - self.BEST if MAXIMIZE else self.BEST - SCORE) > self.MIN_DELTA:  # IF THE SCORE IMPROVED
+            self.BEST = SCORE  # RECORD BEST SCORE
+            self.WAIT = 0  # RESTART WAIT
+            if self.RESTORE_BEST:  # IF THE BEST PARAMETERS ARE RESTORED AT THE END
+                self.__COPY_WEIGHTS__(NETWORK)  # COPY PARAMETERS
+        else:  # OTHERWISE
+            self.WAIT += 1  # COUNT EVALUATION WITHOUT IMPROVEMENT
+            if self.WAIT >= self.PATIENCE:  # IF THE SCORE HAS PLATEAUED
+                NETWORK.STOP_TRAINING = True  # STOP TRAINING
+        return SCORE  # RETURN SCORE
+
+    def __COPY_WEIGHTS__(self, NETWORK):
+        """COPY THE PARAMETERS AND LAYER STATE, REUSING THE COPIES OF THE LAST BEST SCORE
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+
+        RETURNS
+        -------
+        NONE
+        """
+        SOURCES = []  # (OBJECT, NAME) OF EVERY ARRAY TO COPY
+        if NETWORK.ARENA is not None:  # IF THE PARAMETERS ARE FLAT
+            SOURCES.append((NETWORK.ARENA, NETWORK.ARENA.KEY))  # COPY ALL PARAMETERS AT ONCE
+        else:  # OTHERWISE
+            PARAMETERS = []  # UNIQUE PARAMETER OBJECTS
+            for P in NETWORK.PARAMETERS:  # LOOP OVER PARAMETER OBJECTS
+                if not any(P is Q for Q in PARAMETERS):  # IF NOT ALREADY COPIED (LAYERS MAY SHARE PARAMETERS)
+                    PARAMETERS.append(P)  # KEEP PARAMETER OBJECT
+                    SOURCES.extend((P, NAME) for NAME in P.KEYS())  # COPY ITS PARAMETERS
+        for LAYER in NETWORK.LAYERS:  # LOOP OVER LAYERS
+            SOURCES.extend((LAYER, NAME) for NAME in LEARNED_STATE if getattr(LAYER, NAME, None) is not None)  # COPY LEARNED STATE
+        OLD = self.BEST_WEIGHTS or []  # COPIES OF THE LAST BEST SCORE
+        COPIES = []  # NEW COPIES
+        for INDEX, (SOURCE, NAME) in enumerate(SOURCES):  # LOOP OVER ARRAYS
+            VALUE = getattr(SOURCE, NAME) if NAME in LEARNED_STATE else SOURCE[NAME]  # ARRAY TO COPY
+            if INDEX < len(OLD) and OLD[INDEX][0] is SOURCE and OLD[INDEX][2].shape == np.shape(VALUE):  # IF THE OLD COPY FITS
+                np.copyto(OLD[INDEX][2], VALUE)  # COPY INTO IT
+                COPIES.append(OLD[INDEX])  # KEEP IT
+            else:  # OTHERWISE
+                COPIES.append((SOURCE, NAME, np.array(VALUE)))  # ALLOCATE A NEW COPY
+        self.BEST_WEIGHTS = COPIES  # KEEP COPIES
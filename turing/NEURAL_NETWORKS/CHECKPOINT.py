@@ -0,0 +1,824 @@
+import json
+import os
+import threading
+import time
+import numpy as np
+
+from .CALLBACKS import CALLBACK
+from .LAYERS.NORMALIZATION import LEARNED_STATE
+
+FORMAT = "TURING-CHECKPOINT"  # NAME OF THE FORMAT, STORED IN EVERY MANIFEST
+VERSION = 1  # VERSION OF THE FORMAT WRITTEN BY SAVE (LOAD READS THIS VERSION AND OLDER ONES)
+ALIGNMENT = 64  # BYTE ALIGNMENT OF EVERY ARRAY IN THE BLOB (ONE CACHE LINE)
+MANIFEST = "MANIFEST.json"  # NAME OF THE MANIFEST IN A CHECKPOINT DIRECTORY
+# SCALAR OPTIMIZER STATE STORED IN THE MANIFEST
+OPTIMIZER_COUNTERS = ("ITERATION", "T")
+# OPTIMIZER ARRAYS THAT ONLY HOLD SCRATCH VALUES WITHIN A STEP AND ARE NOT SAVED
+OPTIMIZER_SCRATCH = ("BUFFER", "SECOND_BUFFER")
+
+
+class CHECKPOINT_WRITER:
+    """WRITE ARRAYS TO A CHECKPOINT ONE AT A TIME
+
+    A CHECKPOINT IS A DIRECTORY WITH A BINARY BLOB AND A JSON MANIFEST. THE
+    ARRAYS ARE STREAMED INTO THE BLOB AS THEY ARE WRITTEN, EACH STARTING AT A
+    MULTIPLE OF ALIGNMENT BYTES, SO NO COPY OF THE WHOLE CHECKPOINT IS EVER
+    HELD IN MEMORY. THE MANIFEST RECORDS THE NAME, SHAPE, DTYPE AND OFFSET OF
+    EVERY ARRAY. CLOSE WRITES THE MANIFEST LAST AND SWAPS IT IN ATOMICALLY, SO
+    A READER SEES EITHER THE OLD CHECKPOINT OR THE NEW ONE, NEVER HALF OF ONE.
+
+    PARAMETERS
+    ----------
+    PATH : STRING
+        DIRECTORY OF THE CHECKPOINT (CREATED IF IT DOES NOT EXIST).
+
+    ATTRIBUTES
+    ----------
+    ARRAYS : LIST
+        MANIFEST ENTRIES OF THE ARRAYS WRITTEN SO FAR.
+    OFFSET : INT
+        SIZE OF THE BLOB SO FAR.
+
+    METHODS
+    -------
+    WRITE(NAME, ARRAY)
+        APPEND AN ARRAY TO THE BLOB.
+    ALIAS(NAME, SHAPE, DTYPE, BASE, START)
+        NAME AN ARRAY STORED INSIDE AN ARRAY ALREADY WRITTEN.
+    CLOSE(STATE)
+        WRITE THE MANIFEST AND PUBLISH THE CHECKPOINT.
+    ABORT()
+        DISCARD EVERYTHING WRITTEN.
+    """
+
+    def __init__(self, PATH):
+        """OPEN A NEW BLOB IN THE CHECKPOINT DIRECTORY
+
+        PARAMETERS
+        ----------
+        PATH : STRING
+            DIRECTORY OF THE CHECKPOINT.
+
+        RETURNS
+        -------
+        NONE
+        """
+        os.makedirs(PATH, exist_ok=True)  # CREATE DIRECTORY
+        self.PATH = PATH  # DIRECTORY OF THE CHECKPOINT
+        # A NEW NAME FOR EVERY SAVE, SO THE BLOB OF THE PUBLISHED CHECKPOINT IS NEVER OVERWRITTEN
+        self.BLOB = "DATA-%s.bin" % os.urandom(8).hex()
+        self.FILE = open(os.path.join(PATH, self.BLOB), "wb")  # BLOB BEING WRITTEN
+        self.ARRAYS = []  # MANIFEST ENTRIES
+        self.OFFSETS = {}  # OFFSET OF EVERY ARRAY WRITTEN
+        self.OFFSET = 0  # SIZE OF THE BLOB
+
+    def WRITE(self, NAME, ARRAY):
+        """APPEND AN ARRAY TO THE BLOB
+
+        PARAMETERS
+        ----------
+        NAME : STRING
+            NAME OF THE ARRAY.
+        ARRAY : NUMPY ARRAY
+            ARRAY TO WRITE.
+
+        RETURNS
+        -------
+        NONE
+        """
+        ARRAY = np.ascontiguousarray(ARRAY)  # BYTES IN C ORDER (NOT COPIED IF THEY ALREADY ARE)
+        PADDING = -self.OFFSET % ALIGNMENT  # BYTES UP TO THE NEXT ALIGNED OFFSET
+        self.FILE.write(bytes(PADDING))  # PAD BLOB
+        self.OFFSET += PADDING  # MOVE TO THE ALIGNED OFFSET
+        self.OFFSETS[NAME] = self.OFFSET  # OFFSET OF THE ARRAY
+        self.FILE.write(ARRAY.reshape(-1).view(np.uint8))  # WRITE THE BYTES OF THE ARRAY
+        self.OFFSET += ARRAY.nbytes  # MOVE PAST THE ARRAY
+        self.ALIAS(NAME, ARRAY.shape, ARRAY.dtype, NAME, 0)  # RECORD ARRAY
+
+    def ALIAS(self, NAME, SHAPE, DTYPE, BASE, START):
+        """NAME AN ARRAY STORED INSIDE AN ARRAY ALREADY WRITTEN
+
+        PARAMETERS
+        ----------
+        NAME : STRING
+            NAME OF THE ARRAY.
+        SHAPE : TUPLE
+            SHAPE OF THE ARRAY.
+        DTYPE : NUMPY DTYPE
+            DTYPE OF THE ARRAY.
+        BASE : STRING
+            NAME OF THE ARRAY WRITTEN THAT HOLDS IT.
+        START : INT
+            OFFSET OF THE ARRAY IN BASE, IN BYTES (A MULTIPLE OF THE ITEMSIZE OF DTYPE).
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.ARRAYS.append({"NAME": NAME, "SHAPE": [int(N) for N in SHAPE], "DTYPE": np.dtype(DTYPE).str,
+                            "OFFSET": self.OFFSETS[BASE] + int(START)})  # RECORD ARRAY
+
+    def CLOSE(self, STATE=None):
+        """WRITE THE MANIFEST AND PUBLISH THE CHECKPOINT
+
+        PARAMETERS
+        ----------
+        STATE : DICT
+            SCALAR STATE STORED IN THE MANIFEST (MUST BE JSON SERIALIZABLE).
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.FILE.flush()  # FLUSH BLOB
+        os.fsync(self.FILE.fileno())  # MAKE SURE THE BLOB IS ON DISK BEFORE THE MANIFEST POINTS TO IT
+        self.FILE.close()  # CLOSE BLOB
+        PATH = os.path.join(self.PATH, MANIFEST)  # PATH OF THE MANIFEST
+        OLD = READ_MANIFEST(self.PATH)["BLOB"] if os.path.exists(PATH) else None  # BLOB OF THE CHECKPOINT BEING REPLACED
+        with open(PATH + ".tmp", "w") as FILE:  # WRITE THE NEW MANIFEST NEXT TO THE OLD ONE
+            json.dump({"FORMAT": FORMAT, "VERSION": VERSION, "ALIGNMENT": ALIGNMENT, "BLOB": self.BLOB,
+                       "SIZE": self.OFFSET, "ARRAYS": self.ARRAYS, "STATE": STATE or {}}, FILE, indent=1)  # WRITE MANIFEST
+            FILE.flush()  # FLUSH MANIFEST
+            os.fsync(FILE.fileno())  # MAKE SURE THE MANIFEST IS ON DISK
+        os.replace(PATH + ".tmp", PATH)  # PUBLISH THE CHECKPOINT ATOMICALLY
+        if OLD is not None and OLD != self.BLOB:  # IF A CHECKPOINT WAS REPLACED
+            # REMOVE ITS BLOB (PROCESSES THAT STILL MAP IT KEEP THEIR PAGES UNTIL THEY UNMAP IT)
+            os.remove(os.path.join(self.PATH, OLD))
+
+    def ABORT(self):
+        """DISCARD EVERYTHING WRITTEN
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.FILE.close()  # CLOSE BLOB
+        os.remove(os.path.join(self.PATH, self.BLOB))  # REMOVE BLOB
+
+
+def READ_MANIFEST(PATH):
+    """READ AND CHECK THE MANIFEST OF A CHECKPOINT
+
+    PARAMETERS
+    ----------
+    PATH : STRING
+        DIRECTORY OF THE CHECKPOINT.
+
+    RETURNS
+    -------
+    DICT
+        MANIFEST
+    """
+    with open(os.path.join(PATH, MANIFEST)) as FILE:  # OPEN MANIFEST
+        HEADER = json.load(FILE)  # READ MANIFEST
+    if HEADER.get("FORMAT") != FORMAT:  # IF THE DIRECTORY HOLDS SOMETHING ELSE
+        raise ValueError("NOT A CHECKPOINT: " + PATH)  # RAISE A VALUE ERROR
+    if HEADER["VERSION"] > VERSION:  # IF THE CHECKPOINT WAS WRITTEN BY A NEWER VERSION
+        raise ValueError("CHECKPOINT VERSION %d IS NOT SUPPORTED (LATEST IS %d)" % (HEADER["VERSION"], VERSION))
+    return HEADER  # RETURN MANIFEST
+
+
+def OPEN(PATH, MMAP=True):
+    """MAP THE ARRAYS OF A CHECKPOINT
+
+    WITH MMAP, THE BLOB IS MAPPED COPY-ON-WRITE: NOTHING IS READ UNTIL AN
+    ARRAY IS TOUCHED, PROCESSES MAPPING THE SAME CHECKPOINT SHARE ITS PAGES
+    THROUGH THE PAGE CACHE, AND WRITING TO AN ARRAY NEVER CHANGES THE FILE.
+
+    PARAMETERS
+    ----------
+    PATH : STRING
+        DIRECTORY OF THE CHECKPOINT.
+    MMAP : BOOL
+        WHETHER TO MAP THE BLOB INSTEAD OF READING IT INTO MEMORY.
+
+    RETURNS
+    -------
+    HEADER : DICT
+        MANIFEST
+    ARRAYS : DICT
+        VIEW INTO THE BLOB OF EVERY ARRAY, BY NAME
+    """
+    HEADER = READ_MANIFEST(PATH)  # READ MANIFEST
+    FILE = os.path.join(PATH, HEADER["BLOB"])  # PATH OF THE BLOB
+    if HEADER["SIZE"] == 0:  # IF THE CHECKPOINT HOLDS NO ARRAYS (AN EMPTY FILE CANNOT BE MAPPED)
+        BLOB = np.zeros(0, dtype=np.uint8)  # EMPTY BLOB
+    elif MMAP:  # IF THE BLOB IS MAPPED
+        BLOB = np.asarray(np.memmap(FILE, dtype=np.uint8, mode="c", shape=(HEADER["SIZE"],)))  # MAP BLOB
+    else:  # OTHERWISE
+        BLOB = np.fromfile(FILE, dtype=np.uint8, count=HEADER["SIZE"])  # READ BLOB
+    ARRAYS = {}  # VIEWS OF THE ARRAYS
+    for ENTRY in HEADER["ARRAYS"]:  # LOOP OVER ARRAYS
+        DTYPE = np.dtype(ENTRY["DTYPE"])  # DTYPE OF THE ARRAY
+        SHAPE = tuple(ENTRY["SHAPE"])  # SHAPE OF THE ARRAY
+        START = ENTRY["OFFSET"]  # FIRST BYTE OF THE ARRAY
+        STOP = START + int(np.prod(SHAPE)) * DTYPE.itemsize  # END OF THE ARRAY
+        ARRAYS[ENTRY["NAME"]] = BLOB[START:STOP].view(DTYPE).reshape(SHAPE)  # VIEW ARRAY
+    return HEADER, ARRAYS  # RETURN MANIFEST AND ARRAYS
+
+
+def __OWNERS__(NETWORK):
+    """NAME THE PARAMETER OBJECTS OF A NETWORK
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        NETWORK
+
+    RETURNS
+    -------
+    LIST
+        (PREFIX, PARAMETER) FOR EVERY PARAMETER OBJECT, NAMED AFTER THE FIRST LAYER USING IT
+    """
+    OWNERS = []  # NAMED PARAMETER OBJECTS
+    for INDEX, LAYER in enumerate(NETWORK.LAYERS):  # LOOP OVER LAYERS
+        if hasattr(LAYER, "PARAMETERS") and not any(LAYER.PARAMETERS is P for _, P in OWNERS):  # IF NOT NAMED YET (LAYERS MAY SHARE PARAMETERS)
+            OWNERS.append(("LAYERS/%d/" % INDEX, LAYER.PARAMETERS))  # NAME PARAMETER OBJECT
+    return OWNERS  # RETURN NAMED PARAMETER OBJECTS
+
+
+def __GROUP_KEYS__(NETWORK):
+    """NAME THE ARRAYS OF THE PARAMETER GROUPS UPDATED BY THE OPTIMIZER
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        NETWORK (SET UP)
+
+    RETURNS
+    -------
+    DICT
+        NAMES IN THE CHECKPOINT OF EVERY (GROUP, NAME) ARRAY, PREFERRED NAME FIRST
+    """
+    if NETWORK.ARENA is not None:  # IF THE PARAMETERS ARE FLAT
+        return {(0, NETWORK.ARENA.KEY): [NETWORK.ARENA.KEY]}  # ONE GROUP WITH ONE ARRAY
+    PREFIXES = {id(P): PREFIX for PREFIX, P in __OWNERS__(NETWORK)}  # NAME OF EVERY PARAMETER OBJECT
+    LAYERS = [(INDEX, LAYER) for INDEX, LAYER in enumerate(NETWORK.LAYERS) if hasattr(LAYER, "PARAMETERS")]  # ONE GROUP PER PARAMETRIC LAYER
+    KEYS = {}  # NAMES OF THE ARRAYS
+    for GROUP, (INDEX, LAYER) in enumerate(LAYERS):  # LOOP OVER GROUPS
+        for NAME in LAYER.PARAMETERS.KEYS():  # LOOP OVER PARAMETERS
+            # NAMED AFTER THE LAYER, OR AFTER THE FIRST LAYER USING THE SAME PARAMETERS IF SAVED FROM AN ARENA
+            KEYS[(GROUP, NAME)] = ["LAYERS/%d/%s" % (INDEX, NAME), PREFIXES[id(LAYER.PARAMETERS)] + NAME]
+    return KEYS  # RETURN NAMES
+
+
+def __ALIAS_SLICES__(WRITER, ARENA, PREFIXES, PREFIX, BASE):
+    """NAME EVERY PARAMETER OF AN ARENA-SHAPED ARRAY ALREADY WRITTEN
+
+    PARAMETERS
+    ----------
+    WRITER : CHECKPOINT_WRITER
+        CHECKPOINT BEING WRITTEN
+    ARENA : PARAMETER_ARENA
+        ARENA
+    PREFIXES : DICT
+        NAME OF EVERY PARAMETER OBJECT, BY ID
+    PREFIX : STRING
+        PREFIX OF THE NAMES
+    BASE : STRING
+        NAME OF THE ARRAY
+
+    RETURNS
+    -------
+    NONE
+    """
+    for P, NAME, START, _ in ARENA.SLICES:  # LOOP OVER SLICES
+        WRITER.ALIAS(PREFIX + PREFIXES[id(P)] + NAME, P[NAME].shape, ARENA.DATA.dtype,
+                     BASE, START * ARENA.DATA.itemsize)  # NAME SLICE
+
+
+def __RECORD__(NETWORK, WRITER):
+    """WRITE THE ARRAYS OF A NETWORK AND COLLECT ITS SCALAR STATE
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        NETWORK (SET UP)
+    WRITER : CHECKPOINT_WRITER OR CHECKPOINT_SNAPSHOT
+        DESTINATION OF THE ARRAYS
+
+    RETURNS
+    -------
+    DICT
+        SCALAR STATE FOR THE MANIFEST
+    """
+    OWNERS = __OWNERS__(NETWORK)  # NAMED PARAMETER OBJECTS
+    PREFIXES = {id(P): PREFIX for PREFIX, P in OWNERS}  # NAME OF EVERY PARAMETER OBJECT
+    ARENA = NETWORK.ARENA  # FLAT PARAMETERS
+    if ARENA is not None:  # IF THE PARAMETERS ARE FLAT
+        WRITER.WRITE(ARENA.KEY, ARENA.DATA)  # WRITE ALL PARAMETERS AT ONCE
+        __ALIAS_SLICES__(WRITER, ARENA, PREFIXES, "", ARENA.KEY)  # NAME EVERY PARAMETER
+    else:  # OTHERWISE
+        for PREFIX, P in OWNERS:  # LOOP OVER PARAMETER OBJECTS
+            for NAME in P.KEYS():  # LOOP OVER PARAMETERS
+                WRITER.WRITE(PREFIX + NAME, P[NAME])  # WRITE PARAMETER
+    for INDEX, LAYER in enumerate(NETWORK.LAYERS):  # LOOP OVER LAYERS
+        for NAME in LEARNED_STATE:  # LOOP OVER LEARNED LAYER STATE
+            if getattr(LAYER, NAME, None) is not None:  # IF THE LAYER HAS THE STATE
+                WRITER.WRITE("LAYERS/%d/%s" % (INDEX, NAME), getattr(LAYER, NAME))  # WRITE STATE
+    STATE = {"INPUT_SHAPE": NETWORK.INPUT_SHAPE}  # SCALAR STATE
+    OPTIMIZER = NETWORK.OPTIMIZER  # OPTIMIZER
+    if OPTIMIZER is not None:  # IF THE NETWORK HAS AN OPTIMIZER
+        STATE["OPTIMIZER"] = {"CLASS": type(OPTIMIZER).__name__}  # CLASS OF THE OPTIMIZER
+        KEYS = __GROUP_KEYS__(NETWORK)  # NAMES OF THE ARRAYS OF THE PARAMETER GROUPS
+        for ATTRIBUTE, VALUE in sorted(vars(OPTIMIZER).items()):  # LOOP OVER ATTRIBUTES
+            if ATTRIBUTE in OPTIMIZER_COUNTERS:  # IF THE ATTRIBUTE IS A COUNTER
+                STATE["OPTIMIZER"][ATTRIBUTE] = int(VALUE)  # STORE COUNTER
+            elif isinstance(VALUE, dict) and ATTRIBUTE not in OPTIMIZER_SCRATCH:  # IF THE ATTRIBUTE HOLDS PER-PARAMETER STATE
+                PREFIX = "OPTIMIZER/%s/" % ATTRIBUTE  # PREFIX OF THE NAMES
+                for GROUP, ARRAYS in sorted(VALUE.items()):  # LOOP OVER PARAMETER GROUPS
+                    for NAME, ARRAY in ARRAYS.items():  # LOOP OVER PARAMETERS
+                        WRITER.WRITE(PREFIX + KEYS[(GROUP, NAME)][0], ARRAY)  # WRITE STATE
+                        if ARENA is not None:  # IF THE STATE IS FLAT
+                            __ALIAS_SLICES__(WRITER, ARENA, PREFIXES, PREFIX, PREFIX + ARENA.KEY)  # NAME THE STATE OF EVERY PARAMETER
+    if NETWORK.PRECISION is not None:  # IF THE NETWORK HAS A PRECISION POLICY
+        STATE["PRECISION"] = {"LOSS_SCALE": NETWORK.PRECISION.LOSS_SCALE,
+                              "CLEAN_STEPS": NETWORK.PRECISION.CLEAN_STEPS}  # STORE LOSS SCALE
+    if NETWORK.INDICES is not None:  # IF THE TRAINING DATA IS SHUFFLED
+        WRITER.WRITE("INDICES", NETWORK.INDICES)  # WRITE ORDER OF THE CURRENT EPOCH
+    STATE["PROGRESS"] = {"EPOCH": NETWORK.EPOCH, "BATCH": NETWORK.BATCH, "STOPPED": NETWORK.STOP_TRAINING,
+                         "RANDOM": NETWORK.RANDOM.bit_generator.state}  # STORE TRAINING PROGRESS
+    return STATE  # RETURN SCALAR STATE
+
+
+def SAVE(NETWORK, PATH):
+    """SAVE A NETWORK TO A CHECKPOINT
+
+    THE CHECKPOINT HOLDS THE PARAMETERS, THE RUNNING STATISTICS OF THE
+    BATCH NORMALIZATIONS, THE STATE OF THE OPTIMIZER, THE LOSS SCALE OF THE
+    PRECISION POLICY AND THE PROGRESS OF TRAINING. EVERY ARRAY IS NAMED AFTER
+    THE LAYER IT BELONGS TO. IF THE PARAMETERS ARE FLAT, THE ARENA (AND EVERY
+    OPTIMIZER ARRAY SHAPED LIKE IT) IS WRITTEN AS ONE ARRAY AND EVERY
+    PARAMETER IS NAMED AS A SLICE OF IT, SO A CHECKPOINT LOADS WHETHER OR NOT
+    THE PARAMETERS ARE FLAT.
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        NETWORK (SET UP)
+    PATH : STRING
+        DIRECTORY OF THE CHECKPOINT (AN EXISTING CHECKPOINT IS REPLACED).
+
+    RETURNS
+    -------
+    NONE
+    """
+    assert NETWORK.__INITIALIZED__, "THE NETWORK MUST BE SET UP BEFORE IT IS SAVED"  # CHECK NETWORK
+    WRITER = CHECKPOINT_WRITER(PATH)  # OPEN CHECKPOINT
+    try:
+        STATE = __RECORD__(NETWORK, WRITER)  # WRITE ARRAYS
+    except BaseException:  # IF WRITING FAILED
+        WRITER.ABORT()  # DISCARD THE PARTIAL BLOB
+        raise  # RAISE THE ERROR AGAIN
+    WRITER.CLOSE(STATE)  # PUBLISH CHECKPOINT
+
+
+class CHECKPOINT_SNAPSHOT:
+    """COPY OF A CHECKPOINT, TAKEN NOW AND WRITTEN LATER
+
+    COPIES EVERY ARRAY OF THE CHECKPOINT OF A NETWORK (ONE COPY OF THE WHOLE
+    ARENA IF THE PARAMETERS ARE FLAT), SO TRAINING CAN GO ON WHILE ANOTHER
+    THREAD WRITES THE SNAPSHOT.
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        NETWORK (SET UP)
+
+    ATTRIBUTES
+    ----------
+    CALLS : LIST
+        (METHOD, ARGUMENTS) OF EVERY CALL TO REPLAY ON A CHECKPOINT_WRITER.
+    STATE : DICT
+        SCALAR STATE FOR THE MANIFEST.
+
+    METHODS
+    -------
+    WRITE(NAME, ARRAY)
+        COPY AN ARRAY.
+    ALIAS(NAME, SHAPE, DTYPE, BASE, START)
+        NAME AN ARRAY STORED INSIDE AN ARRAY ALREADY COPIED.
+    SAVE(PATH)
+        WRITE THE SNAPSHOT TO A CHECKPOINT.
+    """
+
+    def __init__(self, NETWORK):
+        """COPY THE CHECKPOINT OF A NETWORK
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK (SET UP)
+
+        RETURNS
+        -------
+        NONE
+        """
+        assert NETWORK.__INITIALIZED__, "THE NETWORK MUST BE SET UP BEFORE IT IS SAVED"  # CHECK NETWORK
+        self.CALLS = []  # CALLS TO REPLAY
+        self.STATE = json.loads(json.dumps(__RECORD__(NETWORK, self)))  # COPY ARRAYS AND SCALAR STATE
+
+    def WRITE(self, NAME, ARRAY):
+        """COPY AN ARRAY
+
+        PARAMETERS
+        ----------
+        NAME : STRING
+            NAME OF THE ARRAY.
+        ARRAY : NUMPY ARRAY
+            ARRAY TO COPY.
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.CALLS.append(("WRITE", (NAME, np.array(ARRAY))))  # COPY ARRAY
+
+    def ALIAS(self, NAME, SHAPE, DTYPE, BASE, START):
+        """NAME AN ARRAY STORED INSIDE AN ARRAY ALREADY COPIED
+
+        PARAMETERS
+        ----------
+        NAME : STRING
+            NAME OF THE ARRAY.
+        SHAPE : TUPLE
+            SHAPE OF THE ARRAY.
+        DTYPE : NUMPY DTYPE
+            DTYPE OF THE ARRAY.
+        BASE : STRING
+            NAME OF THE ARRAY COPIED THAT HOLDS IT.
+        START : INT
+            OFFSET OF THE ARRAY IN BASE, IN BYTES.
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.CALLS.append(("ALIAS", (NAME, SHAPE, DTYPE, BASE, START)))  # RECORD ALIAS
+
+    def SAVE(self, PATH):
+        """WRITE THE SNAPSHOT TO A CHECKPOINT
+
+        PARAMETERS
+        ----------
+        PATH : STRING
+            DIRECTORY OF THE CHECKPOINT (AN EXISTING CHECKPOINT IS REPLACED).
+
+        RETURNS
+        -------
+        NONE
+        """
+        WRITER = CHECKPOINT_WRITER(PATH)  # OPEN CHECKPOINT
+        try:
+            for METHOD, ARGUMENTS in self.CALLS:  # LOOP OVER CALLS
+                getattr(WRITER, METHOD)(*ARGUMENTS)  # REPLAY CALL
+        except BaseException:  # IF WRITING FAILED
+            WRITER.ABORT()  # DISCARD THE PARTIAL BLOB
+            raise  # RAISE THE ERROR AGAIN
+        WRITER.CLOSE(self.STATE)  # PUBLISH CHECKPOINT
+
+
+class CHECKPOINT_SCHEDULER(CALLBACK):
+    """WRITE CHECKPOINTS PERIODICALLY WHILE A NETWORK TRAINS
+
+    A CHECKPOINT IS DUE EVERY EVERY_STEPS BATCHES, EVERY EVERY_EPOCHS EPOCHS
+    OR EVERY EVERY_SECONDS SECONDS, WHICHEVER COMES FIRST. WHEN ONE IS DUE,
+    THE TRAINING THREAD ONLY TAKES A CHECKPOINT_SNAPSHOT (A MEMORY COPY) AND
+    A BACKGROUND THREAD WRITES IT. AT MOST ONE SNAPSHOT IS WRITTEN AT A TIME:
+    IF THE LAST ONE IS STILL BEING WRITTEN, THE CHECKPOINT STAYS DUE AND IS
+    TAKEN AFTER A LATER BATCH, SO TRAINING NEVER WAITS FOR THE DISK. AN ERROR
+    OF THE BACKGROUND THREAD IS RAISED ON THE TRAINING THREAD.
+
+    PASS THE SCHEDULER TO NEURAL_NETWORK.FIT, WHICH RUNS IT AFTER ITS OTHER
+    CALLBACKS. IF ITS DIRECTORY ALREADY HOLDS A CHECKPOINT, FIT RESUMES FROM IT.
+
+    PARAMETERS
+    ----------
+    PATH : STRING
+        DIRECTORY OF THE CHECKPOINT (REPLACED BY EVERY NEW CHECKPOINT).
+    EVERY_STEPS : INT
+        NUMBER OF BATCHES BETWEEN CHECKPOINTS (NONE FOR NO LIMIT).
+    EVERY_EPOCHS : INT
+        NUMBER OF EPOCHS BETWEEN CHECKPOINTS (NONE FOR NO LIMIT).
+    EVERY_SECONDS : FLOAT
+        NUMBER OF SECONDS BETWEEN CHECKPOINTS (NONE FOR NO LIMIT).
+
+    ATTRIBUTES
+    ----------
+    STEPS : INT
+        NUMBER OF BATCHES SINCE THE LAST CHECKPOINT.
+    EPOCHS : INT
+        NUMBER OF EPOCHS SINCE THE LAST CHECKPOINT.
+    TIME : FLOAT
+        TIME OF THE LAST CHECKPOINT.
+    THREAD : THREAD
+        THREAD WRITING THE LAST SNAPSHOT (NONE IF THERE IS NONE).
+    ERROR : EXCEPTION
+        ERROR OF THE BACKGROUND THREAD (NONE IF THERE IS NONE).
+
+    METHODS
+    -------
+    ON_TRAIN_BEGIN(NETWORK)
+        RESTART THE SCHEDULE.
+    ON_BATCH_END(NETWORK, LOSS)
+        COUNT A BATCH AND TAKE A CHECKPOINT IF ONE IS DUE.
+    ON_EPOCH_END(NETWORK, LOSS)
+        COUNT AN EPOCH AND TAKE A CHECKPOINT IF ONE IS DUE.
+    ON_TRAIN_END(NETWORK)
+        TAKE A LAST CHECKPOINT IF TRAINING WENT ON SINCE THE LAST ONE, AND WAIT FOR IT.
+    SNAPSHOT(NETWORK)
+        TAKE A CHECKPOINT NOW.
+    WAIT()
+        WAIT FOR THE SNAPSHOT BEING WRITTEN.
+
+    PROPERTIES
+    ----------
+    EXISTS
+        WHETHER THE DIRECTORY HOLDS A CHECKPOINT.
+    """
+
+    def __init__(self, PATH, EVERY_STEPS=None, EVERY_EPOCHS=1, EVERY_SECONDS=None):
+        """INITIALIZE THE SCHEDULER
+
+        PARAMETERS
+        ----------
+        PATH : STRING
+            DIRECTORY OF THE CHECKPOINT.
+        EVERY_STEPS : INT
+            NUMBER OF BATCHES BETWEEN CHECKPOINTS (NONE FOR NO LIMIT).
+        EVERY_EPOCHS : INT
+            NUMBER OF EPOCHS BETWEEN CHECKPOINTS (NONE FOR NO LIMIT).
+        EVERY_SECONDS : FLOAT
+            NUMBER OF SECONDS BETWEEN CHECKPOINTS (NONE FOR NO LIMIT).
+
+        RETURNS
+        -------
+        NONE
+        """
+        assert any(EVERY is not None and EVERY > 0 for EVERY in (EVERY_STEPS, EVERY_EPOCHS, EVERY_SECONDS)), \
+            "ONE OF EVERY_STEPS, EVERY_EPOCHS AND EVERY_SECONDS MUST BE POSITIVE"  # CHECK SCHEDULE
+        self.PATH = PATH  # DIRECTORY OF THE CHECKPOINT
+        self.EVERY_STEPS = EVERY_STEPS  # BATCHES BETWEEN CHECKPOINTS
+        self.EVERY_EPOCHS = EVERY_EPOCHS  # EPOCHS BETWEEN CHECKPOINTS
+        self.EVERY_SECONDS = EVERY_SECONDS  # SECONDS BETWEEN CHECKPOINTS
+        self.STEPS = 0  # BATCHES SINCE THE LAST CHECKPOINT
+        self.EPOCHS = 0  # EPOCHS SINCE THE LAST CHECKPOINT
+        self.TIME = time.monotonic()  # TIME OF THE LAST CHECKPOINT
+        self.THREAD = None  # THREAD WRITING THE LAST SNAPSHOT
+        self.ERROR = None  # ERROR OF THE BACKGROUND THREAD
+
+    def ON_TRAIN_BEGIN(self, NETWORK):
+        """RESTART THE SCHEDULE
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.STEPS = 0  # RESTART BATCH COUNT
+        self.EPOCHS = 0  # RESTART EPOCH COUNT
+        self.TIME = time.monotonic()  # RESTART CLOCK
+
+    def ON_BATCH_END(self, NETWORK, LOSS):
+        """COUNT A BATCH AND TAKE A CHECKPOINT IF ONE IS DUE
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        LOSS : FLOAT
+            LOSS OF THE BATCH
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.STEPS += 1  # COUNT BATCH
+        if (self.EVERY_STEPS and self.STEPS >= self.EVERY_STEPS) or \
+                (self.EVERY_SECONDS and time.monotonic() - self.TIME >= self.EVERY_SECONDS):  # IF A CHECKPOINT IS DUE
+            self.__TAKE__(NETWORK)  # TAKE CHECKPOINT UNLESS THE LAST ONE IS STILL BEING WRITTEN
+
+    def ON_EPOCH_END(self, NETWORK, LOSS):
+        """COUNT AN EPOCH AND TAKE A CHECKPOINT IF ONE IS DUE
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        LOSS : FLOAT
+            MEAN LOSS OF THE EPOCH
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.EPOCHS += 1  # COUNT EPOCH
+        if self.EVERY_EPOCHS and self.EPOCHS >= self.EVERY_EPOCHS:  # IF A CHECKPOINT IS DUE
+            self.__TAKE__(NETWORK)  # TAKE CHECKPOINT UNLESS THE LAST ONE IS STILL BEING WRITTEN
+
+    def __TAKE__(self, NETWORK):
+        """TAKE A CHECKPOINT UNLESS THE LAST ONE IS STILL BEING WRITTEN
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+
+        RETURNS
+        -------
+        NONE
+        """
+        if self.THREAD is not None and self.THREAD.is_alive():  # IF THE LAST SNAPSHOT IS STILL BEING WRITTEN
+            return  # STAY DUE AND TRY AGAIN AFTER THE NEXT BATCH
+        self.SNAPSHOT(NETWORK)  # TAKE CHECKPOINT
+
+    def SNAPSHOT(self, NETWORK):
+        """TAKE A CHECKPOINT NOW
+
+        COPIES THE STATE OF THE NETWORK AND WRITES IT IN THE BACKGROUND,
+        AFTER WAITING FOR THE SNAPSHOT BEING WRITTEN, IF ANY.
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.WAIT()  # WAIT FOR THE LAST SNAPSHOT AND RAISE ITS ERROR
+        SNAPSHOT = CHECKPOINT_SNAPSHOT(NETWORK)  # COPY STATE
+        self.STEPS = 0  # RESTART BATCH COUNT
+        self.EPOCHS = 0  # RESTART EPOCH COUNT
+        self.TIME = time.monotonic()  # RESTART CLOCK
+        self.THREAD = threading.Thread(target=self.__WRITE__, args=(SNAPSHOT,), daemon=True)  # WRITER THREAD
+        self.THREAD.start()  # WRITE SNAPSHOT IN THE BACKGROUND
+
+    def __WRITE__(self, SNAPSHOT):
+        """WRITE A SNAPSHOT (RUNS ON THE BACKGROUND THREAD)
+
+        PARAMETERS
+        ----------
+        SNAPSHOT : CHECKPOINT_SNAPSHOT
+            SNAPSHOT TO WRITE
+
+        RETURNS
+        -------
+        NONE
+        """
+        try:
+            SNAPSHOT.SAVE(self.PATH)  # WRITE SNAPSHOT
+        except BaseException as ERROR:  # IF WRITING FAILED
+            self.ERROR = ERROR  # KEEP ERROR FOR THE TRAINING THREAD
+
+    def ON_TRAIN_END(self, NETWORK):
+        """TAKE A LAST CHECKPOINT IF TRAINING WENT ON SINCE THE LAST ONE, AND WAIT FOR IT
+
+        A CALLBACK THAT STOPPED TRAINING MAY HAVE CHANGED THE NETWORK SINCE
+        (E.G. EARLY_STOPPING RESTORES THE BEST PARAMETERS), SO A LAST
+        CHECKPOINT IS ALWAYS TAKEN AFTER AN EARLY STOP.
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            TRAINED NETWORK
+
+        RETURNS
+        -------
+        NONE
+        """
+        if self.STEPS or self.EPOCHS or NETWORK.STOP_TRAINING:  # IF THE LAST CHECKPOINT IS OUT OF DATE
+            self.SNAPSHOT(NETWORK)  # TAKE CHECKPOINT
+        self.WAIT()  # WAIT FOR IT
+
+    def WAIT(self):
+        """WAIT FOR THE SNAPSHOT BEING WRITTEN
+
+        RETURNS
+        -------
+        NONE
+        """
+        if self.THREAD is not None:  # IF A SNAPSHOT WAS WRITTEN
+            self.THREAD.join()  # WAIT FOR IT
+            self.THREAD = None  # FORGET THREAD
+        if self.ERROR is not None:  # IF WRITING FAILED
+            ERROR, self.ERROR = self.ERROR, None  # TAKE ERROR
+            raise ERROR  # RAISE IT ON THE TRAINING THREAD
+
+    @property
+    def EXISTS(self):
+        """WHETHER THE DIRECTORY HOLDS A CHECKPOINT
+
+        RETURNS
+        -------
+        BOOL
+            TRUE IF A CHECKPOINT WAS WRITTEN TO PATH
+        """
+        return os.path.exists(os.path.join(self.PATH, MANIFEST))  # CHECK MANIFEST
+
+
+def LOAD(NETWORK, PATH, MMAP=True):
+    """LOAD A NETWORK FROM A CHECKPOINT
+
+    THE LAYERS OF THE NETWORK MUST MATCH THOSE OF THE SAVED NETWORK. IF THE
+    NETWORK IS NOT SET UP YET, IT IS SET UP FOR THE INPUT SHAPE OF THE SAVED
+    NETWORK. WITH MMAP, THE PARAMETERS (OR THE WHOLE ARENA) BECOME VIEWS INTO
+    THE MAPPED BLOB, SO LOADING READS NOTHING UP FRONT AND FORKED WORKERS AND
+    OTHER PROCESSES SERVING THE SAME CHECKPOINT SHARE ONE COPY OF THE WEIGHTS.
+    THE OPTIMIZER STATE IS RESTORED IF THE OPTIMIZER IS OF THE SAME CLASS.
+    THE PROGRESS OF TRAINING (EPOCH, BATCH, ORDER OF THE SAMPLES AND STATE
+    OF THE SHUFFLING GENERATOR) IS RESTORED AS WELL.
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        NETWORK
+    PATH : STRING
+        DIRECTORY OF THE CHECKPOINT.
+    MMAP : BOOL
+        WHETHER TO MAP THE PARAMETERS INSTEAD OF COPYING THEM INTO MEMORY.
+
+    RETURNS
+    -------
+    NONE
+    """
+    HEADER, ARRAYS = OPEN(PATH, MMAP)  # MAP CHECKPOINT
+    STATE = HEADER["STATE"]  # SCALAR STATE
+    if not NETWORK.__INITIALIZED__:  # IF THE NETWORK IS NOT SET UP
+        if STATE.get("INPUT_SHAPE") is None:  # IF THE INPUT SHAPE IS UNKNOWN
+            raise ValueError("THE CHECKPOINT HAS NO INPUT SHAPE, SET UP THE NETWORK BEFORE LOADING IT")
+        for PREFIX, P in __OWNERS__(NETWORK):  # LOOP OVER PARAMETER OBJECTS
+            for NAME, ARRAY in ARRAYS.items():  # LOOP OVER ARRAYS
+                KEY = NAME[len(PREFIX):]  # NAME OF THE PARAMETER
+                if NAME.startswith(PREFIX) and KEY not in LEARNED_STATE:  # IF THE ARRAY IS A PARAMETER OF THE OBJECT
+                    P[KEY] = ARRAY  # SET PARAMETER, SO SETTING UP THE LAYER DOES NOT INITIALIZE IT
+        NETWORK.__SETUP_LAYERS__(STATE["INPUT_SHAPE"])  # SET UP NETWORK
+    OWNERS = __OWNERS__(NETWORK)  # NAMED PARAMETER OBJECTS
+    for PREFIX, P in OWNERS:  # LOOP OVER PARAMETER OBJECTS
+        for NAME in P.KEYS():  # LOOP OVER PARAMETERS
+            if PREFIX + NAME not in ARRAYS or ARRAYS[PREFIX + NAME].shape != P[NAME].shape:  # IF THE PARAMETER DIFFERS
+                raise ValueError("CHECKPOINT DOES NOT MATCH THE NETWORK: " + PREFIX + NAME)  # RAISE A VALUE ERROR
+    ARENA = NETWORK.ARENA  # FLAT PARAMETERS
+    if ARENA is not None:  # IF THE PARAMETERS ARE FLAT
+        PREFIXES = {id(P): PREFIX for PREFIX, P in OWNERS}  # NAME OF EVERY PARAMETER OBJECT
+        OFFSETS = {ENTRY["NAME"]: ENTRY["OFFSET"] for ENTRY in HEADER["ARRAYS"]}  # OFFSET OF EVERY ARRAY
+        FLAT = ARRAYS.get(ARENA.KEY)  # SAVED ARENA
+        SAME = (MMAP and FLAT is not None and FLAT.shape == ARENA.DATA.shape and FLAT.dtype == ARENA.DATA.dtype
+                and all(OFFSETS[PREFIXES[id(P)] + NAME] == OFFSETS[ARENA.KEY] + START * FLAT.itemsize
+                        for P, NAME, START, _ in ARENA.SLICES))  # WHETHER THE SAVED ARENA HAS THE SAME LAYOUT
+        if SAME:  # IF THE SAVED ARENA CAN BE USED AS IT IS
+            ARENA.BIND(FLAT, ARENA.GRADS, COPY=False)  # MOVE THE ARENA INTO THE MAPPED BLOB
+        else:  # OTHERWISE
+            for P, NAME, _, _ in ARENA.SLICES:  # LOOP OVER SLICES
+                P[NAME][...] = ARRAYS[PREFIXES[id(P)] + NAME]  # COPY PARAMETER INTO THE ARENA
+    else:  # OTHERWISE
+        for PREFIX, P in OWNERS:  # LOOP OVER PARAMETER OBJECTS
+            for NAME in P.KEYS():  # LOOP OVER PARAMETERS
+                ARRAY = ARRAYS[PREFIX + NAME]  # SAVED PARAMETER
+                # USE THE MAPPED PARAMETER AS IT IS, OR COPY IT IN THE DTYPE OF THE NETWORK
+                P[NAME] = ARRAY if MMAP and ARRAY.dtype == P[NAME].dtype else ARRAY.astype(P[NAME].dtype)
+    for INDEX, LAYER in enumerate(NETWORK.LAYERS):  # LOOP OVER LAYERS
+        for NAME in LEARNED_STATE:  # LOOP OVER LEARNED LAYER STATE
+            KEY = "LAYERS/%d/%s" % (INDEX, NAME)  # NAME OF THE STATE IN THE CHECKPOINT
+            if KEY in ARRAYS:  # IF THE STATE WAS SAVED
+                if not hasattr(LAYER, NAME):  # IF THE LAYER HAS NO SUCH STATE
+                    raise ValueError("CHECKPOINT DOES NOT MATCH THE NETWORK: " + KEY)  # RAISE A VALUE ERROR
+                setattr(LAYER, NAME, np.array(ARRAYS[KEY]))  # COPY STATE
+    OPTIMIZER = NETWORK.OPTIMIZER  # OPTIMIZER
+    SAVED = STATE.get("OPTIMIZER")  # SAVED OPTIMIZER STATE
+    if OPTIMIZER is not None and SAVED is not None and SAVED["CLASS"] == type(OPTIMIZER).__name__:  # IF THE STATE FITS THE OPTIMIZER
+        KEYS = __GROUP_KEYS__(NETWORK)  # NAMES OF THE ARRAYS OF THE PARAMETER GROUPS
+        PREFIXES = {id(P): PREFIX for PREFIX, P in OWNERS}  # NAME OF EVERY PARAMETER OBJECT
+        for ATTRIBUTE, VALUE in sorted(vars(OPTIMIZER).items()):  # LOOP OVER ATTRIBUTES
+            if not isinstance(VALUE, dict) or ATTRIBUTE in OPTIMIZER_SCRATCH:  # IF THE ATTRIBUTE HOLDS NO PER-PARAMETER STATE
+                continue  # SKIP ATTRIBUTE
+            PREFIX = "OPTIMIZER/%s/" % ATTRIBUTE  # PREFIX OF THE NAMES
+            for GROUP, TARGETS in VALUE.items():  # LOOP OVER PARAMETER GROUPS
+                for NAME, TARGET in TARGETS.items():  # LOOP OVER PARAMETERS
+                    FOUND = [ARRAYS[PREFIX + KEY] for KEY in KEYS[(GROUP, NAME)] if PREFIX + KEY in ARRAYS]  # SAVED STATE
+                    if FOUND and FOUND[0].shape == TARGET.shape:  # IF THE STATE WAS SAVED IN THE SAME LAYOUT
+                        TARGET[...] = FOUND[0]  # COPY STATE
+                    elif ARENA is not None and all(PREFIX + PREFIXES[id(P)] + KEY in ARRAYS for P, KEY, _, _ in ARENA.SLICES):  # IF IT WAS SAVED PER PARAMETER
+                        for P, KEY, START, STOP in ARENA.SLICES:  # LOOP OVER SLICES
+                            TARGET[START:STOP] = ARRAYS[PREFIX + PREFIXES[id(P)] + KEY].reshape(-1)  # COPY STATE INTO THE FLAT STATE
+                    else:  # OTHERWISE
+                        raise ValueError("CHECKPOINT DOES NOT MATCH THE OPTIMIZER: " + PREFIX + KEYS[(GROUP, NAME)][0])
+        for NAME in OPTIMIZER_COUNTERS:  # LOOP OVER COUNTERS
+            if NAME in SAVED:  # IF THE COUNTER WAS SAVED
+                setattr(OPTIMIZER, NAME, SAVED[NAME])  # RESTORE COUNTER
+    if NETWORK.PRECISION is not None and "PRECISION" in STATE:  # IF THE LOSS SCALE WAS SAVED
+        NETWORK.PRECISION.LOSS_SCALE = STATE["PRECISION"]["LOSS_SCALE"]  # RESTORE LOSS SCALE
+        NETWORK.PRECISION.CLEAN_STEPS = STATE["PRECISION"]["CLEAN_STEPS"]  # RESTORE CLEAN STEPS
+    PROGRESS = STATE.get("PROGRESS", {"EPOCH": 0, "BATCH": 0})  # SAVED TRAINING PROGRESS
+    NETWORK.EPOCH = PROGRESS["EPOCH"]  # RESTORE EPOCH
+    NETWORK.BATCH = PROGRESS["BATCH"]  # RESTORE BATCH
+    NETWORK.STOP_TRAINING = PROGRESS.get("STOPPED", False)  # RESTORE WHETHER A CALLBACK STOPPED TRAINING
+    NETWORK.INDICES = np.array(ARRAYS["INDICES"]) if "INDICES" in ARRAYS else None  # RESTORE ORDER OF THE SAMPLES
+    if "RANDOM" in PROGRESS:  # IF THE SHUFFLING GENERATOR WAS SAVED
+        NETWORK.RANDOM.bit_generator.state = PROGRESS["RANDOM"]  # RESTORE GENERATOR
+    NETWORK.RESET_STAGE_CACHES()  # DROP WEIGHTS CACHED BY FUSED BLOCKS
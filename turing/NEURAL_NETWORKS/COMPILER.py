@@ -0,0 +1,375 @@
+import collections
+import copy
+import numpy as np
+
+from .ACTIVATIONS import IN_PLACE
+from .LAYERS.BASIC import ACTIVATION, DENSE, DROP_OUT, LAYER, PHASE_MIXIN
+from .LAYERS.CONVOLUTION import CONVOLUTION
+from .LAYERS.NORMALIZATION import BATCH_NORMALIZATION
+
+
+class FUSED_BLOCK(LAYER, PHASE_MIXIN):
+    """DENSE OR CONVOLUTION LAYER FUSED WITH THE LAYERS AROUND IT
+
+    THE BLOCK RUNS THE LAYERS DROP_OUT* (DENSE | CONVOLUTION)
+    [BATCH_NORMALIZATION] [ACTIVATION] AS ONE STAGE AND SHARES THEIR
+    PARAMETERS, SO THE OPTIMIZER IS NOT AFFECTED.
+
+    WHILE TRAINING, AN ACTIVATION WITH AN IN-PLACE VERSION OVERWRITES THE
+    OUTPUT OF THE LAYER BEFORE IT AND ONLY ITS OUTPUT IS KEPT FOR THE
+    BACKWARD PASS. WHILE TESTING, THE DROP_OUT SCALES AND THE BATCH
+    NORMALIZATION ARE FOLDED INTO THE WEIGHTS AND BIASES, SO THE WHOLE BLOCK
+    IS ONE PRODUCT, ONE BIAS ADDITION AND ONE IN-PLACE ACTIVATION ON A
+    WORKSPACE ARRAY. THE FOLDED WEIGHTS ARE RECOMPUTED AFTER EVERY CHANGE OF
+    PHASE.
+
+    PARAMETERS
+    ----------
+    LAYERS : LIST
+        LAYERS OF THE BLOCK.
+
+    ATTRIBUTES
+    ----------
+    DROP_OUTS : LIST
+        DROP_OUT LAYERS BEFORE THE AFFINE LAYER.
+    AFFINE : DENSE OR CONVOLUTION
+        AFFINE LAYER.
+    NORMALIZATION : BATCH_NORMALIZATION
+        BATCH NORMALIZATION AFTER THE AFFINE LAYER (NONE IF THERE IS NONE).
+    ACTIVATION : ACTIVATION
+        ACTIVATION AT THE END OF THE BLOCK (NONE IF THERE IS NONE).
+    IN_PLACE : FUNCTION
+        IN-PLACE VERSION OF THE ACTIVATION FUNCTION (NONE IF THERE IS NONE).
+    LAST_OUTPUT : NUMPY ARRAY
+        LAST OUTPUT OF THE IN-PLACE ACTIVATION.
+    FOLDED : TUPLE
+        WEIGHTS AND BIASES USED WHILE TESTING (NONE UNTIL THEY ARE COMPUTED).
+
+    METHODS
+    -------
+    FORWARD_PASS(X)
+        FORWARD PROPAGATION.
+    BACKWARD_PASS(DELTA)
+        BACKWARD PROPAGATION.
+    FOLD()
+        RETURNS THE WEIGHTS AND BIASES OF THE BLOCK IN THE TESTING PHASE.
+    RESET_CACHE()
+        DROPS THE FOLDED WEIGHTS AND THE LAST OUTPUT.
+    FREEZE()
+        RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+    SHAPE(X_SHAPE)
+        RETURNS SHAPE OF THE OUTPUT.
+    """
+
+    def __init__(self, LAYERS):
+        """INITIALIZE THE BLOCK
+
+        PARAMETERS
+        ----------
+        LAYERS : LIST
+            LAYERS OF THE BLOCK, MATCHING DROP_OUT* (DENSE | CONVOLUTION) [BATCH_NORMALIZATION] [ACTIVATION].
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.LAYERS = list(LAYERS)  # LAYERS OF THE BLOCK
+        REST = list(LAYERS)  # LAYERS NOT MATCHED YET
+        self.DROP_OUTS = []  # LEADING DROP_OUT LAYERS
+        while REST and isinstance(REST[0], DROP_OUT):  # MATCH LEADING DROP_OUT LAYERS
+            self.DROP_OUTS.append(REST.pop(0))  # ADD DROP_OUT LAYER
+        if not REST or not isinstance(REST[0], (DENSE, CONVOLUTION)):  # IF THERE IS NO AFFINE LAYER
+            raise ValueError("A FUSED BLOCK NEEDS A DENSE OR CONVOLUTION LAYER")  # RAISE A VALUE ERROR
+        self.AFFINE = REST.pop(0)  # AFFINE LAYER
+        self.NORMALIZATION = REST.pop(0) if REST and isinstance(REST[0], BATCH_NORMALIZATION) else None  # BATCH NORMALIZATION
+        self.ACTIVATION = REST.pop(0) if REST and isinstance(REST[0], ACTIVATION) else None  # ACTIVATION
+        if REST:  # IF LAYERS ARE LEFT OVER
+            raise ValueError("LAYERS DO NOT MATCH DROP_OUT* (DENSE | CONVOLUTION) [BATCH_NORMALIZATION] [ACTIVATION]")
+        self.IN_PLACE = IN_PLACE.get(self.ACTIVATION.ACTIVATION_FUNCTION) if self.ACTIVATION is not None else None  # IN-PLACE ACTIVATION
+        self.LAST_OUTPUT = None  # INITIALIZE LAST OUTPUT
+        self.FOLDED = None  # INITIALIZE FOLDED WEIGHTS
+        self.__TRAIN__ = self.AFFINE.IS_TRAINING  # START IN THE PHASE OF THE LAYERS
+
+    @property
+    def IS_TRAINING(self):
+        """PHASE OF THE BLOCK
+
+        RETURNS
+        -------
+        BOOL
+            WHETHER THE BLOCK IS TRAINING
+        """
+        return self.__TRAIN__  # RETURN PHASE
+
+    @IS_TRAINING.setter
+    def IS_TRAINING(self, IS_TRAIN=True):
+        """SET PHASE OF THE BLOCK AND OF ITS LAYERS
+
+        PARAMETERS
+        ----------
+        IS_TRAIN : BOOL
+            WHETHER THE BLOCK IS TRAINING
+        """
+        self.__TRAIN__ = IS_TRAIN  # SET PHASE
+        self.RESET_CACHE()  # THE WEIGHTS MAY CHANGE IN EITHER PHASE, FOLD THEM AGAIN WHEN NEEDED
+        for LAYER in self.LAYERS:  # LOOP OVER LAYERS
+            if isinstance(LAYER, PHASE_MIXIN):  # IF THE LAYER HAS PHASES
+                LAYER.IS_TRAINING = IS_TRAIN  # SET PHASE OF THE LAYER
+
+    def RESET_CACHE(self):
+        """DROP THE FOLDED WEIGHTS AND THE LAST OUTPUT
+
+        CALL AFTER THE PARAMETERS OR THE BATCH NORMALIZATION STATE OF THE LAYERS
+        ARE CHANGED OUTSIDE OF AN OPTIMIZER STEP, SO THE WEIGHTS ARE FOLDED AGAIN.
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.FOLDED = None  # FOLD THE WEIGHTS AGAIN WHEN NEEDED
+        self.LAST_OUTPUT = None  # DROP THE CACHE
+
+    @property
+    def IS_TESTING(self):
+        """PHASE OF THE BLOCK
+
+        RETURNS
+        -------
+        BOOL
+            WHETHER THE BLOCK IS TESTING
+        """
+        return not self.__TRAIN__  # RETURN PHASE
+
+    @IS_TESTING.setter
+    def IS_TESTING(self, IS_TEST=True):
+        """SET PHASE OF THE BLOCK AND OF ITS LAYERS
+
+        PARAMETERS
+        ----------
+        IS_TEST : BOOL
+            WHETHER THE BLOCK IS TESTING
+        """
+        self.IS_TRAINING = not IS_TEST  # SET PHASE
+
+    def FORWARD_PASS(self, X):
+        """FORWARD PROPAGATION
+
+        PARAMETERS
+        ----------
+        X : NUMPY ARRAY
+            INPUT TO THE BLOCK
+
+        RETURNS
+        -------
+        NUMPY ARRAY
+            OUTPUT OF THE BLOCK
+        """
+        if self.IS_TESTING:  # IF TESTING
+            self.LAST_OUTPUT = None  # NO BACKWARD PASS WHILE TESTING, DROP THE CACHE
+            if self.NORMALIZATION is None and not self.DROP_OUTS:  # IF THERE IS NOTHING TO FOLD
+                Z = self.AFFINE.APPLY(X, self.AFFINE.PARAMETERS["W"], self.AFFINE.PARAMETERS["b"])  # COMPUTE OUTPUT
+            else:  # IF DROP_OUT OR BATCH NORMALIZATION ARE FOLDED INTO THE WEIGHTS
+                if self.FOLDED is None:  # IF THE WEIGHTS HAVE NOT BEEN FOLDED SINCE THE LAST CHANGE OF PHASE
+                    self.FOLDED = self.FOLD()  # FOLD WEIGHTS
+                Z = self.AFFINE.APPLY(X, *self.FOLDED)  # COMPUTE OUTPUT WITH THE FOLDED WEIGHTS
+            if self.ACTIVATION is None:  # IF THERE IS NO ACTIVATION
+                return Z  # RETURN OUTPUT
+            return self.IN_PLACE(Z) if self.IN_PLACE is not None else self.ACTIVATION.ACTIVATION_FUNCTION(Z)  # RETURN ACTIVATION
+        for LAYER in self.DROP_OUTS:  # LOOP OVER DROP_OUT LAYERS
+            X = LAYER.FORWARD_PASS(X)  # DROP INPUTS
+        Z = self.AFFINE.FORWARD_PASS(X)  # COMPUTE OUTPUT OF THE AFFINE LAYER
+        if self.NORMALIZATION is not None:  # IF THERE IS A BATCH NORMALIZATION
+            Z = self.NORMALIZATION.FORWARD_PASS(Z)  # NORMALIZE OUTPUT
+        if self.ACTIVATION is None:  # IF THERE IS NO ACTIVATION
+            return Z  # RETURN OUTPUT
+        if self.IN_PLACE is None:  # IF THE ACTIVATION NEEDS ITS INPUT FOR THE BACKWARD PASS
+            return self.ACTIVATION.FORWARD_PASS(Z)  # RUN THE ACTIVATION LAYER
+        OUT = self.IN_PLACE(Z)  # OVERWRITE THE OUTPUT OF THE LAYER BEFORE, WHICH NOTHING ELSE KEEPS
+        self.LAST_OUTPUT = self.ACTIVATION.STORE(OUT)  # SAVE OUTPUT FOR BACKWARD PASS
+        return OUT  # RETURN OUTPUT
+
+    def BACKWARD_PASS(self, DELTA):
+        """BACKWARD PROPAGATION
+
+        PARAMETERS
+        ----------
+        DELTA : NUMPY ARRAY
+            DELTA FROM THE NEXT LAYER
+
+        RETURNS
+        -------
+        NUMPY ARRAY
+            DELTA FOR THE PREVIOUS LAYER
+        """
+        if self.ACTIVATION is not None and self.IN_PLACE is None:  # IF THE ACTIVATION LAYER RAN ON ITS OWN
+            DELTA = self.ACTIVATION.BACKWARD_PASS(DELTA)  # BACKPROPAGATE THROUGH THE ACTIVATION LAYER
+        elif self.ACTIVATION is not None:  # IF THE ACTIVATION RAN IN PLACE
+            assert self.LAST_OUTPUT is not None, "FORWARD PASS NOT CALLED WHILE TRAINING"  # CHECK IF FORWARD PASS WAS CALLED
+            OUT = self.ACTIVATION.LOAD(self.LAST_OUTPUT, DELTA)  # GET OUTPUT
+            DELTA = self.ACTIVATION.DERIVATIVE(OUT, OUT, DELTA)  # THE OUTPUT STANDS IN FOR THE INPUT
+        if self.NORMALIZATION is not None:  # IF THERE IS A BATCH NORMALIZATION
+            DELTA = self.NORMALIZATION.BACKWARD_PASS(DELTA)  # BACKPROPAGATE THROUGH THE BATCH NORMALIZATION
+        DELTA = self.AFFINE.BACKWARD_PASS(DELTA)  # BACKPROPAGATE THROUGH THE AFFINE LAYER
+        for LAYER in reversed(self.DROP_OUTS):  # LOOP BACKWARDS OVER DROP_OUT LAYERS
+            DELTA = LAYER.BACKWARD_PASS(DELTA)  # BACKPROPAGATE THROUGH THE DROP_OUT LAYER
+        return DELTA  # RETURN DELTA
+
+    def FOLD(self):
+        """RETURNS THE WEIGHTS AND BIASES OF THE BLOCK IN THE TESTING PHASE
+
+        A DROP_OUT LAYER SCALES ITS INPUT BY 1 - P WHILE TESTING, WHICH IS THE
+        SAME AS SCALING THE WEIGHTS OF THE AFFINE LAYER. A BATCH NORMALIZATION
+        COMPUTES Z * SCALE + SHIFT PER OUTPUT FEATURE, WHICH IS THE SAME AS
+        SCALING THE WEIGHTS AND BIASES OF THAT FEATURE AND SHIFTING THE BIASES.
+
+        RETURNS
+        -------
+        W : NUMPY ARRAY
+            FOLDED WEIGHTS (A NEW ARRAY), IN THE SHAPE OF THE WEIGHTS OF THE AFFINE LAYER
+        B : NUMPY ARRAY
+            FOLDED BIASES, IN THE SHAPE OF THE BIASES OF THE AFFINE LAYER
+        """
+        SCALE = np.prod([1.0 - LAYER.P for LAYER in self.DROP_OUTS])  # SCALE OF THE INPUT
+        return FOLD(self.AFFINE, self.NORMALIZATION, SCALE)  # RETURN FOLDED WEIGHTS
+
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE
+
+        RETURNS
+        -------
+        FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE BLOCK
+        """
+        W, B = self.FOLD()  # FOLD WEIGHTS INTO A NEW ARRAY
+        AFFINE = self.AFFINE.FREEZE(W, B.copy())  # FREEZE THE AFFINE LAYER WITH THE FOLDED WEIGHTS
+        if self.ACTIVATION is None:  # IF THERE IS NO ACTIVATION
+            return AFFINE  # RETURN FORWARD FUNCTION OF THE AFFINE LAYER
+        ACTIVATION_FUNCTION = self.IN_PLACE or self.ACTIVATION.ACTIVATION_FUNCTION  # ACTIVATION, IN PLACE IF POSSIBLE
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            return ACTIVATION_FUNCTION(AFFINE(X))  # THE OUTPUT OF THE AFFINE FUNCTION IS A NEW ARRAY
+        return FORWARD  # RETURN FORWARD FUNCTION
+
+    def SHAPE(self, X_SHAPE):
+        """RETURNS SHAPE OF THE OUTPUT
+
+        PARAMETERS
+        ----------
+        X_SHAPE : TUPLE
+            SHAPE OF THE INPUT
+
+        RETURNS
+        -------
+        TUPLE
+            SHAPE OF THE OUTPUT
+        """
+        for LAYER in self.LAYERS:  # LOOP OVER LAYERS
+            X_SHAPE = LAYER.SHAPE(X_SHAPE)  # GET SHAPE OF THE OUTPUT OF THE LAYER
+        return X_SHAPE  # RETURN SHAPE
+
+
+def FOLD(AFFINE, NORMALIZATION=None, SCALE=1.0):
+    """FOLD AN INPUT SCALE AND A BATCH NORMALIZATION INTO AN AFFINE LAYER
+
+    PARAMETERS
+    ----------
+    AFFINE : DENSE OR CONVOLUTION
+        AFFINE LAYER
+    NORMALIZATION : BATCH_NORMALIZATION
+        BATCH NORMALIZATION OF THE OUTPUT OF THE AFFINE LAYER (NONE IF THERE IS NONE)
+    SCALE : FLOAT
+        SCALE OF THE INPUT OF THE AFFINE LAYER
+
+    RETURNS
+    -------
+    W : NUMPY ARRAY
+        FOLDED WEIGHTS (A NEW ARRAY), IN THE SHAPE AND DTYPE OF THE WEIGHTS OF THE AFFINE LAYER
+    B : NUMPY ARRAY
+        FOLDED BIASES, IN THE SHAPE AND DTYPE OF THE BIASES OF THE AFFINE LAYER
+    """
+    W = AFFINE.PARAMETERS["W"]  # GET WEIGHTS
+    B = AFFINE.PARAMETERS["b"]  # GET BIASES
+    if NORMALIZATION is None:  # IF THERE IS NO BATCH NORMALIZATION
+        return (W * SCALE).astype(W.dtype, copy=False), B  # SCALE WEIGHTS
+    FEATURE_SCALE, SHIFT = NORMALIZATION.FOLD()  # GET SCALE AND SHIFT OF EACH OUTPUT FEATURE
+    if isinstance(AFFINE, DENSE):  # IF THE FEATURES ARE THE COLUMNS OF THE WEIGHTS
+        FOLDED_W = W * (SCALE * FEATURE_SCALE)  # SCALE EACH COLUMN
+    else:  # IF THE FEATURES ARE THE FILTERS OF THE WEIGHTS
+        FOLDED_W = W * (SCALE * FEATURE_SCALE)[:, np.newaxis, np.newaxis, np.newaxis]  # SCALE EACH FILTER
+    FOLDED_B = B * FEATURE_SCALE + SHIFT  # SCALE AND SHIFT BIASES
+    return FOLDED_W.astype(W.dtype, copy=False), FOLDED_B.astype(B.dtype, copy=False)  # RETURN FOLDED WEIGHTS
+
+
+def EXPORT(LAYERS):
+    """COPY LAYERS FOR SERVING, WITH THE BATCH NORMALIZATIONS FOLDED AWAY
+
+    EVERY BATCH_NORMALIZATION THAT DIRECTLY FOLLOWS A DENSE OR CONVOLUTION
+    LAYER IS FOLDED INTO THE WEIGHTS AND BIASES OF THAT LAYER AND REMOVED. A
+    BATCH_NORMALIZATION IS KEPT IF NOTHING PRECEDES IT THAT IT CAN BE FOLDED
+    INTO, OR IF THE PARAMETERS OF THE LAYER BEFORE IT ARE SHARED WITH ANOTHER
+    LAYER. THE COPIES ARE IN THE TESTING PHASE AND THE ORIGINAL LAYERS ARE
+    NOT CHANGED.
+
+    PARAMETERS
+    ----------
+    LAYERS : LIST
+        TRAINED LAYERS
+
+    RETURNS
+    -------
+    LIST
+        LAYERS OF THE SERVING NETWORK
+    """
+    LAYERS = copy.deepcopy(LAYERS)  # COPY LAYERS AND THEIR PARAMETERS
+    USES = collections.Counter(id(LAYER.PARAMETERS) for LAYER in LAYERS
+                               if hasattr(LAYER, "PARAMETERS"))  # NUMBER OF LAYERS USING EACH PARAMETER OBJECT
+    SERVING = []  # LAYERS OF THE SERVING NETWORK
+    for LAYER in LAYERS:  # LOOP OVER LAYERS
+        PREVIOUS = SERVING[-1] if SERVING else None  # LAST LAYER KEPT
+        if isinstance(LAYER, BATCH_NORMALIZATION) and isinstance(PREVIOUS, (DENSE, CONVOLUTION)) and \
+                USES[id(PREVIOUS.PARAMETERS)] == 1:  # IF THE BATCH NORMALIZATION CAN BE FOLDED
+            PREVIOUS.PARAMETERS["W"], PREVIOUS.PARAMETERS["b"] = FOLD(PREVIOUS, LAYER)  # FOLD IT INTO THE LAYER BEFORE
+            continue  # DROP THE BATCH NORMALIZATION
+        SERVING.append(LAYER)  # KEEP LAYER
+    for LAYER in SERVING:  # LOOP OVER LAYERS
+        if isinstance(LAYER, PHASE_MIXIN):  # IF THE LAYER HAS PHASES
+            LAYER.IS_TRAINING = False  # SET TESTING PHASE
+    return SERVING  # RETURN LAYERS
+
+
+def COMPILE(LAYERS):
+    """FUSE COMMON SEQUENCES OF LAYERS INTO BLOCKS
+
+    EVERY RUN OF LAYERS MATCHING DROP_OUT* (DENSE | CONVOLUTION)
+    [BATCH_NORMALIZATION] [ACTIVATION] THAT HAS MORE THAN ONE LAYER BECOMES
+    A FUSED_BLOCK. THE OTHER LAYERS ARE KEPT AS THEY ARE.
+
+    PARAMETERS
+    ----------
+    LAYERS : LIST
+        LAYERS OF A NETWORK
+
+    RETURNS
+    -------
+    LIST
+        STAGES RUN IN PLACE OF THE LAYERS
+    """
+    STAGES = []  # STAGES OF THE COMPILED NETWORK
+    BEGIN = 0  # FIRST LAYER NOT COMPILED YET
+    while BEGIN < len(LAYERS):  # UNTIL ALL LAYERS ARE COMPILED
+        END = BEGIN  # END OF THE MATCH
+        while END < len(LAYERS) and isinstance(LAYERS[END], DROP_OUT):  # MATCH LEADING DROP_OUT LAYERS
+            END += 1  # ADD DROP_OUT LAYER
+        if END < len(LAYERS) and isinstance(LAYERS[END], (DENSE, CONVOLUTION)):  # IF AN AFFINE LAYER FOLLOWS
+            END += 1  # ADD AFFINE LAYER
+            if END < len(LAYERS) and isinstance(LAYERS[END], BATCH_NORMALIZATION):  # IF A BATCH NORMALIZATION FOLLOWS
+                END += 1  # ADD BATCH NORMALIZATION
+            if END < len(LAYERS) and isinstance(LAYERS[END], ACTIVATION):  # IF AN ACTIVATION FOLLOWS
+                END += 1  # ADD ACTIVATION
+            if END - BEGIN > 1:  # IF THERE IS SOMETHING TO FUSE
+                STAGES.append(FUSED_BLOCK(LAYERS[BEGIN: END]))  # FUSE LAYERS
+                BEGIN = END  # CONTINUE AFTER THE BLOCK
+                continue  # MATCH NEXT BLOCK
+        STAGES.append(LAYERS[BEGIN])  # KEEP LAYER AS IT IS
+        BEGIN += 1  # CONTINUE WITH THE NEXT LAYER
+    return STAGES  # RETURN STAGES
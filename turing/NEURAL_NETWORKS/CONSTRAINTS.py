@@ -47,9 +47,25 @@ class MAX_NORM:
         -------
         RETURN CLIPPED WEIGHTS
         """
+        return self.__CLIP__(np.array(P, dtype=np.result_type(P, 1.0)))  # RETURN CLIPPED COPY OF THE WEIGHTS
+
+    def __CLIP__(self, P):
+        """CLIP WEIGHTS IN PLACE (USED BY PARAMETER.STEP)
+
+        PARAMETERS
+        ----------
+        P : ARRAY
+            WEIGHTS, OVERWRITTEN WITH THE CLIPPED WEIGHTS
+
+        RETURNS
+        -------
+        RETURN P
+        """
         NORMS = np.sqrt(np.sum(P ** 2, axis=self.AXIS))  # COMPUTE NORMS
         DESIRED = np.clip(NORMS, 0, self.M)  # CLIP NORMS
-        P = P * (DESIRED / (10e-8 + NORMS))  # SCALE WEIGHTS
+        NORMS += 10e-8  # AVOID DIVISION BY ZERO
+        np.divide(DESIRED, NORMS, out=NORMS)  # COMPUTE SCALE FACTORS
+        P *= NORMS  # SCALE WEIGHTS IN PLACE
         return P  # RETURN CLIPPED WEIGHTS
 
 
@@ -89,6 +105,20 @@ class SMALL_NORM:
         """
         return np.clip(P, -5, 5)  # CLIP WEIGHTS
 
+    def __CLIP__(self, P):
+        """CLIP WEIGHTS IN PLACE (USED BY PARAMETER.STEP)
+
+        PARAMETERS
+        ----------
+        P : ARRAY
+            WEIGHTS, OVERWRITTEN WITH THE CLIPPED WEIGHTS
+
+        RETURNS
+        -------
+        RETURN P
+        """
+        return np.clip(P, -5, 5, out=P)  # CLIP WEIGHTS IN PLACE
+
 
 class UNIT_NORM(CONSTRAINT):
     """UNIT NORM CONSTRAINT"""
@@ -109,4 +139,21 @@ class UNIT_NORM(CONSTRAINT):
         -------
         RETURN CLIPPED WEIGHTS
         """
-        return P / (10e-8 + np.sqrt(np.sum(P ** 2, axis=self.AXIS)))  # RETURN CLIPPED WEIGHTS
+        return self.__CLIP__(np.array(P, dtype=np.result_type(P, 1.0)))  # RETURN CLIPPED COPY OF THE WEIGHTS
+
+    def __CLIP__(self, P):
+        """CLIP WEIGHTS IN PLACE (USED BY PARAMETER.STEP)
+
+        PARAMETERS
+        ----------
+        P : ARRAY
+            WEIGHTS, OVERWRITTEN WITH THE CLIPPED WEIGHTS
+
+        RETURNS
+        -------
+        RETURN P
+        """
+        NORMS = np.sqrt(np.sum(P ** 2, axis=self.AXIS))  # COMPUTE NORMS
+        NORMS += 10e-8  # AVOID DIVISION BY ZERO
+        P /= NORMS  # NORMALIZE WEIGHTS IN PLACE
+        return P  # RETURN CLIPPED WEIGHTS
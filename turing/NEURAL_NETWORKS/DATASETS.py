@@ -0,0 +1,222 @@
+import os
+import numpy as np
+
+
+class SHARDED_DATASET:
+    """OUT-OF-CORE DATASET MADE OF .NPY SHARDS
+
+    EVERY SHARD IS MEMORY-MAPPED, SO INDEXING ONLY READS THE ROWS THAT ARE
+    ASKED FOR. THE SHARDS ARE CONCATENATED ALONG THE FIRST AXIS AND MUST
+    AGREE ON THE REMAINING AXES AND THE DTYPE.
+
+    PARAMETERS
+    ----------
+    SHARDS : STRING OR LIST
+        DIRECTORY OF .NPY FILES (LOADED IN SORTED ORDER), OR A LIST OF FILE
+        PATHS AND/OR ARRAYS.
+
+    ATTRIBUTES
+    ----------
+    SHARDS : LIST
+        MEMORY-MAPPED SHARDS.
+    OFFSETS : NUMPY ARRAY
+        INDEX OF THE FIRST ROW OF EACH SHARD, FOLLOWED BY THE NUMBER OF ROWS.
+
+    METHODS
+    -------
+    SHUFFLED_INDICES(RANDOM)
+        PERMUTATION THAT SHUFFLES THE SHARDS AND THE ROWS INSIDE EACH SHARD.
+
+    PROPERTIES
+    ----------
+    shape
+        SHAPE OF THE WHOLE DATASET.
+    ndim
+        NUMBER OF DIMENSIONS.
+    size
+        NUMBER OF ELEMENTS.
+    dtype
+        DTYPE OF THE ELEMENTS.
+    """
+
+    def __init__(self, SHARDS):
+        """INITIALIZE THE DATASET
+
+        PARAMETERS
+        ----------
+        SHARDS : STRING OR LIST
+            DIRECTORY OF .NPY FILES, OR A LIST OF FILE PATHS AND/OR ARRAYS.
+
+        RETURNS
+        -------
+        NONE
+        """
+        if isinstance(SHARDS, (str, os.PathLike)):  # IF A DIRECTORY IS GIVEN
+            SHARDS = [os.path.join(SHARDS, NAME) for NAME in sorted(os.listdir(SHARDS))
+                      if NAME.endswith(".npy")]  # LIST ITS .NPY FILES
+        self.SHARDS = [np.load(SHARD, mmap_mode="r") if isinstance(SHARD, (str, os.PathLike)) else SHARD
+                       for SHARD in SHARDS]  # MEMORY-MAP THE FILES
+        if len(self.SHARDS) == 0:  # IF THERE ARE NO SHARDS
+            raise ValueError("GOT NO SHARDS")  # RAISE A VALUE ERROR
+        for SHARD in self.SHARDS[1:]:  # CHECK THAT THE SHARDS CAN BE CONCATENATED
+            if SHARD.shape[1:] != self.SHARDS[0].shape[1:] or SHARD.dtype != self.SHARDS[0].dtype:
+                raise ValueError("ALL SHARDS MUST HAVE THE SAME TRAILING SHAPE AND DTYPE")
+        self.OFFSETS = np.concatenate(
+            [[0], np.cumsum([SHARD.shape[0] for SHARD in self.SHARDS])])  # FIRST ROW OF EACH SHARD
+
+    def __len__(self):
+        """NUMBER OF ROWS"""
+        return int(self.OFFSETS[-1])  # RETURN NUMBER OF ROWS
+
+    @property
+    def shape(self):
+        """SHAPE OF THE WHOLE DATASET"""
+        return (len(self),) + self.SHARDS[0].shape[1:]  # RETURN SHAPE
+
+    @property
+    def ndim(self):
+        """NUMBER OF DIMENSIONS"""
+        return self.SHARDS[0].ndim  # RETURN NUMBER OF DIMENSIONS
+
+    @property
+    def size(self):
+        """NUMBER OF ELEMENTS"""
+        return int(np.prod(self.shape))  # RETURN NUMBER OF ELEMENTS
+
+    @property
+    def dtype(self):
+        """DTYPE OF THE ELEMENTS"""
+        return self.SHARDS[0].dtype  # RETURN DTYPE
+
+    def __array__(self, dtype=None, copy=None):
+        """MATERIALIZE THE WHOLE DATASET
+
+        PARAMETERS
+        ----------
+        dtype : NUMPY DTYPE
+            DTYPE OF THE RESULT
+        copy : BOOL
+            IGNORED, THE RESULT IS ALWAYS A NEW ARRAY
+
+        RETURNS
+        -------
+        NUMPY ARRAY
+            ALL ROWS OF THE DATASET
+        """
+        return np.concatenate(self.SHARDS).astype(dtype or self.dtype, copy=False)  # RETURN ALL ROWS
+
+    def __getitem__(self, KEY):
+        """READ ROWS OF THE DATASET
+
+        PARAMETERS
+        ----------
+        KEY : INT, SLICE, ARRAY OR TUPLE
+            ROWS TO READ. A TUPLE WHOSE FIRST ELEMENT IS A FULL SLICE RETURNS A
+            LAZY SHARDED VIEW; ANY OTHER KEY RETURNS AN IN-MEMORY ARRAY.
+
+        RETURNS
+        -------
+        NUMPY ARRAY OR SHARDED_DATASET
+            SELECTED ROWS
+        """
+        if isinstance(KEY, tuple):  # IF THE KEY INDEXES MORE THAN THE ROWS
+            ROWS, REST = KEY[0], KEY[1:]  # SPLIT ROWS FROM THE OTHER AXES
+            if isinstance(ROWS, slice) and ROWS == slice(None):  # IF ALL ROWS ARE SELECTED
+                return SHARDED_DATASET([SHARD[(slice(None),) + REST] for SHARD in self.SHARDS])  # RETURN A LAZY VIEW
+            return self[ROWS][(slice(None),) + REST]  # READ THE ROWS, THEN INDEX THE OTHER AXES
+        if isinstance(KEY, (int, np.integer)):  # IF A SINGLE ROW IS SELECTED
+            INDEX = KEY + len(self) if KEY < 0 else KEY  # WRAP NEGATIVE INDEX
+            if not 0 <= INDEX < len(self):  # IF THE INDEX IS OUT OF RANGE
+                raise IndexError("INDEX OUT OF RANGE")  # RAISE AN INDEX ERROR
+            SHARD = np.searchsorted(self.OFFSETS, INDEX, side="right") - 1  # FIND SHARD
+            return np.asarray(self.SHARDS[SHARD][INDEX - self.OFFSETS[SHARD]])  # READ ROW
+        if isinstance(KEY, slice):  # IF A RANGE OF ROWS IS SELECTED
+            START, STOP, STEP = KEY.indices(len(self))  # RESOLVE RANGE
+            if STEP != 1:  # IF THE RANGE IS STRIDED
+                return self[np.arange(START, STOP, STEP)]  # READ ROWS BY INDEX
+            STOP = max(START, STOP)  # EMPTY RANGE IF STOP IS BEFORE START
+            PIECES = []  # ROWS READ FROM EACH SHARD
+            for SHARD, (BEGIN, END) in enumerate(zip(self.OFFSETS[:-1], self.OFFSETS[1:])):  # FOR EACH SHARD
+                if BEGIN < STOP and START < END:  # IF THE SHARD OVERLAPS THE RANGE
+                    PIECES.append(self.SHARDS[SHARD][max(START, BEGIN) - BEGIN: min(STOP, END) - BEGIN])  # READ OVERLAP
+            if len(PIECES) == 0:  # IF THE RANGE IS EMPTY
+                return np.empty((0,) + self.shape[1:], dtype=self.dtype)  # RETURN EMPTY ARRAY
+            return np.concatenate(PIECES)  # RETURN ROWS
+        INDICES = np.asarray(KEY)  # ROWS SELECTED BY INDEX OR MASK
+        if INDICES.dtype == np.bool_:  # IF A MASK IS GIVEN
+            INDICES = np.flatnonzero(INDICES)  # CONVERT MASK TO INDICES
+        INDICES = np.where(INDICES < 0, INDICES + len(self), INDICES)  # WRAP NEGATIVE INDICES
+        if INDICES.size and (INDICES.min() < 0 or INDICES.max() >= len(self)):  # IF AN INDEX IS OUT OF RANGE
+            raise IndexError("INDEX OUT OF RANGE")  # RAISE AN INDEX ERROR
+        SHARD_OF = np.searchsorted(self.OFFSETS, INDICES, side="right") - 1  # SHARD OF EACH ROW
+        OUT = np.empty(INDICES.shape + self.shape[1:], dtype=self.dtype)  # ALLOCATE RESULT
+        for SHARD in np.unique(SHARD_OF):  # FOR EACH SHARD THAT IS READ
+            MASK = SHARD_OF == SHARD  # ROWS IN THIS SHARD
+            OUT[MASK] = self.SHARDS[SHARD][INDICES[MASK] - self.OFFSETS[SHARD]]  # READ ROWS
+        return OUT  # RETURN ROWS
+
+    def SHUFFLED_INDICES(self, RANDOM):
+        """PERMUTATION THAT SHUFFLES THE SHARDS AND THE ROWS INSIDE EACH SHARD
+
+        PARAMETERS
+        ----------
+        RANDOM : NUMPY GENERATOR
+            RANDOM NUMBER GENERATOR
+
+        RETURNS
+        -------
+        NUMPY ARRAY
+            ROW INDICES THAT VISIT ONE SHARD AT A TIME
+        """
+        return BLOCK_PERMUTATION(self.OFFSETS, RANDOM)  # SHUFFLE WITH ONE BLOCK PER SHARD
+
+
+def BLOCK_PERMUTATION(OFFSETS, RANDOM):
+    """PERMUTATION THAT SHUFFLES BLOCKS AND THE ROWS INSIDE EACH BLOCK
+
+    PARAMETERS
+    ----------
+    OFFSETS : ARRAY-LIKE
+        INDEX OF THE FIRST ROW OF EACH BLOCK, FOLLOWED BY THE NUMBER OF ROWS.
+    RANDOM : NUMPY GENERATOR
+        RANDOM NUMBER GENERATOR
+
+    RETURNS
+    -------
+    NUMPY ARRAY
+        ROW INDICES THAT VISIT ONE BLOCK AT A TIME
+    """
+    OFFSETS = np.asarray(OFFSETS)  # CONVERT OFFSETS
+    BLOCKS = RANDOM.permutation(len(OFFSETS) - 1)  # SHUFFLE BLOCK ORDER
+    return np.concatenate([OFFSETS[BLOCK] + RANDOM.permutation(OFFSETS[BLOCK + 1] - OFFSETS[BLOCK])
+                           for BLOCK in BLOCKS]).astype(np.intp)  # SHUFFLE ROWS INSIDE EACH BLOCK
+
+
+def SHUFFLED_INDICES(X, RANDOM, BLOCK_BYTES=2 ** 26):
+    """PERMUTATION OF THE ROWS OF A DATASET THAT RESPECTS ITS STORAGE
+
+    IN-MEMORY ARRAYS GET A FULL PERMUTATION. SHARDED DATASETS ARE SHUFFLED
+    SHARD BY SHARD AND MEMORY-MAPPED ARRAYS BLOCK BY BLOCK, SO EACH STRETCH
+    OF BATCHES READS FROM ONE REGION OF THE DISK.
+
+    PARAMETERS
+    ----------
+    X : ARRAY-LIKE
+        DATASET
+    RANDOM : NUMPY GENERATOR
+        RANDOM NUMBER GENERATOR
+    BLOCK_BYTES : INT
+        SIZE OF THE BLOCKS OF A MEMORY-MAPPED ARRAY
+
+    RETURNS
+    -------
+    NUMPY ARRAY
+        ROW INDICES
+    """
+    if isinstance(X, SHARDED_DATASET):  # IF THE DATASET IS SHARDED
+        return X.SHUFFLED_INDICES(RANDOM)  # SHUFFLE SHARD BY SHARD
+    if isinstance(X, np.memmap):  # IF THE DATASET IS MEMORY-MAPPED
+        ROW_BYTES = max(1, X.itemsize * int(np.prod(X.shape[1:])))  # SIZE OF ONE ROW
+        BLOCK_ROWS = max(1, BLOCK_BYTES // ROW_BYTES)  # ROWS PER BLOCK
+        return BLOCK_PERMUTATION(np.append(np.arange(0, X.shape[0], BLOCK_ROWS), X.shape[0]), RANDOM)  # SHUFFLE BLOCK BY BLOCK
+    return RANDOM.permutation(X.shape[0])  # SHUFFLE ALL ROWS
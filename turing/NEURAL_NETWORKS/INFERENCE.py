@@ -0,0 +1,185 @@
+from concurrent.futures import Future
+import queue
+import threading
+import time
+import numpy as np
+
+
+class INFERENCE_ENGINE:
+    """MICRO-BATCHING INFERENCE ENGINE
+
+    FREEZES A TRAINED NETWORK INTO A STATELESS FORWARD FUNCTION AND SERVES
+    SINGLE-SAMPLE REQUESTS FROM ANY NUMBER OF THREADS. EACH WORKER THREAD
+    TAKES THE OLDEST REQUEST, WAITS AT MOST MAX_LATENCY SECONDS FOR MORE TO
+    ARRIVE, AND RUNS UP TO MAX_BATCH_SIZE OF THEM AS ONE BATCH. REQUESTS OF
+    DIFFERENT SHAPES (E.G. SEQUENCES OF DIFFERENT LENGTHS) ARE BATCHED
+    SEPARATELY. THE FROZEN FUNCTION USES A COPY OF THE PARAMETERS, SO THE
+    NETWORK CAN KEEP TRAINING WHILE THE ENGINE SERVES.
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        TRAINED NETWORK.
+    MAX_BATCH_SIZE : INT
+        MAXIMUM NUMBER OF REQUESTS RUN AS ONE BATCH.
+    MAX_LATENCY : FLOAT
+        MAXIMUM TIME IN SECONDS A REQUEST WAITS FOR OTHERS TO JOIN ITS BATCH.
+    N_WORKERS : INT
+        NUMBER OF WORKER THREADS RUNNING BATCHES.
+
+    METHODS
+    -------
+    SUBMIT(X)
+        QUEUE ONE SAMPLE AND RETURN A FUTURE OF ITS OUTPUT.
+    PREDICT(X, TIMEOUT=None)
+        RETURN THE OUTPUT FOR ONE SAMPLE.
+    CLOSE()
+        SERVE THE QUEUED REQUESTS AND STOP THE WORKERS.
+    """
+
+    def __init__(self, NETWORK, MAX_BATCH_SIZE=64, MAX_LATENCY=0.002, N_WORKERS=1):
+        """INITIALIZE THE ENGINE AND START ITS WORKERS
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            TRAINED NETWORK.
+        MAX_BATCH_SIZE : INT
+            MAXIMUM NUMBER OF REQUESTS RUN AS ONE BATCH.
+        MAX_LATENCY : FLOAT
+            MAXIMUM TIME IN SECONDS A REQUEST WAITS FOR OTHERS TO JOIN ITS BATCH.
+        N_WORKERS : INT
+            NUMBER OF WORKER THREADS RUNNING BATCHES.
+
+        RETURNS
+        -------
+        NONE
+        """
+        assert MAX_BATCH_SIZE > 0, "MAX_BATCH_SIZE MUST BE POSITIVE"  # CHECK BATCH SIZE
+        assert MAX_LATENCY >= 0, "MAX_LATENCY CANNOT BE NEGATIVE"  # CHECK LATENCY BUDGET
+        assert N_WORKERS > 0, "N_WORKERS MUST BE POSITIVE"  # CHECK NUMBER OF WORKERS
+        self.FORWARD = NETWORK.FREEZE()  # STATELESS FORWARD FUNCTION
+        self.MAX_BATCH_SIZE = MAX_BATCH_SIZE  # MAXIMUM BATCH SIZE
+        self.MAX_LATENCY = MAX_LATENCY  # LATENCY BUDGET
+        self.QUEUE = queue.Queue()  # PENDING REQUESTS
+        self.CLOSED = False  # WHETHER THE ENGINE STILL ACCEPTS REQUESTS
+        self.LOCK = threading.Lock()  # GUARDS CLOSED AGAINST CONCURRENT SUBMIT AND CLOSE
+        self.WORKERS = [threading.Thread(target=self.__SERVE__, daemon=True)
+                        for _ in range(N_WORKERS)]  # WORKER THREADS
+        for WORKER in self.WORKERS:  # START WORKERS
+            WORKER.start()  # START WORKER
+
+    def SUBMIT(self, X):
+        """QUEUE ONE SAMPLE AND RETURN A FUTURE OF ITS OUTPUT
+
+        PARAMETERS
+        ----------
+        X : ARRAY-LIKE
+            ONE SAMPLE, WITHOUT THE BATCH AXIS
+
+        RETURNS
+        -------
+        FUTURE
+            FUTURE OF THE OUTPUT FOR THE SAMPLE
+        """
+        FUTURE = Future()  # FUTURE OF THE OUTPUT
+        with self.LOCK:  # MAKE SURE THE WORKERS ARE STILL RUNNING
+            if self.CLOSED:  # IF THE ENGINE IS CLOSED
+                raise RuntimeError("THE INFERENCE ENGINE IS CLOSED")  # RAISE A RUNTIME ERROR
+            self.QUEUE.put((np.asarray(X), FUTURE))  # QUEUE REQUEST
+        return FUTURE  # RETURN FUTURE
+
+    def PREDICT(self, X, TIMEOUT=None):
+        """RETURN THE OUTPUT FOR ONE SAMPLE
+
+        PARAMETERS
+        ----------
+        X : ARRAY-LIKE
+            ONE SAMPLE, WITHOUT THE BATCH AXIS
+        TIMEOUT : FLOAT
+            MAXIMUM TIME IN SECONDS TO WAIT (NONE TO WAIT FOREVER)
+
+        RETURNS
+        -------
+        NUMPY ARRAY
+            OUTPUT FOR THE SAMPLE
+        """
+        return self.SUBMIT(X).result(TIMEOUT)  # WAIT FOR THE OUTPUT
+
+    def CLOSE(self):
+        """SERVE THE QUEUED REQUESTS AND STOP THE WORKERS
+
+        RETURNS
+        -------
+        NONE
+        """
+        with self.LOCK:  # STOP ACCEPTING REQUESTS
+            if self.CLOSED:  # IF THE ENGINE IS ALREADY CLOSED
+                return  # NOTHING TO DO
+            self.CLOSED = True  # MARK ENGINE AS CLOSED
+            for _ in self.WORKERS:  # ONE STOP MESSAGE PER WORKER, AFTER ALL QUEUED REQUESTS
+                self.QUEUE.put(None)  # QUEUE STOP MESSAGE
+        for WORKER in self.WORKERS:  # WAIT FOR WORKERS
+            WORKER.join()  # JOIN WORKER
+
+    def __enter__(self):
+        """RETURN THE ENGINE FOR A WITH BLOCK"""
+        return self  # RETURN ENGINE
+
+    def __exit__(self, *ARGS):
+        """CLOSE THE ENGINE AT THE END OF A WITH BLOCK"""
+        self.CLOSE()  # CLOSE ENGINE
+
+    def __SERVE__(self):
+        """WORKER LOOP: COLLECT MICRO-BATCHES AND RUN THEM
+
+        RETURNS
+        -------
+        NONE
+        """
+        while True:  # SERVE UNTIL STOPPED
+            REQUEST = self.QUEUE.get()  # WAIT FOR THE FIRST REQUEST OF A BATCH
+            if REQUEST is None:  # IF THE ENGINE IS CLOSED
+                return  # STOP
+            BATCH = [REQUEST]  # REQUESTS OF THIS BATCH
+            DEADLINE = time.monotonic() + self.MAX_LATENCY  # LATEST START OF THIS BATCH
+            STOP = False  # WHETHER A STOP MESSAGE WAS TAKEN
+            while len(BATCH) < self.MAX_BATCH_SIZE:  # UNTIL THE BATCH IS FULL
+                REMAINING = DEADLINE - time.monotonic()  # TIME LEFT IN THE LATENCY BUDGET
+                try:
+                    REQUEST = self.QUEUE.get(timeout=REMAINING) if REMAINING > 0 else self.QUEUE.get_nowait()  # NEXT REQUEST
+                except queue.Empty:  # IF NO REQUEST ARRIVED IN TIME
+                    break  # RUN THE BATCH
+                if REQUEST is None:  # IF THE ENGINE IS CLOSED
+                    STOP = True  # STOP AFTER THIS BATCH
+                    break  # RUN THE BATCH
+                BATCH.append(REQUEST)  # ADD REQUEST TO THE BATCH
+            self.__RUN__(BATCH)  # RUN THE BATCH
+            if STOP:  # IF THE ENGINE IS CLOSED
+                return  # STOP
+
+    def __RUN__(self, BATCH):
+        """RUN A MICRO-BATCH AND RESOLVE ITS FUTURES
+
+        PARAMETERS
+        ----------
+        BATCH : LIST
+            (SAMPLE, FUTURE) PAIRS
+
+        RETURNS
+        -------
+        NONE
+        """
+        GROUPS = {}  # REQUESTS GROUPED BY SAMPLE SHAPE
+        for X, FUTURE in BATCH:  # LOOP OVER REQUESTS
+            if FUTURE.set_running_or_notify_cancel():  # SKIP REQUESTS CANCELLED WHILE QUEUED
+                GROUPS.setdefault(X.shape, []).append((X, FUTURE))  # GROUP REQUEST
+        for GROUP in GROUPS.values():  # RUN ONE FORWARD PASS PER SHAPE
+            try:
+                Y = self.FORWARD(np.stack([X for X, _ in GROUP]))  # FORWARD PASS OF THE STACKED SAMPLES
+            except Exception as ERROR:  # IF THE FORWARD PASS FAILED
+                for _, FUTURE in GROUP:  # LOOP OVER REQUESTS
+                    FUTURE.set_exception(ERROR)  # REPORT ERROR
+                continue  # RUN NEXT GROUP
+            for INDEX, (_, FUTURE) in enumerate(GROUP):  # LOOP OVER REQUESTS
+                FUTURE.set_result(Y[INDEX])  # RETURN OUTPUT OF THE SAMPLE
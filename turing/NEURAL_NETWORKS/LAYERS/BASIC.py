@@ -1,6 +1,6 @@
-from autograd import elementwise_grad
 import numpy as np
 
+from ..ACTIVATIONS import DERIVATIVE
 from ..PARAMETERS import PARAMETER
 
 np.random.seed(9999)  # SET SEED FOR REPRODUCIBILITY OF RESULTS
@@ -19,12 +19,24 @@ class LAYER:
         BACKWARD PROPAGATION.
     SHAPE(X_SHAPE)
         RETURNS SHAPE OF THE CURRENT LAYER.
+    FREEZE()
+        RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+    STORE(X)
+        RETURNS AN ARRAY CAST TO THE STORAGE DTYPE FOR THE BACKWARD PASS.
+    LOAD(X, LIKE)
+        RETURNS A STORED ARRAY CAST BACK TO THE DTYPE OF ANOTHER ARRAY.
 
     ATTRIBUTES:
     -----------
     LAST_INPUT: NUMPY ARRAY
         LAST INPUT TO THE LAYER.
+    COMPUTE_DTYPE: NUMPY DTYPE
+        DTYPE OF THE STATE ALLOCATED BY SETUP.
+    STORAGE_DTYPE: NUMPY DTYPE
+        DTYPE OF THE ARRAYS CACHED FOR THE BACKWARD PASS (NONE TO KEEP THEIR DTYPE).
     """
+    COMPUTE_DTYPE = np.float64  # DEFAULT IS TO COMPUTE IN DOUBLE PRECISION
+    STORAGE_DTYPE = None  # DEFAULT IS TO CACHE ARRAYS AS THEY ARE
 
     def SETUP(self, X_SHAPE):
         """ALLOCATES INITIAL WEIGHTS.
@@ -85,6 +97,54 @@ class LAYER:
         """
         raise NotImplementedError()  # RAISE NOT IMPLEMENTED ERROR
 
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        THE FUNCTION COMPUTES THE TESTING-PHASE OUTPUT OF THE LAYER FROM A COPY
+        OF ITS CURRENT PARAMETERS AND NEVER WRITES TO THE LAYER, SO IT CAN BE
+        CALLED FROM SEVERAL THREADS AT ONCE AND IS NOT AFFECTED BY LATER TRAINING.
+
+        RETURNS:
+        --------
+        FREEZE: FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER.
+        """
+        raise NotImplementedError(type(self).__name__ + " CANNOT BE FROZEN")  # RAISE NOT IMPLEMENTED ERROR
+
+    def STORE(self, X):
+        """RETURNS AN ARRAY CAST TO THE STORAGE DTYPE FOR THE BACKWARD PASS.
+
+        PARAMETERS:
+        ----------
+        X: NUMPY ARRAY
+            ARRAY TO CACHE.
+
+        RETURNS:
+        --------
+        STORE: NUMPY ARRAY
+            ARRAY IN THE STORAGE DTYPE.
+        """
+        if self.STORAGE_DTYPE is None:  # IF THERE IS NO STORAGE DTYPE
+            return X  # CACHE ARRAY AS IT IS
+        return X.astype(self.STORAGE_DTYPE, copy=False)  # CACHE NARROWED ARRAY
+
+    def LOAD(self, X, LIKE):
+        """RETURNS A STORED ARRAY CAST BACK TO THE DTYPE OF ANOTHER ARRAY.
+
+        PARAMETERS:
+        ----------
+        X: NUMPY ARRAY
+            CACHED ARRAY.
+        LIKE: NUMPY ARRAY
+            ARRAY WHOSE DTYPE IS USED.
+
+        RETURNS:
+        --------
+        LOAD: NUMPY ARRAY
+            WIDENED ARRAY.
+        """
+        return X.astype(LIKE.dtype, copy=False)  # WIDEN ARRAY
+
 
 class PARAM_MIXIN:
     """MIXIN CLASS FOR LAYERS WITH PARAMETERS.
@@ -163,9 +223,83 @@ class PHASE_MIXIN:
         self.__TRAIN__ = not IS_TEST  # SET PHASE
 
 
-class DENSE(LAYER, PARAM_MIXIN):
+class WORKSPACE:
+    """CACHE OF REUSABLE SCRATCH ARRAYS FOR A LAYER.
+
+    ARRAYS ARE KEYED BY NAME, SHAPE AND DTYPE. ONLY THE MOST RECENTLY USED
+    SHAPES OF EACH NAME ARE KEPT, SO THE FULL BATCHES AND THE LAST SHORT BATCH
+    OF AN EPOCH DO NOT EVICT EACH OTHER. THE CONTENT OF AN ARRAY IS UNDEFINED
+    WHEN IT IS RETURNED.
+
+    ATTRIBUTES:
+    -----------
+    MAX_SHAPES: INT
+        NUMBER OF SHAPES KEPT PER NAME.
+    BUFFERS: DICT
+        CACHED ARRAYS OF EACH NAME, FROM LEAST TO MOST RECENTLY USED.
+
+    METHODS:
+    --------
+    GET(NAME, SHAPE, DTYPE)
+        RETURNS A CACHED ARRAY, ALLOCATING IT IF NEEDED.
+    CLEAR()
+        RELEASES ALL CACHED ARRAYS.
+    """
+
+    def __init__(self, MAX_SHAPES=2):
+        """INITIALIZE WORKSPACE.
+
+        PARAMETERS:
+        -----------
+        MAX_SHAPES: INT
+            NUMBER OF SHAPES KEPT PER NAME.
+        """
+        self.MAX_SHAPES = MAX_SHAPES  # SET NUMBER OF SHAPES KEPT PER NAME
+        self.BUFFERS = {}  # INITIALIZE CACHED ARRAYS
+
+    def GET(self, NAME, SHAPE, DTYPE=np.float64):
+        """RETURNS A CACHED ARRAY, ALLOCATING IT IF NEEDED.
+
+        PARAMETERS:
+        -----------
+        NAME: STRING
+            NAME OF THE ARRAY.
+        SHAPE: TUPLE
+            SHAPE OF THE ARRAY.
+        DTYPE: NUMPY DTYPE
+            DTYPE OF THE ARRAY.
+
+        RETURNS:
+        --------
+        GET: NUMPY ARRAY
+            C-CONTIGUOUS ARRAY OF THE GIVEN SHAPE AND DTYPE.
+        """
+        KEY = (tuple(SHAPE), np.dtype(DTYPE))  # BUILD KEY
+        CACHE = self.BUFFERS.setdefault(NAME, {})  # GET CACHED ARRAYS OF THIS NAME
+        if KEY in CACHE:  # IF THE ARRAY IS CACHED
+            CACHE[KEY] = CACHE.pop(KEY)  # MARK IT AS MOST RECENTLY USED
+            return CACHE[KEY]  # RETURN ARRAY
+        if len(CACHE) >= self.MAX_SHAPES:  # IF THE CACHE IS FULL
+            del CACHE[next(iter(CACHE))]  # EVICT LEAST RECENTLY USED ARRAY
+        CACHE[KEY] = np.empty(KEY[0], dtype=KEY[1])  # ALLOCATE ARRAY
+        return CACHE[KEY]  # RETURN ARRAY
+
+    def CLEAR(self):
+        """RELEASES ALL CACHED ARRAYS.
+
+        RETURNS:
+        --------
+        NONE
+        """
+        self.BUFFERS = {}  # DROP CACHED ARRAYS
+
+
+class DENSE(LAYER, PARAM_MIXIN, PHASE_MIXIN):
     """DENSE LAYER.
 
+    WHILE TESTING, THE INPUT IS NOT CACHED AND THE OUTPUT IS A WORKSPACE
+    ARRAY THAT IS OVERWRITTEN BY THE NEXT CALL.
+
     ATTRIBUTES:
     -----------
     OUTPUT_DIM: INT
@@ -181,13 +315,15 @@ class DENSE(LAYER, PARAM_MIXIN):
         ALLOCATES INITIAL WEIGHTS.
     FORWARD_PASS(X)
         FORWARD PROPAGATION.
+    APPLY(X, W, B)
+        TESTING-PHASE FORWARD PROPAGATION WITH THE GIVEN WEIGHTS.
     BACKWARD_PASS(DELTA)
         BACKWARD PROPAGATION.
     SHAPE(X_SHAPE)
         RETURNS SHAPE OF THE CURRENT LAYER.
     """
 
-    def __init__(self, OUTPUT_DIM, PARAMETERS=PARAMETER()):
+    def __init__(self, OUTPUT_DIM, PARAMETERS=None):
         """INITIALIZE DENSE LAYER.
 
         PARAMETERS:
@@ -195,12 +331,15 @@ class DENSE(LAYER, PARAM_MIXIN):
         OUTPUT_DIM: INT
             OUTPUT DIMENSION OF THE LAYER.
         PARAMETERS: PARAMETERS
-            PARAMETERS OF THE LAYER.
+            PARAMETERS OF THE LAYER (NONE FOR NEW DEFAULT PARAMETERS).
         """
+        if PARAMETERS is None:  # IF NO PARAMETERS ARE GIVEN
+            PARAMETERS = PARAMETER()  # CREATE PARAMETERS OF THIS LAYER ONLY
         self.__PARAMETERS__ = PARAMETERS  # SET PARAMETERS
         self.OUTPUT_DIM = OUTPUT_DIM  # SET OUTPUT DIMENSION
         self.LAST_INPUT = None  # INITIALIZE LAST INPUT
         self.__PARAMETERS__ = PARAMETERS  # INITIALIZE PARAMETERS
+        self.WORKSPACE = WORKSPACE()  # INITIALIZE WORKSPACE
 
     def SETUP(self, X_SHAPE):
         """ALLOCATES INITIAL WEIGHTS.
@@ -230,8 +369,35 @@ class DENSE(LAYER, PARAM_MIXIN):
         FORWARD_PASS: NUMPY ARRAY
             OUTPUT OF THE LAYER.
         """
-        self.LAST_INPUT = X  # SET LAST INPUT
-        return self.SET_WEIGHT(X)  # RETURN OUTPUT
+        if self.IS_TRAINING:  # IF TRAINING
+            self.LAST_INPUT = self.STORE(X)  # SET LAST INPUT
+            return self.SET_WEIGHT(X)  # RETURN OUTPUT
+        self.LAST_INPUT = None  # NO BACKWARD PASS WHILE TESTING, DROP THE CACHE
+        return self.APPLY(X, self.__PARAMETERS__["W"], self.__PARAMETERS__["b"])  # RETURN OUTPUT
+
+    def APPLY(self, X, W, B):
+        """TESTING-PHASE FORWARD PROPAGATION WITH THE GIVEN WEIGHTS.
+
+        NOTHING IS CACHED AND THE OUTPUT IS A WORKSPACE ARRAY.
+
+        PARAMETERS:
+        ----------
+        X: NUMPY ARRAY
+            INPUT TO THE LAYER.
+        W: NUMPY ARRAY
+            WEIGHTS OF SHAPE (INPUT_DIM, OUTPUT_DIM).
+        B: NUMPY ARRAY
+            BIASES OF SHAPE (OUTPUT_DIM,).
+
+        RETURNS:
+        --------
+        APPLY: NUMPY ARRAY
+            OUTPUT OF THE LAYER.
+        """
+        OUT = self.WORKSPACE.GET("OUT", (X.shape[0], W.shape[1]), np.result_type(X.dtype, W.dtype))  # GET OUTPUT
+        np.dot(X, W, out=OUT)  # COMPUTE WEIGHTS INTO THE OUTPUT
+        OUT += B  # ADD BIASES IN PLACE
+        return OUT  # RETURN OUTPUT
 
     def SET_WEIGHT(self, X):
         """SET WEIGHTS OF THE LAYER.
@@ -262,13 +428,35 @@ class DENSE(LAYER, PARAM_MIXIN):
         BACKWARD_PASS: NUMPY ARRAY
             DELTA TO THE PREVIOUS LAYER.
         """
-        assert self.LAST_INPUT is not None, "FORWARD PASS NOT CALLED"  # ASSERT FORWARD PASS CALLED
-        DW = np.dot(self.LAST_INPUT.T, DELTA)  # COMPUTE GRADIENTS
+        assert self.LAST_INPUT is not None, "FORWARD PASS NOT CALLED WHILE TRAINING"  # ASSERT FORWARD PASS CALLED
+        DW = np.dot(self.LOAD(self.LAST_INPUT, DELTA).T, DELTA)  # COMPUTE GRADIENTS
         DB = np.sum(DELTA, axis=0)  # COMPUTE GRADIENTS
         self.__PARAMETERS__.UPDATE_GRAD("W", DW)  # UPDATE GRADIENTS
         self.__PARAMETERS__.UPDATE_GRAD("b", DB)  # UPDATE GRADIENTS
         return np.dot(DELTA, self.__PARAMETERS__["W"].T)  # RETURN DELTA
 
+    def FREEZE(self, W=None, B=None):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        PARAMETERS:
+        ----------
+        W: NUMPY ARRAY
+            WEIGHTS TO USE INSTEAD OF A COPY OF THE LAYER'S OWN.
+        B: NUMPY ARRAY
+            BIASES TO USE INSTEAD OF A COPY OF THE LAYER'S OWN.
+
+        RETURNS:
+        --------
+        FREEZE: FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER.
+        """
+        W = self.__PARAMETERS__["W"].copy() if W is None else W  # COPY WEIGHTS
+        B = self.__PARAMETERS__["b"].copy() if B is None else B  # COPY BIASES
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            return np.dot(X, W) + B  # RETURN OUTPUT
+        return FORWARD  # RETURN FORWARD FUNCTION
+
     def SHAPE(self, X_SHAPE):
         """RETURNS SHAPE OF THE CURRENT LAYER.
 
@@ -296,15 +484,21 @@ class DENSE(LAYER, PARAM_MIXIN):
         return self.__PARAMETERS__  # RETURN PARAMETERS
 
 
-class ACTIVATION(LAYER):
+class ACTIVATION(LAYER, PHASE_MIXIN):
     """ACTIVATION LAYER.
 
+    WHILE TESTING, THE INPUT AND OUTPUT ARE NOT CACHED.
+
     ATTRIBUTES:
     -----------
     LAST_INPUT: NUMPY ARRAY
         LAST INPUT TO THE LAYER.
+    LAST_OUTPUT: NUMPY ARRAY
+        LAST OUTPUT OF THE LAYER.
     ACTIVATION: FUNCTION
         ACTIVATION FUNCTION.
+    DERIVATIVE: FUNCTION
+        DERIVATIVE OF THE ACTIVATION FUNCTION, SEE ACTIVATIONS.DERIVATIVE.
 
     METHODS:
     --------
@@ -325,7 +519,9 @@ class ACTIVATION(LAYER):
             ACTIVATION FUNCTION.
         """
         self.LAST_INPUT = None  # INITIALIZE LAST INPUT
+        self.LAST_OUTPUT = None  # INITIALIZE LAST OUTPUT
         self.ACTIVATION_FUNCTION = ACTIVATION_FUNCTION  # SET ACTIVATION FUNCTION
+        self.DERIVATIVE = DERIVATIVE(ACTIVATION_FUNCTION)  # LOOK UP DERIVATIVE ONCE
 
     def FORWARD_PASS(self, X):
         """FORWARD PROPAGATION.
@@ -340,8 +536,10 @@ class ACTIVATION(LAYER):
         FORWARD_PASS: NUMPY ARRAY
             OUTPUT OF THE LAYER.
         """
-        self.LAST_INPUT = X  # SET LAST INPUT
-        return self.ACTIVATION_FUNCTION(X)  # RETURN OUTPUT
+        OUTPUT = self.ACTIVATION_FUNCTION(X)  # COMPUTE OUTPUT
+        self.LAST_INPUT = self.STORE(X) if self.IS_TRAINING else None  # SET LAST INPUT
+        self.LAST_OUTPUT = self.STORE(OUTPUT) if self.IS_TRAINING else None  # SET LAST OUTPUT
+        return OUTPUT  # RETURN OUTPUT
 
     def BACKWARD_PASS(self, DELTA):
         """BACKWARD PROPAGATION.
@@ -356,7 +554,17 @@ class ACTIVATION(LAYER):
         BACKWARD_PASS: NUMPY ARRAY
             DELTA TO THE PREVIOUS LAYER.
         """
-        return elementwise_grad(self.ACTIVATION_FUNCTION, self.LAST_INPUT) * DELTA  # RETURN DELTA
+        return self.DERIVATIVE(self.LOAD(self.LAST_INPUT, DELTA), self.LOAD(self.LAST_OUTPUT, DELTA), DELTA)  # RETURN DELTA
+
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        RETURNS:
+        --------
+        FREEZE: FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER.
+        """
+        return self.ACTIVATION_FUNCTION  # THE ACTIVATION FUNCTION IS STATELESS
 
     def SHAPE(self, X_SHAPE):
         """RETURNS SHAPE OF THE CURRENT LAYER.
@@ -439,6 +647,21 @@ class DROP_OUT(LAYER, PHASE_MIXIN):
         """
         return DELTA * self.__MASK__  # RETURN DELTA
 
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        RETURNS:
+        --------
+        FREEZE: FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER.
+        """
+        assert self.P >= 0.0 and self.P <= 1.0, "P SHOULD BE BETWEEN 0 AND 1"  # CHECK IF P IS BETWEEN 0 AND 1
+        SCALE = 1.0 - self.P  # TESTING-PHASE SCALE
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            return X * SCALE  # RETURN OUTPUT
+        return FORWARD  # RETURN FORWARD FUNCTION
+
     def SHAPE(self, X_SHAPE):
         """RETURNS SHAPE OF THE CURRENT LAYER.
 
@@ -513,6 +736,20 @@ class TIME_STEP_SLICER(LAYER):
         """
         return np.repeat(DELTA[:, np.newaxis, :], 2, 1)  # RETURN DELTA
 
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        RETURNS:
+        --------
+        FREEZE: FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER.
+        """
+        STEP = self.STEP  # TIME STEP TO TAKE
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            return X[:, STEP, :]  # RETURN OUTPUT
+        return FORWARD  # RETURN FORWARD FUNCTION
+
     def SHAPE(self, X_SHAPE):
         """RETURNS SHAPE OF THE CURRENT LAYER.
 
@@ -529,7 +766,7 @@ class TIME_STEP_SLICER(LAYER):
         return X_SHAPE[0], X_SHAPE[2]  # RETURN SHAPE
 
 
-class TIME_DISTRIBUTED_DENSE(LAYER):
+class TIME_DISTRIBUTED_DENSE(LAYER, PHASE_MIXIN):
     """APPLY DENSE LAYER TO EACH TIME STEP OF 3D TENSOR.
 
     ATTRIBUTES:
@@ -555,14 +792,19 @@ class TIME_DISTRIBUTED_DENSE(LAYER):
         RETURNS SHAPE OF THE CURRENT LAYER.
     """
 
-    def __init__(self, OUTPUT_DIM):
+    def __init__(self, OUTPUT_DIM, PARAMETERS=None):
         """INITIALIZE TIME DISTRIBUTED DENSE LAYER.
 
         PARAMETERS:
         -----------
         OUTPUT_DIM: INT
             OUTPUT DIMENSION OF THE DENSE LAYER.
+        PARAMETERS: PARAMETERS
+            PARAMETERS OF THE DENSE LAYER (NONE FOR NEW DEFAULT PARAMETERS).
         """
+        if PARAMETERS is None:  # IF NO PARAMETERS ARE GIVEN
+            PARAMETERS = PARAMETER()  # CREATE PARAMETERS OF THIS LAYER ONLY
+        self.__PARAMETERS__ = PARAMETERS  # SET PARAMETERS OF THE DENSE LAYER
         self.OUTPUT_DIM = OUTPUT_DIM  # SET OUTPUT DIMENSION OF THE DENSE LAYER
         self.N_TIME_STEPS = None  # INITIALIZE NUMBER OF TIME STEPS
         self.DENSE = None  # INITIALIZE DENSE LAYER
@@ -576,7 +818,7 @@ class TIME_DISTRIBUTED_DENSE(LAYER):
         X_SHAPE: TUPLE
             SHAPE OF THE INPUT.
         """
-        self.DENSE = DENSE(self.OUTPUT_DIM)  # INITIALIZE DENSE LAYER
+        self.DENSE = DENSE(self.OUTPUT_DIM, self.__PARAMETERS__)  # INITIALIZE DENSE LAYER
         self.DENSE.SETUP((X_SHAPE[0], X_SHAPE[2]))  # SETUP DENSE LAYER
         self.INPUT_DIM = X_SHAPE[2]  # SET INPUT DIMENSION OF THE DENSE LAYER
 
@@ -595,6 +837,7 @@ class TIME_DISTRIBUTED_DENSE(LAYER):
         """
         assert self.DENSE is not None, "SETUP MUST BE CALLED BEFORE FORWARD PASS."  # CHECK IF SETUP IS CALLED
         N_TIME_STEPS = X.shape[1]  # GET NUMBER OF TIME STEPS
+        self.DENSE.IS_TRAINING = self.IS_TRAINING  # PASS PHASE ON TO THE DENSE LAYER
         X = X.reshape(-1, X.shape[-1])  # RESHAPE INPUT
         Y = self.DENSE.FORWARD_PASS(X)  # FORWARD PROPAGATE THROUGH DENSE LAYER
         Y = Y.reshape((-1, N_TIME_STEPS, self.OUTPUT_DIM))  # RESHAPE OUTPUT
@@ -621,6 +864,23 @@ class TIME_DISTRIBUTED_DENSE(LAYER):
         Y = Y.reshape((-1, N_TIME_STEPS, self.INPUT_DIM))  # RESHAPE DELTA
         return Y  # RETURN DELTA
 
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        RETURNS:
+        --------
+        FREEZE: FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER.
+        """
+        assert self.DENSE is not None, "SETUP MUST BE CALLED BEFORE FREEZE."  # CHECK IF SETUP IS CALLED
+        DENSE_FORWARD = self.DENSE.FREEZE()  # FREEZE DENSE LAYER
+        OUTPUT_DIM = self.OUTPUT_DIM  # OUTPUT DIMENSION OF THE DENSE LAYER
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            Y = DENSE_FORWARD(X.reshape(-1, X.shape[-1]))  # FORWARD PROPAGATE EVERY TIME STEP AT ONCE
+            return Y.reshape((-1, X.shape[1], OUTPUT_DIM))  # RETURN OUTPUT
+        return FORWARD  # RETURN FORWARD FUNCTION
+
     def SHAPE(self, X_SHAPE):
         """RETURNS SHAPE OF THE CURRENT LAYER.
 
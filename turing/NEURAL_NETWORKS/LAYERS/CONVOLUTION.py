@@ -1,12 +1,19 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-from .BASIC import LAYER, PARAM_MIXIN
+from .BASIC import LAYER, PARAM_MIXIN, PHASE_MIXIN, WORKSPACE
 from ..PARAMETERS import PARAMETER
 
 
-class CONVOLUTION(LAYER, PARAM_MIXIN):
+class CONVOLUTION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
     """2D CONVOLUTION LAYER.
 
+    THE IM2COL, GEMM AND COL2IM ARRAYS ARE KEPT IN A WORKSPACE AND REUSED
+    ACROSS BATCHES OF THE SAME SHAPE. THE OUTPUT AND THE DELTA FOR THE
+    PREVIOUS LAYER ARE WORKSPACE ARRAYS TOO AND ARE OVERWRITTEN BY THE NEXT
+    CALL. ONLY THE SHAPE OF THE INPUT AND ITS COLUMN (IN THE STORAGE DTYPE)
+    ARE KEPT FOR THE BACKWARD PASS, AND NOTHING IS KEPT WHILE TESTING.
+
     PARAMETERS
     ----------
     N_FILTERS : INT, DEFAULT 8
@@ -34,13 +41,15 @@ class CONVOLUTION(LAYER, PARAM_MIXIN):
         SETS UP PARAMETERS FOR THE LAYER
     FORWARD_PASS(X)
         RETURNS OUTPUT OF THE LAYER
+    APPLY(X, W, B)
+        RETURNS OUTPUT OF THE LAYER FOR THE GIVEN WEIGHTS
     BACKWARD_PASS(DELTA)
         RETURNS DELTA FOR THE PREVIOUS LAYER
     SHAPE(X_SHAPE)
         RETURNS SHAPE OF THE OUTPUT
     """
 
-    def __init__(self, N_FILTERS=8, FILTER_SHAPE=(3, 3), PADDING=(0, 0), STRIDE=(1, 1), PARAMETERS=PARAMETER()):
+    def __init__(self, N_FILTERS=8, FILTER_SHAPE=(3, 3), PADDING=(0, 0), STRIDE=(1, 1), PARAMETERS=None):
         """INITIALIZE CONVOLUTION LAYER.
 
         PARAMETERS
@@ -54,9 +63,11 @@ class CONVOLUTION(LAYER, PARAM_MIXIN):
         STRIDE : TUPLE(HEIGHT, WIDTH), DEFAULT (1, 1)
             STRIDE SIZE
         PARAMETERS : PARAMETERS, DEFAULT NONE
-            PARAMETERS OF THE LAYER
+            PARAMETERS OF THE LAYER (NONE FOR NEW DEFAULT PARAMETERS)
         """
         self.PADDING = PADDING  # SET PADDING
+        if PARAMETERS is None:  # IF NO PARAMETERS ARE GIVEN
+            PARAMETERS = PARAMETER()  # CREATE PARAMETERS OF THIS LAYER ONLY
         self.__PARAMETERS__ = PARAMETERS  # SET PARAMETERS
         self.STRIDE = STRIDE  # SET STRIDE
         self.FILTER_SHAPE = FILTER_SHAPE  # SET FILTER SHAPE
@@ -64,9 +75,10 @@ class CONVOLUTION(LAYER, PARAM_MIXIN):
         self.__PARAMETERS__ = PARAMETERS  # SET PARAMETERS
         self.HEIGHT = None  # INITIALIZE HEIGHT
         self.WIDTH = None  # INITIALIZE WIDTH
-        self.LAST_INPUT = None  # INITIALIZE LAST INPUT
+        self.LAST_INPUT_SHAPE = None  # INITIALIZE LAST INPUT SHAPE
         self.COL = None  # INITIALIZE COL
         self.COL_W = None  # INITIALIZE COL_W
+        self.WORKSPACE = WORKSPACE()  # INITIALIZE WORKSPACE
 
     def SETUP(self, X_SHAPE):
         """SETUP PARAMETERS FOR THE LAYER.
@@ -96,24 +108,52 @@ class CONVOLUTION(LAYER, PARAM_MIXIN):
         X : NUMPY ARRAY
             INPUT TO THE LAYER
 
+        RETURNS
+        -------
+        NUMPY ARRAY
+            OUTPUT OF THE LAYER
+        """
+        return self.APPLY(X, self.__PARAMETERS__["W"], self.__PARAMETERS__["b"])  # RETURN OUTPUT
+
+    def APPLY(self, X, W, B):
+        """RETURNS OUTPUT OF THE LAYER FOR THE GIVEN WEIGHTS.
+
+        PARAMETERS
+        ----------
+        X : NUMPY ARRAY
+            INPUT TO THE LAYER
+        W : NUMPY ARRAY
+            WEIGHTS OF SHAPE (N_FILTERS, N_CHANNELS, HEIGHT, WIDTH)
+        B : NUMPY ARRAY
+            BIASES OF SHAPE (N_FILTERS,)
+
         RETURNS
         -------
         NUMPY ARRAY
             OUTPUT OF THE LAYER
         """
         N_IMAGES, _, HEIGHT, WIDTH = self.SHAPE(
-            X.SHAPE)  # GET SHAPE OF THE INPUT
-        self.LAST_INPUT = X  # SAVE INPUT FOR BACKWARD PASS
+            X.shape)  # GET SHAPE OF THE OUTPUT
+        N_CHANNELS = X.shape[1]  # GET NUMBER OF CHANNELS
+        self.LAST_INPUT_SHAPE = X.shape if self.IS_TRAINING else None  # SAVE SHAPE OF THE INPUT FOR BACKWARD PASS
+        PADDED = None  # INITIALIZE PADDED INPUT
+        if self.PADDING[0] > 0 or self.PADDING[1] > 0:  # IF THE INPUT NEEDS PADDING
+            PADDED = self.WORKSPACE.GET("PADDED", (N_IMAGES, N_CHANNELS, X.shape[2] + 2 * self.PADDING[0],
+                                                   X.shape[3] + 2 * self.PADDING[1]), X.dtype)  # GET PADDED INPUT
+        COL = self.WORKSPACE.GET("COL", (N_IMAGES * HEIGHT * WIDTH, N_CHANNELS * self.FILTER_SHAPE[0] * self.FILTER_SHAPE[1]),
+                                 X.dtype)  # GET COLUMN
         # GET COLUMN FROM THE INPUT
-        self.COL = IMAGE_TO_COLUMN(
-            X, self.FILTER_SHAPE, self.STRIDE, self.PADDING)
-        self.COL_W = self.__PARAMETERS__["W"].reshape(
-            self.N_FILTERS, -1).T  # GET COLUMN FROM THE WEIGHTS
-        OUT = np.dot(self.COL, self.COL_W) + \
-            self.__PARAMETERS__["b"]  # GET OUTPUT
-        OUT = OUT.reshape(N_IMAGES, HEIGHT, WIDTH, -
-                          1).transpose(0, 3, 1, 2)  # RESHAPE OUTPUT
-        return OUT  # RETURN OUTPUT
+        IMAGE_TO_COLUMN(X, self.FILTER_SHAPE, self.STRIDE, self.PADDING, OUT=COL, PADDED=PADDED)
+        self.COL = self.STORE(COL) if self.IS_TRAINING else None  # SAVE COLUMN FOR BACKWARD PASS
+        W = W.reshape(self.N_FILTERS, -1)  # GET WEIGHTS AS A MATRIX
+        self.COL_W = W.T if self.IS_TRAINING else None  # GET COLUMN FROM THE WEIGHTS
+        OUT_SHAPE = (N_IMAGES, self.N_FILTERS, HEIGHT * WIDTH)  # GET SHAPE OF THE OUTPUT MATRICES
+        # REUSE THE OUTPUT, AS IT IS CONSUMED BY THE NEXT LAYER BEFORE THE NEXT CALL
+        OUT = self.WORKSPACE.GET("OUT", OUT_SHAPE, np.result_type(COL.dtype, W.dtype))
+        # COMPUTE W @ COL.T PER IMAGE, WHICH WRITES THE OUTPUT DIRECTLY IN (N_IMAGES, N_FILTERS, HEIGHT, WIDTH) ORDER
+        np.matmul(W, COL.reshape(N_IMAGES, HEIGHT * WIDTH, -1).transpose(0, 2, 1), out=OUT)
+        OUT += B[:, np.newaxis]  # ADD BIASES IN PLACE
+        return OUT.reshape(N_IMAGES, self.N_FILTERS, HEIGHT, WIDTH)  # RETURN OUTPUT
 
     def BACKWARD_PASS(self, DELTA):
         """RETURNS DELTA FOR THE PREVIOUS LAYER.
@@ -128,17 +168,55 @@ class CONVOLUTION(LAYER, PARAM_MIXIN):
         NUMPY ARRAY
             DELTA FOR THE PREVIOUS LAYER
         """
-        assert self.LAST_INPUT is not None and self.COL is not None and self.COL_W is not None, "FORWARD PASS MUST BE CALLED BEFORE BACKWARD PASS"  # CHECK IF FORWARD PASS WAS CALLED
-        DELTA = DELTA.transpose(0, 2, 3, 1).reshape(-1,
-                                                    self.N_FILTERS)  # RESHAPE DELTA
-        D_W = np.dot(self.COL.T, DELTA).transpose((1, 0)).reshape(
-            self.__PARAMETERS__["W"].shape)  # GET DELTA FOR THE WEIGHTS
-        D_B = np.sum(DELTA, axis=0)  # GET DELTA FOR THE BIASES
+        assert self.LAST_INPUT_SHAPE is not None and self.COL is not None and self.COL_W is not None, "FORWARD PASS MUST BE CALLED BEFORE BACKWARD PASS"  # CHECK IF FORWARD PASS WAS CALLED
+        N_IMAGES, N_CHANNELS, HEIGHT, WIDTH = self.LAST_INPUT_SHAPE  # GET SHAPE OF THE INPUT
+        DELTA_COL = self.WORKSPACE.GET(
+            "DELTA", (DELTA.shape[0] * DELTA.shape[2] * DELTA.shape[3], self.N_FILTERS), DELTA.dtype)  # GET DELTA MATRIX
+        np.copyto(DELTA_COL.reshape(DELTA.shape[0], DELTA.shape[2], DELTA.shape[3], self.N_FILTERS),
+                  DELTA.transpose(0, 2, 3, 1))  # RESHAPE DELTA
+        COL = self.LOAD(self.COL, DELTA_COL)  # GET COLUMN OF THE INPUT IN THE DTYPE OF THE DELTA
+        D_W = self.WORKSPACE.GET(
+            "D_W", (self.N_FILTERS, COL.shape[1]), np.result_type(DELTA_COL, COL))  # GET DELTA FOR THE WEIGHTS
+        np.dot(DELTA_COL.T, COL, out=D_W)  # GET DELTA FOR THE WEIGHTS
+        D_B = np.sum(DELTA_COL, axis=0)  # GET DELTA FOR THE BIASES
         self.__PARAMETERS__.UPDATE_GRAD("b", D_B)  # UPDATE GRADIENTS
-        self.__PARAMETERS__.UPDATE_GRAD("W", D_W)  # UPDATE GRADIENTS
-        D_C = np.dot(DELTA, self.COL_W.T)  # GET DELTA FOR THE INPUT
+        self.__PARAMETERS__.UPDATE_GRAD(
+            "W", D_W.reshape(self.__PARAMETERS__["W"].shape))  # UPDATE GRADIENTS
+        D_C = self.WORKSPACE.GET(
+            "D_COL", self.COL.shape, np.result_type(DELTA_COL, self.COL_W))  # GET DELTA FOR THE INPUT COLUMN
+        np.dot(DELTA_COL, self.COL_W.T, out=D_C)  # GET DELTA FOR THE INPUT COLUMN
+        IMAGE = self.WORKSPACE.GET("IMAGE", (N_IMAGES, N_CHANNELS, HEIGHT + 2 * self.PADDING[0],
+                                             WIDTH + 2 * self.PADDING[1]), D_C.dtype)  # GET PADDED DELTA FOR THE INPUT
         # RETURN DELTA FOR THE PREVIOUS LAYER
-        return COLUMN_TO_IMAGE(D_C, self.LAST_INPUT.shape, self.FILTER_SHAPE, self.STRIDE, self.PADDING)
+        return COLUMN_TO_IMAGE(D_C, self.LAST_INPUT_SHAPE, self.FILTER_SHAPE, self.STRIDE, self.PADDING, OUT=IMAGE)
+
+    def FREEZE(self, W=None, B=None):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        PARAMETERS
+        ----------
+        W : NUMPY ARRAY
+            WEIGHTS TO USE INSTEAD OF A COPY OF THE LAYER'S OWN
+        B : NUMPY ARRAY
+            BIASES TO USE INSTEAD OF A COPY OF THE LAYER'S OWN
+
+        RETURNS
+        -------
+        FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER
+        """
+        W = (self.__PARAMETERS__["W"] if W is None else W).reshape(self.N_FILTERS, -1).copy()  # COPY WEIGHTS AS A MATRIX
+        B = (self.__PARAMETERS__["b"] if B is None else B)[:, np.newaxis].copy()  # COPY BIASES
+        SHAPE = self.SHAPE  # SHAPE OF THE OUTPUT
+        FILTER_SHAPE, STRIDE, PADDING = self.FILTER_SHAPE, self.STRIDE, self.PADDING  # GEOMETRY
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            N_IMAGES, N_FILTERS, HEIGHT, WIDTH = SHAPE(X.shape)  # GET SHAPE OF THE OUTPUT
+            COL = IMAGE_TO_COLUMN(X, FILTER_SHAPE, STRIDE, PADDING)  # GET COLUMN FROM THE INPUT
+            OUT = np.matmul(W, COL.reshape(N_IMAGES, HEIGHT * WIDTH, -1).transpose(0, 2, 1))  # CONVOLVE
+            OUT += B  # ADD BIASES IN PLACE
+            return OUT.reshape(N_IMAGES, N_FILTERS, HEIGHT, WIDTH)  # RETURN OUTPUT
+        return FORWARD  # RETURN FORWARD FUNCTION
 
     def SHAPE(self, X_SHAPE):
         """RETURNS SHAPE OF THE OUTPUT.
@@ -170,9 +248,16 @@ class CONVOLUTION(LAYER, PARAM_MIXIN):
         return self.__PARAMETERS__  # RETURN PARAMETERS
 
 
-class MAX_POOLING(LAYER):
+class MAX_POOLING(LAYER, PHASE_MIXIN):
     """MAX POOLING LAYER.
 
+    WHEN THE STRIDE EQUALS THE POOL SHAPE AND THE INPUT IS NOT PADDED, THE
+    WINDOWS ARE A RESHAPE OF THE INPUT; OTHERWISE THEY ARE A STRIDED VIEW. ONLY
+    THE SHAPE OF THE INPUT AND THE INDEX OF THE MAX INSIDE EACH WINDOW ARE KEPT
+    FOR THE BACKWARD PASS, AND THE INDEX IS NOT COMPUTED WHILE TESTING. THE
+    INDICES ARE STORED IN THE SMALLEST UNSIGNED INTEGER DTYPE THAT HOLDS THEM,
+    SO THEY DO NOT FOLLOW THE STORAGE DTYPE.
+
     OUTPUT SHAPE
     ------------
     (N_IMAGES, N_CHANNELS, HEIGHT, WIDTH)
@@ -208,8 +293,9 @@ class MAX_POOLING(LAYER):
         self.POOL_SHAPE = POOL_SHAPE  # SET POOL SHAPE
         self.STRIDE = STRIDE  # SET STRIDE
         self.PADDING = PADDING  # SET PADDING
-        self.LAST_INPUT = None  # INITIALIZE LAST INPUT
+        self.LAST_INPUT_SHAPE = None  # INITIALIZE LAST INPUT SHAPE
         self.ARG_MAX = None  # INITIALIZE ARG MAX
+        self.WORKSPACE = WORKSPACE()  # INITIALIZE WORKSPACE
 
     def FORWARD_PASS(self, X):
         """RETURNS OUTPUT OF THE LAYER.
@@ -224,18 +310,35 @@ class MAX_POOLING(LAYER):
         NUMPY ARRAY
             OUTPUT OF THE LAYER
         """
-        self.LAST_INPUT = X  # SAVE INPUT FOR BACKWARD PASS
-        OUT_HEIGHT, OUT_WIDTH = POOLING_SHAPE(
-            self.POOL_SHAPE, X.shape, self.STRIDE)  # GET SHAPE OF THE OUTPUT
-        N_IMAGES, N_CHANNELS, _, _ = X.shape  # GET SHAPE OF THE INPUT
-        # GET COLUMN FROM THE INPUT
-        COL = IMAGE_TO_COLUMN(X, self.POOL_SHAPE, self.STRIDE, self.PADDING)
-        # RESHAPE COLUMN
-        COL = COL.reshape(-1, self.POOL_SHAPE[0] * self.POOL_SHAPE[1])
-        OUT = np.max(COL, axis=1)  # GET MAX
-        self.ARG_MAX = np.argmax(COL, axis=1)  # SAVE ARGMAX FOR BACKWARD PASS
-        # RETURN OUTPUT
-        return OUT.reshape(N_IMAGES, OUT_HEIGHT, OUT_WIDTH, N_CHANNELS).transpose(0, 3, 1, 2)
+        self.LAST_INPUT_SHAPE = X.shape if self.IS_TRAINING else None  # SAVE SHAPE OF THE INPUT FOR BACKWARD PASS
+        self.ARG_MAX = None  # DROP THE ARGMAX OF THE LAST CALL
+        N_IMAGES, N_CHANNELS, OUT_HEIGHT, OUT_WIDTH = self.SHAPE(
+            X.shape)  # GET SHAPE OF THE OUTPUT
+        P_HEIGHT, P_WIDTH = self.POOL_SHAPE  # GET SHAPE OF THE POOL
+        if tuple(self.STRIDE) == tuple(self.POOL_SHAPE) and self.PADDING[0] == 0 and self.PADDING[1] == 0 and \
+                X.shape[2] == OUT_HEIGHT * P_HEIGHT and X.shape[3] == OUT_WIDTH * P_WIDTH:  # IF THE WINDOWS TILE THE INPUT
+            WINDOWS = X.reshape(N_IMAGES, N_CHANNELS, OUT_HEIGHT,
+                                P_HEIGHT, OUT_WIDTH, P_WIDTH)  # VIEW INPUT AS NON-OVERLAPPING WINDOWS
+            OUT = WINDOWS.max(axis=(3, 5))  # GET MAX
+            OFFSETS = [WINDOWS[:, :, :, Y, :, X_] for Y in range(P_HEIGHT)
+                       for X_ in range(P_WIDTH)]  # GET ONE VIEW PER WINDOW OFFSET
+        else:  # OTHERWISE, IF THE WINDOWS OVERLAP OR THE INPUT IS PADDED
+            PATCHES = IMAGE_TO_PATCHES(
+                X, self.POOL_SHAPE, self.STRIDE, self.PADDING, PAD_VALUE=-np.inf)  # GET VIEW OF THE WINDOWS
+            OFFSETS = [PATCHES[:, :, :, :, Y, X_] for Y in range(P_HEIGHT)
+                       for X_ in range(P_WIDTH)]  # GET ONE VIEW PER WINDOW OFFSET
+            OUT = OFFSETS[0].copy()  # INITIALIZE MAX
+            for OFFSET in OFFSETS[1:]:  # LOOP OVER THE REMAINING WINDOW OFFSETS
+                np.maximum(OUT, OFFSET, out=OUT)  # UPDATE MAX
+        if self.IS_TESTING:  # IF TESTING
+            return OUT  # NO BACKWARD PASS, SO THE ARGMAX IS NOT NEEDED
+        # SAVE THE INDEX OF THE MAX INSIDE EACH WINDOW IN THE SMALLEST UNSIGNED DTYPE
+        self.ARG_MAX = np.empty(OUT.shape, dtype=np.min_scalar_type(len(OFFSETS) - 1))
+        MASK = self.WORKSPACE.GET("MASK", OUT.shape, np.bool_)  # GET MASK
+        for K in reversed(range(len(OFFSETS))):  # LOOP BACKWARDS SO THE FIRST MAX OF A WINDOW WINS
+            np.equal(OFFSETS[K], OUT, out=MASK)  # FIND WHERE THIS OFFSET HOLDS THE MAX
+            np.copyto(self.ARG_MAX, K, where=MASK)  # SAVE ARGMAX FOR BACKWARD PASS
+        return OUT  # RETURN OUTPUT
 
     def BACKWARD_PASS(self, DELTA):
         """RETURNS DELTA FOR THE PREVIOUS LAYER.
@@ -250,17 +353,48 @@ class MAX_POOLING(LAYER):
         NUMPY ARRAY
             DELTA FOR THE PREVIOUS LAYER
         """
-        assert self.LAST_INPUT is not None and self.ARG_MAX is not None, "FORWARD PASS MUST BE CALLED BEFORE BACKWARD PASS"  # CHECK IF FORWARD PASS WAS CALLED
-        DELTA = DELTA.transpose(0, 2, 3, 1)  # RESHAPE DELTA
-        POOL_SIZE = self.POOL_SHAPE[0] * self.POOL_SHAPE[1]  # GET POOL SIZE
-        Y_MAX = np.zeros((DELTA.size, POOL_SIZE))  # CREATE ARRAY FOR DELTA
-        Y_MAX[np.arange(self.ARG_MAX.size), self.ARG_MAX.flatten()
-              ] = DELTA.flatten()  # GET DELTA
-        Y_MAX = Y_MAX.reshape(DELTA.shape + (POOL_SIZE,))  # RESHAPE DELTA
-        DCOL = Y_MAX.reshape(
-            Y_MAX.shape[0] * Y_MAX.shape[1] * Y_MAX.shape[2], -1)  # RESHAPE DELTA
-        # RETURN DELTA FOR THE PREVIOUS LAYER
-        return COLUMN_TO_IMAGE(DCOL, self.LAST_INPUT.shape, self.POOL_SHAPE, self.STRIDE, self.PADDING)
+        assert self.LAST_INPUT_SHAPE is not None and self.ARG_MAX is not None, "FORWARD PASS MUST BE CALLED BEFORE BACKWARD PASS"  # CHECK IF FORWARD PASS WAS CALLED
+        N_IMAGES, N_CHANNELS, HEIGHT, WIDTH = self.LAST_INPUT_SHAPE  # GET SHAPE OF THE INPUT
+        OUT_HEIGHT, OUT_WIDTH = self.ARG_MAX.shape[2:]  # GET SHAPE OF THE OUTPUT
+        P_HEIGHT, P_WIDTH = self.POOL_SHAPE  # GET SHAPE OF THE POOL
+        S_HEIGHT, S_WIDTH = self.STRIDE  # GET STRIDE
+        # CREATE ARRAY FOR THE PADDED DELTA
+        D_X = np.zeros((N_IMAGES, N_CHANNELS, HEIGHT + 2 * self.PADDING[0], WIDTH + 2 * self.PADDING[1]),
+                       dtype=DELTA.dtype)
+        MASK = self.WORKSPACE.GET("MASK", self.ARG_MAX.shape, np.bool_)  # GET MASK
+        ROUTED = self.WORKSPACE.GET("ROUTED", DELTA.shape, DELTA.dtype)  # GET ROUTED DELTA
+        for Y in range(P_HEIGHT):  # LOOP OVER POOL ROWS
+            for X in range(P_WIDTH):  # LOOP OVER POOL COLUMNS
+                np.equal(self.ARG_MAX, Y * P_WIDTH + X, out=MASK)  # FIND WINDOWS WHOSE MAX IS AT THIS OFFSET
+                np.multiply(DELTA, MASK, out=ROUTED)  # ROUTE DELTA TO THOSE WINDOWS
+                D_X[:, :, Y: Y + S_HEIGHT * OUT_HEIGHT: S_HEIGHT,
+                    X: X + S_WIDTH * OUT_WIDTH: S_WIDTH] += ROUTED  # SCATTER-ADD DELTA
+        if self.PADDING[0] == 0 and self.PADDING[1] == 0:  # IF THE INPUT WAS NOT PADDED
+            return D_X  # RETURN DELTA FOR THE PREVIOUS LAYER
+        # RETURN DELTA FOR THE PREVIOUS LAYER WITHOUT PADDING
+        return D_X[:, :, self.PADDING[0]: HEIGHT + self.PADDING[0], self.PADDING[1]: WIDTH + self.PADDING[1]]
+
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        RETURNS
+        -------
+        FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER
+        """
+        SHAPE = self.SHAPE  # SHAPE OF THE OUTPUT
+        POOL_SHAPE, STRIDE, PADDING = self.POOL_SHAPE, self.STRIDE, self.PADDING  # GEOMETRY
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            N_IMAGES, N_CHANNELS, OUT_HEIGHT, OUT_WIDTH = SHAPE(X.shape)  # GET SHAPE OF THE OUTPUT
+            P_HEIGHT, P_WIDTH = POOL_SHAPE  # GET SHAPE OF THE POOL
+            if tuple(STRIDE) == tuple(POOL_SHAPE) and PADDING[0] == 0 and PADDING[1] == 0 and \
+                    X.shape[2] == OUT_HEIGHT * P_HEIGHT and X.shape[3] == OUT_WIDTH * P_WIDTH:  # IF THE WINDOWS TILE THE INPUT
+                return X.reshape(N_IMAGES, N_CHANNELS, OUT_HEIGHT, P_HEIGHT,
+                                 OUT_WIDTH, P_WIDTH).max(axis=(3, 5))  # RETURN MAX OF EACH WINDOW
+            PATCHES = IMAGE_TO_PATCHES(X, POOL_SHAPE, STRIDE, PADDING, PAD_VALUE=-np.inf)  # GET VIEW OF THE WINDOWS
+            return PATCHES.max(axis=(4, 5))  # RETURN MAX OF EACH WINDOW
+        return FORWARD  # RETURN FORWARD FUNCTION
 
     def SHAPE(self, X_SHAPE):
         """RETURNS SHAPE OF THE OUTPUT.
@@ -349,6 +483,18 @@ class FLATTEN(LAYER):
         """
         return DELTA.reshape(self.LAST_INPUT_SHAPE)  # RETURN DELTA FOR THE PREVIOUS LAYER
 
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        RETURNS
+        -------
+        FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER
+        """
+        def FORWARD(X):  # FORWARD FUNCTION
+            return X.reshape((X.shape[0], -1))  # RETURN OUTPUT
+        return FORWARD  # RETURN FORWARD FUNCTION
+
     def SHAPE(self, X_SHAPE):
         """RETURNS SHAPE OF THE OUTPUT.
 
@@ -367,8 +513,8 @@ class FLATTEN(LAYER):
 ##############################################################################################################
 
 
-def IMAGE_TO_COLUMN(IMAGES, FILTER_SHAPE, STRIDE, PADDING):
-    """RETURNS COLUMN FROM THE INPUT.
+def IMAGE_TO_PATCHES(IMAGES, FILTER_SHAPE, STRIDE, PADDING, PAD_VALUE=0.0, PADDED=None):
+    """RETURNS A ZERO-COPY VIEW OF THE PATCHES OF THE INPUT.
 
     PARAMETERS
     ----------
@@ -378,33 +524,71 @@ def IMAGE_TO_COLUMN(IMAGES, FILTER_SHAPE, STRIDE, PADDING):
         SHAPE OF THE FILTER
     STRIDE : TUPLE(INT, INT)
         STRIDE OF THE FILTER
-    PADDING : INT
+    PADDING : TUPLE(INT, INT)
         PADDING OF THE INPUT
+    PAD_VALUE : FLOAT, DEFAULT 0.0
+        VALUE USED TO PAD THE INPUT
+    PADDED : NUMPY ARRAY, DEFAULT NONE
+        PREALLOCATED ARRAY FOR THE PADDED INPUT
 
     RETURNS
     -------
     NUMPY ARRAY
-        COLUMN FROM THE INPUT
+        READ-ONLY VIEW OF SHAPE (N_IMAGES, N_CHANNELS, OUT_HEIGHT, OUT_WIDTH, F_HEIGHT, F_WIDTH)
     """
-    N_IMAGES, N_CHANNELS, HEIGHT, WIDTH = IMAGES.shape  # GET SHAPE OF THE INPUT
-    F_HEIGHT, F_WIDTH = FILTER_SHAPE  # GET SHAPE OF THE FILTER
-    OUT_HEIGHT, OUT_WIDTH = CONVOLUTION_SHAPE(
-        HEIGHT, WIDTH, (F_HEIGHT, F_WIDTH), STRIDE, PADDING)  # GET SHAPE OF THE OUTPUT
-    IMAGES = np.pad(IMAGES, ((0, 0), (0, 0), PADDING, PADDING))  # PAD INPUT
-    COL = np.zeros((N_IMAGES, N_CHANNELS, F_HEIGHT, F_WIDTH,
-                   OUT_HEIGHT, OUT_WIDTH))  # CREATE ARRAY FOR COLUMN
-    for Y in range(F_HEIGHT):  # LOOP OVER HEIGHT
-        Y_BOUND = Y + STRIDE[0] * OUT_HEIGHT  # GET BOUND
-        for X in range(F_WIDTH):  # LOOP OVER WIDTH
-            X_BOUND = X + STRIDE[1] * OUT_WIDTH  # GET BOUND
-            COL[:, :, Y, X, :, :] = IMAGES[:, :, Y: Y_BOUND: STRIDE[0],
-                                           X: X_BOUND: STRIDE[1]]  # GET COLUMN
-    COL = COL.transpose((0, 4, 5, 1, 2, 3)).reshape(
-        N_IMAGES * OUT_HEIGHT * OUT_WIDTH, -1)  # RESHAPE COLUMN
-    return COL  # RETURN COLUMN
+    if (PADDING[0] > 0 or PADDING[1] > 0) and PADDED is None:  # IF THE INPUT NEEDS PADDING
+        IMAGES = np.pad(IMAGES, ((0, 0), (0, 0), (PADDING[0], PADDING[0]), (PADDING[1], PADDING[1])),
+                        constant_values=PAD_VALUE)  # PAD INPUT (THE ONLY COPY)
+    elif PADDING[0] > 0 or PADDING[1] > 0:  # IF THE INPUT NEEDS PADDING INTO A PREALLOCATED ARRAY
+        HEIGHT, WIDTH = IMAGES.shape[2:]  # GET SHAPE OF THE INPUT
+        PADDED[:, :, :PADDING[0]] = PAD_VALUE  # PAD TOP
+        PADDED[:, :, PADDING[0] + HEIGHT:] = PAD_VALUE  # PAD BOTTOM
+        PADDED[:, :, :, :PADDING[1]] = PAD_VALUE  # PAD LEFT
+        PADDED[:, :, :, PADDING[1] + WIDTH:] = PAD_VALUE  # PAD RIGHT
+        PADDED[:, :, PADDING[0]: PADDING[0] + HEIGHT,
+               PADDING[1]: PADDING[1] + WIDTH] = IMAGES  # COPY INPUT
+        IMAGES = PADDED  # USE PADDED INPUT
+    PATCHES = sliding_window_view(
+        IMAGES, FILTER_SHAPE, axis=(2, 3))  # GET EVERY WINDOW AS A VIEW
+    return PATCHES[:, :, ::STRIDE[0], ::STRIDE[1]]  # KEEP ONLY STRIDED WINDOWS
+
+
+def IMAGE_TO_COLUMN(IMAGES, FILTER_SHAPE, STRIDE, PADDING, OUT=None, PADDED=None):
+    """RETURNS COLUMN FROM THE INPUT.
 
+    PARAMETERS
+    ----------
+    IMAGES : NUMPY ARRAY
+        INPUT TO THE LAYER
+    FILTER_SHAPE : TUPLE(INT, INT)
+        SHAPE OF THE FILTER
+    STRIDE : TUPLE(INT, INT)
+        STRIDE OF THE FILTER
+    PADDING : TUPLE(INT, INT)
+        PADDING OF THE INPUT
+    OUT : NUMPY ARRAY, DEFAULT NONE
+        PREALLOCATED C-CONTIGUOUS ARRAY FOR THE COLUMN
+    PADDED : NUMPY ARRAY, DEFAULT NONE
+        PREALLOCATED ARRAY FOR THE PADDED INPUT
 
-def COLUMN_TO_IMAGE(COLUMNS, IMAGES_SHAPE, FILTER_SHAPE, STRIDE, PADDING):
+    RETURNS
+    -------
+    NUMPY ARRAY
+        COLUMN FROM THE INPUT OF SHAPE (N_IMAGES * OUT_HEIGHT * OUT_WIDTH, N_CHANNELS * F_HEIGHT * F_WIDTH)
+    """
+    PATCHES = IMAGE_TO_PATCHES(
+        IMAGES, FILTER_SHAPE, STRIDE, PADDING, PADDED=PADDED)  # GET VIEW OF THE PATCHES
+    N_IMAGES, N_CHANNELS, OUT_HEIGHT, OUT_WIDTH, F_HEIGHT, F_WIDTH = PATCHES.shape  # GET SHAPE OF THE PATCHES
+    PATCHES = PATCHES.transpose(0, 2, 3, 1, 4, 5)  # MOVE CHANNELS NEXT TO THE FILTER AXES
+    if OUT is None:  # IF NO COLUMN IS GIVEN
+        # GATHER THE PATCHES INTO A NEW COLUMN IN A SINGLE COPY
+        return PATCHES.reshape(N_IMAGES * OUT_HEIGHT * OUT_WIDTH, N_CHANNELS * F_HEIGHT * F_WIDTH)
+    # GATHER THE PATCHES INTO THE GIVEN COLUMN
+    np.copyto(OUT.reshape(PATCHES.shape), PATCHES)
+    return OUT  # RETURN COLUMN
+
+
+def COLUMN_TO_IMAGE(COLUMNS, IMAGES_SHAPE, FILTER_SHAPE, STRIDE, PADDING, OUT=None):
     """RETURNS IMAGE FROM THE COLUMN.
 
     PARAMETERS
@@ -417,8 +601,10 @@ def COLUMN_TO_IMAGE(COLUMNS, IMAGES_SHAPE, FILTER_SHAPE, STRIDE, PADDING):
         SHAPE OF THE FILTER
     STRIDE : TUPLE(INT, INT)
         STRIDE OF THE FILTER
-    PADDING : INT
+    PADDING : TUPLE(INT, INT)
         PADDING OF THE INPUT
+    OUT : NUMPY ARRAY, DEFAULT NONE
+        PREALLOCATED ARRAY FOR THE PADDED IMAGE
 
     RETURNS
     -------
@@ -430,21 +616,24 @@ def COLUMN_TO_IMAGE(COLUMNS, IMAGES_SHAPE, FILTER_SHAPE, STRIDE, PADDING):
     OUT_HEIGHT, OUT_WIDTH = CONVOLUTION_SHAPE(
         HEIGHT, WIDTH, (F_HEIGHT, F_WIDTH), STRIDE, PADDING)  # GET SHAPE OF THE OUTPUT
     COLUMNS = COLUMNS.reshape(N_IMAGES, OUT_HEIGHT, OUT_WIDTH, N_CHANNELS, F_HEIGHT, F_WIDTH).transpose(
-        0, 3, 4, 5, 1, 2
-    )  # RESHAPE COLUMN
-    IMG_H = HEIGHT + 2 * PADDING[0] + \
-        STRIDE[0] - 1  # GET THE HEIGHT OF THE IMAGE
-    IMG_W = WIDTH + 2 * PADDING[1] + STRIDE[1] - \
-        1  # GET THE WIDTH OF THE IMAGE
-    # CREATE ARRAY FOR IMAGE
-    IMG = np.zeros((N_IMAGES, N_CHANNELS, IMG_H, IMG_W))
-    for Y in range(F_HEIGHT):  # LOOP OVER HEIGHT
+        0, 3, 1, 2, 4, 5
+    )  # VIEW COLUMN AS (N_IMAGES, N_CHANNELS, OUT_HEIGHT, OUT_WIDTH, F_HEIGHT, F_WIDTH) WITHOUT COPYING
+    if OUT is None:  # IF NO IMAGE IS GIVEN
+        # CREATE ARRAY FOR THE PADDED IMAGE
+        IMG = np.zeros((N_IMAGES, N_CHANNELS, HEIGHT + 2 * PADDING[0], WIDTH + 2 * PADDING[1]),
+                       dtype=COLUMNS.dtype)
+    else:  # OTHERWISE
+        IMG = OUT  # USE THE GIVEN IMAGE
+        IMG.fill(0.0)  # CLEAR IMAGE
+    for Y in range(F_HEIGHT):  # LOOP OVER FILTER ROWS
         Y_BOUND = Y + STRIDE[0] * OUT_HEIGHT  # GET BOUND
-        for X in range(F_WIDTH):  # LOOP OVER WIDTH
+        for X in range(F_WIDTH):  # LOOP OVER FILTER COLUMNS
             X_BOUND = X + STRIDE[1] * OUT_WIDTH  # GET BOUND
-            IMG[:, :, Y: Y_BOUND: STRIDE[0], X: X_BOUND: STRIDE[1]
-                ] += COLUMNS[:, :, Y, X, :, :]  # GET IMAGE
-    # RETURN IMAGE
+            # SCATTER-ADD ONE FILTER OFFSET, WHOSE TARGETS NEVER OVERLAP
+            IMG[:, :, Y: Y_BOUND: STRIDE[0], X: X_BOUND: STRIDE[1]] += COLUMNS[:, :, :, :, Y, X]
+    if PADDING[0] == 0 and PADDING[1] == 0:  # IF THE INPUT WAS NOT PADDED
+        return IMG  # RETURN IMAGE
+    # RETURN IMAGE WITHOUT PADDING
     return IMG[:, :, PADDING[0]: HEIGHT + PADDING[0], PADDING[1]: WIDTH + PADDING[1]]
 
 
@@ -3,6 +3,9 @@ import numpy as np
 from .BASIC import LAYER, PARAM_MIXIN, PHASE_MIXIN
 from ..PARAMETERS import PARAMETER
 
+# LAYER ATTRIBUTES THAT ARE NOT PARAMETERS BUT ARE LEARNED DURING TRAINING (THE RUNNING AVERAGES BELOW)
+LEARNED_STATE = ("EMA_MEAN", "EMA_VAR")
+
 
 class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
     """BATCH NORMALIZATION LAYER
@@ -26,11 +29,13 @@ class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
         PERFORMS A FORWARD PASS THROUGH THE LAYER
     BACKWARD_PASS(X)
         PERFORMS A BACKWARD PASS THROUGH THE LAYER
+    FOLD()
+        RETURNS THE TESTING-PHASE SCALE AND SHIFT OF EACH FEATURE
     SHAPE()
         RETURNS THE SHAPE OF THE LAYER
     """
 
-    def __init__(self, MOMENTUM=0.9, EPS=1e-5, PARAMETERS=PARAMETER()):
+    def __init__(self, MOMENTUM=0.9, EPS=1e-5, PARAMETERS=None):
         """INITIALIZE BATCH NORMALIZATION LAYER
 
         PARAMETERS
@@ -40,7 +45,7 @@ class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
         EPS : FLOAT
             EPSILON FOR NUMERICAL STABILITY
         PARAMETERS : PARAMETER
-            PARAMETERS OF THE LAYER
+            PARAMETERS OF THE LAYER (NONE FOR NEW DEFAULT PARAMETERS)
         EMA_MEAN : FLOAT
             EXPONENTIAL MOVING AVERAGE OF THE MEAN
         EMA_VAR : FLOAT
@@ -51,6 +56,8 @@ class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
         NONE
         """
         super().__init__()  # INITIALIZE LAYER
+        if PARAMETERS is None:  # IF NO PARAMETERS ARE GIVEN
+            PARAMETERS = PARAMETER()  # CREATE PARAMETERS OF THIS LAYER ONLY
         self.__PARAMETERS__ = PARAMETERS  # INITIALIZE PARAMETERS
         self.MOMENTUM = MOMENTUM  # INITIALIZE MOMENTUM
         self.EPS = EPS  # INITIALIZE EPSILON
@@ -91,6 +98,7 @@ class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
         if self.IS_TESTING:  # IF TESTING
             # ENSURE EMA_MEAN AND EMA_VAR ARE SET
             assert self.EMA_MEAN is not None and self.EMA_VAR is not None, "EMA_MEAN AND EMA_VAR MUST BE SET FOR TESTING"
+            self.CACHE = None  # NO BACKWARD PASS WHILE TESTING, DROP THE CACHE
             MU = self.EMA_MEAN  # GET MEAN
             XMU = X - MU  # GET X - MEAN
             VAR = self.EMA_VAR  # GET VARIANCE
@@ -117,8 +125,8 @@ class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
                 (1 - self.MOMENTUM) * MU  # UPDATE EMA_MEAN
             self.EMA_VAR = self.MOMENTUM * self.EMA_VAR + \
                 (1 - self.MOMENTUM) * VAR  # UPDATE EMA_VAR
-        self.CACHE = (XHAT, GAMMA, XMU, IVAR, SQRTVAR,
-                      VAR)  # STORE VARIABLES IN CACHE
+        self.CACHE = (self.STORE(XHAT), GAMMA, self.STORE(XMU), IVAR, SQRTVAR,
+                      VAR)  # STORE VARIABLES IN CACHE, THE NORMALIZED AND CENTERED INPUTS IN THE STORAGE DTYPE
         return OUT  # RETURN OUTPUT
 
     def FORWARD_PASS(self, X):
@@ -161,6 +169,7 @@ class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
         """
         assert self.CACHE is not None, "FORWARD PASS MUST BE RUN BEFORE BACKWARD PASS"  # ENSURE FORWARD PASS HAS BEEN RUN
         XHAT, GAMMA, XMU, IVAR, SQRTVAR, VAR = self.CACHE  # GET VARIABLES FROM CACHE
+        XHAT, XMU = self.LOAD(XHAT, DELTA), self.LOAD(XMU, DELTA)  # GET THE INPUTS IN THE DTYPE OF THE DELTA
         N, D = DELTA.shape  # GET NUMBER OF SAMPLES AND FEATURES
         D_BETA = np.sum(DELTA, axis=0)  # GET DERIVATIVE OF BETA
         D_GAMMAX = DELTA  # GET DERIVATIVE OF GAMMA * NORMALIZED INPUT
@@ -174,11 +183,11 @@ class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
         # GET DERIVATIVE OF VARIANCE
         D_VAR = 0.5 * 1.0 / np.sqrt(VAR + self.EPS) * D_SQRTVAR
         # GET DERIVATIVE OF (X - MEAN) ** 2
-        DSQ = 1.0 / N * np.ones((N, D)) * D_VAR
+        DSQ = 1.0 / N * np.ones((N, D), dtype=DELTA.dtype) * D_VAR
         D_XMU_2 = 2 * XMU * DSQ  # GET DERIVATIVE OF X - MEAN
         DX_1 = D_XMU_1 + D_XMU_2  # GET DERIVATIVE OF INPUT
         D_MU = -1 * np.sum(D_XMU_1 + D_XMU_2, axis=0)  # GET DERIVATIVE OF MEAN
-        DX_2 = 1.0 / N * np.ones((N, D)) * D_MU  # GET DERIVATIVE OF INPUT
+        DX_2 = 1.0 / N * np.ones((N, D), dtype=DELTA.dtype) * D_MU  # GET DERIVATIVE OF INPUT
         DX = DX_1 + DX_2  # GET DERIVATIVE OF INPUT
         self.__PARAMETERS__.UPDATE_GRAD(
             "W", D_GAMMA)  # UPDATE GRADIENT OF GAMMA
@@ -210,6 +219,44 @@ class BATCH_NORMALIZATION(LAYER, PARAM_MIXIN, PHASE_MIXIN):
             raise NotImplementedError(
                 "INPUT SHAPE NOT SUPPORTED")  # RAISE ERROR
 
+    def FOLD(self):
+        """RETURNS THE TESTING-PHASE SCALE AND SHIFT OF EACH FEATURE
+
+        IN THE TESTING PHASE THE LAYER COMPUTES X * SCALE + SHIFT, SO IT CAN BE
+        FOLDED INTO THE WEIGHTS AND BIASES OF THE LAYER BEFORE IT.
+
+        RETURNS
+        -------
+        SCALE : NUMPY ARRAY
+            GAMMA / SQRT(EMA_VAR + EPS) OF EACH FEATURE
+        SHIFT : NUMPY ARRAY
+            BETA - EMA_MEAN * SCALE OF EACH FEATURE
+        """
+        # ENSURE EMA_MEAN AND EMA_VAR ARE SET
+        assert self.EMA_MEAN is not None and self.EMA_VAR is not None, "EMA_MEAN AND EMA_VAR MUST BE SET FOR TESTING"
+        # FOLD THE RUNNING STATISTICS INTO ONE SCALE AND SHIFT PER FEATURE
+        SCALE = (self.__PARAMETERS__["W"] / np.sqrt(self.EMA_VAR + self.EPS)).reshape(-1)
+        SHIFT = self.__PARAMETERS__["b"].reshape(-1) - self.EMA_MEAN * SCALE  # BETA - MEAN * SCALE
+        return SCALE, SHIFT  # RETURN SCALE AND SHIFT
+
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE.
+
+        RETURNS
+        -------
+        FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER
+        """
+        SCALE, SHIFT = self.FOLD()  # FOLD THE RUNNING STATISTICS
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            if len(X.shape) == 2:  # IF INPUT IS A REGULAR LAYER
+                return X * SCALE + SHIFT  # RETURN OUTPUT
+            elif len(X.shape) == 4:  # IF INPUT IS A CONVOLUTION LAYER
+                return X * SCALE[:, np.newaxis, np.newaxis] + SHIFT[:, np.newaxis, np.newaxis]  # SCALE EACH CHANNEL
+            raise NotImplementedError("INPUT SHAPE NOT SUPPORTED")  # RAISE ERROR
+        return FORWARD  # RETURN FORWARD FUNCTION
+
     def SHAPE(self, X_SHAPE):
         """RETURNS THE SHAPE OF THE OUTPUT GIVEN AN INPUT SHAPE
 
@@ -1,15 +1,21 @@
-from autograd import elementwise_grad
 import numpy as np
 
-from ...ACTIVATIONS import TANH, SIGMOID
+from ...ACTIVATIONS import DERIVATIVE, SIGMOID, SIGMOID_DERIVATIVE, TANH
 from ...INITIALIZATIONS import ORTHOGONAL
-from ..BASIC import LAYER, PARAM_MIXIN
+from ..BASIC import LAYER, PARAM_MIXIN, PHASE_MIXIN
 from ...PARAMETERS import PARAMETER
 
 
-class LSTM(LAYER, PARAM_MIXIN):
+class LSTM(LAYER, PARAM_MIXIN, PHASE_MIXIN):
     """LONG SHORT-TERM MEMORY LAYER
 
+    THE WEIGHTS OF THE FOUR GATES ARE STACKED ALONG THE COLUMNS IN THE ORDER
+    INPUT, FORGET, OUTPUT, CELL, SO EACH PROJECTION IS A SINGLE GEMM: ONE FOR
+    THE INPUTS OF ALL TIMESTEPS, ONE PER TIMESTEP FOR THE RECURRENCE, AND ONE
+    EACH FOR THE GRADIENTS OF W, U AND THE INPUT AFTER THE BACKWARD LOOP.
+    THE ARRAYS CACHED FOR THE BACKWARD PASS ARE KEPT IN THE STORAGE DTYPE.
+    WHILE TESTING, ONLY THE STATE CARRIED BETWEEN CALLS IS KEPT.
+
     ATTRIBUTES
     ----------
     HIDDEN_DIM : INT
@@ -31,11 +37,15 @@ class LSTM(LAYER, PARAM_MIXIN):
         FORWARD PROPAGATION
     BACKWARD_PASS(DELTA)
         BACKWARD PROPAGATION
+    RESET_STATE()
+        RESETS THE CELL STATE AND OUTPUT CARRIED BETWEEN CALLS
+    FREEZE()
+        RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE
     SHAPE(X_SHAPE)
         RETURNS SHAPE OF OUTPUT
     """
 
-    def __init__(self, HIDDEN_DIM, ACTIVATION=TANH, INNER_INIT=ORTHOGONAL, PARAMETERS=PARAMETER(), RETURN_SEQUENCES=True):
+    def __init__(self, HIDDEN_DIM, ACTIVATION=TANH, INNER_INIT=ORTHOGONAL, PARAMETERS=None, RETURN_SEQUENCES=True):
         """INITIALIZE LSTM LAYER
 
         PARAMETERS
@@ -47,7 +57,7 @@ class LSTM(LAYER, PARAM_MIXIN):
         INNER_INIT : FUNCTION
             INNER WEIGHT INITIALIZATION FUNCTION
         PARAMETERS : PARAMETER
-            PARAMETER OBJECT
+            PARAMETER OBJECT (NONE FOR NEW DEFAULT PARAMETERS)
         RETURN_SEQUENCES : BOOL
             IF TRUE, RETURNS ALL OUTPUTS, ELSE RETURNS LAST OUTPUT
 
@@ -59,17 +69,19 @@ class LSTM(LAYER, PARAM_MIXIN):
         self.HIDDEN_DIM = HIDDEN_DIM  # NUMBER OF HIDDEN UNITS
         self.INNER_INIT = INNER_INIT  # INNER WEIGHT INITIALIZATION FUNCTION
         self.ACTIVATION = ACTIVATION  # ACTIVATION FUNCTION
+        self.ACTIVATION_DERIVATIVE = DERIVATIVE(ACTIVATION)  # DERIVATIVE OF THE ACTIVATION FUNCTION
+        if PARAMETERS is None:  # IF NO PARAMETERS ARE GIVEN
+            PARAMETERS = PARAMETER()  # CREATE PARAMETERS OF THIS LAYER ONLY
         self.__PARAMETERS__ = PARAMETERS  # PARAMETER OBJECT
         self.LAST_INPUT = None  # LAST INPUT
-        self.STATES = None  # STATES
+        self.STATES = None  # CELL STATES
         self.OUTPUTS = None  # OUTPUTS
-        self.GATES = None  # GATES
-        self.H_PREV = None  # PREVIOUS HIDDEN STATE
+        self.GATES = None  # ACTIVATED GATES
+        self.CANDIDATES = None  # CELL CANDIDATES BEFORE ACTIVATION
+        self.CELL_OUTPUTS = None  # ACTIVATED CELL STATES
         self.INPUT_DIM = None  # INPUT DIMENSION
-        self.W = None  # INPUT WEIGHTS
-        self.U = None  # HIDDEN WEIGHTS
         self.O_PREV = None  # PREVIOUS OUTPUT
-        self.H_PREV = None  # PREVIOUS HIDDEN STATE
+        self.H_PREV = None  # PREVIOUS CELL STATE
 
     def SETUP(self, X_SHAPE):
         """SETUP PARAMETERS
@@ -85,41 +97,23 @@ class LSTM(LAYER, PARAM_MIXIN):
 
         NAMING CONVENTION
         -----------------
-        W_I : INPUT WEIGHTS
-        W_F : FORGET WEIGHTS
-        W_O : OUTPUT WEIGHTS
-        W_C : CELL WEIGHTS
-        U_I : INPUT WEIGHTS
-        U_F : FORGET WEIGHTS
-        U_O : OUTPUT WEIGHTS
-        U_C : CELL WEIGHTS
-        b_I : INPUT BIAS
-        b_F : FORGET BIAS
-        b_O : OUTPUT BIAS
-        b_C : CELL BIAS
+        W : INPUT WEIGHTS, SHAPE (INPUT_DIM, 4 * HIDDEN_DIM)
+        U : HIDDEN WEIGHTS, SHAPE (HIDDEN_DIM, 4 * HIDDEN_DIM)
+        b : BIAS, SHAPE (4 * HIDDEN_DIM,)
+        EACH IS SPLIT INTO [INPUT | FORGET | OUTPUT | CELL] BLOCKS OF HIDDEN_DIM COLUMNS
         """
         self.INPUT_DIM = X_SHAPE[2]  # INPUT DIMENSION
-        W_PARAMETERS = ["W_i", "W_f", "W_o", "W_c"]  # INPUT -> HIDDEN
-        U_PARAMETERS = ["U_i", "U_f", "U_o", "U_c"]  # HIDDEN -> HIDDEN
-        B_PARAMETERS = ["b_i", "b_f", "b_o", "b_c"]  # BIAS
-        for PARAM in W_PARAMETERS:  # INITIALIZE PARAMETERS
-            self.__PARAMETERS__[PARAM] = self.__PARAMETERS__.INIT(
-                (self.INPUT_DIM, self.HIDDEN_DIM))  # INITIALIZE WEIGHTS
-        for PARAM in U_PARAMETERS:  # INITIALIZE PARAMETERS
-            self.__PARAMETERS__[PARAM] = self.INNER_INIT(
-                (self.HIDDEN_DIM, self.HIDDEN_DIM))  # INITIALIZE WEIGHTS
-        for PARAM in B_PARAMETERS:  # INITIALIZE PARAMETERS
-            self.__PARAMETERS__[PARAM] = np.full(
-                (self.HIDDEN_DIM,), self.__PARAMETERS__.INITIAL_BIAS)  # INITIALIZE BIAS
-        self.W = [self.__PARAMETERS__[PARAM]
-                  for PARAM in W_PARAMETERS]  # INPUT WEIGHTS
-        self.U = [self.__PARAMETERS__[PARAM]
-                  for PARAM in U_PARAMETERS]  # HIDDEN WEIGHTS
+        self.__PARAMETERS__["W"] = np.concatenate([self.__PARAMETERS__.INIT(
+            (self.INPUT_DIM, self.HIDDEN_DIM)) for _ in range(4)], axis=1)  # INITIALIZE EACH GATE BLOCK OF THE INPUT WEIGHTS
+        self.__PARAMETERS__["U"] = np.concatenate([self.INNER_INIT(
+            (self.HIDDEN_DIM, self.HIDDEN_DIM)) for _ in range(4)], axis=1)  # INITIALIZE EACH GATE BLOCK OF THE HIDDEN WEIGHTS
+        self.__PARAMETERS__["b"] = np.full(
+            (4 * self.HIDDEN_DIM,), self.__PARAMETERS__.INITIAL_BIAS)  # INITIALIZE BIAS
         self.__PARAMETERS__.INIT_GRAD()  # INITIALIZE GRADIENTS
-        # PREVIOUS HIDDEN STATE
-        self.H_PREV = np.zeros((X_SHAPE[0], self.HIDDEN_DIM))
+        # PREVIOUS CELL STATE
+        self.H_PREV = np.zeros((X_SHAPE[0], self.HIDDEN_DIM), dtype=self.COMPUTE_DTYPE)
         self.O_PREV = np.zeros(
-            (X_SHAPE[0], self.HIDDEN_DIM))  # PREVIOUS OUTPUT
+            (X_SHAPE[0], self.HIDDEN_DIM), dtype=self.COMPUTE_DTYPE)  # PREVIOUS OUTPUT
 
     def FORWARD_PASS(self, X):
         """FORWARD PROPAGATION
@@ -134,48 +128,61 @@ class LSTM(LAYER, PARAM_MIXIN):
         NUMPY ARRAY
             OUTPUT
         """
-        assert self.W is not None, "SETUP HAS NOT BEEN CALLED"  # ENSURE SETUP HAS BEEN CALLED
-        # ENSURE SETUP HAS BEEN CALLED
-        assert self.U is not None, "SETUP HAS NOT BEEN CALLED"
+        assert self.INPUT_DIM is not None, "SETUP HAS NOT BEEN CALLED"  # ENSURE SETUP HAS BEEN CALLED
         N_SAMPLES, N_TIMESTEPS, _ = X.shape  # GET INPUT SHAPE
+        H = self.HIDDEN_DIM  # NUMBER OF HIDDEN UNITS
         P = self.__PARAMETERS__  # PARAMETERS
-        self.LAST_INPUT = X  # LAST INPUT
-        self.STATES = np.zeros(
-            (N_SAMPLES, N_TIMESTEPS + 1, self.HIDDEN_DIM))  # STATES
-        self.OUTPUTS = np.zeros(
-            (N_SAMPLES, N_TIMESTEPS + 1, self.HIDDEN_DIM))  # OUTPUTS
-        self.GATES = {KEY: np.zeros((N_SAMPLES, N_TIMESTEPS, self.HIDDEN_DIM)) for KEY in [
-            "i", "f", "o", "c"]}  # GATES
-        self.STATES[:, -1, :] = self.H_PREV  # INITIALIZE STATES
-        self.OUTPUTS[:, -1, :] = self.O_PREV  # INITIALIZE OUTPUTS
+        DTYPE = np.result_type(X.dtype, P["W"].dtype)  # DTYPE OF THE STATES
+        if self.H_PREV is None or self.H_PREV.shape[0] != N_SAMPLES:  # IF THE BATCH SIZE CHANGED
+            self.H_PREV = np.zeros((N_SAMPLES, H), dtype=DTYPE)  # RESET PREVIOUS CELL STATE
+            self.O_PREV = np.zeros((N_SAMPLES, H), dtype=DTYPE)  # RESET PREVIOUS OUTPUT
+        if self.IS_TESTING:  # IF TESTING, NOTHING IS KEPT FOR THE BACKWARD PASS
+            self.LAST_INPUT = self.STATES = self.OUTPUTS = self.GATES = None  # DROP CACHES
+            self.CANDIDATES = self.CELL_OUTPUTS = None  # DROP CACHES
+            OUTPUTS, self.H_PREV = INFERENCE_PASS(
+                X, P["W"], P["U"], P["b"], self.ACTIVATION, self.H_PREV, self.O_PREV)  # FORWARD PROPAGATION
+            self.O_PREV = OUTPUTS[:, -1, :].copy()  # PREVIOUS OUTPUT
+            return OUTPUTS[:, 1:, :] if self.RETURN_SEQUENCES else OUTPUTS[:, -1, :]  # RETURN OUTPUT
+        # STATES AND OUTPUTS HOLD THE INITIAL VALUES AT INDEX 0 AND TIMESTEP T AT INDEX T + 1
+        self.STATES = np.empty((N_SAMPLES, N_TIMESTEPS + 1, H), dtype=DTYPE)  # CELL STATES
+        self.OUTPUTS = np.empty((N_SAMPLES, N_TIMESTEPS + 1, H), dtype=DTYPE)  # OUTPUTS
+        self.CELL_OUTPUTS = np.empty((N_SAMPLES, N_TIMESTEPS, H), dtype=DTYPE)  # ACTIVATED CELL STATES
+        self.CANDIDATES = np.empty((N_SAMPLES, N_TIMESTEPS, H), dtype=DTYPE)  # CELL CANDIDATES BEFORE ACTIVATION
+        self.STATES[:, 0, :] = self.H_PREV  # INITIALIZE STATES
+        self.OUTPUTS[:, 0, :] = self.O_PREV  # INITIALIZE OUTPUTS
+        # PROJECT THE INPUTS OF ALL TIMESTEPS ONTO ALL GATES WITH ONE GEMM
+        self.GATES = np.dot(X.reshape(N_SAMPLES * N_TIMESTEPS, -1),
+                            P["W"]).reshape(N_SAMPLES, N_TIMESTEPS, 4 * H)
+        self.GATES += P["b"]  # ADD BIAS
+        RECURRENT = np.empty((N_SAMPLES, 4 * H), dtype=DTYPE)  # BUFFER FOR THE RECURRENT PROJECTION
         for STEP in range(N_TIMESTEPS):  # LOOP OVER TIMESTEPS
-            # INPUT * WEIGHTS + OUTPUT * WEIGHTS
-            T_GATES = np.dot(X[:, STEP, :], self.W) + \
-                np.dot(self.OUTPUTS[:, STEP - 1, :], self.U)
-            self.GATES["i"][:, STEP, :] = SIGMOID(
-                T_GATES[:, 0, :] + P["b_i"])  # INPUT
-            self.GATES["f"][:, STEP, :] = SIGMOID(
-                T_GATES[:, 1, :] + P["b_f"])  # FORGET
-            self.GATES["o"][:, STEP, :] = SIGMOID(
-                T_GATES[:, 2, :] + P["b_o"])  # OUTPUT
-            self.GATES["c"][:, STEP, :] = self.ACTIVATION(
-                T_GATES[:, 3, :] + P["b_c"])  # CELL
-            self.STATES[:, STEP, :] = (
-                self.STATES[:, STEP - 1, :] *
-                self.GATES["f"][:, STEP, :]  # FORGET GATE
-                + self.GATES["i"][:, STEP, :] * \
-                self.GATES["c"][:, STEP, :]  # INPUT GATE
+            np.dot(self.OUTPUTS[:, STEP, :], P["U"], out=RECURRENT)  # PROJECT PREVIOUS OUTPUT ONTO ALL GATES
+            GATES = self.GATES[:, STEP, :]  # GATES OF THIS TIMESTEP
+            GATES += RECURRENT  # INPUT * WEIGHTS + OUTPUT * WEIGHTS
+            GATES[:, :3 * H] = SIGMOID(GATES[:, :3 * H])  # INPUT, FORGET AND OUTPUT GATES
+            self.CANDIDATES[:, STEP, :] = GATES[:, 3 * H:]  # SAVE CELL CANDIDATE BEFORE ACTIVATION
+            GATES[:, 3 * H:] = self.ACTIVATION(GATES[:, 3 * H:])  # CELL GATE
+            self.STATES[:, STEP + 1, :] = (
+                self.STATES[:, STEP, :] * GATES[:, H: 2 * H]  # FORGET GATE
+                + GATES[:, :H] * GATES[:, 3 * H:]  # INPUT GATE
             )  # STATE
-            self.OUTPUTS[:, STEP, :] = self.GATES["o"][:, STEP, :] * \
-                self.ACTIVATION(self.STATES[:, STEP, :])  # OUTPUT
-        self.H_PREV = self.STATES[:, N_TIMESTEPS -
-                                  1, :].copy()  # PREVIOUS HIDDEN STATE
-        self.O_PREV = self.OUTPUTS[:, N_TIMESTEPS -
-                                   1, :].copy()  # PREVIOUS OUTPUT
+            self.CELL_OUTPUTS[:, STEP, :] = self.ACTIVATION(
+                self.STATES[:, STEP + 1, :])  # ACTIVATED STATE
+            self.OUTPUTS[:, STEP + 1, :] = GATES[:, 2 * H: 3 * H] * \
+                self.CELL_OUTPUTS[:, STEP, :]  # OUTPUT
+        self.H_PREV = self.STATES[:, -1, :].copy()  # PREVIOUS CELL STATE
+        self.O_PREV = self.OUTPUTS[:, -1, :].copy()  # PREVIOUS OUTPUT
         if self.RETURN_SEQUENCES:  # RETURN SEQUENCES
-            return self.OUTPUTS[:, 0:-1, :]  # RETURN OUTPUTS
+            OUTPUT = self.OUTPUTS[:, 1:, :]  # OUTPUTS
         else:  # RETURN LAST OUTPUT
-            return self.OUTPUTS[:, -2, :]  # RETURN OUTPUT
+            OUTPUT = self.OUTPUTS[:, -1, :]  # OUTPUT
+        self.LAST_INPUT = self.STORE(X)  # LAST INPUT
+        self.STATES = self.STORE(self.STATES)  # CACHE CELL STATES
+        self.OUTPUTS = self.STORE(self.OUTPUTS)  # CACHE OUTPUTS
+        self.CELL_OUTPUTS = self.STORE(self.CELL_OUTPUTS)  # CACHE ACTIVATED CELL STATES
+        self.CANDIDATES = self.STORE(self.CANDIDATES)  # CACHE CELL CANDIDATES
+        self.GATES = self.STORE(self.GATES)  # CACHE GATES
+        return OUTPUT  # RETURN OUTPUT
 
     def BACKWARD_PASS(self, DELTA):
         """BACKWARD PROPAGATION
@@ -190,67 +197,75 @@ class LSTM(LAYER, PARAM_MIXIN):
         NUMPY ARRAY
             GRADIENT
         """
-        assert self.W is not None, "SETUP HAS NOT BEEN CALLED"  # ENSURE SETUP HAS BEEN CALLED
-        # ENSURE SETUP HAS BEEN CALLED
-        assert self.U is not None, "SETUP HAS NOT BEEN CALLED"
-        # ENSURE FORWARD PASS HAS BEEN CALLED
-        assert self.STATES is not None, "FORWARD PASS HAS NOT BEEN CALLED"
-        # ENSURE FORWARD PASS HAS BEEN CALLED
-        assert self.OUTPUTS is not None, "FORWARD PASS HAS NOT BEEN CALLED"
         # ENSURE FORWARD PASS HAS BEEN CALLED
-        assert self.GATES is not None, "FORWARD PASS HAS NOT BEEN CALLED"
-        # ENSURE FORWARD PASS HAS BEEN CALLED
-        assert self.LAST_INPUT is not None, "FORWARD PASS HAS NOT BEEN CALLED"
-        # ENSURE FORWARD PASS HAS BEEN CALLED
-        assert self.H_PREV is not None, "FORWARD PASS HAS NOT BEEN CALLED"
-        # ENSURE FORWARD PASS HAS BEEN CALLED
-        assert self.O_PREV is not None, "FORWARD PASS HAS NOT BEEN CALLED"
-        # ENSURE SETUP HAS BEEN CALLED
-        assert self.INPUT_DIM is not None, "SETUP HAS NOT BEEN CALLED"
-        if len(DELTA.shape) == 2:  # IF DELTA IS 2D
-            DELTA = DELTA[:, np.newaxis, :]  # ADD DIMENSION
-        N_SAMPLES, N_TIMESTEPS, INPUT_SHAPE = DELTA.shape  # GET DELTA SHAPE
-        GRAD = {KEY: np.zeros_like(
-            self.__PARAMETERS__[KEY]) for KEY in self.__PARAMETERS__.KEYS()}  # GRADIENT
-        DH_NEXT = np.zeros((N_SAMPLES, INPUT_SHAPE))  # NEXT HIDDEN STATE
-        OUTPUT = np.zeros((N_SAMPLES, N_TIMESTEPS, self.INPUT_DIM))  # OUTPUT
+        assert self.GATES is not None and self.LAST_INPUT is not None, "FORWARD PASS HAS NOT BEEN CALLED"
+        N_SAMPLES, N_TIMESTEPS, _ = self.LAST_INPUT.shape  # GET INPUT SHAPE
+        H = self.HIDDEN_DIM  # NUMBER OF HIDDEN UNITS
+        P = self.__PARAMETERS__  # PARAMETERS
+        if DELTA.ndim == 2:  # IF ONLY THE LAST OUTPUT WAS RETURNED
+            LAST_DELTA = DELTA  # DELTA OF THE LAST TIMESTEP
+            DELTA = np.zeros((N_SAMPLES, N_TIMESTEPS, H), dtype=LAST_DELTA.dtype)  # NO DELTA FOR THE OTHER TIMESTEPS
+            DELTA[:, -1, :] = LAST_DELTA  # SET DELTA OF THE LAST TIMESTEP
+        DTYPE = np.result_type(DELTA.dtype, P["W"].dtype)  # DTYPE OF THE GRADIENTS
+        D_GATES = np.empty((N_SAMPLES, N_TIMESTEPS, 4 * H), dtype=DTYPE)  # GRADIENTS OF THE GATES BEFORE ACTIVATION
+        DH_NEXT = np.zeros((N_SAMPLES, H), dtype=DTYPE)  # GRADIENT OF THE NEXT OUTPUT
+        DC_NEXT = np.zeros((N_SAMPLES, H), dtype=DTYPE)  # GRADIENT OF THE NEXT CELL STATE
         for STEP in reversed(range(N_TIMESTEPS)):  # LOOP OVER TIMESTEPS
-            DHI = DELTA[:, STEP, :] * self.GATES["o"][:, STEP, :] * elementwise_grad(
-                self.ACTIVATION, self.STATES[:, STEP, :]) + DH_NEXT  # HIDDEN STATE
-            OG = DELTA[:, STEP, :] * \
-                self.ACTIVATION(self.STATES[:, STEP, :])  # OUTPUT GATE
-            DE_O = OG * elementwise_grad(SIGMOID,
-                                         self.GATES["o"][:, STEP, :])  # OUTPUT
-            # INPUT WEIGHTS
-            GRAD["W_o"] += np.dot(self.LAST_INPUT[:, STEP, :].T, DE_O)
-            # HIDDEN WEIGHTS
-            GRAD["U_o"] += np.dot(self.OUTPUTS[:, STEP - 1, :].T, DE_O)
-            GRAD["b_o"] += DE_O.sum(axis=0)  # BIAS
-            DE_F = (DHI * self.STATES[:, STEP - 1, :]) * elementwise_grad(
-                SIGMOID, self.GATES["f"][:, STEP, :])  # FORGET
-            # INPUT WEIGHTS
-            GRAD["W_f"] += np.dot(self.LAST_INPUT[:, STEP, :].T, DE_F)
-            # HIDDEN WEIGHTS
-            GRAD["U_f"] += np.dot(self.OUTPUTS[:, STEP - 1, :].T, DE_F)
-            GRAD["b_f"] += DE_F.sum(axis=0)  # BIAS
-            DE_I = (DHI * self.GATES["c"][:, STEP, :]) * \
-                elementwise_grad(SIGMOID, self.GATES["i"][:, STEP, :])  # INPUT
-            # INPUT WEIGHTS
-            GRAD["W_i"] += np.dot(self.LAST_INPUT[:, STEP, :].T, DE_I)
-            # HIDDEN WEIGHTS
-            GRAD["U_i"] += np.dot(self.OUTPUTS[:, STEP - 1, :].T, DE_I)
-            GRAD["b_i"] += DE_I.sum(axis=0)  # BIAS
-            DE_C = (DHI * self.GATES["i"][:, STEP, :]) * elementwise_grad(
-                self.ACTIVATION, self.GATES["c"][:, STEP, :])  # CELL
-            # INPUT WEIGHTS
-            GRAD["W_c"] += np.dot(self.LAST_INPUT[:, STEP, :].T, DE_C)
-            # HIDDEN WEIGHTS
-            GRAD["U_c"] += np.dot(self.OUTPUTS[:, STEP - 1, :].T, DE_C)
-            GRAD["b_c"] += DE_C.sum(axis=0)  # BIAS
-            DH_NEXT = DHI * self.GATES["f"][:, STEP, :]  # NEXT HIDDEN STATE
-        for KEY in GRAD.keys():  # LOOP OVER GRADIENTS
-            self.__PARAMETERS__.UPDATE_GRAD(KEY, GRAD[KEY])  # UPDATE GRADIENT
-        return OUTPUT  # RETURN OUTPUT
+            GATES = self.LOAD(self.GATES[:, STEP, :], D_GATES)  # GATES OF THIS TIMESTEP
+            STATE = self.LOAD(self.STATES[:, STEP + 1, :], D_GATES)  # CELL STATE OF THIS TIMESTEP
+            CELL_OUTPUT = self.LOAD(self.CELL_OUTPUTS[:, STEP, :], D_GATES)  # ACTIVATED CELL STATE OF THIS TIMESTEP
+            I, F, O, C = GATES[:, :H], GATES[:, H: 2 * H], GATES[:,
+                                                                 2 * H: 3 * H], GATES[:, 3 * H:]  # SPLIT GATES
+            DH = DELTA[:, STEP, :] + DH_NEXT  # OUTPUT
+            DC = self.ACTIVATION_DERIVATIVE(STATE, CELL_OUTPUT, DH * O) + DC_NEXT  # CELL STATE
+            D_GATES[:, STEP, :H] = SIGMOID_DERIVATIVE(None, I, DC * C)  # INPUT GATE
+            D_GATES[:, STEP, H: 2 * H] = SIGMOID_DERIVATIVE(
+                None, F, DC * self.LOAD(self.STATES[:, STEP, :], D_GATES))  # FORGET GATE
+            D_GATES[:, STEP, 2 * H: 3 * H] = SIGMOID_DERIVATIVE(
+                None, O, DH * CELL_OUTPUT)  # OUTPUT GATE
+            D_GATES[:, STEP, 3 * H:] = self.ACTIVATION_DERIVATIVE(
+                self.LOAD(self.CANDIDATES[:, STEP, :], D_GATES), C, DC * I)  # CELL GATE
+            DC_NEXT = DC * F  # NEXT CELL STATE
+            DH_NEXT = np.dot(D_GATES[:, STEP, :], P["U"].T)  # NEXT OUTPUT
+        D_FLAT = D_GATES.reshape(N_SAMPLES * N_TIMESTEPS, 4 * H)  # GRADIENTS OF ALL TIMESTEPS
+        P.UPDATE_GRAD("W", np.dot(self.LOAD(self.LAST_INPUT, D_GATES).reshape(
+            N_SAMPLES * N_TIMESTEPS, -1).T, D_FLAT))  # INPUT WEIGHTS
+        P.UPDATE_GRAD("U", np.tensordot(
+            self.LOAD(self.OUTPUTS[:, :-1, :], D_GATES), D_GATES, axes=([0, 1], [0, 1])))  # HIDDEN WEIGHTS
+        P.UPDATE_GRAD("b", D_FLAT.sum(axis=0))  # BIAS
+        # RETURN GRADIENT OF THE INPUT
+        return np.dot(D_FLAT, P["W"].T).reshape(self.LAST_INPUT.shape)
+
+    def RESET_STATE(self):
+        """RESET THE STATE CARRIED BETWEEN CALLS
+
+        RETURNS
+        -------
+        NONE
+        """
+        if self.H_PREV is not None:  # IF SETUP HAS BEEN CALLED
+            self.H_PREV = np.zeros_like(self.H_PREV)  # RESET PREVIOUS CELL STATE
+            self.O_PREV = np.zeros_like(self.O_PREV)  # RESET PREVIOUS OUTPUT
+
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE
+
+        EVERY CALL STARTS FROM A ZERO STATE, SO NO STATE IS CARRIED BETWEEN CALLS.
+
+        RETURNS
+        -------
+        FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER
+        """
+        W, U, B = (self.__PARAMETERS__[NAME].copy() for NAME in ("W", "U", "b"))  # COPY PARAMETERS
+        H = self.HIDDEN_DIM  # NUMBER OF HIDDEN UNITS
+        ACTIVATION, RETURN_SEQUENCES = self.ACTIVATION, self.RETURN_SEQUENCES  # SETTINGS
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            ZERO = np.zeros((X.shape[0], H), dtype=np.result_type(X.dtype, W.dtype))  # ZERO STATE AND OUTPUT
+            OUTPUTS, _ = INFERENCE_PASS(X, W, U, B, ACTIVATION, ZERO, ZERO)  # FORWARD PROPAGATION
+            return OUTPUTS[:, 1:, :] if RETURN_SEQUENCES else OUTPUTS[:, -1, :]  # RETURN OUTPUT
+        return FORWARD  # RETURN FORWARD FUNCTION
 
     def SHAPE(self, X_SHAPE):
         """SHAPE OF THE OUTPUT TENSOR
@@ -281,3 +296,47 @@ class LSTM(LAYER, PARAM_MIXIN):
             LIST OF PARAMETERS
         """
         return self.__PARAMETERS__  # RETURN PARAMETERS
+
+
+def INFERENCE_PASS(X, W, U, B, ACTIVATION, STATE, OUTPUT):
+    """FORWARD PROPAGATION OF AN LSTM WITHOUT CACHES FOR THE BACKWARD PASS
+
+    PARAMETERS
+    ----------
+    X : NUMPY ARRAY
+        INPUT OF SHAPE (N_SAMPLES, N_TIMESTEPS, INPUT_DIM)
+    W : NUMPY ARRAY
+        INPUT WEIGHTS OF SHAPE (INPUT_DIM, 4 * HIDDEN_DIM)
+    U : NUMPY ARRAY
+        HIDDEN WEIGHTS OF SHAPE (HIDDEN_DIM, 4 * HIDDEN_DIM)
+    B : NUMPY ARRAY
+        BIAS OF SHAPE (4 * HIDDEN_DIM,)
+    ACTIVATION : FUNCTION
+        ACTIVATION FUNCTION
+    STATE : NUMPY ARRAY
+        INITIAL CELL STATE OF SHAPE (N_SAMPLES, HIDDEN_DIM)
+    OUTPUT : NUMPY ARRAY
+        INITIAL OUTPUT OF SHAPE (N_SAMPLES, HIDDEN_DIM)
+
+    RETURNS
+    -------
+    TUPLE
+        OUTPUTS OF SHAPE (N_SAMPLES, N_TIMESTEPS + 1, HIDDEN_DIM) WITH THE
+        INITIAL OUTPUT AT INDEX 0, AND THE FINAL CELL STATE
+    """
+    N_SAMPLES, N_TIMESTEPS, _ = X.shape  # GET INPUT SHAPE
+    H = U.shape[0]  # NUMBER OF HIDDEN UNITS
+    # PROJECT THE INPUTS OF ALL TIMESTEPS ONTO ALL GATES WITH ONE GEMM
+    GATES = np.dot(X.reshape(N_SAMPLES * N_TIMESTEPS, -1), W).reshape(N_SAMPLES, N_TIMESTEPS, 4 * H)
+    GATES += B  # ADD BIAS
+    OUTPUTS = np.empty((N_SAMPLES, N_TIMESTEPS + 1, H), dtype=GATES.dtype)  # OUTPUTS
+    OUTPUTS[:, 0, :] = OUTPUT  # INITIALIZE OUTPUTS
+    RECURRENT = np.empty((N_SAMPLES, 4 * H), dtype=np.result_type(GATES.dtype, U.dtype))  # RECURRENT PROJECTION
+    for STEP in range(N_TIMESTEPS):  # LOOP OVER TIMESTEPS
+        np.dot(OUTPUTS[:, STEP, :], U, out=RECURRENT)  # PROJECT PREVIOUS OUTPUT ONTO ALL GATES
+        G = GATES[:, STEP, :]  # GATES OF THIS TIMESTEP
+        G += RECURRENT  # INPUT * WEIGHTS + OUTPUT * WEIGHTS
+        G[:, :3 * H] = SIGMOID(G[:, :3 * H])  # INPUT, FORGET AND OUTPUT GATES
+        STATE = STATE * G[:, H: 2 * H] + G[:, :H] * ACTIVATION(G[:, 3 * H:])  # STATE
+        OUTPUTS[:, STEP + 1, :] = G[:, 2 * H: 3 * H] * ACTIVATION(STATE)  # OUTPUT
+    return OUTPUTS, STATE  # RETURN OUTPUTS AND FINAL CELL STATE
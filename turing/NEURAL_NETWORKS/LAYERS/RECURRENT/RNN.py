@@ -1,15 +1,20 @@
-from autograd import elementwise_grad
 import numpy as np
 
-from ...ACTIVATIONS import TANH
+from ...ACTIVATIONS import DERIVATIVE, TANH
 from ...INITIALIZATIONS import ORTHOGONAL
-from ..BASIC import LAYER, PARAM_MIXIN
+from ..BASIC import LAYER, PARAM_MIXIN, PHASE_MIXIN
 from ...PARAMETERS import PARAMETER
 
 
-class RNN(LAYER, PARAM_MIXIN):
+class RNN(LAYER, PARAM_MIXIN, PHASE_MIXIN):
     """VANILLA RNN LAYER
 
+    THE INPUT PROJECTION OF ALL TIMESTEPS IS ONE GEMM BEFORE THE RECURRENCE,
+    AND THE GRADIENTS OF W, U AND THE INPUT ARE ONE GEMM EACH AFTER THE
+    BACKWARD LOOP, SO ONLY THE RECURRENT GEMM RUNS ONCE PER TIMESTEP. THE
+    ARRAYS CACHED FOR THE BACKWARD PASS ARE KEPT IN THE STORAGE DTYPE. WHILE
+    TESTING, ONLY THE HIDDEN STATE CARRIED BETWEEN CALLS IS KEPT.
+
     ATTRIBUTES
     ----------
     HIDDEN_DIM : INT
@@ -31,11 +36,15 @@ class RNN(LAYER, PARAM_MIXIN):
         FORWARD PROPAGATION
     BACKWARD_PASS(DELTA)
         BACKWARD PROPAGATION
+    RESET_STATE()
+        RESETS THE HIDDEN STATE CARRIED BETWEEN CALLS
+    FREEZE()
+        RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE
     SHAPE(X_SHAPE)
         RETURNS SHAPE OF OUTPUT
     """
 
-    def __init__(self, HIDDEN_DIM, ACTIVATION=TANH, INNER_INIT=ORTHOGONAL, PARAMETERS=PARAMETER(), RETURN_SEQUENCES=True):
+    def __init__(self, HIDDEN_DIM, ACTIVATION=TANH, INNER_INIT=ORTHOGONAL, PARAMETERS=None, RETURN_SEQUENCES=True):
         """INITIALIZE VANILLA RNN LAYER
 
         PARAMETERS
@@ -47,7 +56,7 @@ class RNN(LAYER, PARAM_MIXIN):
         INNER_INIT : FUNCTION
             INNER WEIGHT INITIALIZATION FUNCTION
         PARAMETERS : PARAMETER
-            PARAMETER OBJECT
+            PARAMETER OBJECT (NONE FOR NEW DEFAULT PARAMETERS)
         RETURN_SEQUENCES : BOOL
             IF TRUE, RETURNS ALL OUTPUTS, ELSE RETURNS LAST OUTPUT
 
@@ -59,9 +68,13 @@ class RNN(LAYER, PARAM_MIXIN):
         self.HIDDEN_DIM = HIDDEN_DIM  # NUMBER OF HIDDEN UNITS
         self.INNER_INIT = INNER_INIT  # INNER WEIGHT INITIALIZATION FUNCTION
         self.ACTIVATION = ACTIVATION  # ACTIVATION FUNCTION
+        self.ACTIVATION_DERIVATIVE = DERIVATIVE(ACTIVATION)  # DERIVATIVE OF THE ACTIVATION FUNCTION
+        if PARAMETERS is None:  # IF NO PARAMETERS ARE GIVEN
+            PARAMETERS = PARAMETER()  # CREATE PARAMETERS OF THIS LAYER ONLY
         self.__PARAMETERS__ = PARAMETERS  # PARAMETER OBJECT
         self.LAST_INPUT = None  # LAST INPUT
         self.STATES = None  # STATES: HIDDEN STATES
+        self.PRE_ACTIVATIONS = None  # HIDDEN STATES BEFORE ACTIVATION
         self.H_PREV = None  # PREVIOUS HIDDEN STATE
         self.INPUT_DIM = None  # INPUT DIMENSION
 
@@ -86,7 +99,7 @@ class RNN(LAYER, PARAM_MIXIN):
             (self.HIDDEN_DIM, self.HIDDEN_DIM))  # INNER WEIGHT INITIALIZATION
         self.__PARAMETERS__.INIT_GRAD()  # INITIALIZE GRADIENTS
         # INITIALIZE PREVIOUS HIDDEN STATE
-        self.H_PREV = np.zeros((X_SHAPE[0], self.HIDDEN_DIM))
+        self.H_PREV = np.zeros((X_SHAPE[0], self.HIDDEN_DIM), dtype=self.COMPUTE_DTYPE)
 
     def FORWARD_PASS(self, X):
         """FORWARD PROPAGATION
@@ -102,23 +115,32 @@ class RNN(LAYER, PARAM_MIXIN):
             OUTPUT ARRAY
         """
         assert self.H_PREV is not None, "SETUP() MUST BE CALLED BEFORE FORWARD_PASS()"
-        self.LAST_INPUT = X  # SAVE LAST INPUT
+        self.LAST_INPUT = self.STORE(X) if self.IS_TRAINING else None  # SAVE LAST INPUT
         N_SAMPLES, N_TIMESTEPS, _ = X.shape  # GET INPUT SHAPE
-        # INITIALIZE STATES
-        STATES = np.zeros((N_SAMPLES, N_TIMESTEPS + 1, self.HIDDEN_DIM))
-        # SET LAST STATE TO PREVIOUS HIDDEN STATE
-        STATES[:, -1, :] = self.H_PREV.copy()
         p = self.__PARAMETERS__  # GET PARAMETERS
+        DTYPE = np.result_type(X.dtype, p["W"].dtype)  # DTYPE OF THE STATES
+        if self.H_PREV.shape[0] != N_SAMPLES:  # IF THE BATCH SIZE CHANGED
+            self.H_PREV = np.zeros((N_SAMPLES, self.HIDDEN_DIM), dtype=DTYPE)  # RESET PREVIOUS HIDDEN STATE
+        # STATES HOLD THE PREVIOUS HIDDEN STATE AT INDEX 0 AND TIMESTEP T AT INDEX T + 1
+        STATES = np.empty((N_SAMPLES, N_TIMESTEPS + 1, self.HIDDEN_DIM), dtype=DTYPE)
+        STATES[:, 0, :] = self.H_PREV  # SET FIRST STATE TO PREVIOUS HIDDEN STATE
+        # PROJECT THE INPUTS OF ALL TIMESTEPS WITH ONE GEMM
+        Z = np.dot(X.reshape(N_SAMPLES * N_TIMESTEPS, -1),
+                   p["W"]).reshape(N_SAMPLES, N_TIMESTEPS, self.HIDDEN_DIM)
+        Z += p["b"]  # ADD BIAS
+        RECURRENT = np.empty((N_SAMPLES, self.HIDDEN_DIM), dtype=DTYPE)  # BUFFER FOR THE RECURRENT PROJECTION
         for STEP in range(N_TIMESTEPS):  # FORWARD PROPAGATION
-            STATES[:, STEP, :] = np.tanh(np.dot(
-                X[:, STEP, :], p["W"]) + np.dot(STATES[:, STEP - 1, :], p["U"]) + p["b"])  # HIDDEN STATE
-        self.STATES = STATES  # SAVE STATES
+            np.dot(STATES[:, STEP, :], p["U"], out=RECURRENT)  # PROJECT PREVIOUS HIDDEN STATE
+            Z[:, STEP, :] += RECURRENT  # INPUT * W + STATE * U + b
+            STATES[:, STEP + 1, :] = self.ACTIVATION(Z[:, STEP, :])  # HIDDEN STATE
+        self.PRE_ACTIVATIONS = self.STORE(Z) if self.IS_TRAINING else None  # SAVE HIDDEN STATES BEFORE ACTIVATION
+        self.STATES = self.STORE(STATES) if self.IS_TRAINING else None  # SAVE STATES
         # SAVE PREVIOUS HIDDEN STATE
-        self.H_PREV = STATES[:, N_TIMESTEPS - 1, :].copy()
+        self.H_PREV = STATES[:, -1, :].copy()
         if self.RETURN_SEQUENCES:  # RETURN OUTPUT
-            return STATES[:, 0:-1, :]  # RETURN ALL OUTPUTS
+            return STATES[:, 1:, :]  # RETURN ALL OUTPUTS
         else:  # RETURN LAST OUTPUT
-            return STATES[:, -2, :]  # RETURN LAST OUTPUT
+            return STATES[:, -1, :]  # RETURN LAST OUTPUT
 
     def BACKWARD_PASS(self, DELTA):
         """BACKWARD PROPAGATION
@@ -137,31 +159,64 @@ class RNN(LAYER, PARAM_MIXIN):
         assert self.LAST_INPUT is not None, "FORWARD_PASS() MUST BE CALLED BEFORE BACKWARD_PASS()"
         assert self.H_PREV is not None, "SETUP() MUST BE CALLED BEFORE BACKWARD_PASS()"
         assert self.INPUT_DIM is not None, "SETUP() MUST BE CALLED BEFORE BACKWARD_PASS()"
-        if len(DELTA.shape) == 2:  # IF DELTA IS 2D, CONVERT TO 3D
-            DELTA = DELTA[:, np.newaxis, :]  # CONVERT TO 3D
-        N_SAMPLES, N_TIMESTEPS, INPUT_SHAPE = DELTA.shape  # GET DELTA SHAPE
+        N_SAMPLES, N_TIMESTEPS, _ = self.LAST_INPUT.shape  # GET INPUT SHAPE
+        if len(DELTA.shape) == 2:  # IF ONLY THE LAST OUTPUT WAS RETURNED
+            LAST_DELTA = DELTA  # DELTA OF THE LAST TIMESTEP
+            DELTA = np.zeros((N_SAMPLES, N_TIMESTEPS, self.HIDDEN_DIM), dtype=LAST_DELTA.dtype)  # NO DELTA FOR THE OTHER TIMESTEPS
+            DELTA[:, -1, :] = LAST_DELTA  # SET DELTA OF THE LAST TIMESTEP
         P = self.__PARAMETERS__  # GET PARAMETERS
-        GRAD = {KEY: np.zeros_like(P[KEY])
-                for KEY in P.KEYS()}  # INITIALIZE GRADIENTS
+        DTYPE = np.result_type(DELTA.dtype, P["W"].dtype)  # DTYPE OF THE GRADIENTS
+        # GRADIENTS OF THE HIDDEN STATES BEFORE ACTIVATION
+        DZ = np.empty((N_SAMPLES, N_TIMESTEPS, self.HIDDEN_DIM), dtype=DTYPE)
         # INITIALIZE NEXT HIDDEN STATE GRADIENT
-        DH_NEXT = np.zeros((N_SAMPLES, INPUT_SHAPE))
-        # INITIALIZE OUTPUT GRADIENT
-        OUTPUT = np.zeros((N_SAMPLES, N_TIMESTEPS, self.INPUT_DIM))
+        DH_NEXT = np.zeros((N_SAMPLES, self.HIDDEN_DIM), dtype=DTYPE)
         for STEP in reversed(range(N_TIMESTEPS)):  # BACKWARD PROPAGATION
-            DHI = elementwise_grad(self.ACTIVATION, self.STATES[:, STEP, :]) * (
-                DELTA[:, STEP, :] + DH_NEXT)  # HIDDEN STATE GRADIENT
-            # UPDATE GRADIENTS
-            GRAD["W"] += np.dot(self.LAST_INPUT[:, STEP, :].T, DHI)
-            GRAD["b"] += DELTA[:, STEP, :].sum(axis=0)  # UPDATE GRADIENTS
-            # UPDATE GRADIENTS
-            GRAD["U"] += np.dot(self.STATES[:, STEP - 1, :].T, DHI)
+            DZ[:, STEP, :] = self.ACTIVATION_DERIVATIVE(
+                self.LOAD(self.PRE_ACTIVATIONS[:, STEP, :], DZ), self.LOAD(self.STATES[:, STEP + 1, :], DZ),
+                DELTA[:, STEP, :] + DH_NEXT)  # HIDDEN STATE GRADIENT FROM THE CACHED STATE
             # UPDATE NEXT HIDDEN STATE GRADIENT
-            DH_NEXT = np.dot(DHI, P["U"].T)
-            D = np.dot(DELTA[:, STEP, :], P["U"].T)  # OUTPUT GRADIENT
-            OUTPUT[:, STEP, :] = np.dot(D, P["W"].T)  # UPDATE OUTPUT GRADIENT
-        for KEY in GRAD.keys():  # UPDATE PARAMETERS
-            self.__PARAMETERS__.UPDATE_GRAD(KEY, GRAD[KEY])  # UPDATE GRADIENTS
-        return OUTPUT  # RETURN OUTPUT GRADIENT
+            DH_NEXT = np.dot(DZ[:, STEP, :], P["U"].T)
+        DZ_FLAT = DZ.reshape(N_SAMPLES * N_TIMESTEPS, self.HIDDEN_DIM)  # GRADIENTS OF ALL TIMESTEPS
+        P.UPDATE_GRAD("W", np.dot(self.LOAD(self.LAST_INPUT, DZ).reshape(
+            N_SAMPLES * N_TIMESTEPS, -1).T, DZ_FLAT))  # UPDATE GRADIENTS
+        P.UPDATE_GRAD("U", np.tensordot(
+            self.LOAD(self.STATES[:, :-1, :], DZ), DZ, axes=([0, 1], [0, 1])))  # UPDATE GRADIENTS
+        P.UPDATE_GRAD("b", DZ_FLAT.sum(axis=0))  # UPDATE GRADIENTS
+        # RETURN OUTPUT GRADIENT
+        return np.dot(DZ_FLAT, P["W"].T).reshape(self.LAST_INPUT.shape)
+
+    def RESET_STATE(self):
+        """RESET THE STATE CARRIED BETWEEN CALLS
+
+        RETURNS
+        -------
+        NONE
+        """
+        if self.H_PREV is not None:  # IF SETUP HAS BEEN CALLED
+            self.H_PREV = np.zeros_like(self.H_PREV)  # RESET PREVIOUS HIDDEN STATE
+
+    def FREEZE(self):
+        """RETURNS A STATELESS FORWARD FUNCTION FOR INFERENCE
+
+        EVERY CALL STARTS FROM A ZERO STATE, SO NO STATE IS CARRIED BETWEEN CALLS.
+
+        RETURNS
+        -------
+        FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE LAYER
+        """
+        W, U, B = (self.__PARAMETERS__[NAME].copy() for NAME in ("W", "U", "b"))  # COPY PARAMETERS
+        ACTIVATION, RETURN_SEQUENCES = self.ACTIVATION, self.RETURN_SEQUENCES  # SETTINGS
+
+        def FORWARD(X):  # FORWARD FUNCTION
+            N_SAMPLES, N_TIMESTEPS, _ = X.shape  # GET INPUT SHAPE
+            Z = np.dot(X.reshape(N_SAMPLES * N_TIMESTEPS, -1), W).reshape(N_SAMPLES, N_TIMESTEPS, -1)  # PROJECT INPUTS
+            Z += B  # ADD BIAS
+            STATES = np.zeros((N_SAMPLES, N_TIMESTEPS + 1, Z.shape[2]), dtype=Z.dtype)  # STATES FROM A ZERO STATE
+            for STEP in range(N_TIMESTEPS):  # FORWARD PROPAGATION
+                STATES[:, STEP + 1, :] = ACTIVATION(Z[:, STEP, :] + np.dot(STATES[:, STEP, :], U))  # HIDDEN STATE
+            return STATES[:, 1:, :] if RETURN_SEQUENCES else STATES[:, -1, :]  # RETURN OUTPUT
+        return FORWARD  # RETURN FORWARD FUNCTION
 
     def SHAPE(self, X_SHAPE):
         """GET OUTPUT SHAPE
@@ -192,4 +247,4 @@ class RNN(LAYER, PARAM_MIXIN):
         LIST
             PARAMETERS
         """
-        return super().PARAMETERS()  # RETURN PARAMETERS
+        return self.__PARAMETERS__  # RETURN PARAMETERS
@@ -1,5 +1,8 @@
+from autograd import elementwise_grad
 import numpy as np
 
+from .ACTIVATIONS import SIGMOID, SOFTMAX
+
 
 def SQUARED_ERROR(ACTUAL, PREDICTED):
     """RETURN SQUARED ERROR.
@@ -162,7 +165,7 @@ def HINGE(ACTUAL, PREDICTED):
     HINGE: NUMPY ARRAY
         HINGE LOSS.
     """
-    return np.mean(np.max(1.0 - ACTUAL * PREDICTED, 0))  # RETURN HINGE LOSS
+    return np.mean(np.maximum(1.0 - ACTUAL * PREDICTED, 0.0))  # RETURN HINGE LOSS
 
 
 def BINARY_CROSSENTROPY(ACTUAL, PREDICTED):
@@ -219,3 +222,330 @@ def ACCURACY(ACTUAL, PREDICTED):
         ACCURACY.
     """
     return np.sum(ACTUAL == PREDICTED) / len(ACTUAL)  # RETURN ACCURACY
+
+
+def SQUARED_ERROR_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF SQUARED ERROR WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF SQUARED ERROR.
+    """
+    GRAD = np.subtract(PREDICTED, ACTUAL)  # COMPUTE RESIDUALS
+    GRAD *= 2.0  # SCALE RESIDUALS
+    return GRAD  # RETURN GRADIENT
+
+
+def SQUARED_LOG_ERROR_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF SQUARED LOG ERROR WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF SQUARED LOG ERROR.
+    """
+    GRAD = np.log1p(PREDICTED) - np.log1p(ACTUAL)  # COMPUTE LOG RESIDUALS
+    GRAD *= 2.0  # SCALE LOG RESIDUALS
+    GRAD /= np.add(PREDICTED, 1.0)  # APPLY CHAIN RULE OF LOG(PREDICTED + 1)
+    return GRAD  # RETURN GRADIENT
+
+
+def MEAN_SQUARED_LOG_ERROR_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF MEAN SQUARED LOG ERROR WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF MEAN SQUARED LOG ERROR.
+    """
+    GRAD = SQUARED_LOG_ERROR_GRADIENT(ACTUAL, PREDICTED)  # COMPUTE ELEMENTWISE GRADIENT
+    GRAD /= GRAD.size  # AVERAGE OVER ALL ELEMENTS
+    return GRAD  # RETURN GRADIENT
+
+
+def MEAN_SQUARED_ERROR_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF MEAN SQUARED ERROR WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF MEAN SQUARED ERROR.
+    """
+    GRAD = SQUARED_ERROR_GRADIENT(ACTUAL, PREDICTED)  # COMPUTE ELEMENTWISE GRADIENT
+    GRAD /= GRAD.size  # AVERAGE OVER ALL ELEMENTS
+    return GRAD  # RETURN GRADIENT
+
+
+def ROOT_MEAN_SQUARED_ERROR_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF ROOT MEAN SQUARED ERROR WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF ROOT MEAN SQUARED ERROR.
+    """
+    GRAD = MEAN_SQUARED_ERROR_GRADIENT(ACTUAL, PREDICTED)  # COMPUTE GRADIENT OF THE MEAN
+    ERROR = ROOT_MEAN_SQUARED_ERROR(ACTUAL, PREDICTED)  # COMPUTE ROOT MEAN SQUARED ERROR
+    if ERROR > 0.0:  # IF THE ERROR IS NOT ZERO
+        GRAD /= 2.0 * ERROR  # APPLY CHAIN RULE OF THE SQUARE ROOT
+    return GRAD  # RETURN GRADIENT
+
+
+def ROOT_MEAN_SQUARED_LOG_ERROR_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF ROOT MEAN SQUARED LOG ERROR WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF ROOT MEAN SQUARED LOG ERROR.
+    """
+    GRAD = MEAN_SQUARED_LOG_ERROR_GRADIENT(ACTUAL, PREDICTED)  # COMPUTE GRADIENT OF THE MEAN
+    ERROR = ROOT_MEAN_SQUARED_LOG_ERROR(ACTUAL, PREDICTED)  # COMPUTE ROOT MEAN SQUARED LOG ERROR
+    if ERROR > 0.0:  # IF THE ERROR IS NOT ZERO
+        GRAD /= 2.0 * ERROR  # APPLY CHAIN RULE OF THE SQUARE ROOT
+    return GRAD  # RETURN GRADIENT
+
+
+def LOGLOSS_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF LOGLOSS WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF LOGLOSS.
+    """
+    GRAD = np.clip(PREDICTED, 1e-15, 1 - 1e-15)  # CLIP PREDICTED VALUES
+    np.divide(ACTUAL, GRAD, out=GRAD)  # COMPUTE ACTUAL / PREDICTED
+    GRAD *= -1.0 / float(ACTUAL.shape[0])  # NEGATE AND AVERAGE OVER SAMPLES
+    return GRAD  # RETURN GRADIENT
+
+
+def CATEGORICAL_CROSSENTROPY_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF CATEGORICAL CROSS ENTROPY WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    ----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF CATEGORICAL CROSS ENTROPY.
+    """
+    return LOGLOSS_GRADIENT(ACTUAL, PREDICTED)  # RETURN GRADIENT OF LOGLOSS
+
+
+def HINGE_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF HINGE LOSS WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF HINGE LOSS.
+    """
+    MARGIN = ACTUAL * PREDICTED  # COMPUTE MARGINS
+    # PASS -ACTUAL WHERE THE MARGIN IS VIOLATED, AVERAGED OVER ALL ELEMENTS
+    return np.where(MARGIN < 1.0, -ACTUAL, 0.0) / MARGIN.size
+
+
+def BINARY_CROSSENTROPY_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF BINARY CROSS ENTROPY WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF BINARY CROSS ENTROPY.
+    """
+    PREDICTED = np.clip(PREDICTED, 1e-15, 1 - 1e-15)  # CLIP PREDICTED VALUES
+    GRAD = PREDICTED - ACTUAL  # COMPUTE PREDICTED - ACTUAL
+    GRAD /= PREDICTED * (1.0 - PREDICTED)  # DIVIDE BY PREDICTED * (1 - PREDICTED)
+    return GRAD  # RETURN GRADIENT
+
+
+def R2_SCORE_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF R2 SCORE WITH RESPECT TO PREDICTED.
+
+    PARAMETERS:
+    ----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        PREDICTED VALUES.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT OF R2 SCORE.
+    """
+    ACTUAL = np.asarray(ACTUAL)  # CONVERT ACTUAL VALUES TO A NUMPY ARRAY
+    GRAD = SQUARED_ERROR_GRADIENT(ACTUAL, PREDICTED)  # COMPUTE GRADIENT OF THE RESIDUAL SUM OF SQUARES
+    GRAD /= -np.sum((ACTUAL - np.mean(ACTUAL)) ** 2)  # DIVIDE BY MINUS THE TOTAL SUM OF SQUARES
+    return GRAD  # RETURN GRADIENT
+
+
+def SOFTMAX_CATEGORICAL_CROSSENTROPY_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF CATEGORICAL CROSS ENTROPY WITH RESPECT TO THE INPUT OF A SOFTMAX.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES (ONE-HOT OR PROBABILITIES SUMMING TO ONE PER ROW).
+    PREDICTED: NUMPY ARRAY
+        OUTPUT OF THE SOFTMAX.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT WITH RESPECT TO THE SOFTMAX INPUT.
+    """
+    GRAD = np.subtract(PREDICTED, ACTUAL)  # COMPUTE PREDICTED - ACTUAL
+    GRAD /= float(ACTUAL.shape[0])  # AVERAGE OVER SAMPLES
+    return GRAD  # RETURN GRADIENT
+
+
+def SIGMOID_BINARY_CROSSENTROPY_GRADIENT(ACTUAL, PREDICTED):
+    """RETURN GRADIENT OF BINARY CROSS ENTROPY WITH RESPECT TO THE INPUT OF A SIGMOID.
+
+    PARAMETERS:
+    -----------
+    ACTUAL: NUMPY ARRAY
+        ACTUAL VALUES.
+    PREDICTED: NUMPY ARRAY
+        OUTPUT OF THE SIGMOID.
+
+    RETURNS:
+    --------
+    GRADIENT: NUMPY ARRAY
+        GRADIENT WITH RESPECT TO THE SIGMOID INPUT.
+    """
+    return np.subtract(PREDICTED, ACTUAL)  # RETURN PREDICTED - ACTUAL
+
+
+# GRADIENTS MAPS EACH LOSS TO ITS GRADIENT WITH RESPECT TO THE PREDICTIONS.
+GRADIENTS = {
+    SQUARED_ERROR: SQUARED_ERROR_GRADIENT,
+    SQUARED_LOG_ERROR: SQUARED_LOG_ERROR_GRADIENT,
+    MEAN_SQUARED_LOG_ERROR: MEAN_SQUARED_LOG_ERROR_GRADIENT,
+    MEAN_SQUARED_ERROR: MEAN_SQUARED_ERROR_GRADIENT,
+    ROOT_MEAN_SQUARED_ERROR: ROOT_MEAN_SQUARED_ERROR_GRADIENT,
+    ROOT_MEAN_SQUARED_LOG_ERROR: ROOT_MEAN_SQUARED_LOG_ERROR_GRADIENT,
+    CATEGORICAL_CROSSENTROPY: CATEGORICAL_CROSSENTROPY_GRADIENT,
+    LOGLOSS: LOGLOSS_GRADIENT,
+    HINGE: HINGE_GRADIENT,
+    BINARY_CROSSENTROPY: BINARY_CROSSENTROPY_GRADIENT,
+    R2_SCORE: R2_SCORE_GRADIENT,
+}
+
+# FUSED_GRADIENTS MAPS (LOSS, OUTPUT ACTIVATION) PAIRS TO THE GRADIENT OF THE LOSS WITH RESPECT TO THE INPUT OF THE ACTIVATION.
+FUSED_GRADIENTS = {
+    (CATEGORICAL_CROSSENTROPY, SOFTMAX): SOFTMAX_CATEGORICAL_CROSSENTROPY_GRADIENT,
+    (LOGLOSS, SOFTMAX): SOFTMAX_CATEGORICAL_CROSSENTROPY_GRADIENT,
+    (BINARY_CROSSENTROPY, SIGMOID): SIGMOID_BINARY_CROSSENTROPY_GRADIENT,
+}
+
+
+def GRADIENT(LOSS):
+    """RETURN THE GRADIENT OF A LOSS WITH RESPECT TO THE PREDICTIONS.
+
+    LOSSES IN THIS MODULE USE THEIR HAND-WRITTEN GRADIENT. ANY OTHER LOSS
+    FALLS BACK TO AUTOGRAD.
+
+    PARAMETERS:
+    -----------
+    LOSS: FUNCTION
+        LOSS FUNCTION.
+
+    RETURNS:
+    --------
+    GRADIENT: FUNCTION
+        FUNCTION (ACTUAL, PREDICTED) -> GRADIENT WITH RESPECT TO PREDICTED.
+    """
+    if LOSS in GRADIENTS:  # IF A HAND-WRITTEN GRADIENT IS KNOWN
+        return GRADIENTS[LOSS]  # RETURN IT
+    return elementwise_grad(LOSS, 1)  # RETURN AUTOGRAD GRADIENT
+
+
+def FUSED_GRADIENT(LOSS, ACTIVATION_FUNCTION):
+    """RETURN THE FUSED GRADIENT OF A LOSS AND AN OUTPUT ACTIVATION.
+
+    PARAMETERS:
+    -----------
+    LOSS: FUNCTION
+        LOSS FUNCTION.
+    ACTIVATION_FUNCTION: FUNCTION
+        ACTIVATION FUNCTION OF THE OUTPUT LAYER.
+
+    RETURNS:
+    --------
+    GRADIENT: FUNCTION OR NONE
+        FUNCTION (ACTUAL, PREDICTED) -> GRADIENT WITH RESPECT TO THE INPUT OF
+        THE ACTIVATION, OR NONE IF THE PAIR HAS NO FUSED GRADIENT.
+    """
+    return FUSED_GRADIENTS.get((LOSS, ACTIVATION_FUNCTION))  # RETURN FUSED GRADIENT OR NONE
@@ -1,11 +1,14 @@
-import secrets
 import numpy as np
-from autograd import elementwise_grad
 
 from .BASE_ESTIMATOR import BASE_ESTIMATOR
 from .BATCH_ITERATOR import BATCH_ITERATOR
+from .CHECKPOINT import LOAD, SAVE
+from .COMPILER import COMPILE, EXPORT, FUSED_BLOCK
+from .DATASETS import SHUFFLED_INDICES
 from .LAYERS.BASIC import PHASE_MIXIN
-from .METRICS import MEAN_SQUARED_ERROR
+from .METRICS import FUSED_GRADIENT, GRADIENT, MEAN_SQUARED_ERROR
+from .PARALLEL import DATA_PARALLEL, HOGWILD
+from .PARAMETERS import PARAMETER_ARENA
 
 
 class NEURAL_NETWORK(BASE_ESTIMATOR):
@@ -27,6 +30,16 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         METRIC TO BE USED IN THE NETWORK.
     SHUFFLE : BOOL
         WHETHER TO SHUFFLE THE TRAINING DATA BEFORE EACH EPOCH.
+    FLAT_PARAMETERS : BOOL
+        WHETHER TO STORE ALL PARAMETERS IN ONE CONTIGUOUS BUFFER.
+    SEED : INT
+        SEED OF THE RANDOM NUMBER GENERATOR USED TO SHUFFLE THE TRAINING DATA.
+    PIPELINE : PIPELINE
+        PIPELINE THAT PREPARES TRAINING BATCHES IN THE BACKGROUND.
+    PRECISION : PRECISION
+        MIXED-PRECISION POLICY (NONE TO KEEP EVERYTHING IN FLOAT64).
+    PROFILER : PROFILER
+        PROFILER OF THE PASSES OF THE LAYERS AND THE OPTIMIZER (NONE FOR NO PROFILING).
 
     ATTRIBUTES
     ----------
@@ -38,6 +51,8 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         LOSS FUNCTION TO BE USED IN THE NETWORK.
     LOSS_GRAD : FUNCTION
         GRADIENT OF THE LOSS FUNCTION.
+    FUSED_OUTPUT : BOOL
+        WHETHER LOSS_GRAD IS FUSED WITH THE ACTIVATION OF THE LAST LAYER.
     METRIC : FUNCTION
         METRIC TO BE USED IN THE NETWORK.
     LAYERS : LIST
@@ -58,6 +73,34 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         WHETHER THE NETWORK IS CURRENTLY TRAINING.
     __INITIALIZED__ : BOOL
         WHETHER THE NETWORK HAS BEEN INITIALIZED.
+    FLAT_PARAMETERS : BOOL
+        WHETHER TO STORE ALL PARAMETERS IN ONE CONTIGUOUS BUFFER.
+    ARENA : PARAMETER_ARENA
+        CONTIGUOUS STORAGE OF THE PARAMETERS (NONE UNLESS FLAT_PARAMETERS IS TRUE).
+    RANDOM : NUMPY GENERATOR
+        RANDOM NUMBER GENERATOR USED TO SHUFFLE THE TRAINING DATA.
+    INDICES : NUMPY ARRAY
+        ORDER IN WHICH THE TRAINING SAMPLES ARE VISITED (NONE FOR THE STORED ORDER).
+    PIPELINE : PIPELINE
+        PIPELINE THAT PREPARES TRAINING BATCHES IN THE BACKGROUND (NONE TO PREPARE THEM SERIALLY).
+    PRECISION : PRECISION
+        MIXED-PRECISION POLICY (NONE TO KEEP EVERYTHING IN FLOAT64).
+    PROFILER : PROFILER
+        PROFILER OF THE PASSES OF THE LAYERS AND THE OPTIMIZER (NONE FOR NO PROFILING).
+    FINITE_GRADS : BOOL
+        WHETHER THE GRADIENTS OF THE LAST UPDATE ARE FINITE, I.E. WHETHER THE OPTIMIZER SHOULD TAKE THE STEP.
+    STAGES : LIST
+        LAYERS AND FUSED BLOCKS RUN BY THE COMPILED NETWORK (NONE UNTIL THE NETWORK IS COMPILED).
+    INPUT_SHAPE : LIST
+        SHAPE OF THE INPUT THE LAYERS WERE SET UP FOR (NONE UNTIL THE NETWORK IS SET UP).
+    EPOCH : INT
+        NUMBER OF EPOCHS TRAINED BY THE CURRENT CALL TO FIT.
+    BATCH : INT
+        NUMBER OF BATCHES TRAINED IN THE CURRENT EPOCH.
+    CALLBACKS : LIST
+        CALLBACKS OF THE CURRENT CALL TO FIT (EMPTY OUTSIDE FIT).
+    STOP_TRAINING : BOOL
+        WHETHER A CALLBACK ASKED TO STOP TRAINING AFTER THE CURRENT BATCH.
 
     METHODS
     -------
@@ -65,8 +108,28 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         INITIALIZE MODEL'S LAYERS.
     ___FIND_BPROP_ENTRY____()
         FIND ENTRY LAYER FOR BACK PROPAGATION.
-    FIT(X, Y)
-        FIT THE MODEL TO THE TRAINING DATA.
+    FIT(X, Y, CHECKPOINT, CALLBACKS)
+        FIT THE MODEL TO THE TRAINING DATA, RESUMING FROM A CHECKPOINT IF THERE IS ONE.
+    FIT_STREAM(X, Y, WINDOW)
+        FIT THE MODEL TO LONG SEQUENCES WITH TRUNCATED BACKPROPAGATION THROUGH TIME.
+    FIT_PARALLEL(X, Y, N_WORKERS, REDUCTION, ASYNCHRONOUS)
+        FIT THE MODEL WITH PARALLEL WORKER PROCESSES.
+    STEP(X)
+        ADVANCE THE RECURRENT STATE BY ONE TIMESTEP AND RETURN THE OUTPUT.
+    FREEZE()
+        RETURN A STATELESS, THREAD-SAFE FORWARD FUNCTION FOR INFERENCE.
+    COMPILE()
+        FUSE COMMON SEQUENCES OF LAYERS INTO BLOCKS THAT KEEP FEWER INTERMEDIATE ARRAYS.
+    EXPORT()
+        RETURN A COPY OF THE NETWORK FOR SERVING, WITH THE BATCH NORMALIZATIONS FOLDED AWAY.
+    SAVE(PATH)
+        SAVE THE PARAMETERS, LAYER STATE AND OPTIMIZER STATE TO A CHECKPOINT.
+    LOAD(PATH, MMAP)
+        LOAD THE NETWORK FROM A CHECKPOINT, MAPPING THE PARAMETERS INTO MEMORY.
+    RESET_STATES()
+        RESET THE STATE CARRIED BY THE RECURRENT LAYERS.
+    RESET_STAGE_CACHES()
+        DROP THE WEIGHTS CACHED BY THE COMPILED STAGES.
     _PREDICT__(X)
         MAKE PREDICTIONS ON THE TEST DATA.
     UPDATE(X, Y)
@@ -92,10 +155,12 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         MODEL PARAMETERS.
     PARAMETRIC_LAYERS
         LIST OF PARAMETRIC LAYERS IN THE NETWORK.
+    PARAMETER_GROUPS
+        PARAMETER OBJECTS UPDATED BY THE OPTIMIZER.
     """
     FIT_REQUIRED = False  # THIS LINE OF CODE SETS THE FIT_REQUIRED ATTRIBUTE TO FALSE. THIS ATTRIBUTE IS USED BY THE BASE_ESTIMATOR CLASS TO DETERMINE WHETHER THE MODEL NEEDS TO BE FIT TO DATA BEFORE MAKING PREDICTIONS. IN THIS CASE, THE NEURAL NETWORK CLASSIFIER DOES NOT NEED TO BE FIT TO DATA BEFORE MAKING PREDICTIONS, SO WE SET FIT_REQUIRED TO FALSE.
 
-    def __init__(self, LAYERS, OPTIMIZER, LOSS, MAX_EPOCHS=10, BATCH_SIZE=64, METRIC=MEAN_SQUARED_ERROR, SHUFFLE=False):
+    def __init__(self, LAYERS, OPTIMIZER, LOSS, MAX_EPOCHS=10, BATCH_SIZE=64, METRIC=MEAN_SQUARED_ERROR, SHUFFLE=False, FLAT_PARAMETERS=False, SEED=None, PIPELINE=None, PRECISION=None, PROFILER=None):
         """INITIALIZE THE NEURAL NETWORK CLASSIFIER.
 
         PARAMETERS
@@ -114,6 +179,16 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
             METRIC TO BE USED IN THE NETWORK.
         SHUFFLE : BOOL
             WHETHER TO SHUFFLE THE TRAINING DATA BEFORE EACH EPOCH.
+        FLAT_PARAMETERS : BOOL
+            WHETHER TO STORE ALL PARAMETERS, GRADIENTS AND OPTIMIZER STATE IN CONTIGUOUS BUFFERS.
+        SEED : INT
+            SEED OF THE RANDOM NUMBER GENERATOR USED TO SHUFFLE THE TRAINING DATA.
+        PIPELINE : PIPELINE
+            PIPELINE THAT PREPARES TRAINING BATCHES IN THE BACKGROUND.
+        PRECISION : PRECISION
+            MIXED-PRECISION POLICY.
+        PROFILER : PROFILER
+            PROFILER OF THE PASSES OF THE LAYERS AND THE OPTIMIZER.
 
         RETURNS
         -------
@@ -127,13 +202,12 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         self.OPTIMIZER = OPTIMIZER
         # THIS LINE OF CODE SETS THE LOSS ATTRIBUTE TO THE VALUE OF THE LOSS PARAMETER. THIS ATTRIBUTE IS USED TO CALCULATE THE SCORE BETWEEN THE MODEL'S PREDICTIONS AND THE TRUE LABELS.
         self.LOSS = LOSS
-        # THIS LINE OF CODE CHECKS IF THE LOSS FUNCTION IS CATEGORICAL_CROSSENTROPY.
-        # if isinstance(LOSS, CATEGORICAL_CROSSENTROPY):  # THIS LINE OF CODE RUNS IF THE LOSS FUNCTION IS CATEGORICAL_CROSSENTROPY.
-        #    # THIS LINE OF CODE SETS THE LOSS_GRAD ATTRIBUTE TO THE GRADIENT OF THE LOSS FUNCTION. THIS ATTRIBUTE IS USED TO CALCULATE THE GRADIENT OF THE LOSS FUNCTION.
-        #    self.LOSS_GRAD = lambda actual, predicted: -(actual - predicted)
-        # else:  # THIS LINE OF CODE RUNS IF THE LOSS FUNCTION IS NOT CATEGORICAL_CROSSENTROPY.
-        # THIS LINE OF CODE SETS THE LOSS_GRAD ATTRIBUTE TO THE GRADIENT OF THE LOSS FUNCTION. THIS ATTRIBUTE IS USED TO CALCULATE THE GRADIENT OF THE LOSS FUNCTION.
-        self.LOSS_GRAD = elementwise_grad(self.LOSS, 1)
+        # THIS LINE OF CODE LOOKS UP A FUSED GRADIENT FOR THE LOSS FUNCTION AND THE ACTIVATION OF THE LAST LAYER (E.G. SOFTMAX WITH CATEGORICAL_CROSSENTROPY), WHICH IS NONE IF THE PAIR CANNOT BE FUSED.
+        FUSED_LOSS_GRAD = FUSED_GRADIENT(LOSS, getattr(LAYERS[-1], "ACTIVATION_FUNCTION", None)) if len(LAYERS) > 0 else None
+        # THIS LINE OF CODE SETS THE FUSED_OUTPUT ATTRIBUTE TO TRUE IF THE GRADIENT OF THE LOSS FUNCTION IS TAKEN WITH RESPECT TO THE INPUT OF THE LAST ACTIVATION LAYER.
+        self.FUSED_OUTPUT = FUSED_LOSS_GRAD is not None
+        # THIS LINE OF CODE SETS THE LOSS_GRAD ATTRIBUTE TO THE FUSED GRADIENT IF THERE IS ONE, OTHERWISE TO THE HAND-WRITTEN GRADIENT OF THE LOSS FUNCTION (OR AUTOGRAD FOR UNKNOWN LOSSES). THIS ATTRIBUTE IS USED TO CALCULATE THE GRADIENT OF THE LOSS FUNCTION.
+        self.LOSS_GRAD = FUSED_LOSS_GRAD if self.FUSED_OUTPUT else GRADIENT(LOSS)
         # THIS LINE OF CODE SETS THE METRIC ATTRIBUTE TO THE VALUE OF THE METRIC PARAMETER. THIS ATTRIBUTE IS USED TO CALCULATE THE MODEL'S PERFORMANCE.
         self.METRIC = METRIC
         # THIS LINE OF CODE SETS THE LAYERS ATTRIBUTE TO THE VALUE OF THE LAYERS PARAMETER. THIS ATTRIBUTE IS USED TO STORE THE MODEL'S LAYERS.
@@ -154,6 +228,34 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         self.TRAINING = False
         # THIS LINE OF CODE SETS THE __INITIALIZED__ ATTRIBUTE TO FALSE. THIS ATTRIBUTE IS USED TO DETERMINE WHETHER THE MODEL HAS BEEN INITIALIZED.
         self.__INITIALIZED__ = False
+        # THIS LINE OF CODE SETS THE FLAT_PARAMETERS ATTRIBUTE TO THE VALUE OF THE FLAT_PARAMETERS PARAMETER. THIS ATTRIBUTE IS USED TO DETERMINE WHETHER THE PARAMETERS ARE STORED IN ONE CONTIGUOUS BUFFER.
+        self.FLAT_PARAMETERS = FLAT_PARAMETERS
+        # THIS LINE OF CODE SETS THE ARENA ATTRIBUTE TO NONE. THIS ATTRIBUTE IS USED TO STORE THE CONTIGUOUS BUFFER OF THE PARAMETERS.
+        self.ARENA = None
+        # THIS LINE OF CODE SETS THE RANDOM ATTRIBUTE TO A GENERATOR SEEDED WITH THE SEED PARAMETER. THIS ATTRIBUTE IS USED TO SHUFFLE THE TRAINING DATA.
+        self.RANDOM = np.random.default_rng(SEED)
+        # THIS LINE OF CODE SETS THE INDICES ATTRIBUTE TO NONE. THIS ATTRIBUTE IS USED TO STORE THE ORDER IN WHICH THE TRAINING SAMPLES ARE VISITED.
+        self.INDICES = None
+        # THIS LINE OF CODE SETS THE PIPELINE ATTRIBUTE TO THE VALUE OF THE PIPELINE PARAMETER. THIS ATTRIBUTE IS USED TO PREPARE THE TRAINING BATCHES IN THE BACKGROUND.
+        self.PIPELINE = PIPELINE
+        # THIS LINE OF CODE SETS THE PRECISION ATTRIBUTE TO THE VALUE OF THE PRECISION PARAMETER. THIS ATTRIBUTE IS USED TO CHOOSE THE DTYPES OF THE PARAMETERS, THE COMPUTATION AND THE CACHED ACTIVATIONS.
+        self.PRECISION = PRECISION
+        # THIS LINE OF CODE SETS THE PROFILER ATTRIBUTE TO THE VALUE OF THE PROFILER PARAMETER. THIS ATTRIBUTE IS USED TO RECORD THE TIME, FLOPS AND MEMORY OF EVERY PASS.
+        self.PROFILER = PROFILER
+        # THIS LINE OF CODE SETS THE FINITE_GRADS ATTRIBUTE TO TRUE. THIS ATTRIBUTE IS USED TO SKIP OPTIMIZER STEPS WHOSE GRADIENTS OVERFLOWED.
+        self.FINITE_GRADS = True
+        # THIS LINE OF CODE SETS THE STAGES ATTRIBUTE TO NONE. THIS ATTRIBUTE IS USED TO STORE THE FUSED BLOCKS OF THE COMPILED NETWORK.
+        self.STAGES = None
+        # THIS LINE OF CODE SETS THE INPUT_SHAPE ATTRIBUTE TO NONE. THIS ATTRIBUTE IS USED TO STORE THE SHAPE OF THE INPUT THE LAYERS WERE SET UP FOR.
+        self.INPUT_SHAPE = None
+        # THIS LINE OF CODE SETS THE EPOCH ATTRIBUTE TO 0. THIS ATTRIBUTE IS USED TO COUNT THE EPOCHS TRAINED BY FIT.
+        self.EPOCH = 0
+        # THIS LINE OF CODE SETS THE BATCH ATTRIBUTE TO 0. THIS ATTRIBUTE IS USED TO COUNT THE BATCHES TRAINED IN THE CURRENT EPOCH.
+        self.BATCH = 0
+        # THIS LINE OF CODE SETS THE CALLBACKS ATTRIBUTE TO AN EMPTY LIST. THIS ATTRIBUTE IS USED TO CALL THE CALLBACKS DURING FIT.
+        self.CALLBACKS = []
+        # THIS LINE OF CODE SETS THE STOP_TRAINING ATTRIBUTE TO FALSE. THIS ATTRIBUTE IS USED BY CALLBACKS TO STOP TRAINING EARLY.
+        self.STOP_TRAINING = False
 
     def __SETUP_LAYERS__(self, X_SHAPE):
         """SETUP THE LAYERS IN THE NETWORK.
@@ -171,16 +273,34 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
             X_SHAPE)  # THIS LINE OF CODE CONVERTS THE X_SHAPE PARAMETER TO A LIST.
         # THIS LINE OF CODE SETS THE FIRST ELEMENT OF THE X_SHAPE PARAMETER TO THE VALUE OF THE BATCH_SIZE PARAMETER.
         X_SHAPE[0] = self.BATCH_SIZE
+        # THIS LINE OF CODE SETS THE INPUT_SHAPE ATTRIBUTE TO THE SHAPE OF THE INPUT, SO A CHECKPOINT CAN SET UP THE LAYERS AGAIN.
+        self.INPUT_SHAPE = [int(N) for N in X_SHAPE]
+        # THIS LINE OF CODE CHECKS IF A MIXED-PRECISION POLICY IS SET.
+        if self.PRECISION is not None:
+            # THIS LINE OF CODE TELLS EVERY LAYER IN WHICH DTYPE TO COMPUTE AND TO CACHE ACTIVATIONS FOR THE BACKWARD PASS.
+            for LAYER in self.LAYERS:
+                LAYER.COMPUTE_DTYPE = self.PRECISION.COMPUTE_DTYPE
+                LAYER.STORAGE_DTYPE = self.PRECISION.STORAGE_DTYPE
         # THIS LINE OF CODE ITERATES THROUGH EACH LAYER IN THE LAYERS ATTRIBUTE.
         for LAYER in self.LAYERS:
             # THIS LINE OF CODE CALLS THE SETUP METHOD OF THE LAYER OBJECT.
-            LAYER.setup(X_SHAPE)
+            LAYER.SETUP(X_SHAPE)
             # THIS LINE OF CODE SETS THE X_SHAPE PARAMETER TO THE VALUE OF THE SHAPE METHOD OF THE LAYER OBJECT.
-            X_SHAPE = LAYER.shape(X_SHAPE)
+            X_SHAPE = LAYER.SHAPE(X_SHAPE)
         # THIS LINE OF CODE SETS THE __N_LAYERS__ ATTRIBUTE TO THE LENGTH OF THE LAYERS ATTRIBUTE.
         self.__N_LAYERS__ = len(self.LAYERS)
-        # THIS LINE OF CODE CALLS THE SETUP METHOD OF THE OPTIMIZER OBJECT.
-        self.OPTIMIZER.SETUP(self)
+        # THIS LINE OF CODE CHECKS IF A MIXED-PRECISION POLICY IS SET.
+        if self.PRECISION is not None:
+            # THIS LINE OF CODE CASTS THE PARAMETERS AND GRADIENTS OF EVERY LAYER TO THE COMPUTE DTYPE.
+            for PARAMETERS in self.PARAMETERS:
+                PARAMETERS.CAST(self.PRECISION.COMPUTE_DTYPE)
+        # THIS LINE OF CODE SETS THE DTYPE OF THE PARAMETERS TO THE COMPUTE DTYPE OF THE PRECISION POLICY, OR FLOAT64.
+        DTYPE = self.PRECISION.COMPUTE_DTYPE if self.PRECISION is not None else np.float64
+        # THIS LINE OF CODE MOVES THE PARAMETERS INTO ONE CONTIGUOUS BUFFER IF THE FLAT_PARAMETERS ATTRIBUTE IS TRUE.
+        self.ARENA = PARAMETER_ARENA(self.PARAMETERS, DTYPE=DTYPE) if self.FLAT_PARAMETERS else None
+        # THIS LINE OF CODE CALLS THE SETUP METHOD OF THE OPTIMIZER OBJECT, IF THE NETWORK HAS ONE (SERVING NETWORKS DO NOT).
+        if self.OPTIMIZER is not None:
+            self.OPTIMIZER.SETUP(self)
         # THIS LINE OF CODE SETS THE __INITIALIZED__ ATTRIBUTE TO TRUE.
         self.__INITIALIZED__ = True
 
@@ -196,20 +316,34 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         INT
             INDEX OF THE ENTRY LAYER FOR BACK PROPAGATION.
         """
-        if len(self.LAYERS) > 0 and not hasattr(self.LAYERS[-1], "PARAMETERS"):  # THIS LINE OF CODE CHECKS IF THE LAST LAYER IN THE LAYERS ATTRIBUTE HAS THE PARAMETERS ATTRIBUTE.
-            return -1  # THIS LINE OF CODE RETURNS -1.
+        if self.FUSED_OUTPUT:  # THIS LINE OF CODE CHECKS IF THE GRADIENT OF THE LOSS FUNCTION ALREADY INCLUDES THE LAST ACTIVATION LAYER.
+            return -1  # THIS LINE OF CODE RETURNS -1 SO THAT THE LAST ACTIVATION LAYER IS SKIPPED DURING BACK PROPAGATION.
         # THIS LINE OF CODE RETURNS THE LENGTH OF THE LAYERS ATTRIBUTE.
         return len(self.LAYERS)
 
-    def FIT(self, X, Y):
+    def FIT(self, X, Y, CHECKPOINT=None, CALLBACKS=None):
         """TRAIN THE NETWORK.
 
+        THE CALLBACKS ARE CALLED AFTER EVERY BATCH AND EVERY EPOCH, AND CAN
+        STOP TRAINING EARLY BY SETTING THE STOP_TRAINING ATTRIBUTE (SEE
+        EARLY_STOPPING).
+
+        WITH A CHECKPOINT_SCHEDULER, CHECKPOINTS ARE WRITTEN IN THE BACKGROUND
+        WHILE THE NETWORK TRAINS AND A LAST ONE IS WRITTEN WHEN IT IS DONE. IF
+        THE DIRECTORY OF THE SCHEDULER ALREADY HOLDS A CHECKPOINT (E.G. FROM A
+        RUN THAT WAS INTERRUPTED), THE NETWORK IS LOADED FROM IT AND TRAINING
+        RESUMES FROM THE EPOCH AND BATCH IT WAS TAKEN AT.
+
         PARAMETERS
         ----------
         X : NUMPY ARRAY
             INPUT DATA.
         Y : NUMPY ARRAY
             TARGET DATA.
+        CHECKPOINT : CHECKPOINT_SCHEDULER
+            SCHEDULER OF THE CHECKPOINTS (NONE FOR NO CHECKPOINTS).
+        CALLBACKS : LIST
+            CALLBACKS CALLED DURING TRAINING, IN ORDER, BEFORE THE SCHEDULER (NONE FOR NO CALLBACKS).
 
         RETURNS
         -------
@@ -220,6 +354,11 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         assert Y is not None, "Y CANNOT BE NONE"
         # THIS LINE OF CODE CHECKS IF THE LENGTH OF THE X PARAMETER IS EQUAL TO THE LENGTH OF THE Y PARAMETER.
         assert len(X) == len(Y), "X AND Y MUST HAVE THE SAME LENGTH"
+        # THIS LINE OF CODE CHECKS IF THERE IS A CHECKPOINT TO RESUME FROM.
+        RESUME = CHECKPOINT is not None and CHECKPOINT.EXISTS
+        if RESUME:  # THIS LINE OF CODE RUNS IF TRAINING RESUMES FROM A CHECKPOINT.
+            # THIS LINE OF CODE LOADS THE NETWORK INTO ITS OWN MEMORY, AS TRAINING WRITES TO EVERY PARAMETER ANYWAY.
+            self.LOAD(CHECKPOINT.PATH, MMAP=False)
         # THIS LINE OF CODE CHECKS IF THE __INITIALIZED__ ATTRIBUTE IS FALSE.
         if not self.__INITIALIZED__:
             # THIS LINE OF CODE CALLS THE __SETUP_LAYERS__ METHOD.
@@ -229,12 +368,196 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
             Y = Y[:, np.newaxis]
         # THIS LINE OF CODE CALLS THE __SETUP_INPUT__ METHOD.
         self.__SETUP_INPUT__(X, Y)
+        if RESUME:  # THIS LINE OF CODE RUNS IF TRAINING RESUMES FROM A CHECKPOINT.
+            # THIS LINE OF CODE CHECKS THAT THE SAVED ORDER OF THE SAMPLES FITS THE DATA.
+            if self.INDICES is not None and len(self.INDICES) != len(X):
+                raise ValueError("THE CHECKPOINT WAS TAKEN ON A DATASET OF A DIFFERENT SIZE")
+        else:  # THIS LINE OF CODE RUNS IF TRAINING STARTS FROM THE FIRST EPOCH.
+            # THIS LINE OF CODE SETS THE INDICES ATTRIBUTE TO NONE SO THAT THE NEW DATA IS VISITED IN ITS STORED ORDER UNTIL IT IS SHUFFLED.
+            self.INDICES = None
+            # THIS LINE OF CODE SETS THE EPOCH AND BATCH ATTRIBUTES TO 0 SO THAT TRAINING STARTS FROM THE FIRST EPOCH.
+            self.EPOCH = self.BATCH = 0
+            # THIS LINE OF CODE SETS THE STOP_TRAINING ATTRIBUTE TO FALSE SO THAT A STOP OF AN EARLIER CALL IS FORGOTTEN.
+            self.STOP_TRAINING = False
+        # THIS LINE OF CODE SETS THE CALLBACKS VARIABLE TO THE CALLBACKS OF THIS CALL, FOLLOWED BY THE SCHEDULER SO THAT CHECKPOINTS SEE THEIR EFFECTS.
+        CALLBACKS = list(CALLBACKS or []) + ([CHECKPOINT] if CHECKPOINT is not None else [])
+        for CALLBACK in CALLBACKS:  # THIS LINE OF CODE ITERATES THROUGH THE CALLBACKS.
+            CALLBACK.ON_TRAIN_BEGIN(self)  # THIS LINE OF CODE CALLS THE ON_TRAIN_BEGIN METHOD OF THE CALLBACK.
+        # THIS LINE OF CODE SETS THE CALLBACKS ATTRIBUTE TO THE CALLBACKS OF THIS CALL.
+        self.CALLBACKS = CALLBACKS
         # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE TO TRUE.
         self.IS_TRAINING = True
-        # THIS LINE OF CODE CALLS THE OPTIMIZE METHOD OF THE OPTIMIZER OBJECT.
-        self.OPTIMIZER.optimize(self)
+        try:
+            # THIS LINE OF CODE CALLS THE OPTIMIZE METHOD OF THE OPTIMIZER OBJECT.
+            self.OPTIMIZER.OPTIMIZE(self)
+        finally:
+            # THIS LINE OF CODE SETS THE CALLBACKS ATTRIBUTE BACK TO AN EMPTY LIST.
+            self.CALLBACKS = []
         # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE TO FALSE.
         self.IS_TRAINING = False
+        for CALLBACK in CALLBACKS:  # THIS LINE OF CODE ITERATES THROUGH THE CALLBACKS.
+            # THIS LINE OF CODE CALLS THE ON_TRAIN_END METHOD OF THE CALLBACK, E.G. TO RESTORE THE BEST PARAMETERS OR WRITE A LAST CHECKPOINT.
+            CALLBACK.ON_TRAIN_END(self)
+
+    def FIT_STREAM(self, X, Y, WINDOW=64):
+        """TRAIN THE NETWORK ON LONG SEQUENCES IN FIXED-LENGTH WINDOWS.
+
+        THE RECURRENT LAYERS CARRY THEIR STATE FROM ONE WINDOW TO THE NEXT AND
+        GRADIENTS ARE TRUNCATED AT THE WINDOW BOUNDARIES, SO ONLY ONE WINDOW
+        IS EVER HELD IN MEMORY. X AND Y CAN BE MEMORY-MAPPED ARRAYS.
+
+        PARAMETERS
+        ----------
+        X : NUMPY ARRAY
+            INPUT SEQUENCES OF SHAPE (N_SEQUENCES, N_TIMESTEPS, N_FEATURES).
+        Y : NUMPY ARRAY
+            TARGET SEQUENCES OF SHAPE (N_SEQUENCES, N_TIMESTEPS, N_TARGETS).
+        WINDOW : INT
+            NUMBER OF TIMESTEPS PER UPDATE.
+
+        RETURNS
+        -------
+        LIST
+            LOSS OF EACH EPOCH.
+        """
+        assert X is not None, "X CANNOT BE NONE"  # THIS LINE OF CODE CHECKS IF THE X PARAMETER IS NOT NONE.
+        # THIS LINE OF CODE CHECKS IF THE Y PARAMETER IS NOT NONE.
+        assert Y is not None, "Y CANNOT BE NONE"
+        # THIS LINE OF CODE CHECKS IF X AND Y HAVE THE SAME NUMBER OF SEQUENCES AND TIMESTEPS.
+        assert X.shape[:2] == Y.shape[:2], "X AND Y MUST HAVE THE SAME NUMBER OF SEQUENCES AND TIMESTEPS"
+        # THIS LINE OF CODE CHECKS IF THE __INITIALIZED__ ATTRIBUTE IS FALSE.
+        if not self.__INITIALIZED__:
+            # THIS LINE OF CODE CALLS THE __SETUP_LAYERS__ METHOD WITH THE SHAPE OF ONE WINDOW.
+            self.__SETUP_LAYERS__((X.shape[0], min(WINDOW, X.shape[1])) + tuple(X.shape[2:]))
+        # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE TO TRUE.
+        self.IS_TRAINING = True
+        # THIS LINE OF CODE CALLS THE OPTIMIZE_STREAM METHOD OF THE OPTIMIZER OBJECT.
+        LOSS_HISTORY = self.OPTIMIZER.OPTIMIZE_STREAM(self, X, Y, WINDOW)
+        # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE TO FALSE.
+        self.IS_TRAINING = False
+        return LOSS_HISTORY  # THIS LINE OF CODE RETURNS THE LOSS OF EACH EPOCH.
+
+    def FIT_PARALLEL(self, X, Y, N_WORKERS=None, REDUCTION="MEAN", ASYNCHRONOUS=False):
+        """TRAIN THE NETWORK WITH PARALLEL WORKER PROCESSES.
+
+        BY DEFAULT EACH MINIBATCH IS SPLIT ACROSS N_WORKERS FORKED REPLICAS OF THE
+        NETWORK, THEIR GRADIENTS ARE SUMMED IN SHARED MEMORY AND THE OPTIMIZER
+        TAKES ONE STEP. WITH ASYNCHRONOUS=TRUE THE WORKERS INSTEAD RUN HOGWILD
+        SGD, EACH UPDATING THE SHARED PARAMETERS WITHOUT LOCKS. THE NETWORK MUST
+        USE FLAT_PARAMETERS.
+
+        PARAMETERS
+        ----------
+        X : NUMPY ARRAY
+            INPUT DATA.
+        Y : NUMPY ARRAY
+            TARGET DATA.
+        N_WORKERS : INT
+            NUMBER OF WORKER PROCESSES (DEFAULTS TO THE NUMBER OF CPUS).
+        REDUCTION : STRING
+            "MEAN" IF THE GRADIENT OF THE LOSS AVERAGES OVER THE SAMPLES, "SUM" IF IT SUMS OVER THEM.
+        ASYNCHRONOUS : BOOL
+            WHETHER TO TRAIN WITH LOCK-FREE ASYNCHRONOUS SGD (NEEDS A STOCHASTIC_GRADIENT_DESCENT OPTIMIZER).
+
+        RETURNS
+        -------
+        LIST
+            LOSS OF EACH EPOCH.
+        """
+        assert X is not None, "X CANNOT BE NONE"  # THIS LINE OF CODE CHECKS IF THE X PARAMETER IS NOT NONE.
+        # THIS LINE OF CODE CHECKS IF THE Y PARAMETER IS NOT NONE.
+        assert Y is not None, "Y CANNOT BE NONE"
+        # THIS LINE OF CODE CHECKS IF THE LENGTH OF THE X PARAMETER IS EQUAL TO THE LENGTH OF THE Y PARAMETER.
+        assert len(X) == len(Y), "X AND Y MUST HAVE THE SAME LENGTH"
+        # THIS LINE OF CODE CHECKS THAT THE PARAMETERS LIVE IN ONE BUFFER THAT CAN BE SHARED WITH THE WORKERS.
+        assert self.FLAT_PARAMETERS, "FIT_PARALLEL NEEDS FLAT_PARAMETERS=TRUE"
+        # THIS LINE OF CODE CHECKS IF THE __INITIALIZED__ ATTRIBUTE IS FALSE.
+        if not self.__INITIALIZED__:
+            # THIS LINE OF CODE CALLS THE __SETUP_LAYERS__ METHOD.
+            self.__SETUP_LAYERS__(X.shape)
+        if Y.ndim == 1:  # THIS LINE OF CODE CHECKS IF THE Y PARAMETER IS A 1D ARRAY.
+            # THIS LINE OF CODE ADDS A NEW AXIS TO THE Y PARAMETER.
+            Y = Y[:, np.newaxis]
+        # THIS LINE OF CODE CALLS THE __SETUP_INPUT__ METHOD.
+        self.__SETUP_INPUT__(X, Y)
+        # THIS LINE OF CODE SETS THE INDICES ATTRIBUTE TO NONE SO THAT THE NEW DATA IS VISITED IN ITS STORED ORDER UNTIL IT IS SHUFFLED.
+        self.INDICES = None
+        # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE TO TRUE.
+        self.IS_TRAINING = True
+        try:
+            # THIS LINE OF CODE CHOOSES THE ASYNCHRONOUS OR THE SYNCHRONOUS TRAINER.
+            TRAINER = HOGWILD(N_WORKERS) if ASYNCHRONOUS else DATA_PARALLEL(N_WORKERS, REDUCTION)
+            # THIS LINE OF CODE TRAINS THE NETWORK WITH THE PARALLEL TRAINER.
+            LOSS_HISTORY = TRAINER.OPTIMIZE(self)
+        finally:
+            # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE TO FALSE.
+            self.IS_TRAINING = False
+        return LOSS_HISTORY  # THIS LINE OF CODE RETURNS THE LOSS OF EACH EPOCH.
+
+    def STEP(self, X):
+        """ADVANCE THE NETWORK BY ONE TIMESTEP.
+
+        THE RECURRENT LAYERS KEEP THEIR STATE BETWEEN CALLS, SO A STREAM CAN BE
+        PROCESSED ONE TIMESTEP AT A TIME WITH CONSTANT MEMORY. CALL
+        RESET_STATES() BEFORE STARTING A NEW STREAM.
+
+        PARAMETERS
+        ----------
+        X : NUMPY ARRAY
+            INPUT OF ONE TIMESTEP OF SHAPE (N_SEQUENCES, N_FEATURES).
+
+        RETURNS
+        -------
+        NUMPY ARRAY
+            OUTPUT OF THE NETWORK FOR THIS TIMESTEP.
+        """
+        assert X is not None, "X CANNOT BE NONE"  # THIS LINE OF CODE CHECKS IF THE X PARAMETER IS NOT NONE.
+        X = np.asarray(X)[:, np.newaxis]  # THIS LINE OF CODE ADDS A TIME AXIS OF LENGTH ONE TO THE X PARAMETER.
+        # THIS LINE OF CODE CHECKS IF THE __INITIALIZED__ ATTRIBUTE IS FALSE.
+        if not self.__INITIALIZED__:
+            # THIS LINE OF CODE CALLS THE __SETUP_LAYERS__ METHOD.
+            self.__SETUP_LAYERS__(X.shape)
+        Y = self.__FORWARD__(X)  # THIS LINE OF CODE SETS THE Y VARIABLE TO THE VALUE OF THE __FORWARD__ METHOD.
+        # THIS LINE OF CODE REMOVES THE TIME AXIS IF THE LAST LAYER RETURNED SEQUENCES AND COPIES THE OUTPUT, WHICH MAY BE A WORKSPACE ARRAY OF THE LAST LAYER.
+        return (Y[:, 0] if Y.ndim == 3 else Y).copy()
+
+    def RESET_STATES(self):
+        """RESET THE STATE CARRIED BY THE RECURRENT LAYERS.
+
+        PARAMETERS
+        ----------
+        NONE
+
+        RETURNS
+        -------
+        NONE
+        """
+        for LAYER in self.LAYERS:  # THIS LINE OF CODE ITERATES THROUGH EACH LAYER IN THE LAYERS ATTRIBUTE.
+            # THIS LINE OF CODE CHECKS IF THE LAYER OBJECT CARRIES STATE BETWEEN CALLS.
+            if hasattr(LAYER, "RESET_STATE"):
+                LAYER.RESET_STATE()  # THIS LINE OF CODE CALLS THE RESET_STATE METHOD OF THE LAYER OBJECT.
+
+    def RESET_STAGE_CACHES(self):
+        """DROP THE WEIGHTS CACHED BY THE COMPILED STAGES.
+
+        A FUSED BLOCK KEEPS ITS WEIGHTS WITH THE DROP_OUT AND BATCH NORMALIZATION
+        FOLDED IN UNTIL ITS PHASE CHANGES. CALL THIS AFTER WRITING PARAMETERS OR
+        LAYER STATE DIRECTLY (E.G. RESTORING THEM FROM A COPY OR A CHECKPOINT), SO
+        THE BLOCKS FOLD THE NEW VALUES.
+
+        PARAMETERS
+        ----------
+        NONE
+
+        RETURNS
+        -------
+        NONE
+        """
+        # THIS LINE OF CODE ITERATES THROUGH THE STAGES OF THE COMPILED NETWORK, IF ANY.
+        for STAGE in self.STAGES or []:
+            # THIS LINE OF CODE CHECKS IF THE STAGE IS A FUSED BLOCK.
+            if isinstance(STAGE, FUSED_BLOCK):
+                STAGE.RESET_CACHE()  # THIS LINE OF CODE CALLS THE RESET_CACHE METHOD OF THE BLOCK.
 
     def UPDATE(self, X, Y):
         """UPDATE THE PARAMETERS OF THE NETWORK.
@@ -250,17 +573,157 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         -------
         NONE
         """
+        TESTING_PHASE = not self.IS_TRAINING  # THIS LINE OF CODE SETS THE TESTING_PHASE VARIABLE TO TRUE IF THE NETWORK IS NOT TRAINING.
+        if TESTING_PHASE:  # THIS LINE OF CODE CHECKS IF THE TESTING_PHASE VARIABLE IS TRUE.
+            # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE TO TRUE, AS THE LAYERS ONLY KEEP THE CACHES OF THE BACKWARD PASS WHILE TRAINING.
+            self.IS_TRAINING = True
         Y_PREDICTION = self.__FORWARD__(
             X)  # THIS LINE OF CODE SETS THE Y_PREDICTION VARIABLE TO THE VALUE OF THE __FORWARD__ METHOD.
+        # THIS LINE OF CODE CASTS THE Y PARAMETER TO THE COMPUTE DTYPE IF A MIXED-PRECISION POLICY IS SET.
+        Y = self.PRECISION.CAST(Y) if self.PRECISION is not None else Y
         # THIS LINE OF CODE SETS THE GRAD VARIABLE TO THE VALUE OF THE LOSS_GRAD METHOD.
         GRAD = self.LOSS_GRAD(Y, Y_PREDICTION)
-        # THIS LINE OF CODE ITERATES THROUGH EACH LAYER IN THE LAYERS ATTRIBUTE.
-        for LAYER in reversed(self.LAYERS[: self.BPROP_ENTRY]):
-            # THIS LINE OF CODE SETS THE GRAD VARIABLE TO THE VALUE OF THE BACKWARD_PASS METHOD OF THE LAYER OBJECT.
-            GRAD = LAYER.BACKWARD_PASS(GRAD)
+        # THIS LINE OF CODE MULTIPLIES THE GRAD VARIABLE BY THE LOSS SCALE IF A MIXED-PRECISION POLICY IS SET.
+        GRAD = self.PRECISION.SCALE(GRAD) if self.PRECISION is not None else GRAD
+        # THIS LINE OF CODE ITERATES BACKWARDS THROUGH THE STAGES OF THE COMPILED NETWORK, OR THROUGH THE LAYERS.
+        for LAYER in reversed(self.__STAGES__[: self.BPROP_ENTRY]):
+            # THIS LINE OF CODE SETS THE GRAD VARIABLE TO THE VALUE OF THE BACKWARD_PASS METHOD OF THE LAYER OBJECT, RECORDED BY THE PROFILER IF THERE IS ONE.
+            GRAD = LAYER.BACKWARD_PASS(GRAD) if self.PROFILER is None else self.PROFILER.RUN(self, LAYER, "BACKWARD_PASS", GRAD)
+        # THIS LINE OF CODE DIVIDES THE GRADIENTS BY THE LOSS SCALE AND CHECKS THAT THEY ARE FINITE IF A MIXED-PRECISION POLICY IS SET.
+        self.FINITE_GRADS = self.PRECISION.UNSCALE(self.PARAMETER_GROUPS) if self.PRECISION is not None else True
+        if TESTING_PHASE:  # THIS LINE OF CODE CHECKS IF THE TESTING_PHASE VARIABLE IS TRUE.
+            # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE BACK TO FALSE.
+            self.IS_TRAINING = False
         # THIS LINE OF CODE RETURNS THE VALUE OF THE LOSS METHOD.
         return self.LOSS(Y, Y_PREDICTION)
 
+    def FREEZE(self):
+        """RETURN A STATELESS, THREAD-SAFE FORWARD FUNCTION FOR INFERENCE.
+
+        EVERY LAYER IS FROZEN INTO A FUNCTION OVER A COPY OF ITS CURRENT
+        PARAMETERS THAT COMPUTES ITS TESTING-PHASE OUTPUT WITHOUT WRITING TO THE
+        LAYER, SO THE RESULT CAN BE CALLED FROM MANY THREADS AT ONCE.
+
+        RETURNS
+        -------
+        FUNCTION
+            FUNCTION MAPPING AN INPUT BATCH TO THE OUTPUT OF THE NETWORK.
+        """
+        # THIS LINE OF CODE CHECKS THAT THE LAYERS HAVE BEEN SET UP.
+        assert self.__INITIALIZED__, "THE NETWORK MUST BE SET UP BEFORE IT IS FROZEN"
+        # THIS LINE OF CODE FREEZES EVERY STAGE OF THE COMPILED NETWORK, OR EVERY LAYER.
+        FORWARDS = [LAYER.FREEZE() for LAYER in self.__STAGES__]
+        # THIS LINE OF CODE KEEPS THE CAST OF THE MIXED-PRECISION POLICY, IF ANY.
+        CAST = self.PRECISION.CAST if self.PRECISION is not None else None
+
+        def FORWARD(X):  # THIS LINE OF CODE DEFINES THE FROZEN FORWARD FUNCTION.
+            X = CAST(X) if CAST is not None else X  # THIS LINE OF CODE CASTS THE INPUT TO THE COMPUTE DTYPE.
+            for LAYER_FORWARD in FORWARDS:  # THIS LINE OF CODE ITERATES THROUGH THE FROZEN LAYERS.
+                X = LAYER_FORWARD(X)  # THIS LINE OF CODE APPLIES THE FROZEN LAYER.
+            return X  # THIS LINE OF CODE RETURNS THE OUTPUT.
+        return FORWARD  # THIS LINE OF CODE RETURNS THE FROZEN FORWARD FUNCTION.
+
+    def COMPILE(self):
+        """FUSE COMMON SEQUENCES OF LAYERS INTO BLOCKS.
+
+        EVERY DENSE OR CONVOLUTION LAYER IS FUSED WITH THE DROP_OUT LAYERS
+        BEFORE IT AND THE BATCH_NORMALIZATION AND ACTIVATION AFTER IT (SEE
+        FUSED_BLOCK). WHILE TESTING, A BLOCK FOLDS THE DROP_OUT AND BATCH
+        NORMALIZATION INTO ITS WEIGHTS AND APPLIES THE ACTIVATION IN PLACE, SO IT
+        WRITES ONE ARRAY PER BATCH INSTEAD OF ONE PER LAYER; WHILE TRAINING, IT
+        KEEPS THE OUTPUT OF AN IN-PLACE ACTIVATION INSTEAD OF BOTH ITS INPUT AND
+        OUTPUT. THE BLOCKS SHARE THE PARAMETERS OF THE LAYERS, SO THE NETWORK CAN
+        BE COMPILED BEFORE OR AFTER IT IS TRAINED.
+
+        PARAMETERS
+        ----------
+        NONE
+
+        RETURNS
+        -------
+        NONE
+        """
+        # THIS LINE OF CODE SETS THE HEAD VARIABLE TO THE LAYERS THAT ARE BACK PROPAGATED, AS THE LAST ACTIVATION IS SKIPPED WHEN IT IS FUSED WITH THE LOSS.
+        HEAD = self.LAYERS[: self.BPROP_ENTRY]
+        # THIS LINE OF CODE FUSES THE LAYERS THAT ARE BACK PROPAGATED AND KEEPS THE OTHERS AS THEY ARE.
+        self.STAGES = COMPILE(HEAD) + self.LAYERS[len(HEAD):]
+        # THIS LINE OF CODE SETS THE PHASE OF THE NEW BLOCKS TO THE PHASE OF THE NETWORK.
+        self.IS_TRAINING = self.IS_TRAINING
+
+    def EXPORT(self):
+        """RETURN A COPY OF THE NETWORK FOR SERVING.
+
+        EVERY BATCH_NORMALIZATION THAT DIRECTLY FOLLOWS A DENSE OR CONVOLUTION
+        LAYER IS FOLDED INTO THE WEIGHTS AND BIASES OF THAT LAYER AND REMOVED,
+        SO ITS PASSES OVER EACH BATCH DISAPPEAR FROM THE SERVING NETWORK. THE
+        COPY HAS NO OPTIMIZER AND IS ONLY MEANT FOR PREDICT, SCORE, FREEZE AND
+        THE INFERENCE ENGINE. IT IS COMPILED IF THIS NETWORK IS.
+
+        PARAMETERS
+        ----------
+        NONE
+
+        RETURNS
+        -------
+        NEURAL_NETWORK
+            SERVING NETWORK.
+        """
+        # THIS LINE OF CODE CHECKS THAT THE LAYERS HAVE BEEN SET UP.
+        assert self.__INITIALIZED__, "THE NETWORK MUST BE SET UP BEFORE IT IS EXPORTED"
+        # THIS LINE OF CODE CREATES THE SERVING NETWORK FROM A COPY OF THE LAYERS WITH THE BATCH NORMALIZATIONS FOLDED AWAY.
+        NETWORK = NEURAL_NETWORK(EXPORT(self.LAYERS), None, self.LOSS, MAX_EPOCHS=self.MAX_EPOCHS, BATCH_SIZE=self.BATCH_SIZE,
+                                 METRIC=self.METRIC, PRECISION=self.PRECISION)
+        # THIS LINE OF CODE SETS THE __N_LAYERS__ ATTRIBUTE OF THE SERVING NETWORK TO ITS NUMBER OF LAYERS.
+        NETWORK.__N_LAYERS__ = len(NETWORK.LAYERS)
+        # THIS LINE OF CODE MARKS THE SERVING NETWORK AS INITIALIZED, AS ITS LAYERS ARE ALREADY SET UP.
+        NETWORK.__INITIALIZED__ = True
+        # THIS LINE OF CODE SETS THE INPUT_SHAPE ATTRIBUTE OF THE SERVING NETWORK TO THE INPUT SHAPE OF THIS NETWORK.
+        NETWORK.INPUT_SHAPE = self.INPUT_SHAPE
+        if self.STAGES is not None:  # THIS LINE OF CODE CHECKS IF THIS NETWORK IS COMPILED.
+            NETWORK.COMPILE()  # THIS LINE OF CODE COMPILES THE SERVING NETWORK.
+        return NETWORK  # THIS LINE OF CODE RETURNS THE SERVING NETWORK.
+
+    def SAVE(self, PATH):
+        """SAVE THE NETWORK TO A CHECKPOINT.
+
+        THE CHECKPOINT IS A DIRECTORY WITH ONE ALIGNED BINARY BLOB AND A JSON
+        MANIFEST OF THE NAME, SHAPE AND DTYPE OF EVERY ARRAY IN IT. IT HOLDS
+        THE PARAMETERS, THE RUNNING STATISTICS OF THE BATCH NORMALIZATIONS,
+        THE STATE OF THE OPTIMIZER AND THE LOSS SCALE. AN EXISTING CHECKPOINT
+        IN PATH IS REPLACED ATOMICALLY.
+
+        PARAMETERS
+        ----------
+        PATH : STRING
+            DIRECTORY OF THE CHECKPOINT.
+
+        RETURNS
+        -------
+        NONE
+        """
+        SAVE(self, PATH)  # THIS LINE OF CODE WRITES THE CHECKPOINT.
+
+    def LOAD(self, PATH, MMAP=True):
+        """LOAD THE NETWORK FROM A CHECKPOINT.
+
+        WITH MMAP, THE PARAMETERS ARE MAPPED COPY-ON-WRITE FROM THE BLOB
+        INSTEAD OF BEING READ, SO A SERVING PROCESS STARTS WITHOUT READING THE
+        WEIGHTS AND PROCESSES SERVING THE SAME CHECKPOINT SHARE THEIR PAGES.
+        THE NETWORK IS SET UP FOR THE SAVED INPUT SHAPE IF IT IS NOT SET UP.
+
+        PARAMETERS
+        ----------
+        PATH : STRING
+            DIRECTORY OF THE CHECKPOINT.
+        MMAP : BOOL
+            WHETHER TO MAP THE PARAMETERS INSTEAD OF COPYING THEM INTO MEMORY.
+
+        RETURNS
+        -------
+        NONE
+        """
+        LOAD(self, PATH, MMAP)  # THIS LINE OF CODE READS THE CHECKPOINT.
+
     def __FORWARD__(self, X):
         """__FORWARD__ PASS THROUGH THE NETWORK.
 
@@ -274,9 +737,11 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         NUMPY ARRAY
             OUTPUT DATA.
         """
-        for LAYER in self.LAYERS:  # THIS LINE OF CODE ITERATES THROUGH EACH LAYER IN THE LAYERS ATTRIBUTE.
-            # THIS LINE OF CODE SETS THE X VARIABLE TO THE VALUE OF THE FORWARD_PASS METHOD OF THE LAYER OBJECT.
-            X = LAYER.FORWARD_PASS(X)
+        # THIS LINE OF CODE CASTS THE X PARAMETER TO THE COMPUTE DTYPE IF A MIXED-PRECISION POLICY IS SET.
+        X = self.PRECISION.CAST(X) if self.PRECISION is not None else X
+        for LAYER in self.__STAGES__:  # THIS LINE OF CODE ITERATES THROUGH THE STAGES OF THE COMPILED NETWORK, OR THROUGH THE LAYERS.
+            # THIS LINE OF CODE SETS THE X VARIABLE TO THE VALUE OF THE FORWARD_PASS METHOD OF THE LAYER OBJECT, RECORDED BY THE PROFILER IF THERE IS ONE.
+            X = LAYER.FORWARD_PASS(X) if self.PROFILER is None else self.PROFILER.RUN(self, LAYER, "FORWARD_PASS", X)
         return X  # THIS LINE OF CODE RETURNS THE X VARIABLE.
 
     def PREDICT(self, X=None):
@@ -297,14 +762,20 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         if not self.__INITIALIZED__:
             # THIS LINE OF CODE CALLS THE __SETUP_LAYERS__ METHOD.
             self.__SETUP_LAYERS__(X.shape)
-        Y = []  # THIS LINE OF CODE CREATES AN EMPTY LIST.
+        assert len(X) > 0, "X CANNOT BE EMPTY"  # THIS LINE OF CODE CHECKS IF THE X PARAMETER HAS AT LEAST ONE SAMPLE.
+        Y = None  # THIS LINE OF CODE INITIALIZES THE OUTPUT, WHICH IS ALLOCATED ONCE THE SHAPE OF THE FIRST BATCH IS KNOWN.
+        BEGIN = 0  # THIS LINE OF CODE SETS THE BEGIN VARIABLE TO THE INDEX OF THE FIRST SAMPLE OF THE NEXT BATCH.
         # THIS LINE OF CODE SETS THE X_BATCH VARIABLE TO THE VALUE OF THE BATCH_ITERATOR FUNCTION.
         X_BATCH = BATCH_ITERATOR(X, self.BATCH_SIZE)
         for XB in X_BATCH:  # THIS LINE OF CODE ITERATES THROUGH EACH BATCH IN THE X_BATCH VARIABLE.
-            # THIS LINE OF CODE APPENDS THE VALUE OF THE __FORWARD__ METHOD TO THE Y LIST.
-            Y.append(self.__FORWARD__(XB))
-        # THIS LINE OF CODE RETURNS THE CONCATENATED VALUE OF THE Y LIST.
-        return np.concatenate(Y)
+            # THIS LINE OF CODE SETS THE YB VARIABLE TO THE VALUE OF THE __FORWARD__ METHOD. IT MAY BE A WORKSPACE ARRAY THAT THE NEXT BATCH OVERWRITES.
+            YB = self.__FORWARD__(XB)
+            if Y is None:  # THIS LINE OF CODE CHECKS IF THE OUTPUT HAS NOT BEEN ALLOCATED YET.
+                # THIS LINE OF CODE ALLOCATES THE OUTPUT FOR ALL SAMPLES, SO THE BATCHES ARE NOT HELD TWICE BY A CONCATENATION.
+                Y = np.empty((len(X),) + YB.shape[1:], dtype=YB.dtype)
+            Y[BEGIN: BEGIN + len(YB)] = YB  # THIS LINE OF CODE COPIES THE OUTPUT OF THE BATCH INTO THE OUTPUT.
+            BEGIN += len(YB)  # THIS LINE OF CODE MOVES THE BEGIN VARIABLE TO THE NEXT BATCH.
+        return Y  # THIS LINE OF CODE RETURNS THE OUTPUT.
 
     def SCORE(self, X=None, Y=None):
         """CALCULATE THE ERROR OF THE NETWORK.
@@ -357,6 +828,11 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
     def __SHUFFLE_DATASET__(self):
         """SHUFFLE THE DATASET.
 
+        DRAWS A NEW PERMUTATION OF THE SAMPLE INDICES IN O(N). THE DATASET
+        ITSELF IS NOT COPIED; THE OPTIMIZER GATHERS EACH BATCH THROUGH INDICES.
+        SHARDED AND MEMORY-MAPPED DATASETS ARE SHUFFLED SHARD BY SHARD (OR
+        BLOCK BY BLOCK) TO KEEP DISK READS LOCAL.
+
         PARAMETERS
         ----------
         NONE
@@ -368,27 +844,8 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
         assert self.X is not None, "X CANNOT BE NONE"  # THIS LINE OF CODE CHECKS IF THE X ATTRIBUTE IS NOT NONE.
         # THIS LINE OF CODE CHECKS IF THE Y ATTRIBUTE IS NOT NONE.
         assert self.Y is not None, "Y CANNOT BE NONE"
-        # THIS LINE OF CODE SETS THE N_SAMPLES VARIABLE TO THE VALUE OF THE X ATTRIBUTE.
-        N_SAMPLES = self.X.shape[0]
-        # THIS LINE OF CODE SETS THE INDICES VARIABLE TO THE VALUE OF THE arange METHOD.
-        INDICES = np.arange(N_SAMPLES)
-        # THIS LINE OF CODE SETS THE ORIGINAL_LIST VARIABLE TO THE VALUE OF THE INDICES VARIABLE.
-        ORIGINAL_LIST = list(INDICES)
-        SHUFFLED_LIST = []  # THIS LINE OF CODE CREATES AN EMPTY LIST.
-        # THIS LINE OF CODE CHECKS IF THE LENGTH OF THE ORIGINAL_LIST VARIABLE IS GREATER THAN 0.
-        while len(ORIGINAL_LIST) > 0:
-            # THIS LINE OF CODE SETS THE picked_item VARIABLE TO THE VALUE OF THE choice METHOD.
-            picked_item = secrets.choice(ORIGINAL_LIST)
-            # THIS LINE OF CODE APPENDS THE VALUE OF THE picked_item VARIABLE TO THE SHUFFLED_LIST VARIABLE.
-            SHUFFLED_LIST.append(picked_item)
-            # THIS LINE OF CODE REMOVES THE VALUE OF THE picked_item VARIABLE FROM THE ORIGINAL_LIST VARIABLE.
-            ORIGINAL_LIST.remove(picked_item)
-        # THIS LINE OF CODE SETS THE INDICES VARIABLE TO THE VALUE OF THE SHUFFLED_LIST VARIABLE.
-        INDICES = np.array(SHUFFLED_LIST)
-        # THIS LINE OF CODE SETS THE X ATTRIBUTE TO THE VALUE OF THE take METHOD.
-        self.X = self.X.take(INDICES, axis=0)
-        # THIS LINE OF CODE SETS THE y ATTRIBUTE TO THE VALUE OF THE take METHOD.
-        self.Y = self.Y.take(INDICES, axis=0)
+        # THIS LINE OF CODE SETS THE INDICES ATTRIBUTE TO A RANDOM PERMUTATION OF THE SAMPLE INDICES.
+        self.INDICES = SHUFFLED_INDICES(self.X, self.RANDOM)
 
     def __PREDICT__(self, X=None):
         """MAKE PREDICTIONS USING THE NETWORK.
@@ -443,6 +900,38 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
             PARAMS.append(LAYER.PARAMETERS)
         return PARAMS  # THIS LINE OF CODE RETURNS THE PARAMS LIST.
 
+    @property
+    def PARAMETER_GROUPS(self):
+        """GET THE PARAMETER OBJECTS UPDATED BY THE OPTIMIZER.
+
+        PARAMETERS
+        ----------
+        NONE
+
+        RETURNS
+        -------
+        LIST
+            THE ARENA IF THE PARAMETERS ARE FLAT, OTHERWISE THE PARAMETERS OF EACH PARAMETRIC LAYER.
+        """
+        if self.ARENA is not None:  # THIS LINE OF CODE CHECKS IF THE PARAMETERS ARE STORED IN THE ARENA.
+            return [self.ARENA]  # THIS LINE OF CODE RETURNS THE ARENA AS THE ONLY PARAMETER GROUP.
+        return self.PARAMETERS  # THIS LINE OF CODE RETURNS THE PARAMETERS OF EACH PARAMETRIC LAYER.
+
+    @property
+    def __STAGES__(self):
+        """GET THE STAGES RUN BY THE FORWARD AND BACKWARD PASSES.
+
+        PARAMETERS
+        ----------
+        NONE
+
+        RETURNS
+        -------
+        LIST
+            STAGES OF THE COMPILED NETWORK, OR THE LAYERS IF THE NETWORK IS NOT COMPILED.
+        """
+        return self.LAYERS if self.STAGES is None else self.STAGES  # THIS LINE OF CODE RETURNS THE STAGES OR THE LAYERS.
+
     @property
     def IS_TRAINING(self):
         """GET THE TRAINING ATTRIBUTE.
@@ -478,6 +967,12 @@ class NEURAL_NETWORK(BASE_ESTIMATOR):
             if isinstance(LAYER, PHASE_MIXIN):
                 # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE TO THE VALUE OF THE TRAIN PARAMETER.
                 LAYER.IS_TRAINING = TRAIN
+        # THIS LINE OF CODE ITERATES THROUGH THE STAGES OF THE COMPILED NETWORK, IF ANY.
+        for STAGE in self.STAGES or []:
+            # THIS LINE OF CODE CHECKS IF THE STAGE IS A FUSED BLOCK, WHOSE FOLDED WEIGHTS ARE STALE AFTER A CHANGE OF PHASE.
+            if isinstance(STAGE, FUSED_BLOCK):
+                # THIS LINE OF CODE SETS THE IS_TRAINING ATTRIBUTE OF THE BLOCK TO THE VALUE OF THE TRAIN PARAMETER.
+                STAGE.IS_TRAINING = TRAIN
 
     @property
     def N_LAYERS(self):
@@ -1,6 +1,6 @@
 from collections import defaultdict
 import numpy as np
-from .BATCH_ITERATOR import BATCH_ITERATOR
+from .BATCH_ITERATOR import BATCH_ITERATOR, SEQUENCE_ITERATOR
 
 
 class OPTIMIZER:
@@ -9,6 +9,9 @@ class OPTIMIZER:
     def OPTIMIZE(self, NETWORK):
         """OPTIMIZATION PROCESS
 
+        TRAINS FROM THE PROGRESS RECORDED IN NETWORK.EPOCH AND NETWORK.BATCH
+        (BOTH ZERO UNLESS TRAINING RESUMES FROM A CHECKPOINT) UP TO MAX_EPOCHS.
+
         PARAMETERS
         ----------
         NETWORK : OBJECT
@@ -19,11 +22,50 @@ class OPTIMIZER:
         RETURN LOSS HISTORY
         """
         LOSS_HISTORY = []  # LOSS HISTORY LIST: STORES LOSS HISTORY
-        for _ in range(NETWORK.MAX_EPOCHS):  # ITERATE OVER MAX_EPOCHS
-            if NETWORK.SHUFFLE:  # IF SHUFFLE IS TRUE
-                NETWORK.SUFFLE_DATASET()  # SHUFFLE DATASET
+        # ITERATE OVER THE REMAINING EPOCHS, UNTIL A CALLBACK STOPS TRAINING
+        while NETWORK.EPOCH < NETWORK.MAX_EPOCHS and not NETWORK.STOP_TRAINING:
+            if NETWORK.SHUFFLE and NETWORK.BATCH == 0:  # IF SHUFFLE IS TRUE AND THE EPOCH IS NOT RESUMED HALFWAY
+                NETWORK.__SHUFFLE_DATASET__()  # SHUFFLE DATASET
             LOSS = self.TRAIN_EPOCH(NETWORK)  # TRAIN EPOCH
             LOSS_HISTORY.append(LOSS)  # APPEND LOSS TO LOSS HISTORY
+            if NETWORK.STOP_TRAINING:  # IF A CALLBACK STOPPED TRAINING HALFWAY THROUGH THE EPOCH
+                break  # STOP WITHOUT COUNTING THE EPOCH
+            NETWORK.EPOCH += 1  # COUNT EPOCH
+            NETWORK.BATCH = 0  # NEXT EPOCH STARTS AT THE FIRST BATCH
+            for CALLBACK in NETWORK.CALLBACKS:  # LOOP OVER CALLBACKS
+                CALLBACK.ON_EPOCH_END(NETWORK, LOSS)  # END OF EPOCH
+        return LOSS_HISTORY  # RETURN LOSS HISTORY
+
+    def OPTIMIZE_STREAM(self, NETWORK, X, Y, WINDOW):
+        """TRUNCATED BACKPROPAGATION THROUGH TIME OVER LONG SEQUENCES
+
+        EACH EPOCH WALKS THE SEQUENCES IN CONSECUTIVE WINDOWS. THE RECURRENT
+        STATE IS CARRIED FROM ONE WINDOW TO THE NEXT, BUT GRADIENTS STOP AT
+        THE WINDOW BOUNDARY.
+
+        PARAMETERS
+        ----------
+        NETWORK : OBJECT
+            NEURAL NETWORK OBJECT
+        X : ARRAY-LIKE
+            FEATURE SEQUENCES OF SHAPE (N_SEQUENCES, N_TIMESTEPS, N_FEATURES)
+        Y : ARRAY-LIKE
+            TARGET SEQUENCES OF SHAPE (N_SEQUENCES, N_TIMESTEPS, N_TARGETS)
+        WINDOW : INT
+            NUMBER OF TIMESTEPS PER UPDATE
+
+        RETURNS
+        -------
+        RETURN LOSS HISTORY
+        """
+        LOSS_HISTORY = []  # LOSS HISTORY LIST: STORES LOSS HISTORY
+        for _ in range(NETWORK.MAX_EPOCHS):  # ITERATE OVER MAX_EPOCHS
+            NETWORK.RESET_STATES()  # START EVERY EPOCH FROM THE BEGINNING OF THE SEQUENCES
+            LOSSES = []  # LOSS LIST: STORES LOSS
+            # ITERATE OVER THE WINDOWS OF X AND Y
+            for X_WINDOW, Y_WINDOW in zip(SEQUENCE_ITERATOR(X, WINDOW), SEQUENCE_ITERATOR(Y, WINDOW)):
+                LOSSES.append(self.TRAIN_BATCH(NETWORK, X_WINDOW, Y_WINDOW))  # TRAIN WINDOW
+            LOSS_HISTORY.append(np.mean(LOSSES))  # APPEND LOSS TO LOSS HISTORY
         return LOSS_HISTORY  # RETURN LOSS HISTORY
 
     def UPDATE(self, NETWORK):
@@ -40,6 +82,23 @@ class OPTIMIZER:
         """
         raise NotImplementedError  # RAISE NOT IMPLEMENTED ERROR
 
+    def STEP(self, NETWORK):
+        """UPDATE PARAMETERS, RECORDED BY THE PROFILER OF THE NETWORK IF IT HAS ONE
+
+        PARAMETERS
+        ----------
+        NETWORK : OBJECT
+            NEURAL NETWORK OBJECT
+
+        RETURNS
+        -------
+        NONE
+        """
+        if NETWORK.PROFILER is None:  # IF THE NETWORK IS NOT PROFILED
+            self.UPDATE(NETWORK)  # UPDATE NETWORK
+        else:  # OTHERWISE
+            NETWORK.PROFILER.RUN(NETWORK, self, "UPDATE", NETWORK)  # UPDATE NETWORK AND RECORD IT
+
     def TRAIN_EPOCH(self, NETWORK):
         """TRAIN EPOCH
 
@@ -53,16 +112,32 @@ class OPTIMIZER:
         RETURN EPOCH LOSS
         """
         LOSSES = []  # LOSS LIST: STORES LOSS
-        # CREATE BATCH ITERATOR FOR X
-        X_BATCH = BATCH_ITERATOR(NETWORK.X, NETWORK.BATCH_SIZE)
-        # CREATE BATCH ITERATOR FOR Y
-        Y_BATCH = BATCH_ITERATOR(NETWORK.Y, NETWORK.BATCH_SIZE)
-        BATCH = zip(X_BATCH, Y_BATCH)  # ZIP X_BATCH AND Y_BATCH
+        INDICES = NETWORK.INDICES  # ORDER OF THE SAMPLES
+        if NETWORK.BATCH:  # IF THE EPOCH IS RESUMED HALFWAY
+            if INDICES is None:  # IF THE SAMPLES ARE VISITED IN THEIR STORED ORDER
+                INDICES = np.arange(NETWORK.X.shape[0])  # STORED ORDER
+            INDICES = INDICES[NETWORK.BATCH * NETWORK.BATCH_SIZE:]  # SKIP THE BATCHES ALREADY TRAINED
+        if NETWORK.PIPELINE is not None:  # IF BATCHES ARE PREPARED IN THE BACKGROUND
+            BATCH = NETWORK.PIPELINE.BATCHES(
+                NETWORK.X, NETWORK.Y, NETWORK.BATCH_SIZE, INDICES)  # PREFETCHED BATCHES
+        else:  # OTHERWISE
+            # CREATE BATCH ITERATOR FOR X
+            X_BATCH = BATCH_ITERATOR(NETWORK.X, NETWORK.BATCH_SIZE, INDICES)
+            # CREATE BATCH ITERATOR FOR Y
+            Y_BATCH = BATCH_ITERATOR(NETWORK.Y, NETWORK.BATCH_SIZE, INDICES)
+            BATCH = zip(X_BATCH, Y_BATCH)  # ZIP X_BATCH AND Y_BATCH
         for X, Y in BATCH:  # FOR EACH X, Y IN BATCH # type: ignore
             LOSS = np.mean(NETWORK.UPDATE(X, Y))  # CALCULATE LOSS
-            self.UPDATE(NETWORK)  # UPDATE NETWORK
+            if NETWORK.FINITE_GRADS:  # SKIP THE STEP IF THE SCALED GRADIENTS OVERFLOWED
+                self.STEP(NETWORK)  # UPDATE NETWORK
             LOSSES.append(LOSS)  # APPEND LOSS TO LOSSES
-        EPOCH_LOSS = np.mean(LOSSES)  # CALCULATE EPOCH LOSS
+            NETWORK.BATCH += 1  # COUNT BATCH
+            for CALLBACK in NETWORK.CALLBACKS:  # LOOP OVER CALLBACKS
+                CALLBACK.ON_BATCH_END(NETWORK, LOSS)  # END OF BATCH
+            if NETWORK.STOP_TRAINING:  # IF A CALLBACK STOPPED TRAINING
+                break  # SKIP THE REST OF THE EPOCH
+        # CALCULATE EPOCH LOSS (NAN IF THE CHECKPOINT WAS TAKEN AFTER THE LAST BATCH OF THE EPOCH)
+        EPOCH_LOSS = np.mean(LOSSES) if LOSSES else np.nan
         return EPOCH_LOSS  # RETURN EPOCH LOSS
 
     def TRAIN_BATCH(self, NETWORK, X, Y):
@@ -82,7 +157,8 @@ class OPTIMIZER:
         RETURN BATCH LOSS
         """
         LOSS = np.mean(NETWORK.UPDATE(X, Y))  # CALCULATE LOSS
-        self.UPDATE(NETWORK)  # UPDATE NETWORK
+        if NETWORK.FINITE_GRADS:  # SKIP THE STEP IF THE SCALED GRADIENTS OVERFLOWED
+            self.STEP(NETWORK)  # UPDATE NETWORK
         return LOSS  # RETURN LOSS
 
     def SETUP(self, NETWORK):
@@ -127,6 +203,8 @@ class STOCHASTIC_GRADIENT_DESCENT(OPTIMIZER):
         self.LEARNING_RATE = LEARNING_RATE  # SET LEARNING RATE
         self.ITERATION = 0  # SET ITERATION TO 0
         self.VELOCITY = None  # SET VELOCITY TO NONE
+        self.BUFFER = None  # SET BUFFER TO NONE
+        self.SECOND_BUFFER = None  # SET SECOND BUFFER TO NONE
 
     def SETUP(self, NETWORK):
         """SETUP OPTIMIZER
@@ -141,11 +219,17 @@ class STOCHASTIC_GRADIENT_DESCENT(OPTIMIZER):
         NONE
         """
         self.VELOCITY = defaultdict(dict)  # SET VELOCITY TO DEFAULTDICT
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
+        self.BUFFER = defaultdict(dict)  # SET BUFFER TO DEFAULTDICT
+        self.SECOND_BUFFER = defaultdict(dict)  # SET SECOND BUFFER TO DEFAULTDICT
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
                 self.VELOCITY[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET VELOCITY TO ZERO
+                    PARAMETERS[n])  # SET VELOCITY TO ZERO
+                self.BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE STEP BUFFER
+                self.SECOND_BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE SECOND BUFFER
 
     def UPDATE(self, NETWORK):
         """UPDATE PARAMETERS
@@ -159,22 +243,27 @@ class STOCHASTIC_GRADIENT_DESCENT(OPTIMIZER):
         -------
         NONE
         """
-        assert self.VELOCITY is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT VELOCITY IS NOT NONE
+        assert self.VELOCITY is not None and self.BUFFER is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT VELOCITY IS NOT NONE
         LEARNING_RATE = self.LEARNING_RATE * \
             (1.0 / (1.0 + self.DECAY * self.ITERATION))  # CALCULATE LEARNING RATE
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
-                GRAD = LAYER.PARAMETERS.GRAD[n]  # GET GRADIENT
-                UPDATE = self.MOMENTUM * \
-                    self.VELOCITY[i][n] - LEARNING_RATE * \
-                    GRAD  # CALCULATE UPDATE
-                self.VELOCITY[i][n] = UPDATE  # UPDATE VELOCITY
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
+                GRAD = PARAMETERS.GRAD[n]  # GET GRADIENT
+                VELOCITY = self.VELOCITY[i][n]  # GET VELOCITY
+                BUFFER = self.BUFFER[i][n]  # GET STEP BUFFER
+                # BUFFER = -LEARNING_RATE * GRAD
+                np.multiply(GRAD, -LEARNING_RATE, out=BUFFER)
+                VELOCITY *= self.MOMENTUM  # VELOCITY = MOMENTUM * VELOCITY
+                VELOCITY += BUFFER  # VELOCITY = MOMENTUM * VELOCITY - LEARNING_RATE * GRAD
                 if self.NESTEROV:  # IF NESTEROV IS TRUE
-                    UPDATE = self.MOMENTUM * \
-                        self.VELOCITY[i][n] - LEARNING_RATE * \
-                        GRAD  # CALCULATE UPDATE
-                LAYER.PARAMETERS.STEP(n, UPDATE)  # UPDATE PARAMETER
+                    SECOND_BUFFER = self.SECOND_BUFFER[i][n]  # GET SECOND BUFFER
+                    # SECOND_BUFFER = MOMENTUM * VELOCITY
+                    np.multiply(VELOCITY, self.MOMENTUM, out=SECOND_BUFFER)
+                    SECOND_BUFFER += BUFFER  # SECOND_BUFFER = MOMENTUM * VELOCITY - LEARNING_RATE * GRAD
+                    PARAMETERS.STEP(n, SECOND_BUFFER)  # UPDATE PARAMETER
+                else:  # OTHERWISE
+                    PARAMETERS.STEP(n, VELOCITY)  # UPDATE PARAMETER
         self.ITERATION += 1  # INCREMENT ITERATION
 
 
@@ -202,6 +291,8 @@ class ADA_GRAD(OPTIMIZER):
         self.MS = None  # SET MS TO NONE
         self.VS = None  # SET VS TO NONE
         self.US = None  # SET US TO NONE
+        self.BUFFER = None  # SET BUFFER TO NONE
+        self.SECOND_BUFFER = None  # SET SECOND BUFFER TO NONE
 
     def UPDATE(self, NETWORK):
         """UPDATE PARAMETERS
@@ -215,16 +306,22 @@ class ADA_GRAD(OPTIMIZER):
         -------
         NONE
         """
-        assert self.ACCUMULATOR is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT ACCUMULATOR IS NOT NONE
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
-                GRAD = LAYER.PARAMETERS.GRAD[n]  # GET GRADIENT
-                self.ACCUMULATOR[i][n] += GRAD ** 2  # UPDATE ACCUMULATOR
-                STEP = self.LEARNING_RATE * GRAD / \
-                    (np.sqrt(self.ACCUMULATOR[i][n]) +
-                     self.EPSILON)  # CALCULATE STEP
-                LAYER.PARAMETERS.STEP(n, -STEP)  # UPDATE PARAMETER
+        assert self.ACCUMULATOR is not None and self.BUFFER is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT ACCUMULATOR IS NOT NONE
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
+                GRAD = PARAMETERS.GRAD[n]  # GET GRADIENT
+                ACCUMULATOR = self.ACCUMULATOR[i][n]  # GET ACCUMULATOR
+                BUFFER = self.BUFFER[i][n]  # GET STEP BUFFER
+                SECOND_BUFFER = self.SECOND_BUFFER[i][n]  # GET SECOND BUFFER
+                np.multiply(GRAD, GRAD, out=BUFFER)  # BUFFER = GRAD ** 2
+                ACCUMULATOR += BUFFER  # UPDATE ACCUMULATOR
+                np.sqrt(ACCUMULATOR, out=BUFFER)  # BUFFER = SQRT(ACCUMULATOR)
+                BUFFER += self.EPSILON  # BUFFER = SQRT(ACCUMULATOR) + EPSILON
+                # SECOND_BUFFER = -LEARNING_RATE * GRAD
+                np.multiply(GRAD, -self.LEARNING_RATE, out=SECOND_BUFFER)
+                np.divide(SECOND_BUFFER, BUFFER, out=BUFFER)  # CALCULATE STEP
+                PARAMETERS.STEP(n, BUFFER)  # UPDATE PARAMETER
 
     def SETUP(self, NETWORK):
         """SETUP OPTIMIZER
@@ -239,11 +336,17 @@ class ADA_GRAD(OPTIMIZER):
         NONE
         """
         self.ACCUMULATOR = defaultdict(dict)  # SET ACCUMULATOR TO DEFAULTDICT
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
+        self.BUFFER = defaultdict(dict)  # SET BUFFER TO DEFAULTDICT
+        self.SECOND_BUFFER = defaultdict(dict)  # SET SECOND BUFFER TO DEFAULTDICT
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
                 self.ACCUMULATOR[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET ACCUMULATOR TO ZERO
+                    PARAMETERS[n])  # SET ACCUMULATOR TO ZERO
+                self.BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE STEP BUFFER
+                self.SECOND_BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE SECOND BUFFER
 
 
 class ADA_DELTA(OPTIMIZER):
@@ -273,6 +376,8 @@ class ADA_DELTA(OPTIMIZER):
         self.MS = None  # SET MS TO NONE
         self.VS = None  # SET VS TO NONE
         self.US = None  # SET US TO NONE
+        self.BUFFER = None  # SET BUFFER TO NONE
+        self.SECOND_BUFFER = None  # SET SECOND BUFFER TO NONE
 
     def UPDATE(self, NETWORK):
         """UPDATE PARAMETERS
@@ -286,20 +391,34 @@ class ADA_DELTA(OPTIMIZER):
         -------
         NONE
         """
-        assert self.ACCUMULATOR is not None and self.DELTA_ACCUMULATOR is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT ACCUMULATOR AND DELTA_ACCUMULATOR ARE NOT NONE
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
-                GRAD = LAYER.PARAMETERS.GRAD[n]  # GET GRADIENT
-                self.ACCUMULATOR[i][n] = self.RHO * self.ACCUMULATOR[i][n] + \
-                    (1.0 - self.RHO) * GRAD ** 2  # UPDATE ACCUMULATOR
-                STEP = GRAD * np.sqrt(self.DELTA_ACCUMULATOR[i][n] + self.EPSILON) / np.sqrt(
-                    self.ACCUMULATOR[i][n] + self.EPSILON)  # CALCULATE STEP
-                LAYER.PARAMETERS.STEP(
-                    n, -STEP * self.LEARNING_RATE)  # UPDATE PARAMETER
-                self.DELTA_ACCUMULATOR[i][n] = self.RHO * \
-                    self.DELTA_ACCUMULATOR[i][n] + \
-                    (1.0 - self.RHO) * STEP ** 2  # UPDATE DELTA_ACCUMULATOR
+        assert self.ACCUMULATOR is not None and self.DELTA_ACCUMULATOR is not None and self.BUFFER is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT ACCUMULATOR AND DELTA_ACCUMULATOR ARE NOT NONE
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
+                GRAD = PARAMETERS.GRAD[n]  # GET GRADIENT
+                ACCUMULATOR = self.ACCUMULATOR[i][n]  # GET ACCUMULATOR
+                DELTA_ACCUMULATOR = self.DELTA_ACCUMULATOR[i][n]  # GET DELTA_ACCUMULATOR
+                BUFFER = self.BUFFER[i][n]  # GET STEP BUFFER
+                SECOND_BUFFER = self.SECOND_BUFFER[i][n]  # GET SECOND BUFFER
+                np.multiply(GRAD, GRAD, out=BUFFER)  # BUFFER = GRAD ** 2
+                BUFFER *= 1.0 - self.RHO  # BUFFER = (1 - RHO) * GRAD ** 2
+                ACCUMULATOR *= self.RHO  # ACCUMULATOR = RHO * ACCUMULATOR
+                ACCUMULATOR += BUFFER  # UPDATE ACCUMULATOR
+                # BUFFER = DELTA_ACCUMULATOR + EPSILON
+                np.add(DELTA_ACCUMULATOR, self.EPSILON, out=BUFFER)
+                np.sqrt(BUFFER, out=BUFFER)  # BUFFER = SQRT(DELTA_ACCUMULATOR + EPSILON)
+                BUFFER *= GRAD  # BUFFER = GRAD * SQRT(DELTA_ACCUMULATOR + EPSILON)
+                # SECOND_BUFFER = ACCUMULATOR + EPSILON
+                np.add(ACCUMULATOR, self.EPSILON, out=SECOND_BUFFER)
+                np.sqrt(SECOND_BUFFER, out=SECOND_BUFFER)  # SECOND_BUFFER = SQRT(ACCUMULATOR + EPSILON)
+                BUFFER /= SECOND_BUFFER  # CALCULATE STEP
+                # SECOND_BUFFER = STEP ** 2
+                np.multiply(BUFFER, BUFFER, out=SECOND_BUFFER)
+                SECOND_BUFFER *= 1.0 - self.RHO  # SECOND_BUFFER = (1 - RHO) * STEP ** 2
+                DELTA_ACCUMULATOR *= self.RHO  # DELTA_ACCUMULATOR = RHO * DELTA_ACCUMULATOR
+                DELTA_ACCUMULATOR += SECOND_BUFFER  # UPDATE DELTA_ACCUMULATOR
+                BUFFER *= -self.LEARNING_RATE  # SCALE STEP
+                PARAMETERS.STEP(n, BUFFER)  # UPDATE PARAMETER
 
     def SETUP(self, NETWORK):
         """SETUP OPTIMIZER
@@ -316,13 +435,19 @@ class ADA_DELTA(OPTIMIZER):
         self.ACCUMULATOR = defaultdict(dict)  # SET ACCUMULATOR TO DEFAULTDICT
         # SET DELTA_ACCUMULATOR TO DEFAULTDICT
         self.DELTA_ACCUMULATOR = defaultdict(dict)
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
+        self.BUFFER = defaultdict(dict)  # SET BUFFER TO DEFAULTDICT
+        self.SECOND_BUFFER = defaultdict(dict)  # SET SECOND BUFFER TO DEFAULTDICT
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
                 self.ACCUMULATOR[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET ACCUMULATOR TO ZERO
+                    PARAMETERS[n])  # SET ACCUMULATOR TO ZERO
                 self.DELTA_ACCUMULATOR[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET DELTA_ACCUMULATOR TO ZERO
+                    PARAMETERS[n])  # SET DELTA_ACCUMULATOR TO ZERO
+                self.BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE STEP BUFFER
+                self.SECOND_BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE SECOND BUFFER
 
 
 class RMS_PROP(OPTIMIZER):
@@ -351,6 +476,8 @@ class RMS_PROP(OPTIMIZER):
         self.MS = None  # SET MS TO NONE
         self.VS = None  # SET VS TO NONE
         self.US = None  # SET US TO NONE
+        self.BUFFER = None  # SET BUFFER TO NONE
+        self.SECOND_BUFFER = None  # SET SECOND BUFFER TO NONE
 
     def UPDATE(self, NETWORK):
         """UPDATE PARAMETERS
@@ -364,17 +491,24 @@ class RMS_PROP(OPTIMIZER):
         -------
         NONE
         """
-        assert self.ACCUMULATOR is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT ACCUMULATOR IS NOT NONE
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
-                GRAD = LAYER.PARAMETERS.GRAD[n]  # GET GRADIENT
-                self.ACCUMULATOR[i][n] = (
-                    self.RHO * self.ACCUMULATOR[i][n]) + (1.0 - self.RHO) * (GRAD ** 2)  # UPDATE ACCUMULATOR
-                STEP = self.LEARNING_RATE * GRAD / \
-                    (np.sqrt(self.ACCUMULATOR[i][n]) +
-                     self.EPSILON)  # CALCULATE STEP
-                LAYER.PARAMETERS.STEP(n, -STEP)  # UPDATE PARAMETER
+        assert self.ACCUMULATOR is not None and self.BUFFER is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT ACCUMULATOR IS NOT NONE
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
+                GRAD = PARAMETERS.GRAD[n]  # GET GRADIENT
+                ACCUMULATOR = self.ACCUMULATOR[i][n]  # GET ACCUMULATOR
+                BUFFER = self.BUFFER[i][n]  # GET STEP BUFFER
+                SECOND_BUFFER = self.SECOND_BUFFER[i][n]  # GET SECOND BUFFER
+                np.multiply(GRAD, GRAD, out=BUFFER)  # BUFFER = GRAD ** 2
+                BUFFER *= 1.0 - self.RHO  # BUFFER = (1 - RHO) * GRAD ** 2
+                ACCUMULATOR *= self.RHO  # ACCUMULATOR = RHO * ACCUMULATOR
+                ACCUMULATOR += BUFFER  # UPDATE ACCUMULATOR
+                np.sqrt(ACCUMULATOR, out=BUFFER)  # BUFFER = SQRT(ACCUMULATOR)
+                BUFFER += self.EPSILON  # BUFFER = SQRT(ACCUMULATOR) + EPSILON
+                # SECOND_BUFFER = -LEARNING_RATE * GRAD
+                np.multiply(GRAD, -self.LEARNING_RATE, out=SECOND_BUFFER)
+                np.divide(SECOND_BUFFER, BUFFER, out=BUFFER)  # CALCULATE STEP
+                PARAMETERS.STEP(n, BUFFER)  # UPDATE PARAMETER
 
     def SETUP(self, NETWORK):
         """SETUP OPTIMIZER
@@ -389,11 +523,17 @@ class RMS_PROP(OPTIMIZER):
         NONE
         """
         self.ACCUMULATOR = defaultdict(dict)  # SET ACCUMULATOR TO DEFAULTDICT
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
+        self.BUFFER = defaultdict(dict)  # SET BUFFER TO DEFAULTDICT
+        self.SECOND_BUFFER = defaultdict(dict)  # SET SECOND BUFFER TO DEFAULTDICT
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
                 self.ACCUMULATOR[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET ACCUMULATOR TO ZERO
+                    PARAMETERS[n])  # SET ACCUMULATOR TO ZERO
+                self.BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE STEP BUFFER
+                self.SECOND_BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE SECOND BUFFER
 
 
 class ADMA(OPTIMIZER):
@@ -423,6 +563,8 @@ class ADMA(OPTIMIZER):
         self.T = 1  # SET T TO 1
         self.MS = None  # SET MS TO NONE
         self.VS = None  # SET VS TO NONE
+        self.BUFFER = None  # SET BUFFER TO NONE
+        self.SECOND_BUFFER = None  # SET SECOND BUFFER TO NONE
 
     def UPDATE(self, NETWORK):
         """UPDATE PARAMETERS
@@ -436,23 +578,30 @@ class ADMA(OPTIMIZER):
         -------
         NONE
         """
-        assert self.MS is not None and self.VS is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT MS AND VS ARE NOT NONE
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
-                GRAD = LAYER.PARAMETERS.GRAD[n]  # GET GRADIENT
-                # UPDATE FIRST MOMENT ESTIMATE
-                self.MS[i][n] = (self.FIRST_BETA * self.MS[i]
-                                 [n]) + (1.0 - self.FIRST_BETA) * GRAD
-                # UPDATE SECOND MOMENT ESTIMATE
-                self.VS[i][n] = (self.SECOND_BETA * self.VS[i]
-                                 [n]) + (1.0 - self.SECOND_BETA) * GRAD ** 2
-                LEARNING_RATE = self.LEARNING_RATE * np.sqrt(1.0 - self.SECOND_BETA ** self.T) / (
-                    1.0 - self.FIRST_BETA ** self.T)  # CALCULATE LEARNING RATE
-                STEP = LEARNING_RATE * \
-                    self.MS[i][n] / (np.sqrt(self.VS[i][n]) +
-                                     self.EPSILON)  # CALCULATE STEP
-                LAYER.PARAMETERS.STEP(n, -STEP)  # UPDATE PARAMETER
+        assert self.MS is not None and self.VS is not None and self.BUFFER is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT MS AND VS ARE NOT NONE
+        LEARNING_RATE = self.LEARNING_RATE * np.sqrt(1.0 - self.SECOND_BETA ** self.T) / (
+            1.0 - self.FIRST_BETA ** self.T)  # CALCULATE LEARNING RATE
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
+                GRAD = PARAMETERS.GRAD[n]  # GET GRADIENT
+                MS = self.MS[i][n]  # GET FIRST MOMENT ESTIMATE
+                VS = self.VS[i][n]  # GET SECOND MOMENT ESTIMATE
+                BUFFER = self.BUFFER[i][n]  # GET STEP BUFFER
+                SECOND_BUFFER = self.SECOND_BUFFER[i][n]  # GET SECOND BUFFER
+                # BUFFER = (1 - FIRST_BETA) * GRAD
+                np.multiply(GRAD, 1.0 - self.FIRST_BETA, out=BUFFER)
+                MS *= self.FIRST_BETA  # MS = FIRST_BETA * MS
+                MS += BUFFER  # UPDATE FIRST MOMENT ESTIMATE
+                np.multiply(GRAD, GRAD, out=BUFFER)  # BUFFER = GRAD ** 2
+                BUFFER *= 1.0 - self.SECOND_BETA  # BUFFER = (1 - SECOND_BETA) * GRAD ** 2
+                VS *= self.SECOND_BETA  # VS = SECOND_BETA * VS
+                VS += BUFFER  # UPDATE SECOND MOMENT ESTIMATE
+                np.sqrt(VS, out=BUFFER)  # BUFFER = SQRT(VS)
+                BUFFER += self.EPSILON  # BUFFER = SQRT(VS) + EPSILON
+                np.multiply(MS, -LEARNING_RATE, out=SECOND_BUFFER)  # SECOND_BUFFER = -LEARNING_RATE * MS
+                np.divide(SECOND_BUFFER, BUFFER, out=BUFFER)  # CALCULATE STEP
+                PARAMETERS.STEP(n, BUFFER)  # UPDATE PARAMETER
         self.T += 1  # INCREMENT T
 
     def SETUP(self, NETWORK):
@@ -469,13 +618,19 @@ class ADMA(OPTIMIZER):
         """
         self.MS = defaultdict(dict)  # SET MS TO DEFAULTDICT
         self.VS = defaultdict(dict)  # SET VS TO DEFAULTDICT
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
+        self.BUFFER = defaultdict(dict)  # SET BUFFER TO DEFAULTDICT
+        self.SECOND_BUFFER = defaultdict(dict)  # SET SECOND BUFFER TO DEFAULTDICT
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
                 self.MS[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET MS TO ZERO
+                    PARAMETERS[n])  # SET MS TO ZERO
                 self.VS[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET VS TO ZERO
+                    PARAMETERS[n])  # SET VS TO ZERO
+                self.BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE STEP BUFFER
+                self.SECOND_BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE SECOND BUFFER
 
 
 class ADA_MAX(OPTIMIZER):
@@ -506,6 +661,8 @@ class ADA_MAX(OPTIMIZER):
         self.T = 1  # SET T TO 1
         self.MS = None  # SET MS TO NONE
         self.US = None  # SET US TO NONE
+        self.BUFFER = None  # SET BUFFER TO NONE
+        self.SECOND_BUFFER = None  # SET SECOND BUFFER TO NONE
 
     def UPDATE(self, NETWORK):
         """UPDATE PARAMETERS
@@ -519,20 +676,27 @@ class ADA_MAX(OPTIMIZER):
         -------
         NONE
         """
-        assert self.MS is not None and self.US is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT MS AND US ARE NOT NONE
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
-                GRAD = LAYER.PARAMETERS.GRAD[n]  # GET GRADIENT
-                self.MS[i][n] = self.FIRST_BETA * self.MS[i][n] + \
-                    (1.0 - self.FIRST_BETA) * \
-                    GRAD  # UPDATE FIRST MOMENT ESTIMATE
-                # UPDATE SECOND MOMENT ESTIMATE
-                self.US[i][n] = np.maximum(
-                    self.SECOND_BETA * self.US[i][n], np.abs(GRAD))
-                STEP = self.LEARNING_RATE / (1 - self.FIRST_BETA ** self.T) * self.MS[i][n] / (
-                    self.US[i][n] + self.EPSILON)  # CALCULATE STEP
-                LAYER.PARAMETERS.STEP(n, -STEP)  # UPDATE PARAMETER
+        assert self.MS is not None and self.US is not None and self.BUFFER is not None, "CALL SETUP() BEFORE UPDATE()"  # ASSERT MS AND US ARE NOT NONE
+        LEARNING_RATE = self.LEARNING_RATE / (1 - self.FIRST_BETA ** self.T)  # CALCULATE LEARNING RATE
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
+                GRAD = PARAMETERS.GRAD[n]  # GET GRADIENT
+                MS = self.MS[i][n]  # GET FIRST MOMENT ESTIMATE
+                US = self.US[i][n]  # GET SECOND MOMENT ESTIMATE
+                BUFFER = self.BUFFER[i][n]  # GET STEP BUFFER
+                SECOND_BUFFER = self.SECOND_BUFFER[i][n]  # GET SECOND BUFFER
+                # BUFFER = (1 - FIRST_BETA) * GRAD
+                np.multiply(GRAD, 1.0 - self.FIRST_BETA, out=BUFFER)
+                MS *= self.FIRST_BETA  # MS = FIRST_BETA * MS
+                MS += BUFFER  # UPDATE FIRST MOMENT ESTIMATE
+                np.abs(GRAD, out=BUFFER)  # BUFFER = ABS(GRAD)
+                US *= self.SECOND_BETA  # US = SECOND_BETA * US
+                np.maximum(US, BUFFER, out=US)  # UPDATE SECOND MOMENT ESTIMATE
+                np.add(US, self.EPSILON, out=BUFFER)  # BUFFER = US + EPSILON
+                np.multiply(MS, -LEARNING_RATE, out=SECOND_BUFFER)  # SECOND_BUFFER = -LEARNING_RATE * MS
+                np.divide(SECOND_BUFFER, BUFFER, out=BUFFER)  # CALCULATE STEP
+                PARAMETERS.STEP(n, BUFFER)  # UPDATE PARAMETER
         self.T += 1  # INCREMENT T
 
     def SETUP(self, NETWORK):
@@ -549,10 +713,16 @@ class ADA_MAX(OPTIMIZER):
         """
         self.MS = defaultdict(dict)  # SET MS TO DEFAULTDICT
         self.US = defaultdict(dict)  # SET US TO DEFAULTDICT
-        # FOR EACH LAYER IN NETWORK.PARAMETRIC_LAYERS
-        for i, LAYER in enumerate(NETWORK.PARAMETRIC_LAYERS):
-            for n in LAYER.PARAMETERS.KEYS():  # FOR EACH PARAMETER IN LAYER.PARAMETERS
+        self.BUFFER = defaultdict(dict)  # SET BUFFER TO DEFAULTDICT
+        self.SECOND_BUFFER = defaultdict(dict)  # SET SECOND BUFFER TO DEFAULTDICT
+        # FOR EACH PARAMETER GROUP IN NETWORK.PARAMETER_GROUPS
+        for i, PARAMETERS in enumerate(NETWORK.PARAMETER_GROUPS):
+            for n in PARAMETERS.KEYS():  # FOR EACH PARAMETER IN PARAMETERS
                 self.MS[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET MS TO ZERO
+                    PARAMETERS[n])  # SET MS TO ZERO
                 self.US[i][n] = np.zeros_like(
-                    LAYER.PARAMETERS[n])  # SET US TO ZERO
+                    PARAMETERS[n])  # SET US TO ZERO
+                self.BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE STEP BUFFER
+                self.SECOND_BUFFER[i][n] = np.zeros_like(
+                    PARAMETERS[n])  # PREALLOCATE SECOND BUFFER
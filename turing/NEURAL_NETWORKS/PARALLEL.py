@@ -0,0 +1,348 @@
+import multiprocessing
+import numpy as np
+
+from .BATCH_ITERATOR import BATCH_ITERATOR
+from .LAYERS.NORMALIZATION import LEARNED_STATE
+from .OPTIMIZERS import STOCHASTIC_GRADIENT_DESCENT
+
+
+def __SHARED_ARRAY__(CONTEXT, SHAPE, DTYPE):
+    """ALLOCATE AN ARRAY IN MEMORY SHARED WITH FORKED PROCESSES
+
+    PARAMETERS
+    ----------
+    CONTEXT : MULTIPROCESSING CONTEXT
+        CONTEXT THE WORKERS ARE STARTED FROM
+    SHAPE : TUPLE
+        SHAPE OF THE ARRAY
+    DTYPE : NUMPY DTYPE
+        DTYPE OF THE ARRAY
+
+    RETURNS
+    -------
+    NUMPY ARRAY
+        ZEROED ARRAY BACKED BY SHARED MEMORY
+    """
+    DTYPE = np.dtype(DTYPE)  # RESOLVE DTYPE
+    BUFFER = CONTEXT.RawArray("b", max(1, int(np.prod(SHAPE)) * DTYPE.itemsize))  # ALLOCATE SHARED BYTES
+    return np.frombuffer(BUFFER, dtype=DTYPE, count=int(np.prod(SHAPE))).reshape(SHAPE)  # VIEW AS ARRAY
+
+
+def __WORKER__(NETWORK, X, Y, DATA, GRADS, CONNECTION):
+    """WORKER LOOP: SERVE THE REQUESTS OF A PARALLEL TRAINER
+
+    REQUESTS ARE (COMMAND, KEY) PAIRS. "GRADIENTS" COMPUTES THE GRADIENTS OF
+    THE SAMPLES IN KEY, "TRAIN" RUNS THE OPTIMIZER OF THE NETWORK OVER THE
+    MINIBATCHES OF KEY, AND "STATE" SENDS THE LEARNED LAYER STATE. NONE STOPS
+    THE WORKER.
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        REPLICA OF THE NETWORK (INHERITED THROUGH FORK)
+    X : ARRAY-LIKE
+        FEATURE DATASET (INHERITED THROUGH FORK)
+    Y : ARRAY-LIKE
+        TARGET DATASET (INHERITED THROUGH FORK)
+    DATA : NUMPY ARRAY
+        SHARED PARAMETERS
+    GRADS : NUMPY ARRAY
+        SHARED GRADIENT ROW OF THIS WORKER
+    CONNECTION : CONNECTION
+        PIPE TO THE TRAINER
+
+    RETURNS
+    -------
+    NONE
+    """
+    NETWORK.ARENA.BIND(DATA, GRADS)  # READ THE SHARED PARAMETERS AND WRITE GRADIENTS INTO OWN ROW
+    NETWORK.IS_TRAINING = True  # SET TRAINING PHASE
+    while True:  # SERVE REQUESTS
+        MESSAGE = CONNECTION.recv()  # WAIT FOR REQUEST
+        if MESSAGE is None:  # IF THE TRAINER IS DONE
+            break  # STOP
+        COMMAND, KEY = MESSAGE  # UNPACK REQUEST
+        if COMMAND == "GRADIENTS":  # IF THE TRAINER ASKS FOR THE GRADIENTS OF A SUB-BATCH
+            LOSS = np.mean(NETWORK.UPDATE(X[KEY], Y[KEY]))  # COMPUTE GRADIENTS
+            CONNECTION.send((LOSS, NETWORK.FINITE_GRADS))  # REPORT LOSS
+        elif COMMAND == "TRAIN":  # IF THE TRAINER ASKS TO TRAIN ON A SHARE OF THE EPOCH
+            LOSSES = [NETWORK.OPTIMIZER.TRAIN_BATCH(NETWORK, X[BATCH], Y[BATCH])
+                      for BATCH in BATCH_ITERATOR(KEY, NETWORK.BATCH_SIZE)]  # UPDATE THE SHARED PARAMETERS
+            CONNECTION.send((np.mean(LOSSES) if LOSSES else 0.0, len(LOSSES)))  # REPORT LOSS
+        elif COMMAND == "STATE":  # IF THE TRAINER ASKS FOR THE LEARNED LAYER STATE
+            CONNECTION.send([{NAME: getattr(LAYER, NAME) for NAME in LEARNED_STATE if hasattr(LAYER, NAME)}
+                             for LAYER in NETWORK.LAYERS])  # SEND STATE OF EVERY LAYER
+
+
+class PARALLEL_TRAINER:
+    """BASE CLASS FOR MULTI-PROCESS TRAINERS
+
+    FORKS N_WORKERS PROCESSES THAT EACH HOLD A REPLICA OF THE NETWORK AND
+    INHERIT THE DATASET. THE FLAT PARAMETERS OF THE NETWORK ARE MOVED INTO
+    SHARED MEMORY, SO EVERY WORKER READS THE SAME PARAMETERS, AND EACH WORKER
+    WRITES ITS GRADIENTS INTO ITS OWN ROW OF A SHARED GRADIENT MATRIX. ONLY
+    BATCH INDICES AND LOSSES GO THROUGH THE PIPES. LEARNED LAYER STATE THAT IS
+    NOT A PARAMETER (THE RUNNING AVERAGES OF BATCH_NORMALIZATION) STAYS IN THE
+    WORKERS DURING TRAINING AND IS AVERAGED ACROSS THEM AT THE END.
+
+    THE NETWORK MUST USE FLAT_PARAMETERS, AND THE WORKERS ARE FORKED, SO THIS
+    NEEDS A PLATFORM WITH THE "FORK" START METHOD. LIMIT THE BLAS THREADS (E.G.
+    OMP_NUM_THREADS) SO THE WORKERS DO NOT OVERSUBSCRIBE THE CORES.
+
+    PARAMETERS
+    ----------
+    N_WORKERS : INT
+        NUMBER OF WORKER PROCESSES (DEFAULTS TO THE NUMBER OF CPUS).
+
+    METHODS
+    -------
+    OPTIMIZE(NETWORK)
+        TRAIN THE NETWORK ON ITS STORED DATASET.
+    TRAIN_EPOCH(NETWORK, ORDER)
+        TRAIN ONE EPOCH, VISITING THE SAMPLES IN ORDER.
+    """
+
+    def __init__(self, N_WORKERS=None):
+        """INITIALIZE THE TRAINER
+
+        PARAMETERS
+        ----------
+        N_WORKERS : INT
+            NUMBER OF WORKER PROCESSES (DEFAULTS TO THE NUMBER OF CPUS).
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.N_WORKERS = N_WORKERS or multiprocessing.cpu_count()  # NUMBER OF WORKERS
+        assert self.N_WORKERS > 0, "N_WORKERS MUST BE POSITIVE"  # CHECK NUMBER OF WORKERS
+        self.CONTEXT = multiprocessing.get_context("fork")  # WORKERS ARE FORKED TO INHERIT THE NETWORK AND DATA
+        self.GRADS = None  # SHARED GRADIENT MATRIX, ONE ROW PER WORKER
+        self.CONNECTIONS = []  # PIPES TO THE WORKERS
+
+    def OPTIMIZE(self, NETWORK):
+        """TRAIN THE NETWORK ON ITS STORED DATASET
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            SET-UP NETWORK WITH FLAT_PARAMETERS
+
+        RETURNS
+        -------
+        LIST
+            LOSS OF EACH EPOCH
+        """
+        assert NETWORK.ARENA is not None, "PARALLEL TRAINING NEEDS A NETWORK WITH FLAT_PARAMETERS=TRUE"  # CHECK ARENA
+        ARENA = NETWORK.ARENA  # FLAT PARAMETERS
+        DATA = __SHARED_ARRAY__(self.CONTEXT, ARENA.DATA.shape, ARENA.DATA.dtype)  # SHARED PARAMETERS
+        self.GRADS = __SHARED_ARRAY__(self.CONTEXT, (self.N_WORKERS,) + ARENA.GRADS.shape,
+                                      ARENA.GRADS.dtype)  # SHARED GRADIENTS
+        ARENA.BIND(DATA, ARENA.GRADS)  # MOVE THE PARAMETERS INTO SHARED MEMORY
+        WORKERS = []  # WORKER PROCESSES
+        self.CONNECTIONS = []  # PIPES TO THE WORKERS
+        try:
+            for RANK in range(self.N_WORKERS):  # START WORKERS
+                PARENT, CHILD = self.CONTEXT.Pipe()  # CREATE PIPE
+                WORKER = self.CONTEXT.Process(target=__WORKER__, args=(
+                    NETWORK, NETWORK.X, NETWORK.Y, DATA, self.GRADS[RANK], CHILD), daemon=True)  # CREATE WORKER
+                WORKER.start()  # START WORKER
+                WORKERS.append(WORKER)  # STORE WORKER
+                self.CONNECTIONS.append(PARENT)  # STORE PIPE
+            LOSS_HISTORY = []  # LOSS HISTORY LIST: STORES LOSS HISTORY
+            for _ in range(NETWORK.MAX_EPOCHS):  # ITERATE OVER MAX_EPOCHS
+                if NETWORK.SHUFFLE:  # IF SHUFFLE IS TRUE
+                    NETWORK.__SHUFFLE_DATASET__()  # SHUFFLE DATASET
+                ORDER = NETWORK.INDICES if NETWORK.INDICES is not None else np.arange(NETWORK.X.shape[0])  # VISIT ORDER
+                LOSS_HISTORY.append(self.TRAIN_EPOCH(NETWORK, ORDER))  # TRAIN EPOCH
+            for CONNECTION in self.CONNECTIONS:  # ASK EVERY WORKER FOR THE LEARNED LAYER STATE
+                CONNECTION.send(("STATE", None))  # SEND STATE REQUEST
+            STATES = [CONNECTION.recv() for CONNECTION in self.CONNECTIONS]  # GATHER STATE OF EVERY WORKER
+            for LAYER, LAYER_STATES in zip(NETWORK.LAYERS, zip(*STATES)):  # LOOP OVER LAYERS
+                for NAME in LAYER_STATES[0]:  # LOOP OVER STATE
+                    VALUES = [STATE[NAME] for STATE in LAYER_STATES if STATE[NAME] is not None]  # WORKERS THAT LEARNED IT
+                    if VALUES:  # IF ANY WORKER SAW A MINIBATCH
+                        setattr(LAYER, NAME, np.mean(VALUES, axis=0))  # AVERAGE STATE ACROSS WORKERS
+        finally:
+            for CONNECTION in self.CONNECTIONS:  # STOP WORKERS
+                try:
+                    CONNECTION.send(None)  # SEND STOP MESSAGE
+                except OSError:  # IF THE WORKER HAS ALREADY DIED
+                    pass  # NOTHING TO STOP
+            for WORKER in WORKERS:  # WAIT FOR WORKERS
+                WORKER.join()  # JOIN WORKER
+            ARENA.BIND(DATA.copy(), ARENA.GRADS)  # MOVE THE PARAMETERS BACK INTO PRIVATE MEMORY
+            self.GRADS = None  # RELEASE SHARED GRADIENTS
+            self.CONNECTIONS = []  # RELEASE PIPES
+        return LOSS_HISTORY  # RETURN LOSS HISTORY
+
+    def TRAIN_EPOCH(self, NETWORK, ORDER):
+        """TRAIN ONE EPOCH
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        ORDER : NUMPY ARRAY
+            ORDER IN WHICH TO VISIT THE SAMPLES
+
+        RETURNS
+        -------
+        FLOAT
+            LOSS OF THE EPOCH
+        """
+        raise NotImplementedError  # RAISE NOT IMPLEMENTED ERROR
+
+
+class DATA_PARALLEL(PARALLEL_TRAINER):
+    """SYNCHRONOUS DATA-PARALLEL TRAINER
+
+    EVERY MINIBATCH IS SPLIT ACROSS THE WORKERS, THEIR GRADIENT ROWS ARE
+    REDUCED WITH ONE MATRIX-VECTOR PRODUCT, AND THE OPTIMIZER OF THE NETWORK
+    TAKES ONE STEP ON THE SHARED PARAMETERS. WITHOUT BATCH_NORMALIZATION THIS
+    IS THE STEP ONE PROCESS TAKES ON THE WHOLE MINIBATCH, UP TO ROUNDING.
+
+    A BATCH_NORMALIZATION LAYER NORMALIZES OVER THE SUB-BATCH OF EACH WORKER,
+    NOT OVER THE WHOLE MINIBATCH, SO ITS GRADIENTS AND RUNNING AVERAGES DIFFER
+    FROM ONE-PROCESS TRAINING (MORE SO FOR SMALL SUB-BATCHES), AND THE RUNNING
+    AVERAGES OF THE WORKERS ARE AVERAGED AT THE END OF TRAINING.
+
+    PARAMETERS
+    ----------
+    N_WORKERS : INT
+        NUMBER OF WORKER PROCESSES (DEFAULTS TO THE NUMBER OF CPUS).
+    REDUCTION : STRING
+        "MEAN" IF THE GRADIENT OF THE LOSS AVERAGES OVER THE SAMPLES (E.G.
+        MEAN_SQUARED_ERROR, CATEGORICAL_CROSSENTROPY), "SUM" IF IT SUMS OVER
+        THEM (E.G. SQUARED_ERROR, SIGMOID WITH BINARY_CROSSENTROPY).
+
+    METHODS
+    -------
+    TRAIN_BATCH(NETWORK, KEY)
+        TRAIN ON ONE MINIBATCH.
+    """
+
+    def __init__(self, N_WORKERS=None, REDUCTION="MEAN"):
+        """INITIALIZE THE TRAINER
+
+        PARAMETERS
+        ----------
+        N_WORKERS : INT
+            NUMBER OF WORKER PROCESSES (DEFAULTS TO THE NUMBER OF CPUS).
+        REDUCTION : STRING
+            "MEAN" OR "SUM", HOW THE GRADIENT OF THE LOSS REDUCES OVER THE SAMPLES.
+
+        RETURNS
+        -------
+        NONE
+        """
+        if REDUCTION not in ("MEAN", "SUM"):  # CHECK REDUCTION
+            raise ValueError("REDUCTION MUST BE 'MEAN' OR 'SUM'")  # RAISE A VALUE ERROR
+        super().__init__(N_WORKERS)  # INITIALIZE WORKER POOL SETTINGS
+        self.REDUCTION = REDUCTION  # REDUCTION OF THE LOSS GRADIENT
+
+    def TRAIN_EPOCH(self, NETWORK, ORDER):
+        """TRAIN ONE EPOCH
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        ORDER : NUMPY ARRAY
+            ORDER IN WHICH TO VISIT THE SAMPLES
+
+        RETURNS
+        -------
+        FLOAT
+            LOSS OF THE EPOCH
+        """
+        LOSSES = [self.TRAIN_BATCH(NETWORK, KEY) for KEY in BATCH_ITERATOR(ORDER, NETWORK.BATCH_SIZE)]  # TRAIN MINIBATCHES
+        return np.mean(LOSSES)  # RETURN EPOCH LOSS
+
+    def TRAIN_BATCH(self, NETWORK, KEY):
+        """TRAIN ON ONE MINIBATCH
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        KEY : NUMPY ARRAY
+            INDICES OF THE SAMPLES IN THE MINIBATCH
+
+        RETURNS
+        -------
+        FLOAT
+            LOSS OF THE MINIBATCH
+        """
+        PARTS = [PART for PART in np.array_split(KEY, self.N_WORKERS) if len(PART) > 0]  # SPLIT ACROSS WORKERS
+        for CONNECTION, PART in zip(self.CONNECTIONS, PARTS):  # SCATTER
+            CONNECTION.send(("GRADIENTS", PART))  # SEND SUB-BATCH
+        RESULTS = [CONNECTION.recv() for CONNECTION in self.CONNECTIONS[:len(PARTS)]]  # GATHER
+        SIZES = np.array([len(PART) for PART in PARTS], dtype=np.float64)  # SUB-BATCH SIZES
+        LOSSES = np.array([LOSS for LOSS, _ in RESULTS])  # SUB-BATCH LOSSES
+        # SUM OF THE GRADIENTS, WEIGHTED BY SUB-BATCH SIZE IF THE GRADIENT OF THE LOSS IS AN AVERAGE
+        WEIGHTS = SIZES / SIZES.sum() if self.REDUCTION == "MEAN" else np.ones_like(SIZES)
+        np.dot(WEIGHTS.astype(self.GRADS.dtype), self.GRADS[:len(PARTS)], out=NETWORK.ARENA.GRADS)  # ALL-REDUCE
+        NETWORK.FINITE_GRADS = all(FINITE for _, FINITE in RESULTS)  # WHETHER EVERY WORKER KEPT FINITE GRADIENTS
+        if NETWORK.FINITE_GRADS:  # SKIP THE STEP IF THE SCALED GRADIENTS OVERFLOWED
+            NETWORK.OPTIMIZER.UPDATE(NETWORK)  # ONE OPTIMIZER STEP ON THE SHARED PARAMETERS
+        return np.dot(SIZES / SIZES.sum(), LOSSES)  # RETURN LOSS OF THE MINIBATCH
+
+
+class HOGWILD(PARALLEL_TRAINER):
+    """LOCK-FREE ASYNCHRONOUS SGD TRAINER
+
+    EACH EPOCH IS SPLIT INTO ONE SHARE PER WORKER, AND EVERY WORKER RUNS ITS
+    OWN STOCHASTIC_GRADIENT_DESCENT OVER THE MINIBATCHES OF ITS SHARE,
+    WRITING ITS STEPS STRAIGHT INTO THE SHARED PARAMETERS WITHOUT LOCKS.
+    UPDATES FROM DIFFERENT WORKERS CAN INTERLEAVE OR OVERWRITE EACH OTHER;
+    WHEN EACH STEP TOUCHES FEW OF THE PARAMETERS (E.G. WIDE DENSE MODELS ON
+    SPARSE INPUTS) THIS RARELY HAPPENS AND SGD STILL CONVERGES, WITH NO
+    SYNCHRONIZATION BETWEEN MINIBATCHES. EACH WORKER KEEPS ITS OWN MOMENTUM.
+
+    PARAMETERS
+    ----------
+    N_WORKERS : INT
+        NUMBER OF WORKER PROCESSES (DEFAULTS TO THE NUMBER OF CPUS).
+    """
+
+    def OPTIMIZE(self, NETWORK):
+        """TRAIN THE NETWORK ON ITS STORED DATASET
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            SET-UP NETWORK WITH FLAT_PARAMETERS AND A STOCHASTIC_GRADIENT_DESCENT OPTIMIZER
+
+        RETURNS
+        -------
+        LIST
+            LOSS OF EACH EPOCH
+        """
+        assert isinstance(NETWORK.OPTIMIZER, STOCHASTIC_GRADIENT_DESCENT), \
+            "HOGWILD TRAINING NEEDS A STOCHASTIC_GRADIENT_DESCENT OPTIMIZER"  # CHECK OPTIMIZER
+        return super().OPTIMIZE(NETWORK)  # TRAIN WITH THE WORKER POOL
+
+    def TRAIN_EPOCH(self, NETWORK, ORDER):
+        """TRAIN ONE EPOCH
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            NETWORK BEING TRAINED
+        ORDER : NUMPY ARRAY
+            ORDER IN WHICH TO VISIT THE SAMPLES
+
+        RETURNS
+        -------
+        FLOAT
+            LOSS OF THE EPOCH
+        """
+        STARTS = np.arange(0, len(ORDER), NETWORK.BATCH_SIZE)  # FIRST SAMPLE OF EACH MINIBATCH
+        BOUNDS = [STARTS[PART[0]] for PART in np.array_split(np.arange(len(STARTS)), self.N_WORKERS)
+                  if len(PART) > 0] + [len(ORDER)]  # SPLIT THE EPOCH AT MINIBATCH BOUNDARIES
+        for CONNECTION, BEGIN, END in zip(self.CONNECTIONS, BOUNDS[:-1], BOUNDS[1:]):  # SCATTER
+            CONNECTION.send(("TRAIN", ORDER[BEGIN:END]))  # SEND SHARE OF THE EPOCH
+        RESULTS = [CONNECTION.recv() for CONNECTION in self.CONNECTIONS[:len(BOUNDS) - 1]]  # WAIT FOR THE EPOCH
+        COUNTS = np.array([COUNT for _, COUNT in RESULTS], dtype=np.float64)  # MINIBATCHES PER WORKER
+        return np.dot(COUNTS / COUNTS.sum(), [LOSS for LOSS, _ in RESULTS])  # RETURN MEAN MINIBATCH LOSS
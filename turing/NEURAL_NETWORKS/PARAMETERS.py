@@ -44,6 +44,10 @@ class PARAMETER:
         UPDATE GRADIENTS OF A LAYER.
     STEP(PARAM, STEP)
         UPDATE PARAMETERS OF A LAYER.
+    BIND(NAME, VALUE, GRAD)
+        MOVE A PARAMETER AND ITS GRADIENT INTO EXTERNAL STORAGE.
+    CAST(DTYPE)
+        CONVERT ALL PARAMETERS AND GRADIENTS TO A DTYPE.
     KEYS()
         RETURN KEYS OF PARAMETERS.
 
@@ -123,6 +127,8 @@ class PARAMETER:
             else:  # OTHERWISE
                 self.__PARAMETERS__["b"] = np.full(
                     B_SHAPE, self.INITIAL_BIAS)  # SET BIAS TO INITIAL BIAS
+        else:  # IF WEIGHTS WERE SET BEFORE (SHARED WITH ANOTHER LAYER OR LOADED FROM A CHECKPOINT)
+            assert self.__PARAMETERS__["W"].shape == tuple(W_SHAPE), "WEIGHTS DO NOT MATCH THE SHAPE OF THE LAYER"  # CHECK SHAPE
         self.INIT_GRAD()  # INITIALIZE GRADIENTS
 
     def INIT_GRAD(self):
@@ -155,7 +161,11 @@ class PARAMETER:
         --------
         NONE
         """
-        self.__GRADS__[NAME] = VALUE  # SET GRADIENT TO VALUE
+        if NAME in self.__GRADS__ and self.__GRADS__[NAME].size == np.size(VALUE):  # IF GRADIENT STORAGE EXISTS
+            # COPY INTO THE EXISTING STORAGE (KEEPS ARENA VIEWS VALID, EVEN IF THE LAYER RETURNS ANOTHER SHAPE)
+            self.__GRADS__[NAME][...] = np.reshape(VALUE, self.__GRADS__[NAME].shape)
+        else:  # OTHERWISE
+            self.__GRADS__[NAME] = VALUE  # SET GRADIENT TO VALUE
         if NAME in self.REGULARIZERS:  # IF NAME IS IN REGULARIZERS
             # ADD REGULARIZATION TO GRADIENT
             self.__GRADS__[
@@ -177,8 +187,48 @@ class PARAMETER:
         """
         self.__PARAMETERS__[NAME] += STEP  # UPDATE PARAMETER
         if NAME in self.CONSTRAINTS:  # IF NAME IS IN CONSTRAINTS
-            self.__PARAMETERS__[NAME] = self.CONSTRAINTS[NAME].clip(
-                self.__PARAMETERS__[NAME])  # CLIP PARAMETER
+            __CLIP__(self.CONSTRAINTS[NAME], self.__PARAMETERS__[NAME])  # CLIP PARAMETER IN PLACE
+
+    def BIND(self, NAME, VALUE, GRAD, COPY=True):
+        """MOVE A PARAMETER AND ITS GRADIENT INTO EXTERNAL STORAGE.
+
+        PARAMETERS:
+        ----------
+        NAME: STRING
+            NAME OF THE PARAMETER.
+        VALUE: NUMPY ARRAY
+            STORAGE FOR THE PARAMETER (SAME SHAPE AS THE PARAMETER).
+        GRAD: NUMPY ARRAY
+            STORAGE FOR THE GRADIENT (SAME SHAPE AS THE PARAMETER).
+        COPY: BOOL
+            WHETHER TO COPY THE CURRENT VALUES INTO THE STORAGE (FALSE IF IT ALREADY HOLDS THE VALUES TO USE).
+
+        RETURNS:
+        --------
+        NONE
+        """
+        if COPY:  # IF THE CURRENT VALUES ARE KEPT
+            VALUE[...] = self.__PARAMETERS__[NAME]  # COPY CURRENT VALUES
+            GRAD[...] = self.__GRADS__.get(NAME, 0.0)  # COPY CURRENT GRADIENT
+        self.__PARAMETERS__[NAME] = VALUE  # USE EXTERNAL STORAGE FOR PARAMETER
+        self.__GRADS__[NAME] = GRAD  # USE EXTERNAL STORAGE FOR GRADIENT
+
+    def CAST(self, DTYPE):
+        """CONVERT ALL PARAMETERS AND GRADIENTS TO A DTYPE.
+
+        PARAMETERS:
+        ----------
+        DTYPE: NUMPY DTYPE
+            DTYPE OF THE PARAMETERS AND GRADIENTS.
+
+        RETURNS:
+        --------
+        NONE
+        """
+        for NAME in self.__PARAMETERS__.keys():  # LOOP OVER KEYS IN PARAMETERS
+            self.__PARAMETERS__[NAME] = self.__PARAMETERS__[NAME].astype(DTYPE, copy=False)  # CAST PARAMETER
+        for NAME in self.__GRADS__.keys():  # LOOP OVER KEYS IN GRADIENTS
+            self.__GRADS__[NAME] = self.__GRADS__[NAME].astype(DTYPE, copy=False)  # CAST GRADIENT
 
     @property
     def __NUMBER_OF_PARAMETERS__(self):
@@ -257,3 +307,235 @@ class PARAMETER:
         NONE
         """
         self.__PARAMETERS__[KEY] = VALUE  # SET PARAMETER
+
+
+class PARAMETER_ARENA:
+    """CONTIGUOUS STORAGE FOR ALL PARAMETERS OF A NEURAL NETWORK
+
+    EVERY PARAMETER AND GRADIENT OF THE GIVEN PARAMETER OBJECTS BECOMES A VIEW
+    INTO ONE FLAT BUFFER, SO AN OPTIMIZER CAN UPDATE THE WHOLE MODEL WITH A
+    HANDFUL OF VECTOR OPERATIONS. THE ARENA EXPOSES THE SAME INTERFACE AS A
+    PARAMETER OBJECT WITH A SINGLE KEY ("ARENA").
+
+    PARAMETERS
+    ----------
+    PARAMETERS: LIST
+        LIST OF PARAMETER OBJECTS.
+    DTYPE: NUMPY DTYPE
+        DATA TYPE OF THE BUFFERS.
+
+    ATTRIBUTES
+    ----------
+    PARAMETERS : LIST
+        UNIQUE PARAMETER OBJECTS STORED IN THE ARENA.
+    SLICES : LIST
+        (PARAMETER, NAME, START, STOP) FOR EVERY STORED ARRAY.
+    DATA : NUMPY ARRAY
+        FLAT BUFFER OF PARAMETERS.
+    GRADS : NUMPY ARRAY
+        FLAT BUFFER OF GRADIENTS.
+
+    METHODS
+    -------
+    BIND(DATA, GRADS)
+        MOVE THE ARENA INTO EXTERNAL BUFFERS.
+    STEP(NAME, STEP)
+        UPDATE ALL PARAMETERS.
+    KEYS()
+        RETURN KEYS OF PARAMETERS.
+    SAVE(PATH)
+        WRITE ALL PARAMETERS TO DISK.
+    LOAD(PATH)
+        READ ALL PARAMETERS FROM DISK.
+    """
+    KEY = "ARENA"  # NAME OF THE SINGLE FLAT PARAMETER
+
+    def __init__(self, PARAMETERS, DTYPE=np.float64):
+        """INITIALIZE THE ARENA.
+
+        PARAMETERS:
+        ----------
+        PARAMETERS: LIST
+            LIST OF PARAMETER OBJECTS.
+        DTYPE: NUMPY DTYPE
+            DATA TYPE OF THE BUFFERS.
+
+        RETURNS:
+        --------
+        NONE
+        """
+        self.PARAMETERS = []  # UNIQUE PARAMETER OBJECTS
+        for P in PARAMETERS:  # LOOP OVER PARAMETER OBJECTS
+            if not any(P is Q for Q in self.PARAMETERS):  # IF NOT ALREADY STORED (LAYERS MAY SHARE PARAMETERS)
+                self.PARAMETERS.append(P)  # STORE PARAMETER OBJECT
+        self.SLICES = []  # SLICES OF THE FLAT BUFFERS
+        OFFSET = 0  # CURRENT OFFSET
+        for P in self.PARAMETERS:  # LOOP OVER PARAMETER OBJECTS
+            for NAME in P.KEYS():  # LOOP OVER KEYS IN PARAMETERS
+                SIZE = P[NAME].size  # SIZE OF THE PARAMETER
+                self.SLICES.append((P, NAME, OFFSET, OFFSET + SIZE))  # STORE SLICE
+                OFFSET += SIZE  # MOVE OFFSET
+        self.CONSTRAINED = [(P, NAME) for P, NAME, _, _ in self.SLICES if NAME in P.CONSTRAINTS]  # CONSTRAINED PARAMETERS
+        self.DATA = None  # FLAT BUFFER OF PARAMETERS
+        self.GRADS = None  # FLAT BUFFER OF GRADIENTS
+        self.BIND(np.empty(OFFSET, dtype=DTYPE), np.zeros(OFFSET, dtype=DTYPE))  # ALLOCATE BUFFERS
+
+    def BIND(self, DATA, GRADS, COPY=True):
+        """MOVE THE ARENA INTO EXTERNAL BUFFERS.
+
+        PARAMETERS:
+        ----------
+        DATA: NUMPY ARRAY
+            FLAT BUFFER FOR THE PARAMETERS.
+        GRADS: NUMPY ARRAY
+            FLAT BUFFER FOR THE GRADIENTS.
+        COPY: BOOL
+            WHETHER TO COPY THE CURRENT VALUES INTO THE BUFFERS (FALSE IF THEY ALREADY HOLD THE VALUES TO USE).
+
+        RETURNS:
+        --------
+        NONE
+        """
+        assert DATA.shape == GRADS.shape == (self.SIZE,), "BUFFERS MUST MATCH THE SIZE OF THE ARENA"  # CHECK SIZES
+        for P, NAME, START, STOP in self.SLICES:  # LOOP OVER SLICES
+            SHAPE = P[NAME].shape  # SHAPE OF THE PARAMETER
+            P.BIND(NAME, DATA[START:STOP].reshape(SHAPE),
+                   GRADS[START:STOP].reshape(SHAPE), COPY)  # MOVE PARAMETER INTO THE BUFFERS
+        self.DATA = DATA  # SET PARAMETER BUFFER
+        self.GRADS = GRADS  # SET GRADIENT BUFFER
+
+    def STEP(self, NAME, STEP):
+        """UPDATE ALL PARAMETERS.
+
+        PARAMETERS:
+        ----------
+        NAME: STRING
+            NAME OF THE PARAMETER (ALWAYS "ARENA").
+        STEP: NUMPY ARRAY
+            VALUE OF THE STEP.
+
+        RETURNS:
+        --------
+        NONE
+        """
+        self.DATA += STEP  # UPDATE ALL PARAMETERS AT ONCE
+        for P, KEY in self.CONSTRAINED:  # LOOP OVER CONSTRAINED PARAMETERS
+            __CLIP__(P.CONSTRAINTS[KEY], P[KEY])  # CLIP PARAMETER IN PLACE
+
+    def KEYS(self):
+        """RETURN KEYS OF PARAMETERS.
+
+        PARAMETERS:
+        ----------
+        NONE
+
+        RETURNS:
+        --------
+        KEYS: TUPLE
+            TUPLE OF KEYS.
+        """
+        return (self.KEY,)  # RETURN KEYS
+
+    def SAVE(self, PATH):
+        """WRITE ALL PARAMETERS TO DISK.
+
+        PARAMETERS:
+        ----------
+        PATH: STRING
+            PATH OF THE FILE.
+
+        RETURNS:
+        --------
+        NONE
+        """
+        np.save(PATH, self.DATA)  # WRITE THE FLAT BUFFER
+
+    def LOAD(self, PATH):
+        """READ ALL PARAMETERS FROM DISK.
+
+        PARAMETERS:
+        ----------
+        PATH: STRING
+            PATH OF THE FILE.
+
+        RETURNS:
+        --------
+        NONE
+        """
+        DATA = np.load(PATH)  # READ THE FLAT BUFFER
+        assert DATA.shape == self.DATA.shape, "CHECKPOINT DOES NOT MATCH THE ARENA"  # CHECK SIZE
+        self.DATA[...] = DATA  # COPY INTO THE ARENA
+
+    @property
+    def SIZE(self):
+        """RETURN NUMBER OF PARAMETERS IN THE ARENA.
+
+        PARAMETERS:
+        ----------
+        NONE
+
+        RETURNS:
+        --------
+        SIZE: INT
+            NUMBER OF PARAMETERS.
+        """
+        return self.SLICES[-1][3] if self.SLICES else 0  # RETURN END OF THE LAST SLICE
+
+    @property
+    def GRAD(self):
+        """RETURN GRADIENTS OF PARAMETERS.
+
+        PARAMETERS:
+        ----------
+        NONE
+
+        RETURNS:
+        --------
+        GRADS: DICT
+            DICTIONARY OF GRADIENTS.
+        """
+        return {self.KEY: self.GRADS}  # RETURN GRADIENTS
+
+    def __getitem__(self, ITEM):
+        """RETURN PARAMETER.
+
+        PARAMETERS:
+        ----------
+        ITEM: STRING
+            NAME OF THE PARAMETER.
+
+        RETURNS:
+        --------
+        PARAMETER: NUMPY ARRAY
+            PARAMETER.
+        """
+        if ITEM == self.KEY:  # IF ITEM IS THE ARENA KEY
+            return self.DATA  # RETURN FLAT BUFFER
+        else:  # OTHERWISE
+            raise ValueError("PARAMETER NOT FOUND.")  # RAISE ERROR
+
+
+def __CLIP__(CONSTRAINT, P):
+    """CLIP A PARAMETER IN PLACE.
+
+    THE BUILT-IN CONSTRAINTS CLIP IN PLACE THROUGH THEIR __CLIP__ METHOD.
+    OTHER CONSTRAINTS ONLY HAVE CLIP, WHOSE RESULT IS COPIED BACK INTO P IF
+    IT IS A NEW ARRAY.
+
+    PARAMETERS:
+    ----------
+    CONSTRAINT: OBJECT
+        CONSTRAINT OF THE PARAMETER.
+    P: NUMPY ARRAY
+        PARAMETER, OVERWRITTEN WITH THE CLIPPED VALUES.
+
+    RETURNS:
+    --------
+    NONE
+    """
+    if hasattr(CONSTRAINT, "__CLIP__"):  # IF THE CONSTRAINT CAN CLIP IN PLACE
+        CONSTRAINT.__CLIP__(P)  # CLIP IN PLACE
+    else:  # OTHERWISE
+        CLIPPED = CONSTRAINT.CLIP(P)  # CLIP PARAMETER
+        if CLIPPED is not P:  # IF THE CONSTRAINT RETURNED A NEW ARRAY
+            P[...] = CLIPPED  # COPY IT BACK IN PLACE
@@ -0,0 +1,122 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from .BATCH_ITERATOR import BATCH_ITERATOR
+
+
+class PIPELINE:
+    """PREFETCHING BATCH PIPELINE
+
+    PREPARES THE NEXT BATCHES ON A BACKGROUND THREAD POOL WHILE THE CURRENT
+    BATCH IS TRAINED. PREPARING A BATCH MEANS GATHERING ITS ROWS (BY SHUFFLED
+    INDEX IF GIVEN), CASTING THEM TO DTYPE AND APPLYING THE TRANSFORMS IN
+    ORDER. NUMPY RELEASES THE GIL IN MOST HEAVY OPERATIONS, SO THIS WORK
+    OVERLAPS WITH THE FORWARD AND BACKWARD PASSES. BATCHES ARE YIELDED IN
+    ORDER, AND AT MOST PREFETCH BATCHES ARE IN FLIGHT AT ANY TIME.
+
+    PARAMETERS
+    ----------
+    TRANSFORMS : LIST
+        FUNCTIONS (X, Y) -> (X, Y) APPLIED TO EACH BATCH, E.G. AUGMENTATIONS.
+    DTYPE : NUMPY DTYPE
+        DTYPE THE INPUTS ARE CAST TO (NONE TO KEEP THE DTYPE OF THE DATASET).
+    N_WORKERS : INT
+        NUMBER OF BACKGROUND THREADS.
+    PREFETCH : INT
+        MAXIMUM NUMBER OF BATCHES PREPARED AHEAD OF THE CURRENT ONE.
+
+    METHODS
+    -------
+    PREPARE(X, Y, KEY)
+        GATHER, CAST AND TRANSFORM ONE BATCH.
+    BATCHES(X, Y, BATCH_SIZE, INDICES=None)
+        ITERATE OVER PREPARED BATCHES.
+    """
+
+    def __init__(self, TRANSFORMS=None, DTYPE=None, N_WORKERS=2, PREFETCH=4):
+        """INITIALIZE THE PIPELINE
+
+        PARAMETERS
+        ----------
+        TRANSFORMS : LIST
+            FUNCTIONS (X, Y) -> (X, Y) APPLIED TO EACH BATCH, E.G. AUGMENTATIONS.
+        DTYPE : NUMPY DTYPE
+            DTYPE THE INPUTS ARE CAST TO (NONE TO KEEP THE DTYPE OF THE DATASET).
+        N_WORKERS : INT
+            NUMBER OF BACKGROUND THREADS.
+        PREFETCH : INT
+            MAXIMUM NUMBER OF BATCHES PREPARED AHEAD OF THE CURRENT ONE.
+
+        RETURNS
+        -------
+        NONE
+        """
+        assert N_WORKERS > 0, "N_WORKERS MUST BE POSITIVE"  # CHECK NUMBER OF WORKERS
+        assert PREFETCH > 0, "PREFETCH MUST BE POSITIVE"  # CHECK PREFETCH DEPTH
+        self.TRANSFORMS = list(TRANSFORMS) if TRANSFORMS is not None else []  # BATCH TRANSFORMS
+        self.DTYPE = DTYPE  # INPUT DTYPE
+        self.N_WORKERS = N_WORKERS  # NUMBER OF BACKGROUND THREADS
+        self.PREFETCH = PREFETCH  # PREFETCH DEPTH
+
+    def PREPARE(self, X, Y, KEY):
+        """GATHER, CAST AND TRANSFORM ONE BATCH
+
+        PARAMETERS
+        ----------
+        X : ARRAY-LIKE
+            FEATURE DATASET
+        Y : ARRAY-LIKE
+            TARGET DATASET
+        KEY : SLICE OR ARRAY
+            ROWS OF THE BATCH
+
+        RETURNS
+        -------
+        TUPLE
+            FEATURES AND TARGETS OF THE BATCH
+        """
+        X_BATCH = np.asarray(X[KEY])  # GATHER FEATURES
+        Y_BATCH = np.asarray(Y[KEY])  # GATHER TARGETS
+        if self.DTYPE is not None:  # IF A DTYPE IS GIVEN
+            X_BATCH = X_BATCH.astype(self.DTYPE, copy=False)  # CAST FEATURES
+        for TRANSFORM in self.TRANSFORMS:  # FOR EACH TRANSFORM
+            X_BATCH, Y_BATCH = TRANSFORM(X_BATCH, Y_BATCH)  # APPLY TRANSFORM
+        return X_BATCH, Y_BATCH  # RETURN BATCH
+
+    def BATCHES(self, X, Y, BATCH_SIZE, INDICES=None):
+        """ITERATE OVER PREPARED BATCHES
+
+        PARAMETERS
+        ----------
+        X : ARRAY-LIKE
+            FEATURE DATASET
+        Y : ARRAY-LIKE
+            TARGET DATASET
+        BATCH_SIZE : INT
+            SIZE OF EACH BATCH
+        INDICES : ARRAY-LIKE, OPTIONAL
+            ORDER IN WHICH TO VISIT THE SAMPLES
+
+        RETURNS
+        -------
+        GENERATOR
+            FEATURES AND TARGETS OF EACH BATCH, IN ORDER
+        """
+        if INDICES is not None:  # IF AN ORDER IS GIVEN
+            KEYS = BATCH_ITERATOR(INDICES, BATCH_SIZE)  # BATCHES OF INDICES
+        else:  # OTHERWISE
+            KEYS = (slice(BEGIN, BEGIN + BATCH_SIZE)
+                    for BEGIN in range(0, X.shape[0], BATCH_SIZE))  # CONTIGUOUS SLICES
+        PENDING = deque()  # BATCHES IN FLIGHT
+        with ThreadPoolExecutor(max_workers=self.N_WORKERS) as EXECUTOR:  # START WORKERS
+            try:
+                for KEY in KEYS:  # FOR EACH BATCH
+                    PENDING.append(EXECUTOR.submit(self.PREPARE, X, Y, KEY))  # SCHEDULE BATCH
+                    if len(PENDING) > self.PREFETCH:  # IF THE QUEUE IS FULL
+                        yield PENDING.popleft().result()  # YIELD OLDEST BATCH
+                while PENDING:  # DRAIN THE QUEUE
+                    yield PENDING.popleft().result()  # YIELD OLDEST BATCH
+            finally:
+                for FUTURE in PENDING:  # IF THE CONSUMER STOPPED EARLY
+                    FUTURE.cancel()  # DROP BATCHES THAT HAVE NOT STARTED
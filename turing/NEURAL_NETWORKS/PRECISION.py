@@ -0,0 +1,138 @@
+import numpy as np
+
+
+class PRECISION:
+    """MIXED-PRECISION POLICY FOR A NEURAL NETWORK
+
+    PARAMETERS, GRADIENTS, OPTIMIZER STATE AND COMPUTATION USE COMPUTE_DTYPE,
+    SO THE PARAMETERS DOUBLE AS THE MASTER WEIGHTS. IF STORAGE_DTYPE IS SET,
+    LAYERS KEEP THE ACTIVATIONS THEY CACHE FOR THE BACKWARD PASS IN THAT
+    (NARROWER) DTYPE AND WIDEN THEM AGAIN WHEN THEY ARE USED.
+
+    THE GRADIENT OF THE LOSS IS MULTIPLIED BY LOSS_SCALE BEFORE THE BACKWARD
+    PASS AND THE PARAMETER GRADIENTS ARE DIVIDED BY IT AFTERWARDS, SO SMALL
+    GRADIENTS DO NOT UNDERFLOW IN THE NARROW STORAGE DTYPE. WITH DYNAMIC
+    SCALING, A STEP WHOSE GRADIENTS OVERFLOW IS SKIPPED AND THE SCALE IS
+    HALVED, AND THE SCALE IS DOUBLED AFTER GROWTH_INTERVAL CLEAN STEPS.
+
+    PARAMETERS
+    ----------
+    COMPUTE_DTYPE : NUMPY DTYPE
+        DTYPE OF THE PARAMETERS AND OF ALL COMPUTATION.
+    STORAGE_DTYPE : NUMPY DTYPE
+        DTYPE OF THE CACHED ACTIVATIONS (NONE TO KEEP COMPUTE_DTYPE).
+    LOSS_SCALE : FLOAT
+        INITIAL LOSS SCALE.
+    DYNAMIC : BOOL
+        WHETHER TO ADAPT THE LOSS SCALE TO OVERFLOWS.
+    GROWTH_INTERVAL : INT
+        NUMBER OF CLEAN STEPS BEFORE THE LOSS SCALE IS DOUBLED.
+
+    ATTRIBUTES
+    ----------
+    CLEAN_STEPS : INT
+        NUMBER OF CLEAN STEPS SINCE THE LAST CHANGE OF THE LOSS SCALE.
+
+    METHODS
+    -------
+    CAST(X)
+        CAST AN ARRAY TO THE COMPUTE DTYPE.
+    SCALE(DELTA)
+        SCALE THE GRADIENT OF THE LOSS.
+    UNSCALE(PARAMETERS)
+        UNSCALE THE GRADIENTS AND REPORT WHETHER THEY ARE FINITE.
+    """
+
+    def __init__(self, COMPUTE_DTYPE=np.float32, STORAGE_DTYPE=None, LOSS_SCALE=1.0, DYNAMIC=False, GROWTH_INTERVAL=2000):
+        """INITIALIZE THE POLICY
+
+        PARAMETERS
+        ----------
+        COMPUTE_DTYPE : NUMPY DTYPE
+            DTYPE OF THE PARAMETERS AND OF ALL COMPUTATION.
+        STORAGE_DTYPE : NUMPY DTYPE
+            DTYPE OF THE CACHED ACTIVATIONS (NONE TO KEEP COMPUTE_DTYPE).
+        LOSS_SCALE : FLOAT
+            INITIAL LOSS SCALE.
+        DYNAMIC : BOOL
+            WHETHER TO ADAPT THE LOSS SCALE TO OVERFLOWS.
+        GROWTH_INTERVAL : INT
+            NUMBER OF CLEAN STEPS BEFORE THE LOSS SCALE IS DOUBLED.
+
+        RETURNS
+        -------
+        NONE
+        """
+        assert LOSS_SCALE > 0, "LOSS_SCALE MUST BE POSITIVE"  # CHECK LOSS SCALE
+        self.COMPUTE_DTYPE = np.dtype(COMPUTE_DTYPE)  # COMPUTE DTYPE
+        self.STORAGE_DTYPE = np.dtype(STORAGE_DTYPE) if STORAGE_DTYPE is not None else None  # STORAGE DTYPE
+        self.LOSS_SCALE = float(LOSS_SCALE)  # LOSS SCALE
+        self.DYNAMIC = DYNAMIC  # WHETHER THE LOSS SCALE IS DYNAMIC
+        self.GROWTH_INTERVAL = GROWTH_INTERVAL  # CLEAN STEPS BEFORE GROWTH
+        self.CLEAN_STEPS = 0  # CLEAN STEPS SINCE THE LAST CHANGE
+
+    def CAST(self, X):
+        """CAST AN ARRAY TO THE COMPUTE DTYPE
+
+        PARAMETERS
+        ----------
+        X : ARRAY-LIKE
+            ARRAY
+
+        RETURNS
+        -------
+        NUMPY ARRAY
+            X IN THE COMPUTE DTYPE (NOT COPIED IF IT ALREADY IS)
+        """
+        return np.asarray(X, dtype=self.COMPUTE_DTYPE)  # RETURN CAST ARRAY
+
+    def SCALE(self, DELTA):
+        """SCALE THE GRADIENT OF THE LOSS
+
+        PARAMETERS
+        ----------
+        DELTA : NUMPY ARRAY
+            GRADIENT OF THE LOSS WITH RESPECT TO THE OUTPUT
+
+        RETURNS
+        -------
+        NUMPY ARRAY
+            SCALED GRADIENT IN THE COMPUTE DTYPE
+        """
+        DELTA = self.CAST(DELTA)  # CAST GRADIENT
+        if self.LOSS_SCALE == 1.0:  # IF THERE IS NO SCALING
+            return DELTA  # RETURN GRADIENT
+        return DELTA * self.COMPUTE_DTYPE.type(self.LOSS_SCALE)  # RETURN SCALED GRADIENT
+
+    def UNSCALE(self, PARAMETERS):
+        """UNSCALE THE GRADIENTS AND REPORT WHETHER THEY ARE FINITE
+
+        PARAMETERS
+        ----------
+        PARAMETERS : LIST
+            PARAMETER OBJECTS WHOSE GRADIENTS WERE COMPUTED WITH THE SCALED LOSS
+
+        RETURNS
+        -------
+        BOOL
+            TRUE IF EVERY GRADIENT IS FINITE AND THE STEP CAN BE TAKEN
+        """
+        if self.LOSS_SCALE == 1.0 and not self.DYNAMIC:  # IF THERE IS NO LOSS SCALING
+            return True  # NOTHING TO UNSCALE OR CHECK
+        FINITE = True  # WHETHER ALL GRADIENTS ARE FINITE
+        for P in PARAMETERS:  # LOOP OVER PARAMETER OBJECTS
+            for GRAD in P.GRAD.values():  # LOOP OVER GRADIENTS
+                if self.LOSS_SCALE != 1.0:  # IF THE LOSS WAS SCALED
+                    GRAD *= 1.0 / self.LOSS_SCALE  # UNSCALE GRADIENT IN PLACE
+                if FINITE and not np.isfinite(GRAD).all():  # IF THE GRADIENT OVERFLOWED
+                    FINITE = False  # MARK STEP AS INVALID
+        if self.DYNAMIC:  # IF THE LOSS SCALE IS DYNAMIC
+            if not FINITE:  # IF THE GRADIENTS OVERFLOWED
+                self.LOSS_SCALE = max(self.LOSS_SCALE / 2.0, 1.0)  # HALVE LOSS SCALE
+                self.CLEAN_STEPS = 0  # RESTART COUNT
+            else:  # IF THE GRADIENTS ARE CLEAN
+                self.CLEAN_STEPS += 1  # COUNT CLEAN STEP
+                if self.CLEAN_STEPS >= self.GROWTH_INTERVAL:  # IF THE SCALE HAS BEEN SAFE LONG ENOUGH
+                    self.LOSS_SCALE *= 2.0  # DOUBLE LOSS SCALE
+                    self.CLEAN_STEPS = 0  # RESTART COUNT
+        return FINITE  # RETURN WHETHER THE STEP CAN BE TAKEN
@@ -0,0 +1,303 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+import numpy as np
+
+# ESTIMATED FLOPS PER PARAMETER OF ONE STEP OF EACH OPTIMIZER (OTHER OPTIMIZERS COUNT AS 4)
+OPTIMIZER_FLOPS = {"STOCHASTIC_GRADIENT_DESCENT": 4, "ADA_GRAD": 6, "ADA_DELTA": 10, "RMS_PROP": 7, "ADMA": 12,
+                   "ADA_MAX": 10}
+# COLUMNS OF THE TABLE: (HEADER, KEY OF THE SUMMARY, FORMAT)
+COLUMNS = (("EPOCH", "EPOCH", "{}"), ("STAGE", "STAGE", "{}"), ("PASS", "PASS", "{}"), ("CALLS", "CALLS", "{}"),
+           ("TIME (MS)", "TIME", "{:.3f}"), ("TIME (%)", "SHARE", "{:.1f}"), ("GFLOP/S", "GFLOPS", "{:.2f}"),
+           ("MFLOP/CALL", "MFLOPS", "{:.3f}"), ("KB/CALL", "KB", "{:.1f}"), ("SHAPE", "SHAPE", "{}"))
+
+
+class PROFILER:
+    """PER-LAYER PROFILER OF A NEURAL_NETWORK
+
+    PASS A PROFILER TO NEURAL_NETWORK (OR SET ITS PROFILER ATTRIBUTE) AND
+    EVERY FORWARD_PASS AND BACKWARD_PASS OF EVERY LAYER (OR FUSED BLOCK OF A
+    COMPILED NETWORK) AND EVERY UPDATE OF THE OPTIMIZER IS RECORDED WITH ITS
+    WALL TIME, AN ESTIMATE OF ITS FLOPS, THE BYTES IT ALLOCATED AND THE SHAPE
+    OF ITS OUTPUT. THE RECORDS ARE AGGREGATED PER EPOCH OF THE NETWORK AND
+    CAN BE PRINTED AS A TABLE OR SAVED AS A CHROME TRACE (CHROME://TRACING OR
+    PERFETTO). WITHOUT A PROFILER THE NETWORK RUNS UNINSTRUMENTED.
+
+    THE FLOPS ARE ESTIMATED FROM THE SHAPES: TWO PER MULTIPLY-ADD OF THE
+    WEIGHT MATRICES (TWICE AS MANY IN THE BACKWARD PASS) PLUS ONE PER ELEMENT,
+    AND A FIXED NUMBER PER PARAMETER FOR THE OPTIMIZER. THE BYTES ARE THE
+    PEAK MEMORY ALLOCATED BY THE CALL, AS TRACED BY TRACEMALLOC.
+
+    PARAMETERS
+    ----------
+    MEMORY : BOOL
+        WHETHER TO TRACE THE BYTES ALLOCATED BY EACH CALL.
+    MAX_EVENTS : INT
+        MAXIMUM NUMBER OF CALLS KEPT FOR THE TRACE (THE AGGREGATES KEEP COUNTING).
+
+    ATTRIBUTES
+    ----------
+    STATS : DICT
+        CALLS, SECONDS, FLOPS, BYTES AND LAST OUTPUT SHAPE PER (EPOCH, STAGE, PASS).
+    EVENTS : LIST
+        CALLS RECORDED FOR THE TRACE.
+    DROPPED : INT
+        NUMBER OF CALLS NOT KEPT FOR THE TRACE.
+
+    METHODS
+    -------
+    RUN(NETWORK, OBJECT, PASS, ARGUMENT)
+        CALL A PASS OF A LAYER OR OPTIMIZER AND RECORD IT.
+    SUMMARY(EPOCH=None)
+        RETURN THE AGGREGATED RECORDS.
+    TABLE(EPOCH=None)
+        RETURN THE AGGREGATED RECORDS AS A TABLE.
+    TRACE()
+        RETURN THE RECORDED CALLS AS A CHROME TRACE.
+    SAVE_TRACE(PATH)
+        SAVE THE CHROME TRACE AS JSON.
+    RESET()
+        FORGET EVERYTHING RECORDED.
+
+    PROPERTIES
+    ----------
+    EPOCHS
+        EPOCHS WITH RECORDS.
+    """
+
+    def __init__(self, MEMORY=True, MAX_EVENTS=100000):
+        """INITIALIZE THE PROFILER
+
+        PARAMETERS
+        ----------
+        MEMORY : BOOL
+            WHETHER TO TRACE THE BYTES ALLOCATED BY EACH CALL.
+        MAX_EVENTS : INT
+            MAXIMUM NUMBER OF CALLS KEPT FOR THE TRACE.
+
+        RETURNS
+        -------
+        NONE
+        """
+        assert MAX_EVENTS >= 0, "MAX_EVENTS CANNOT BE NEGATIVE"  # CHECK TRACE LIMIT
+        self.MEMORY = MEMORY  # WHETHER TO TRACE ALLOCATIONS
+        self.MAX_EVENTS = MAX_EVENTS  # TRACE LIMIT
+        self.NAMES = {}  # NAME OF EACH STAGE, BY ID
+        self.RESET()  # START EMPTY
+
+    def RESET(self):
+        """FORGET EVERYTHING RECORDED
+
+        RETURNS
+        -------
+        NONE
+        """
+        self.STATS = {}  # AGGREGATES
+        self.EVENTS = []  # CALLS KEPT FOR THE TRACE
+        self.DROPPED = 0  # CALLS NOT KEPT FOR THE TRACE
+        self.START = time.perf_counter()  # ORIGIN OF THE TRACE
+
+    def RUN(self, NETWORK, OBJECT, PASS, ARGUMENT):
+        """CALL A PASS OF A LAYER OR OPTIMIZER AND RECORD IT
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            PROFILED NETWORK
+        OBJECT : LAYER OR OPTIMIZER
+            OBJECT WHOSE PASS IS CALLED
+        PASS : STRING
+            "FORWARD_PASS", "BACKWARD_PASS" OR "UPDATE"
+        ARGUMENT : OBJECT
+            ARGUMENT OF THE PASS
+
+        RETURNS
+        -------
+        OBJECT
+            RESULT OF THE PASS
+        """
+        TRACING = self.MEMORY and tracemalloc.is_tracing()  # WHETHER SOMEONE ELSE IS ALREADY TRACING
+        if TRACING:  # IF ALLOCATIONS ARE ALREADY TRACED
+            BASE = tracemalloc.get_traced_memory()[0]  # MEMORY IN USE BEFORE THE CALL
+            tracemalloc.reset_peak()  # MEASURE THE PEAK OF THIS CALL
+        elif self.MEMORY:  # OTHERWISE, IF ALLOCATIONS ARE TRACED
+            BASE = 0  # ONLY ALLOCATIONS OF THIS CALL ARE TRACED
+            tracemalloc.start()  # TRACE THIS CALL ONLY
+        BEGIN = time.perf_counter()  # START OF THE CALL
+        try:
+            OUTPUT = getattr(OBJECT, PASS)(ARGUMENT)  # CALL PASS
+        finally:
+            END = time.perf_counter()  # END OF THE CALL
+            BYTES = tracemalloc.get_traced_memory()[1] - BASE if self.MEMORY else 0  # PEAK ALLOCATED BY THE CALL
+            if self.MEMORY and not TRACING:  # IF THE TRACE WAS STARTED FOR THIS CALL
+                tracemalloc.stop()  # STOP TRACING
+        NAME = self.__NAME__(NETWORK, OBJECT)  # NAME OF THE STAGE
+        if PASS == "FORWARD_PASS" and not NETWORK.IS_TRAINING:  # IF THE NETWORK IS TESTING
+            PASS = "FORWARD_PASS (TESTING)"  # TELL INFERENCE APART FROM TRAINING
+        FLOPS = __FLOPS__(NETWORK, OBJECT, PASS, ARGUMENT, OUTPUT)  # ESTIMATED FLOPS
+        SHAPE = list(np.shape(OUTPUT)) if OUTPUT is not None else None  # SHAPE OF THE OUTPUT
+        RECORD = self.STATS.setdefault((NETWORK.EPOCH, NAME, PASS), [0, 0.0, 0, 0, None])  # AGGREGATE OF THE STAGE
+        RECORD[0] += 1  # COUNT CALL
+        RECORD[1] += END - BEGIN  # ADD TIME
+        RECORD[2] += FLOPS  # ADD FLOPS
+        RECORD[3] += BYTES  # ADD BYTES
+        RECORD[4] = SHAPE  # KEEP LAST SHAPE
+        if len(self.EVENTS) < self.MAX_EVENTS:  # IF THE TRACE IS NOT FULL
+            self.EVENTS.append({"name": NAME, "cat": PASS, "ph": "X", "pid": os.getpid(),
+                                "tid": threading.get_ident(), "ts": (BEGIN - self.START) * 1e6,
+                                "dur": (END - BEGIN) * 1e6, "args": {"EPOCH": NETWORK.EPOCH, "FLOPS": FLOPS,
+                                                                     "BYTES": BYTES, "SHAPE": SHAPE}})  # RECORD CALL
+        else:  # OTHERWISE
+            self.DROPPED += 1  # COUNT DROPPED CALL
+        return OUTPUT  # RETURN RESULT OF THE PASS
+
+    def SUMMARY(self, EPOCH=None):
+        """RETURN THE AGGREGATED RECORDS
+
+        PARAMETERS
+        ----------
+        EPOCH : INT
+            EPOCH TO SUMMARIZE (NONE TO ADD UP ALL EPOCHS)
+
+        RETURNS
+        -------
+        LIST
+            ONE DICT PER STAGE AND PASS, IN ORDER OF THE FIRST CALL
+        """
+        TOTALS = {}  # AGGREGATES OF THE SELECTED EPOCHS
+        for (AT, NAME, PASS), (CALLS, SECONDS, FLOPS, BYTES, SHAPE) in self.STATS.items():  # LOOP OVER AGGREGATES
+            if EPOCH is None or AT == EPOCH:  # IF THE EPOCH IS SELECTED
+                TOTAL = TOTALS.setdefault((NAME, PASS), [0, 0.0, 0, 0, None])  # TOTAL OF THE STAGE
+                TOTAL[0] += CALLS  # ADD CALLS
+                TOTAL[1] += SECONDS  # ADD TIME
+                TOTAL[2] += FLOPS  # ADD FLOPS
+                TOTAL[3] += BYTES  # ADD BYTES
+                TOTAL[4] = SHAPE  # KEEP LAST SHAPE
+        ELAPSED = sum(TOTAL[1] for TOTAL in TOTALS.values()) or 1.0  # TOTAL TIME
+        return [{"EPOCH": "ALL" if EPOCH is None else EPOCH, "STAGE": NAME, "PASS": PASS, "CALLS": CALLS,
+                 "TIME": SECONDS * 1e3, "SHARE": 100.0 * SECONDS / ELAPSED,
+                 "GFLOPS": FLOPS / SECONDS / 1e9 if SECONDS > 0 else 0.0, "MFLOPS": FLOPS / CALLS / 1e6,
+                 "KB": BYTES / CALLS / 1024, "SHAPE": SHAPE}
+                for (NAME, PASS), (CALLS, SECONDS, FLOPS, BYTES, SHAPE) in TOTALS.items()]  # RETURN SUMMARY
+
+    def TABLE(self, EPOCH=None):
+        """RETURN THE AGGREGATED RECORDS AS A TABLE
+
+        PARAMETERS
+        ----------
+        EPOCH : INT
+            EPOCH TO SUMMARIZE (NONE TO ADD UP ALL EPOCHS)
+
+        RETURNS
+        -------
+        STRING
+            TABLE WITH ONE ROW PER STAGE AND PASS
+        """
+        ROWS = [[HEADER for HEADER, _, _ in COLUMNS]]  # HEADER ROW
+        for ENTRY in self.SUMMARY(EPOCH):  # LOOP OVER STAGES
+            ROWS.append([FORMAT.format(ENTRY[KEY]) for _, KEY, FORMAT in COLUMNS])  # FORMAT ROW
+        WIDTHS = [max(len(ROW[INDEX]) for ROW in ROWS) for INDEX in range(len(COLUMNS))]  # WIDTH OF EACH COLUMN
+        LINES = ["  ".join(CELL.ljust(WIDTH) for CELL, WIDTH in zip(ROW, WIDTHS)).rstrip() for ROW in ROWS]  # ALIGN
+        LINES.insert(1, "  ".join("-" * WIDTH for WIDTH in WIDTHS))  # RULE UNDER THE HEADER
+        return "\n".join(LINES)  # RETURN TABLE
+
+    def TRACE(self):
+        """RETURN THE RECORDED CALLS AS A CHROME TRACE
+
+        RETURNS
+        -------
+        DICT
+            TRACE IN THE CHROME TRACE EVENT FORMAT
+        """
+        return {"traceEvents": self.EVENTS, "displayTimeUnit": "ms",
+                "otherData": {"DROPPED": self.DROPPED}}  # RETURN TRACE
+
+    def SAVE_TRACE(self, PATH):
+        """SAVE THE CHROME TRACE AS JSON
+
+        PARAMETERS
+        ----------
+        PATH : STRING
+            PATH OF THE JSON FILE
+
+        RETURNS
+        -------
+        NONE
+        """
+        with open(PATH, "w") as FILE:  # OPEN FILE
+            json.dump(self.TRACE(), FILE)  # WRITE TRACE
+
+    @property
+    def EPOCHS(self):
+        """EPOCHS WITH RECORDS
+
+        RETURNS
+        -------
+        LIST
+            SORTED EPOCHS
+        """
+        return sorted({EPOCH for EPOCH, _, _ in self.STATS})  # RETURN EPOCHS
+
+    def __NAME__(self, NETWORK, OBJECT):
+        """RETURN THE NAME OF A STAGE OR OPTIMIZER
+
+        PARAMETERS
+        ----------
+        NETWORK : NEURAL_NETWORK
+            PROFILED NETWORK
+        OBJECT : LAYER OR OPTIMIZER
+            PROFILED OBJECT
+
+        RETURNS
+        -------
+        STRING
+            POSITION AND CLASS OF THE STAGE, OR CLASS OF THE OPTIMIZER
+        """
+        ENTRY = self.NAMES.get(id(OBJECT))  # CACHED NAME
+        if ENTRY is None or ENTRY[0] is not OBJECT:  # IF THE OBJECT IS NEW (E.G. THE NETWORK WAS COMPILED)
+            NAME = type(OBJECT).__name__  # CLASS OF THE OBJECT
+            for INDEX, STAGE in enumerate(NETWORK.__STAGES__):  # LOOP OVER STAGES
+                if STAGE is OBJECT:  # IF THE OBJECT IS A STAGE
+                    INNER = getattr(OBJECT, "LAYERS", None)  # LAYERS OF A FUSED BLOCK
+                    NAME = "{}:{}".format(INDEX, NAME) if INNER is None else "{}:{}({})".format(
+                        INDEX, NAME, "+".join(type(LAYER).__name__ for LAYER in INNER))  # NAME THE STAGE
+                    break  # STOP SEARCHING
+            ENTRY = self.NAMES[id(OBJECT)] = (OBJECT, NAME)  # CACHE NAME
+        return ENTRY[1]  # RETURN NAME
+
+
+def __FLOPS__(NETWORK, OBJECT, PASS, ARGUMENT, OUTPUT):
+    """ESTIMATE THE FLOPS OF A PASS FROM THE SHAPES
+
+    PARAMETERS
+    ----------
+    NETWORK : NEURAL_NETWORK
+        PROFILED NETWORK
+    OBJECT : LAYER OR OPTIMIZER
+        PROFILED OBJECT
+    PASS : STRING
+        PROFILED PASS
+    ARGUMENT : OBJECT
+        ARGUMENT OF THE PASS
+    OUTPUT : OBJECT
+        RESULT OF THE PASS
+
+    RETURNS
+    -------
+    INT
+        ESTIMATED FLOPS
+    """
+    if PASS == "UPDATE":  # IF THE PASS IS AN OPTIMIZER STEP
+        SIZE = sum(np.size(GROUP[KEY]) for GROUP in NETWORK.PARAMETER_GROUPS for KEY in GROUP.KEYS())  # PARAMETERS
+        return OPTIMIZER_FLOPS.get(type(OBJECT).__name__, 4) * SIZE  # A FEW FLOPS PER PARAMETER
+    RESULT = OUTPUT if PASS.startswith("FORWARD_PASS") else ARGUMENT  # ARRAY OF THE SHAPE OF THE LAYER OUTPUT
+    ELEMENTS = max(np.size(ARGUMENT), np.size(OUTPUT))  # ONE FLOP PER ELEMENT
+    PARAMETERS = getattr(getattr(OBJECT, "AFFINE", OBJECT), "PARAMETERS", None)  # PARAMETERS (OF A FUSED BLOCK)
+    if PARAMETERS is None or np.ndim(RESULT) < 2:  # IF THE LAYER HAS NO WEIGHT MATRICES
+        return int(ELEMENTS)  # ELEMENT-WISE LAYER
+    MATRICES = sum(np.size(PARAMETERS[KEY]) for KEY in PARAMETERS.KEYS() if np.ndim(PARAMETERS[KEY]) >= 2)  # WEIGHTS
+    UNITS = np.shape(RESULT)[1] if np.ndim(RESULT) == 4 else np.shape(RESULT)[-1]  # OUTPUT UNITS (CHANNELS FIRST)
+    PRODUCTS = 2 * np.size(RESULT) * MATRICES // max(UNITS, 1)  # TWO FLOPS PER MULTIPLY-ADD OF EACH OUTPUT
+    return int(PRODUCTS * (1 if PASS.startswith("FORWARD_PASS") else 2) + ELEMENTS)  # BACKWARD ALSO DOES THE WEIGHTS